@@ -1,10 +1,14 @@
 """Internal classes used by the gzip, lzma and bz2 modules"""
 
+import collections
 import io
 
 
 BUFFER_SIZE = io.DEFAULT_BUFFER_SIZE  # Compressed data read chunk size
 
+# Upper bound on the decompressed data held by a ParallelDecompressReader
+PARALLEL_BUFFER_SIZE = 32 * 1024 * 1024
+
 
 class BaseStream(io.BufferedIOBase):
     """Mode-checking helper functions."""
@@ -150,3 +154,202 @@ class DecompressReader(io.RawIOBase):
     def tell(self):
         """Return the current file position."""
         return self._pos
+
+
+class BlockWriter:
+    """Compress data in independent blocks on a pool of threads.
+
+    Data written is split into blocks of block_size bytes, each of which is
+    passed to compress_block() to produce a self-contained compressed stream.
+    The zlib, bz2 and lzma compressors release the GIL, so the blocks are
+    compressed concurrently.  The results are written to fp in order.
+    """
+
+    def __init__(self, fp, compress_block, block_size, threads):
+        self._fp = fp
+        self._compress_block = compress_block
+        self._block_size = block_size
+        self._buffer = bytearray()
+        self._pending = collections.deque()
+        self._max_pending = 2 * threads
+        if threads > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            self._executor = ThreadPoolExecutor(threads)
+        else:
+            self._executor = None
+
+    def write(self, data):
+        buf = self._buffer
+        buf += data
+        block_size = self._block_size
+        if len(buf) >= block_size:
+            end = len(buf) - len(buf) % block_size
+            for start in range(0, end, block_size):
+                self._submit(bytes(buf[start:start + block_size]))
+            del buf[:end]
+
+    def _submit(self, block):
+        if self._executor is None:
+            self._fp.write(self._compress_block(block))
+            return
+        self._pending.append(self._executor.submit(self._compress_block,
+                                                   block))
+        while len(self._pending) > self._max_pending:
+            self._fp.write(self._pending.popleft().result())
+
+    def flush(self):
+        """Compress and write out all the data written so far."""
+        if self._buffer:
+            self._submit(bytes(self._buffer))
+            del self._buffer[:]
+        while self._pending:
+            self._fp.write(self._pending.popleft().result())
+
+    def close(self):
+        try:
+            self.flush()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+
+class ParallelDecompressReader(DecompressReader):
+    """Decompress independent chunks of a compressed file on a pool of threads
+
+    iter_chunks() returns an iterator over pieces of the compressed data
+    read from fp.  decompress_chunk(data, state=None, max_length=-1)
+    decompresses at most max_length bytes of one of them and returns a
+    (result, state) pair.  state is None if the piece ended exactly at the
+    end of a compressed stream, and False if the piece ended with trailing
+    data to be ignored along with the rest of the file.  Otherwise state
+    is a decompressor to pass back along with b"" to get more of the data,
+    or, if its needs_input attribute is true, along with the next piece,
+    which was not split at a stream boundary.
+
+    As for DecompressReader, trailing_error is raised by decompress_chunk()
+    for a piece that does not start with a valid stream.  After the end of
+    a stream, such a piece and the rest of the file are ignored.
+
+    At most PARALLEL_BUFFER_SIZE bytes of decompressed data are held by
+    the pieces being decompressed ahead of the reader.
+    """
+
+    def __init__(self, fp, iter_chunks, decompress_chunk, threads,
+                 trailing_error=()):
+        # There is no single decompressor object, so DecompressReader's
+        # constructor is not used.
+        self._fp = fp
+        self._eof = False
+        self._pos = 0
+        self._size = -1
+        self._iter_chunks = iter_chunks
+        self._decompress_chunk = decompress_chunk
+        self._threads = threads
+        self._max_length = max(BUFFER_SIZE,
+                               PARALLEL_BUFFER_SIZE // (2 * threads))
+        self._trailing_error = trailing_error
+        self._stream_ended = False
+        self._executor = None
+        self._chunks = iter_chunks()
+        self._pending = collections.deque()
+        self._data = b""
+        self._offset = 0
+
+    def _cancel(self):
+        for raw, future in self._pending:
+            future.cancel()
+        self._pending.clear()
+
+    def close(self):
+        self._cancel()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        return io.RawIOBase.close(self)
+
+    def _submit(self, data, state=None):
+        return self._executor.submit(self._decompress_chunk, data, state,
+                                     self._max_length)
+
+    def _fill(self):
+        if self._executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._executor = ThreadPoolExecutor(self._threads)
+        while self._chunks is not None and \
+              len(self._pending) < 2 * self._threads:
+            raw = next(self._chunks, None)
+            if raw is None:
+                self._chunks = None
+                break
+            self._pending.append((raw, self._submit(raw)))
+
+    def _next_raw(self):
+        if not self._pending:
+            self._fill()
+            if not self._pending:
+                return None
+        # The result of decompressing this piece on its own is not used.
+        raw, future = self._pending.popleft()
+        future.cancel()
+        return raw
+
+    def _next_data(self):
+        """Return the next part of the decompressed data, or None."""
+        while True:
+            self._fill()
+            if not self._pending:
+                return None
+            raw, future = self._pending.popleft()
+            try:
+                data, state = future.result()
+            except self._trailing_error:
+                if not self._stream_ended:
+                    raise
+                # Trailing data is ignored, like in DecompressReader.
+                data, state = b"", False
+            if state is False:
+                self._chunks = None
+                self._cancel()
+            elif state is not None:
+                # Go on with the rest of this piece, or with the next one
+                # if the stream continues there, while data is being read.
+                if state.needs_input:
+                    raw = self._next_raw()
+                    if raw is None:
+                        raise EOFError("Compressed file ended before the "
+                                       "end-of-stream marker was reached")
+                else:
+                    raw = b""
+                self._pending.appendleft((raw, self._submit(raw, state)))
+            self._stream_ended = True
+            if data:
+                return data
+
+    def read(self, size=-1):
+        if size < 0:
+            return self.readall()
+        if not size or self._eof:
+            return b""
+        while self._offset >= len(self._data):
+            data = self._next_data()
+            if data is None:
+                self._eof = True
+                self._size = self._pos
+                return b""
+            self._data = data
+            self._offset = 0
+        data = self._data[self._offset:self._offset + size]
+        self._offset += len(data)
+        self._pos += len(data)
+        return data
+
+    def _rewind(self):
+        self._cancel()
+        self._fp.seek(0)
+        self._stream_ended = False
+        self._chunks = self._iter_chunks()
+        self._eof = False
+        self._pos = 0
+        self._data = b""
+        self._offset = 0
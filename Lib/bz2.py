@@ -10,7 +10,9 @@ __all__ = ["BZ2File", "BZ2Compressor", "BZ2Decompressor",
 __author__ = "Nadeem Vawda <nadeem.vawda@gmail.com>"
 
 from builtins import open as _builtin_open
+import functools
 import io
+import re
 import warnings
 import _compression
 
@@ -27,6 +29,12 @@ _MODE_READ     = 1
 # Value 2 no longer used
 _MODE_WRITE    = 3
 
+# Start of a bzip2 stream: a header followed by the magic of its first block.
+_STREAM_HEADER = re.compile(rb"BZh[1-9]1AY&SY")
+
+# Amount of compressed data read at a time when reading with threads.
+_SPLIT_SIZE = 1 << 20
+
 
 class BZ2File(_compression.BaseStream):
 
@@ -39,7 +47,8 @@ class BZ2File(_compression.BaseStream):
     returned as bytes, and data to be written should be given as bytes.
     """
 
-    def __init__(self, filename, mode="r", buffering=None, compresslevel=9):
+    def __init__(self, filename, mode="r", buffering=None, compresslevel=9,
+                 *, threads=None):
         """Open a bzip2-compressed file.
 
         If filename is a str or bytes object, it gives the name
@@ -58,6 +67,11 @@ class BZ2File(_compression.BaseStream):
 
         If mode is 'r', the input file may be the concatenation of
         multiple compressed streams.
+
+        If threads is given, up to that many threads are used. When
+        writing, the data is split into blocks that are compressed into
+        separate streams concurrently. When reading, the streams of a
+        multi-stream file are decompressed concurrently.
         """
         # This lock must be recursive, so that BufferedIOBase's
         # writelines() does not deadlock.
@@ -73,6 +87,10 @@ class BZ2File(_compression.BaseStream):
         if not (1 <= compresslevel <= 9):
             raise ValueError("compresslevel must be between 1 and 9")
 
+        if threads is not None and threads < 1:
+            raise ValueError("threads must be a positive integer")
+        self._blocks = None
+
         if mode in ("", "r", "rb"):
             mode = "rb"
             mode_code = _MODE_READ
@@ -102,11 +120,22 @@ class BZ2File(_compression.BaseStream):
             raise TypeError("filename must be a str or bytes object, or a file")
 
         if self._mode == _MODE_READ:
-            raw = _compression.DecompressReader(self._fp,
-                BZ2Decompressor, trailing_error=OSError)
+            if threads is None:
+                raw = _compression.DecompressReader(self._fp,
+                    BZ2Decompressor, trailing_error=OSError)
+            else:
+                fp = self._fp
+                raw = _compression.ParallelDecompressReader(fp,
+                    lambda: _split_streams(fp), _decompress_chunk, threads,
+                    trailing_error=OSError)
             self._buffer = io.BufferedReader(raw)
         else:
             self._pos = 0
+            if threads is not None:
+                self._compressor = None
+                self._blocks = _compression.BlockWriter(self._fp,
+                    functools.partial(compress, compresslevel=compresslevel),
+                    compresslevel * 100000, threads)
 
     def close(self):
         """Flush and close the file.
@@ -120,6 +149,9 @@ class BZ2File(_compression.BaseStream):
             try:
                 if self._mode == _MODE_READ:
                     self._buffer.close()
+                elif self._blocks is not None:
+                    self._blocks.close()
+                    self._blocks = None
                 elif self._mode == _MODE_WRITE:
                     self._fp.write(self._compressor.flush())
                     self._compressor = None
@@ -241,8 +273,11 @@ class BZ2File(_compression.BaseStream):
         """
         with self._lock:
             self._check_can_write()
-            compressed = self._compressor.compress(data)
-            self._fp.write(compressed)
+            if self._blocks is not None:
+                self._blocks.write(data)
+            else:
+                compressed = self._compressor.compress(data)
+                self._fp.write(compressed)
             self._pos += len(data)
             return len(data)
 
@@ -285,8 +320,67 @@ class BZ2File(_compression.BaseStream):
             return self._pos
 
 
+def _split_streams(fp):
+    """Yield pieces of a bzip2 file, split before stream headers if possible.
+
+    A piece may also end in the middle of a stream, if the stream is large
+    or a header could not be found.
+    """
+    buf = b""
+    while True:
+        data = fp.read(_SPLIT_SIZE)
+        if not data:
+            break
+        buf += data
+        start = 0
+        for match in _STREAM_HEADER.finditer(buf, 1):
+            yield buf[start:match.start()]
+            start = match.start()
+        buf = buf[start:]
+        if len(buf) > _SPLIT_SIZE:
+            # No stream header in sight; pass the data on, keeping enough of
+            # it to recognize a header spanning the next read.
+            yield buf[:-9]
+            buf = buf[-9:]
+    if buf:
+        yield buf
+
+
+def _decompress_chunk(data, decompressor=None, max_length=-1):
+    """Decompress a piece of a bzip2 file for ParallelDecompressReader.
+
+    At most max_length bytes are returned if it is nonnegative.  If the
+    piece was not decompressed to the end of a stream, the decompressor
+    to continue with is returned along with the data.  If the piece ends
+    with data that is not a valid stream, False is returned instead.
+    """
+    results = []
+    while True:
+        if decompressor is None:
+            decompressor = BZ2Decompressor()
+            try:
+                res = decompressor.decompress(data, max_length)
+            except OSError:
+                if results:
+                    # Leftover data is not a valid bzip2 stream; ignore it
+                    # and the rest of the file.
+                    return b"".join(results), False
+                raise
+        else:
+            res = decompressor.decompress(data, max_length)
+        results.append(res)
+        if max_length >= 0:
+            max_length -= len(res)
+        if not decompressor.eof:
+            return b"".join(results), decompressor
+        data = decompressor.unused_data
+        decompressor = None
+        if not data:
+            return b"".join(results), None
+
+
 def open(filename, mode="rb", compresslevel=9,
-         encoding=None, errors=None, newline=None):
+         encoding=None, errors=None, newline=None, *, threads=None):
     """Open a bzip2-compressed file in binary or text mode.
 
     The filename argument can be an actual filename (a str or bytes
@@ -297,8 +391,9 @@ def open(filename, mode="rb", compresslevel=9,
     The default mode is "rb", and the default compresslevel is 9.
 
     For binary mode, this function is equivalent to the BZ2File
-    constructor: BZ2File(filename, mode, compresslevel). In this case,
-    the encoding, errors and newline arguments must not be provided.
+    constructor: BZ2File(filename, mode, compresslevel, threads=threads).
+    In this case, the encoding, errors and newline arguments must not be
+    provided.
 
     For text mode, a BZ2File object is created, and wrapped in an
     io.TextIOWrapper instance with the specified encoding, error
@@ -317,7 +412,8 @@ def open(filename, mode="rb", compresslevel=9,
             raise ValueError("Argument 'newline' not supported in binary mode")
 
     bz_mode = mode.replace("t", "")
-    binary_file = BZ2File(filename, bz_mode, compresslevel=compresslevel)
+    binary_file = BZ2File(filename, bz_mode, compresslevel=compresslevel,
+                          threads=threads)
 
     if "t" in mode:
         return io.TextIOWrapper(binary_file, encoding, errors, newline)
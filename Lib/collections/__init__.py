@@ -353,6 +353,11 @@ _field_template = '''\
     {name} = _property(_itemgetter({index:d}), doc='Alias for field number {index:d}')
 '''
 
+try:
+    from _collections import _tuplegetter
+except ImportError:
+    _tuplegetter = lambda index, doc: property(_itemgetter(index), doc=doc)
+
 def namedtuple(typename, field_names, verbose=False, rename=False):
     """Returns a new subclass of tuple with named fields.
 
@@ -410,24 +415,90 @@ def namedtuple(typename, field_names, verbose=False, rename=False):
             raise ValueError('Encountered duplicate field name: %r' % name)
         seen.add(name)
 
-    # Fill-in the class template
-    class_definition = _class_template.format(
+    # Build the class directly rather than exec'ing the whole template:
+    # only __new__ is compiled, the other methods are closures and the
+    # fields are C-level descriptors.
+    num_fields = len(field_names)
+    field_names = tuple(field_names)
+    arg_list = repr(field_names).replace("'", "")[1:-1]
+    repr_fmt = '(' + ', '.join(_repr_template.format(name=name)
+                               for name in field_names) + ')'
+    tuple_new = tuple.__new__
+
+    # Create all the named tuple methods to be added to the class namespace.
+    # Support tracing utilities by setting a value for
+    # frame.f_globals['__name__'] in __new__.
+    namespace = dict(_tuple_new=tuple_new, __name__='namedtuple_%s' % typename)
+    exec('def __new__(_cls, %s): return _tuple_new(_cls, (%s))'
+         % (arg_list, arg_list), namespace)
+    __new__ = namespace['__new__']
+    __new__.__doc__ = 'Create new instance of %s(%s)' % (typename, arg_list)
+
+    @classmethod
+    def _make(cls, iterable):
+        result = tuple_new(cls, iterable)
+        if len(result) != num_fields:
+            raise TypeError('Expected %d arguments, got %d'
+                            % (num_fields, len(result)))
+        return result
+
+    _make.__func__.__doc__ = ('Make a new %s object from a sequence '
+                              'or iterable' % typename)
+
+    def _replace(_self, **kwds):
+        result = _self._make(map(kwds.pop, field_names, _self))
+        if kwds:
+            raise ValueError('Got unexpected field names: %r' % list(kwds))
+        return result
+
+    _replace.__doc__ = ('Return a new %s object replacing specified '
+                        'fields with new values' % typename)
+
+    def __repr__(self):
+        'Return a nicely formatted representation string'
+        return self.__class__.__name__ + repr_fmt % self
+
+    def _asdict(self):
+        'Return a new OrderedDict which maps field names to their values.'
+        return OrderedDict(zip(self._fields, self))
+
+    def __getnewargs__(self):
+        'Return self as a plain tuple.  Used by copy and pickle.'
+        return tuple(self)
+
+    # Modify function metadata to help with introspection and debugging
+    for method in (__new__, _make.__func__, _replace,
+                   __repr__, _asdict, __getnewargs__):
+        method.__qualname__ = '%s.%s' % (typename, method.__name__)
+
+    # Build-up the class namespace dictionary
+    # and use type() to build the result class
+    class_namespace = {
+        '__doc__': '%s(%s)' % (typename, arg_list),
+        '__slots__': (),
+        '_fields': field_names,
+        '__new__': __new__,
+        '_make': _make,
+        '_replace': _replace,
+        '__repr__': __repr__,
+        '_asdict': _asdict,
+        '__getnewargs__': __getnewargs__,
+    }
+    for index, name in enumerate(field_names):
+        doc = 'Alias for field number %d' % index
+        class_namespace[name] = _tuplegetter(index, doc)
+
+    result = type(typename, (tuple,), class_namespace)
+    # The equivalent pure Python class definition, kept for introspection
+    result._source = _class_template.format(
         typename = typename,
-        field_names = tuple(field_names),
-        num_fields = len(field_names),
-        arg_list = repr(tuple(field_names)).replace("'", "")[1:-1],
-        repr_fmt = ', '.join(_repr_template.format(name=name)
-                             for name in field_names),
+        field_names = field_names,
+        num_fields = num_fields,
+        arg_list = arg_list,
+        repr_fmt = repr_fmt[1:-1],
         field_defs = '\n'.join(_field_template.format(index=index, name=name)
                                for index, name in enumerate(field_names))
     )
-
-    # Execute the template string in a temporary namespace and support
-    # tracing utilities by setting a value for frame.f_globals['__name__']
-    namespace = dict(__name__='namedtuple_%s' % typename)
-    exec(class_definition, namespace)
-    result = namespace[typename]
-    result._source = class_definition
     if verbose:
         print(result._source)
 
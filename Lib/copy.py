@@ -251,6 +251,14 @@ def _deepcopy_method(x, memo): # Copy instance methods
     return type(x)(x.__func__, deepcopy(x.__self__, memo))
 _deepcopy_dispatch[types.MethodType] = _deepcopy_method
 
+# The C accelerator copies atomic values and the builtin containers itself
+# and calls back into _py_deepcopy() for all other objects.
+_py_deepcopy = deepcopy
+try:
+    from _copy import deepcopy
+except ImportError:
+    pass
+
 def _keep_alive(x, memo):
     """Keeps a reference to the object x in the memo.
 
@@ -18,7 +18,7 @@ __all__ = ["QUOTE_MINIMAL", "QUOTE_ALL", "QUOTE_NONNUMERIC", "QUOTE_NONE",
            "field_size_limit", "reader", "writer",
            "register_dialect", "get_dialect", "list_dialects", "Sniffer",
            "unregister_dialect", "__version__", "DictReader", "DictWriter",
-           "unix_dialect"]
+           "unix_dialect", "chunk_offsets", "read_chunks"]
 
 class Dialect:
     """Describe a CSV dialect.
@@ -156,6 +156,103 @@ class DictWriter:
     def writerows(self, rowdicts):
         return self.writer.writerows(map(self._dict_to_list, rowdicts))
 
+
+def chunk_offsets(f, chunksize, dialect="excel", **fmtparams):
+    """Split a binary file into chunks of whole records.
+
+    Returns a list of (start, stop) byte offsets of chunks of roughly
+    chunksize bytes, each ending after a newline that is not inside a
+    quoted field.  The file's encoding must be ASCII compatible, and the
+    quote character must only appear in quoted fields, as written by
+    csv.writer.
+    """
+    d = _Dialect(dialect, **fmtparams)
+    if d.escapechar is not None:
+        raise ValueError("cannot split records of a dialect with an "
+                         "escapechar")
+    quote = None
+    if d.quoting != QUOTE_NONE and d.quotechar is not None:
+        quote = d.quotechar.encode("ascii")
+    offsets = [0]
+    target = chunksize
+    base = 0            # file offset of the current block
+    inquote = False     # state at the end of the scanned part
+    f.seek(0)
+    while True:
+        block = f.read(1 << 20)
+        if not block:
+            break
+        n = len(block)
+        i = 0           # index up to which the block has been scanned
+        while target - base < n:
+            start = target - base
+            if start > i:
+                if quote:
+                    inquote ^= block.count(quote, i, start) & 1
+                i = start
+            nl = block.find(b"\n", i)
+            if nl < 0:
+                break
+            if quote:
+                inquote ^= block.count(quote, i, nl) & 1
+            i = nl + 1
+            if inquote:
+                target = base + i
+            else:
+                offsets.append(base + i)
+                target = base + i + chunksize
+        if quote:
+            inquote ^= block.count(quote, i, n) & 1
+        base += n
+        target = max(target, base)
+    if offsets[-1] != base:
+        offsets.append(base)
+    return list(zip(offsets, offsets[1:]))
+
+def _read_chunk(path, start, stop, encoding, dialect, fmtparams,
+                converters, columns, skip_first):
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(stop - start)
+    rdr = reader(StringIO(data.decode(encoding), newline=""), dialect,
+                 **fmtparams)
+    if skip_first:
+        next(rdr, None)
+    return rdr.readbatch(converters=converters, columns=columns)
+
+def read_chunks(path, converters=None, *, columns=False, skip_header=False,
+                chunksize=1 << 26, max_workers=None, encoding="utf-8",
+                dialect="excel", **fmtparams):
+    """Parse a CSV file in chunks, in parallel worker processes.
+
+    Yields the result of reader.readbatch(converters=converters,
+    columns=columns) for each chunk, in file order.  See chunk_offsets()
+    for the restrictions on the file.  The converters must be picklable.
+    If max_workers is 1, the chunks are parsed in this process.
+    """
+    with open(path, "rb") as f:
+        chunks = chunk_offsets(f, chunksize, dialect, **fmtparams)
+    args = [(path, start, stop, encoding, dialect, fmtparams, converters,
+             columns, skip_header and i == 0)
+            for i, (start, stop) in enumerate(chunks)]
+    if max_workers == 1 or len(args) <= 1:
+        for a in args:
+            yield _read_chunk(*a)
+        return
+
+    import collections, os
+    from concurrent.futures import ProcessPoolExecutor
+    # keep a bounded number of parsed chunks in flight
+    window = 2 * (max_workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers) as executor:
+        pending = collections.deque()
+        for a in args:
+            pending.append(executor.submit(_read_chunk, *a))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
 # Guard Sniffer's type checking against builds that exclude complex()
 try:
     complex
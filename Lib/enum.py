@@ -10,6 +10,14 @@ except ImportError:
 
 __all__ = ['EnumMeta', 'Enum', 'IntEnum', 'unique']
 
+try:
+    from _enum import member_getter as _member_getter
+except ImportError:
+    _member_getter = None
+
+# EnumMeta.__call__() has an argument named type
+_type = type
+
 
 def _is_descriptor(obj):
     """Returns True if obj is a descriptor, False otherwise."""
@@ -35,6 +43,41 @@ def _is_sunder(name):
             len(name) > 2)
 
 
+if _member_getter is not None:
+    class _MemberAttribute(_member_getter, DynamicClassAttribute):
+        """DynamicClassAttribute reading a member attribute directly in C."""
+
+        def __new__(cls, attr, fget):
+            return _member_getter.__new__(cls, attr)
+
+        def __init__(self, attr, fget):
+            super().__init__(fget)
+
+        # a new getter, setter or deleter no longer reads attr; fall back
+        # to a plain DynamicClassAttribute
+        def _plain(self):
+            return DynamicClassAttribute(self.fget, self.fset, self.fdel,
+                                         self.__doc__)
+
+        def getter(self, fget):
+            return self._plain().getter(fget)
+
+        def setter(self, fset):
+            return self._plain().setter(fset)
+
+        def deleter(self, fdel):
+            return self._plain().deleter(fdel)
+
+
+def _member_attribute(attr):
+    """Decorator making fget a read-only member attribute returning attr."""
+    def decorator(fget):
+        if _member_getter is None:
+            return DynamicClassAttribute(fget)
+        return _MemberAttribute(attr, fget)
+    return decorator
+
+
 def _make_class_unpicklable(cls):
     """Make the given class un-picklable."""
     def _break_on_call_reduce(self, proto):
@@ -238,7 +281,17 @@ class EnumMeta(type):
 
         """
         if names is None:  # simple value lookup
-            return cls.__new__(cls, value)
+            # fast path for hashable values of existing members; anything
+            # else is handled by Enum.__new__
+            if _type(value) is cls:
+                return value
+            try:
+                member = cls._value2member_map_.get(value)
+            except TypeError:
+                member = None
+            if member is None:
+                return cls.__new__(cls, value)
+            return member
         # otherwise, functional API: we're creating a new Enum type
         return cls._create_(value, names, module=module, qualname=qualname, type=type, start=start)
 
@@ -466,8 +519,9 @@ class Enum(metaclass=EnumMeta):
         # by-value search for a matching enum member
         # see if it's in the reverse mapping (for hashable values)
         try:
-            if value in cls._value2member_map_:
-                return cls._value2member_map_[value]
+            member = cls._value2member_map_.get(value)
+            if member is not None:
+                return member
         except TypeError:
             # not there, now do long search -- O(n) behavior
             for member in cls._member_map_.values():
@@ -517,14 +571,15 @@ class Enum(metaclass=EnumMeta):
     # protection from modification, while still allowing for an enumeration
     # to have members named `name` and `value`.  This works because enumeration
     # members are not set directly on the enum class -- __getattr__ is
-    # used to look them up.
+    # used to look them up.  When the _enum accelerator is available, member
+    # access reads _name_ and _value_ without calling the functions below.
 
-    @DynamicClassAttribute
+    @_member_attribute('_name_')
     def name(self):
         """The name of the Enum member."""
         return self._name_
 
-    @DynamicClassAttribute
+    @_member_attribute('_value_')
     def value(self):
         """The value of the Enum member."""
         return self._value_
@@ -687,19 +687,12 @@ def _find_impl(cls, registry):
             match = t
     return registry.get(match)
 
-def singledispatch(func):
-    """Single-dispatch generic function decorator.
-
-    Transforms a function into a generic function, which can have different
-    behaviours depending upon the type of its first argument. The decorated
-    function acts as the default implementation, and additional
-    implementations can be registered using the register() attribute of the
-    generic function.
-
-    """
-    registry = {}
+def _singledispatch_wrapper(registry, find_impl, get_cache_token):
+    # Dispatch on the class of the first argument with a cache of the
+    # implementations found by find_impl() for the classes seen so far.
+    # Setting wrapper._cache_token to get_cache_token() makes the cache
+    # follow changes of the ABC registrations.
     dispatch_cache = WeakKeyDictionary()
-    cache_token = None
 
     def dispatch(cls):
         """generic_func.dispatch(cls) -> <function implementation>
@@ -708,44 +701,67 @@ def singledispatch(func):
         for the given *cls* registered on *generic_func*.
 
         """
-        nonlocal cache_token
+        cache_token = wrapper._cache_token
         if cache_token is not None:
             current_token = get_cache_token()
             if cache_token != current_token:
                 dispatch_cache.clear()
-                cache_token = current_token
+                wrapper._cache_token = current_token
         try:
             impl = dispatch_cache[cls]
         except KeyError:
             try:
                 impl = registry[cls]
             except KeyError:
-                impl = _find_impl(cls, registry)
+                impl = find_impl(cls, registry)
             dispatch_cache[cls] = impl
         return impl
 
+    def wrapper(*args, **kw):
+        if not args:
+            raise TypeError('singledispatch function requires at least '
+                            '1 positional argument')
+        return dispatch(args[0].__class__)(*args, **kw)
+
+    wrapper.dispatch = dispatch
+    wrapper._clear_cache = dispatch_cache.clear
+    wrapper._cache_token = None
+    return wrapper
+
+try:
+    from _functools import _singledispatch_wrapper
+except ImportError:
+    pass
+
+def singledispatch(func):
+    """Single-dispatch generic function decorator.
+
+    Transforms a function into a generic function, which can have different
+    behaviours depending upon the type of its first argument. The decorated
+    function acts as the default implementation, and additional
+    implementations can be registered using the register() attribute of the
+    generic function.
+
+    """
+    registry = {}
+    wrapper = _singledispatch_wrapper(registry, _find_impl, get_cache_token)
+
     def register(cls, func=None):
         """generic_func.register(cls, func) -> func
 
         Registers a new implementation for the given *cls* on a *generic_func*.
 
         """
-        nonlocal cache_token
         if func is None:
             return lambda f: register(cls, f)
         registry[cls] = func
-        if cache_token is None and hasattr(cls, '__abstractmethods__'):
-            cache_token = get_cache_token()
-        dispatch_cache.clear()
+        if wrapper._cache_token is None and hasattr(cls, '__abstractmethods__'):
+            wrapper._cache_token = get_cache_token()
+        wrapper._clear_cache()
         return func
 
-    def wrapper(*args, **kw):
-        return dispatch(args[0].__class__)(*args, **kw)
-
     registry[object] = func
     wrapper.register = register
-    wrapper.dispatch = dispatch
     wrapper.registry = MappingProxyType(registry)
-    wrapper._clear_cache = dispatch_cache.clear
     update_wrapper(wrapper, func)
     return wrapper
@@ -1,7 +1,9 @@
 """Functions that read and write gzipped files.
 
-The user of the file doesn't have to worry about the compression,
-but random access is not allowed."""
+The user of the file doesn't have to worry about the compression.
+Random access is supported by decompressing from the nearest member
+boundary; files written in blocks (threads argument) can be seeked in
+without decompressing the data before the target offset."""
 
 # based on Andrew Kuchling's minigzip.py distributed with the zlib module
 
@@ -9,6 +11,8 @@ import struct, sys, time, os
 import zlib
 import builtins
 import io
+import bisect
+import functools
 import _compression
 
 __all__ = ["GzipFile", "open", "compress", "decompress"]
@@ -17,8 +21,16 @@ FTEXT, FHCRC, FEXTRA, FNAME, FCOMMENT = 1, 2, 4, 8, 16
 
 READ, WRITE = 1, 2
 
+# Maximum amount of uncompressed data in a block written in threaded mode.
+# Blocks are BGZF members, whose compressed size must fit in 16 bits.
+BLOCK_SIZE = 0xff00
+
+# An empty BGZF block, conventionally used as an end-of-file marker.
+_BGZF_EOF = (b'\037\213\010\004\000\000\000\000\000\377\006\000BC\002\000'
+             b'\033\000\003\000\000\000\000\000\000\000\000\000')
+
 def open(filename, mode="rb", compresslevel=9,
-         encoding=None, errors=None, newline=None):
+         encoding=None, errors=None, newline=None, *, threads=None):
     """Open a gzip-compressed file in binary or text mode.
 
     The filename argument can be an actual filename (a str or bytes object), or
@@ -29,8 +41,8 @@ def open(filename, mode="rb", compresslevel=9,
     "rb", and the default compresslevel is 9.
 
     For binary mode, this function is equivalent to the GzipFile constructor:
-    GzipFile(filename, mode, compresslevel). In this case, the encoding, errors
-    and newline arguments must not be provided.
+    GzipFile(filename, mode, compresslevel, threads=threads). In this case, the
+    encoding, errors and newline arguments must not be provided.
 
     For text mode, a GzipFile object is created, and wrapped in an
     io.TextIOWrapper instance with the specified encoding, error handling
@@ -50,9 +62,11 @@ def open(filename, mode="rb", compresslevel=9,
 
     gz_mode = mode.replace("t", "")
     if isinstance(filename, (str, bytes)):
-        binary_file = GzipFile(filename, gz_mode, compresslevel)
+        binary_file = GzipFile(filename, gz_mode, compresslevel,
+                               threads=threads)
     elif hasattr(filename, "read") or hasattr(filename, "write"):
-        binary_file = GzipFile(None, gz_mode, compresslevel, filename)
+        binary_file = GzipFile(None, gz_mode, compresslevel, filename,
+                               threads=threads)
     else:
         raise TypeError("filename must be a str or bytes object, or a file")
 
@@ -66,6 +80,29 @@ def write32u(output, value):
     # or unsigned.
     output.write(struct.pack("<L", value))
 
+def _bgzf_block_size(extra):
+    """Return the BSIZE value of a BGZF extra field, or None."""
+    pos = 0
+    while pos + 4 <= len(extra):
+        si1, si2, slen = struct.unpack_from("<BBH", extra, pos)
+        if si1 == 66 and si2 == 67 and slen == 2 and pos + 6 <= len(extra):
+            return struct.unpack_from("<H", extra, pos + 4)[0]
+        pos += 4 + slen
+    return None
+
+def _compress_block(data, compresslevel, mtime):
+    """Compress DATA into a complete, self-contained BGZF member."""
+    compressor = zlib.compressobj(compresslevel, zlib.DEFLATED,
+                                  -zlib.MAX_WBITS, zlib.DEF_MEM_LEVEL, 0)
+    cdata = compressor.compress(data) + compressor.flush()
+    # BSIZE is the total member size minus one: an 18 byte header, the
+    # compressed data and an 8 byte trailer.
+    header = struct.pack("<BBBBLBBHBBHH", 0o37, 0o213, 8, FEXTRA, mtime,
+                         0, 255, 6, 66, 67, 2, len(cdata) + 25)
+    trailer = struct.pack("<LL", zlib.crc32(data), len(data) & 0xffffffff)
+    return b"".join((header, cdata, trailer))
+
+
 class _PaddedFile:
     """Minimal read-only file object that prepends a string to the contents
     of an actual file. Shouldn't be used outside of gzip.py, as it lacks
@@ -104,6 +141,12 @@ class _PaddedFile:
         self._buffer = None
         return self.file.seek(off)
 
+    def tell(self):
+        pos = self.file.tell()
+        if self._read is not None:
+            pos -= self._length - self._read
+        return pos
+
     def seekable(self):
         return True  # Allows fast-forwarding even in unseekable streams
 
@@ -120,8 +163,11 @@ class GzipFile(_compression.BaseStream):
     # is passed in
     myfileobj = None
 
+    # _compression.BlockWriter used when writing in threaded mode
+    _blocks = None
+
     def __init__(self, filename=None, mode=None,
-                 compresslevel=9, fileobj=None, mtime=None):
+                 compresslevel=9, fileobj=None, mtime=None, *, threads=None):
         """Constructor for the GzipFile class.
 
         At least one of fileobj and filename must be given a
@@ -153,6 +199,12 @@ class GzipFile(_compression.BaseStream):
         to the last modification time field in the stream when compressing.
         If omitted or None, the current time is used.
 
+        If the threads argument is given when writing, the data is split into
+        blocks of at most BLOCK_SIZE bytes, which are compressed independently
+        by up to that many threads and written as a sequence of BGZF members.
+        Such files can be read by any gzip decompressor, and seeking in them
+        only decompresses the block containing the target offset.
+
         """
 
         if mode and ('t' in mode or 'U' in mode):
@@ -177,18 +229,29 @@ class GzipFile(_compression.BaseStream):
         elif mode.startswith(('w', 'a', 'x')):
             self.mode = WRITE
             self._init_write(filename)
-            self.compress = zlib.compressobj(compresslevel,
-                                             zlib.DEFLATED,
-                                             -zlib.MAX_WBITS,
-                                             zlib.DEF_MEM_LEVEL,
-                                             0)
             self._write_mtime = mtime
+            if threads is None:
+                self.compress = zlib.compressobj(compresslevel,
+                                                 zlib.DEFLATED,
+                                                 -zlib.MAX_WBITS,
+                                                 zlib.DEF_MEM_LEVEL,
+                                                 0)
+            else:
+                if threads < 1:
+                    raise ValueError("threads must be a positive integer")
+                if mtime is None:
+                    mtime = time.time()
+                compress_block = functools.partial(_compress_block,
+                                                   compresslevel=compresslevel,
+                                                   mtime=int(mtime))
+                self._blocks = _compression.BlockWriter(
+                    fileobj, compress_block, BLOCK_SIZE, threads)
         else:
             raise ValueError("Invalid mode: {!r}".format(mode))
 
         self.fileobj = fileobj
 
-        if self.mode == WRITE:
+        if self.mode == WRITE and self._blocks is None:
             self._write_gzip_header()
 
     @property
@@ -259,9 +322,12 @@ class GzipFile(_compression.BaseStream):
             length = data.nbytes
 
         if length > 0:
-            self.fileobj.write(self.compress.compress(data))
+            if self._blocks is not None:
+                self._blocks.write(data)
+            else:
+                self.fileobj.write(self.compress.compress(data))
+                self.crc = zlib.crc32(data, self.crc)
             self.size += length
-            self.crc = zlib.crc32(data, self.crc)
             self.offset += length
 
         return length
@@ -303,7 +369,10 @@ class GzipFile(_compression.BaseStream):
             return
         self.fileobj = None
         try:
-            if self.mode == WRITE:
+            if self._blocks is not None:
+                self._blocks.close()
+                fileobj.write(_BGZF_EOF)
+            elif self.mode == WRITE:
                 fileobj.write(self.compress.flush())
                 write32u(fileobj, self.crc)
                 # self.size may exceed 2GB, or even 4GB
@@ -320,7 +389,10 @@ class GzipFile(_compression.BaseStream):
         self._check_not_closed()
         if self.mode == WRITE:
             # Ensure the compressor's buffer is flushed
-            self.fileobj.write(self.compress.flush(zlib_mode))
+            if self._blocks is not None:
+                self._blocks.flush()
+            else:
+                self.fileobj.write(self.compress.flush(zlib_mode))
             self.fileobj.flush()
 
     def fileno(self):
@@ -379,6 +451,16 @@ class _GzipReader(_compression.DecompressReader):
         # Set flag indicating start of a new member
         self._new_member = True
         self._last_mtime = None
+        # Index of the members seen so far, for seeking.  Parallel lists of
+        # decompressed offsets, compressed offsets and BGZF block sizes (or
+        # None); they always describe a prefix of the members in the file.
+        try:
+            self._indexed = fp.seekable()
+        except AttributeError:
+            self._indexed = False
+        self._member_pos = []
+        self._member_offset = []
+        self._member_bsize = []
 
     def _init_read(self):
         self._crc = zlib.crc32(b"")
@@ -401,6 +483,8 @@ class _GzipReader(_compression.DecompressReader):
         return data
 
     def _read_gzip_header(self):
+        if self._indexed:
+            offset = self._fp.tell()
         magic = self._fp.read(2)
         if magic == b'':
             return False
@@ -413,10 +497,11 @@ class _GzipReader(_compression.DecompressReader):
         if method != 8:
             raise OSError('Unknown compression method')
 
+        bsize = None
         if flag & FEXTRA:
-            # Read & discard the extra field, if present
+            # Read the extra field, if present, only keeping a BGZF block size
             extra_len, = struct.unpack("<H", self._read_exact(2))
-            self._read_exact(extra_len)
+            bsize = _bgzf_block_size(self._read_exact(extra_len))
         if flag & FNAME:
             # Read and discard a null-terminated string containing the filename
             while True:
@@ -431,8 +516,79 @@ class _GzipReader(_compression.DecompressReader):
                     break
         if flag & FHCRC:
             self._read_exact(2)     # Read & discard the 16-bit header CRC
+        if self._indexed and (not self._member_offset or
+                              offset > self._member_offset[-1]):
+            self._add_member(self._pos, offset, bsize)
         return True
 
+    def _add_member(self, pos, offset, bsize):
+        self._member_pos.append(pos)
+        self._member_offset.append(offset)
+        self._member_bsize.append(bsize)
+
+    def _read_block_header(self, offset):
+        """Return the BGZF block size of the member starting at OFFSET.
+
+        Return None if there is no member at OFFSET or it isn't a BGZF block.
+        """
+        fp = self._fp.file
+        fp.seek(offset)
+        header = fp.read(12)
+        if len(header) < 12 or header[:4] != b'\037\213\010\004':
+            return None
+        extra_len, = struct.unpack("<H", header[10:])
+        return _bgzf_block_size(fp.read(extra_len))
+
+    def _extend_index(self, target):
+        """Walk BGZF block headers to index the members up to TARGET.
+
+        This reads only the headers and trailers of the blocks, not their
+        compressed data.
+        """
+        fp = self._fp.file
+        saved = fp.tell()
+        try:
+            if not self._member_offset:
+                bsize = self._read_block_header(0)
+                if bsize is None:
+                    return
+                self._add_member(0, 0, bsize)
+            while self._member_pos[-1] < target:
+                bsize = self._member_bsize[-1]
+                if bsize is None:
+                    break
+                end = self._member_offset[-1] + bsize + 1
+                fp.seek(end - 4)
+                isize = fp.read(4)
+                if len(isize) < 4:
+                    break
+                next_bsize = self._read_block_header(end)
+                if next_bsize is None:
+                    break
+                pos = self._member_pos[-1] + struct.unpack("<L", isize)[0]
+                self._add_member(pos, end, next_bsize)
+        finally:
+            fp.seek(saved)
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset = self._pos + offset
+            whence = io.SEEK_SET
+        if self._indexed and whence == io.SEEK_SET:
+            # Jump to the last member starting at or before offset, instead
+            # of decompressing everything before it.
+            self._extend_index(offset)
+            i = bisect.bisect_right(self._member_pos, offset) - 1
+            if i >= 0 and (offset < self._pos or
+                           self._member_pos[i] > self._pos):
+                self._fp.seek(self._member_offset[i])
+                self._pos = self._member_pos[i]
+                self._eof = False
+                self._new_member = True
+                self._decompressor = self._decomp_factory(
+                    **self._decomp_args)
+        return super().seek(offset, whence)
+
     def read(self, size=-1):
         if size < 0:
             return self.readall()
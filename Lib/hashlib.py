@@ -34,6 +34,9 @@ Hash objects have these methods:
  - copy():      Return a copy (clone) of the hash object. This can be used to
                 efficiently compute the digests of strings that share a common
                 initial substring.
+ - digest_many(iterable): Return a list with the digest of each buffer in
+                iterable, as if computed on a copy of the hash object.  The
+                hash object itself is left unchanged.
 
 For example, to obtain the digest of the string 'Nobody inspects the
 spammish repetition':
@@ -60,7 +63,8 @@ algorithms_guaranteed = set(__always_supported)
 algorithms_available = set(__always_supported)
 
 __all__ = __always_supported + ('new', 'algorithms_guaranteed',
-                                'algorithms_available', 'pbkdf2_hmac')
+                                'algorithms_available', 'pbkdf2_hmac',
+                                'file_digest')
 
 
 __builtin_constructor_cache = {}
@@ -203,6 +207,43 @@ except ImportError:
         return dkey[:dklen]
 
 
+def file_digest(fileobj, digest, *, _bufsize=2**18):
+    """Return a hash object updated with the contents of a file object.
+
+    *fileobj* must be opened for reading in binary mode; io.BytesIO objects
+    are hashed without copying their contents.  *digest* is either a hash
+    algorithm name, as accepted by new(), or a callable returning a new hash
+    object, such as hashlib.sha256.
+
+    The file is read with readinto() into a single reused buffer.  The read
+    system calls release the GIL, and so does update() for large chunks when
+    the hash is implemented by OpenSSL.
+    """
+    if isinstance(digest, str):
+        digestobj = new(digest)
+    else:
+        digestobj = digest()
+
+    if hasattr(fileobj, 'getbuffer'):
+        # io.BytesIO, hash the buffer in place
+        with fileobj.getbuffer() as view:
+            digestobj.update(view)
+        return digestobj
+
+    if not (hasattr(fileobj, 'readinto') and hasattr(fileobj, 'readable')
+            and fileobj.readable()):
+        raise ValueError('%r is not a file object opened for reading '
+                         'in binary mode' % (fileobj,))
+
+    buf = bytearray(_bufsize)
+    view = memoryview(buf)
+    while True:
+        size = fileobj.readinto(buf)
+        if not size:
+            break
+        digestobj.update(view[:size])
+    return digestobj
+
 for __func_name in __always_supported:
     # try them all, some may not work due to the OpenSSL
     # version not supporting that algorithm.
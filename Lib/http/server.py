@@ -93,6 +93,7 @@ import io
 import mimetypes
 import os
 import posixpath
+import re
 import select
 import shutil
 import socket # For gethostbyaddr()
@@ -623,12 +624,33 @@ class SimpleHTTPRequestHandler(BaseHTTPRequestHandler):
 
     server_version = "SimpleHTTP/" + __version__
 
+    # If true, regular files are sent with socket.sendfile() whenever the
+    # response goes straight to the connection's socket.
+    use_sendfile = True
+
+    # Number of bytes of the file returned by send_head() that make up the
+    # response body, or None to send everything up to EOF.
+    _send_count = None
+
+    # Maps (handler class, path) to (st_mtime_ns, content type,
+    # Last-Modified value) for files recently served.
+    _file_info_cache = {}
+    _MAXCACHE = 1000
+
     def do_GET(self):
         """Serve a GET request."""
         f = self.send_head()
         if f:
             try:
-                self.copyfile(f, self.wfile)
+                if self._send_count is None:
+                    self.copyfile(f, self.wfile)
+                elif (getattr(self.copyfile, '__func__', None) is
+                      SimpleHTTPRequestHandler.copyfile):
+                    self.copyfile(f, self.wfile, self._send_count)
+                else:
+                    # copyfile() overridden before it took a count
+                    self.copyfile(_LimitedReader(f, self._send_count),
+                                  self.wfile)
             finally:
                 f.close()
 
@@ -651,6 +673,7 @@ class SimpleHTTPRequestHandler(BaseHTTPRequestHandler):
         """
         path = self.translate_path(self.path)
         f = None
+        self._send_count = None
         if os.path.isdir(path):
             parts = urllib.parse.urlsplit(self.path)
             if not parts.path.endswith('/'):
@@ -669,24 +692,70 @@ class SimpleHTTPRequestHandler(BaseHTTPRequestHandler):
                     break
             else:
                 return self.list_directory(path)
-        ctype = self.guess_type(path)
         try:
             f = open(path, 'rb')
         except OSError:
             self.send_error(HTTPStatus.NOT_FOUND, "File not found")
             return None
         try:
-            self.send_response(HTTPStatus.OK)
-            self.send_header("Content-type", ctype)
             fs = os.fstat(f.fileno())
-            self.send_header("Content-Length", str(fs[6]))
-            self.send_header("Last-Modified", self.date_time_string(fs.st_mtime))
+            ctype, last_modified = self.file_info(path, fs)
+            size = fs.st_size
+            byte_range = None
+            if "Range" in self.headers:
+                byte_range = _parse_range(self.headers["Range"], size)
+            if byte_range is None:
+                self.send_response(HTTPStatus.OK)
+                self.send_header("Content-type", ctype)
+                self.send_header("Content-Length", str(size))
+            else:
+                first, last = byte_range
+                if first >= size:
+                    f.close()
+                    self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+                    self.send_header("Content-Range", "bytes */%d" % size)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return None
+                f.seek(first)
+                self._send_count = last - first + 1
+                self.send_response(HTTPStatus.PARTIAL_CONTENT)
+                self.send_header("Content-type", ctype)
+                self.send_header("Content-Range",
+                                 "bytes %d-%d/%d" % (first, last, size))
+                self.send_header("Content-Length", str(self._send_count))
+            self.send_header("Accept-Ranges", "bytes")
+            self.send_header("Last-Modified", last_modified)
             self.end_headers()
             return f
         except:
             f.close()
             raise
 
+    def file_info(self, path, fs):
+        """Return the content type and Last-Modified value for a file.
+
+        PATH is the file's local path and FS the result of stat() on it.
+        Results are cached per path and recomputed when the file's
+        modification time changes.
+
+        """
+        cache = self._file_info_cache
+        key = (self.__class__, path)
+        try:
+            mtime, ctype, last_modified = cache[key]
+        except KeyError:
+            pass
+        else:
+            if mtime == fs.st_mtime_ns:
+                return ctype, last_modified
+        ctype = self.guess_type(path)
+        last_modified = self.date_time_string(fs.st_mtime)
+        if len(cache) >= self._MAXCACHE:
+            cache.clear()
+        cache[key] = fs.st_mtime_ns, ctype, last_modified
+        return ctype, last_modified
+
     def list_directory(self, path):
         """Helper to produce a directory listing (absent index.html).
 
@@ -775,13 +844,19 @@ class SimpleHTTPRequestHandler(BaseHTTPRequestHandler):
             path += '/'
         return path
 
-    def copyfile(self, source, outputfile):
+    def copyfile(self, source, outputfile, count=None):
         """Copy all data between two file objects.
 
         The SOURCE argument is a file object open for reading
         (or anything with a read() method) and the DESTINATION
         argument is a file object open for writing (or
-        anything with a write() method).
+        anything with a write() method).  If COUNT is given, at
+        most that many bytes are copied from the current position
+        of SOURCE.
+
+        When DESTINATION is the connection's wfile and SOURCE is a
+        real file, the data is sent with socket.sendfile() so that
+        it does not pass through a userspace buffer.
 
         The only reason for overriding this would be to change
         the block size or perhaps to replace newlines by CRLF
@@ -789,7 +864,30 @@ class SimpleHTTPRequestHandler(BaseHTTPRequestHandler):
         to copy binary data as well.
 
         """
-        shutil.copyfileobj(source, outputfile)
+        if self._can_sendfile(source, outputfile):
+            outputfile.flush()
+            self.connection.sendfile(source, source.tell(), count)
+        elif count is None:
+            shutil.copyfileobj(source, outputfile)
+        else:
+            while count > 0:
+                buf = source.read(min(count, 16*1024))
+                if not buf:
+                    break
+                outputfile.write(buf)
+                count -= len(buf)
+
+    def _can_sendfile(self, source, outputfile):
+        if not self.use_sendfile or outputfile is not self.wfile:
+            return False
+        sock = getattr(self, 'connection', None)
+        if not isinstance(sock, socket.socket) or sock.gettimeout() == 0:
+            return False
+        try:
+            source.fileno()
+        except (AttributeError, OSError):
+            return False
+        return 'b' in getattr(source, 'mode', 'b')
 
     def guess_type(self, path):
         """Guess the type of a file.
@@ -826,6 +924,55 @@ class SimpleHTTPRequestHandler(BaseHTTPRequestHandler):
         })
 
 
+class _LimitedReader:
+    """Read at most COUNT bytes from the current position of FILE."""
+
+    def __init__(self, file, count):
+        self.file = file
+        self.remaining = count
+
+    def read(self, size=-1):
+        if size is None or size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+
+def _parse_range(value, size):
+    """Parse the value of a Range header for a resource of SIZE bytes.
+
+    Return a (first, last) tuple of inclusive byte positions, or None if
+    the header is malformed or asks for several ranges, in which case it
+    is ignored and the whole resource is sent.  FIRST is not less than
+    SIZE if the range cannot be satisfied.
+
+    """
+    unit, sep, spec = value.partition('=')
+    if not sep or unit.strip().lower() != 'bytes':
+        return None
+    # Not str.isdigit(), which accepts digits that int() rejects.
+    m = re.fullmatch('([0-9]*)-([0-9]*)', spec.strip())
+    if m is None:
+        return None
+    first, last = m.groups()
+    if not (first or last):
+        return None
+    if not first:
+        # A suffix range: the final LAST bytes of the resource.
+        suffix = int(last)
+        if suffix == 0:
+            return size, size - 1
+        return max(size - suffix, 0), size - 1
+    first = int(first)
+    if not last:
+        return first, size - 1
+    last = int(last)
+    if last < first:
+        return None
+    return first, min(last, size - 1)
+
+
 # Utilities for CGIHTTPRequestHandler
 
 def _url_collapse_path(path):
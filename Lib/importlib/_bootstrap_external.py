@@ -459,7 +459,8 @@ def _validate_bytecode_header(data, source_stats=None, name=None, path=None):
             if _r_long(raw_size) != source_size:
                 raise ImportError('bytecode is stale for {!r}'.format(name),
                                   **exc_details)
-    return data[12:]
+    # A view lets marshal read the code object without copying the data.
+    return memoryview(data)[12:]
 
 
 def _compile_bytecode(data, name=None, bytecode_path=None, source_path=None):
@@ -817,7 +818,11 @@ class SourceFileLoader(FileLoader, SourceLoader):
 
     def path_stats(self, path):
         """Return the metadata for the path."""
-        st = _path_stat(path)
+        st = None
+        if FileFinder.directory_cache is not None:
+            st = FileFinder.directory_cache.stat(path)
+        if st is None:
+            st = _path_stat(path)
         return {'mtime': st.st_mtime, 'size': st.st_size}
 
     def _cache_bytecode(self, source_path, bytecode_path, data):
@@ -1038,6 +1043,8 @@ class PathFinder:
         for finder in sys.path_importer_cache.values():
             if hasattr(finder, 'invalidate_caches'):
                 finder.invalidate_caches()
+        if FileFinder.directory_cache is not None:
+            FileFinder.directory_cache.clear()
 
     @classmethod
     def _path_hooks(cls, path):
@@ -1161,15 +1168,105 @@ class PathFinder:
         return spec.loader
 
 
+class DirectoryCache:
+
+    """Cache of directory snapshots shared by all FileFinder instances.
+
+    Each directory is listed once with os.scandir() and the snapshot then
+    answers the existence and type checks of the finders, and the stat()
+    of the source files of their loaders.  A finder validates the snapshot
+    of a directory with a single stat() of the directory per search, and
+    the snapshot is taken again when the modification time of the
+    directory has changed.
+
+    The scans and stats_avoided attributes count the directories listed
+    and the existence and type checks answered from a snapshot.
+
+    """
+
+    def __init__(self):
+        self._snapshots = {}
+        self.scans = 0
+        self.stats_avoided = 0
+
+    def clear(self, path=None):
+        """Drop the snapshot of path, or all snapshots."""
+        if path is None:
+            self._snapshots.clear()
+        else:
+            self._snapshots.pop(path, None)
+
+    def entries(self, path):
+        """Return a dict mapping the names in the directory to os.DirEntry
+        objects, listing the directory if it has no current snapshot."""
+        try:
+            mtime = _path_stat(path or _os.getcwd()).st_mtime
+        except OSError:
+            mtime = -1
+        snapshot = self._snapshots.get(path)
+        if snapshot is not None and snapshot[0] == mtime:
+            return snapshot[1]
+        try:
+            entries = {entry.name: entry
+                       for entry in _os.scandir(path or _os.getcwd())}
+        except (FileNotFoundError, PermissionError, NotADirectoryError):
+            entries = {}
+        self.scans += 1
+        self._snapshots[path] = mtime, entries
+        return entries
+
+    def _entry(self, path):
+        # The snapshot of the directory is used as is; entries() validates
+        # it.
+        directory, name = _path_split(path)
+        snapshot = self._snapshots.get(directory)
+        if snapshot is None:
+            return None
+        # None makes the caller fall back to stat(), also for names a
+        # case-insensitive file system matched with different casing.
+        return snapshot[1].get(name)
+
+    def isfile(self, path):
+        """Replacement for os.path.isfile using the snapshots."""
+        entry = self._entry(path)
+        if entry is None:
+            return _path_isfile(path)
+        self.stats_avoided += 1
+        return entry.is_file()
+
+    def isdir(self, path):
+        """Replacement for os.path.isdir using the snapshots."""
+        entry = self._entry(path)
+        if entry is None:
+            return _path_isdir(path)
+        self.stats_avoided += 1
+        return entry.is_dir()
+
+    def stat(self, path):
+        """Return the stat result of path cached by its entry in the
+        snapshot of its directory, or None if there is no such entry."""
+        entry = self._entry(path)
+        if entry is None:
+            return None
+        try:
+            return entry.stat()
+        except OSError:
+            return None
+
+
 class FileFinder:
 
     """File-based finder.
 
     Interactions with the file system are cached for performance, being
     refreshed when the directory the finder is handling has been modified.
+    If directory_cache is set to a DirectoryCache, all instances share its
+    directory snapshots instead.
 
     """
 
+    directory_cache = None
+
     def __init__(self, path, *loader_details):
         """Initialize with the path to search on and a variable number of
         2-tuples containing the loader and the file suffixes the loader
@@ -1187,6 +1284,8 @@ class FileFinder:
     def invalidate_caches(self):
         """Invalidate the directory mtime."""
         self._path_mtime = -1
+        if self.directory_cache is not None:
+            self.directory_cache.clear(self.path)
 
     find_module = _find_module_shim
 
@@ -1212,13 +1311,26 @@ class FileFinder:
         package portions. Returns (loader, list-of-portions)."""
         is_namespace = False
         tail_module = fullname.rpartition('.')[2]
-        try:
-            mtime = _path_stat(self.path or _os.getcwd()).st_mtime
-        except OSError:
-            mtime = -1
-        if mtime != self._path_mtime:
-            self._fill_cache()
-            self._path_mtime = mtime
+        directory_cache = self.directory_cache
+        if directory_cache is not None:
+            # The snapshot, validated by the directory's mtime, stands in
+            # for the mtime.
+            entries = directory_cache.entries(self.path)
+            if entries is not self._path_mtime:
+                self._fill_cache(entries)
+                self._path_mtime = entries
+            isfile = directory_cache.isfile
+            isdir = directory_cache.isdir
+        else:
+            try:
+                mtime = _path_stat(self.path or _os.getcwd()).st_mtime
+            except OSError:
+                mtime = -1
+            if mtime != self._path_mtime:
+                self._fill_cache()
+                self._path_mtime = mtime
+            isfile = _path_isfile
+            isdir = _path_isdir
         # tail_module keeps the original casing, for __file__ and friends
         if _relax_case():
             cache = self._relaxed_path_cache
@@ -1229,21 +1341,23 @@ class FileFinder:
         # Check if the module is the name of a directory (and thus a package).
         if cache_module in cache:
             base_path = _path_join(self.path, tail_module)
+            if directory_cache is not None:
+                directory_cache.entries(base_path)
             for suffix, loader_class in self._loaders:
                 init_filename = '__init__' + suffix
                 full_path = _path_join(base_path, init_filename)
-                if _path_isfile(full_path):
+                if isfile(full_path):
                     return self._get_spec(loader_class, fullname, full_path, [base_path], target)
             else:
                 # If a namespace package, return the path if we don't
                 #  find a module in the next section.
-                is_namespace = _path_isdir(base_path)
+                is_namespace = isdir(base_path)
         # Check for a file w/ a proper suffix exists.
         for suffix, loader_class in self._loaders:
             full_path = _path_join(self.path, tail_module + suffix)
             _bootstrap._verbose_message('trying {}', full_path, verbosity=2)
             if cache_module + suffix in cache:
-                if _path_isfile(full_path):
+                if isfile(full_path):
                     return self._get_spec(loader_class, fullname, full_path,
                                           None, target)
         if is_namespace:
@@ -1253,15 +1367,16 @@ class FileFinder:
             return spec
         return None
 
-    def _fill_cache(self):
+    def _fill_cache(self, contents=None):
         """Fill the cache of potential modules and packages for this directory."""
         path = self.path
-        try:
-            contents = _os.listdir(path or _os.getcwd())
-        except (FileNotFoundError, PermissionError, NotADirectoryError):
-            # Directory has either been removed, turned into a file, or made
-            # unreadable.
-            contents = []
+        if contents is None:
+            try:
+                contents = _os.listdir(path or _os.getcwd())
+            except (FileNotFoundError, PermissionError, NotADirectoryError):
+                # Directory has either been removed, turned into a file, or
+                # made unreadable.
+                contents = []
         # We store two cached versions, to handle runtime changes of the
         # PYTHONCASEOK environment variable.
         if not sys.platform.startswith('win'):
@@ -1296,7 +1411,11 @@ class FileFinder:
         """
         def path_hook_for_FileFinder(path):
             """Path hook for importlib.machinery.FileFinder."""
-            if not _path_isdir(path):
+            if cls.directory_cache is not None:
+                is_dir = cls.directory_cache.isdir(path)
+            else:
+                is_dir = _path_isdir(path)
+            if not is_dir:
                 raise ImportError('only directories are supported', path=path)
             return cls(path, *loader_details)
 
@@ -1415,6 +1534,8 @@ def _install(_bootstrap_module):
     _setup(_bootstrap_module)
     supported_loaders = _get_supported_file_loaders()
     sys.path_hooks.extend([FileFinder.path_hook(*supported_loaders)])
+    if 'importcache' in sys._xoptions:
+        FileFinder.directory_cache = DirectoryCache()
     if _os.__name__ == 'nt':
         sys.meta_path.append(WindowsRegistryFinder)
     sys.meta_path.append(PathFinder)
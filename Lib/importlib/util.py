@@ -1,16 +1,19 @@
 """Utility code for constructing importers, etc."""
 from . import abc
 from ._bootstrap import module_from_spec
+from ._bootstrap import _ModuleLockManager
 from ._bootstrap import _resolve_name
 from ._bootstrap import spec_from_loader
 from ._bootstrap import _find_spec
 from ._bootstrap_external import MAGIC_NUMBER
+from ._bootstrap_external import _LoaderBasics
 from ._bootstrap_external import cache_from_source
 from ._bootstrap_external import decode_source
 from ._bootstrap_external import source_from_cache
 from ._bootstrap_external import spec_from_file_location
 
 from contextlib import contextmanager
+import _imp
 import functools
 import sys
 import types
@@ -217,34 +220,52 @@ class _LazyModule(types.ModuleType):
         """Trigger the load of the module and return the attribute."""
         # All module metadata must be garnered from __spec__ in order to avoid
         # using mutated values.
-        # Stop triggering this method.
-        self.__class__ = _Module
-        # Get the original name to make sure no object substitution occurred
-        # in sys.modules.
-        original_name = self.__spec__.name
-        # Figure out exactly what attributes were mutated between the creation
-        # of the module and now.
-        attrs_then = self.__spec__.loader_state
-        attrs_now = self.__dict__
-        attrs_updated = {}
-        for key, value in attrs_now.items():
-            # Code that set the attribute may have kept a reference to the
-            # assigned object, making identity more important than equality.
-            if key not in attrs_then:
-                attrs_updated[key] = value
-            elif id(attrs_now[key]) != id(attrs_then[key]):
-                attrs_updated[key] = value
-        self.__spec__.loader.exec_module(self)
-        # If exec_module() was used directly there is no guarantee the module
-        # object was put into sys.modules.
-        if original_name in sys.modules:
-            if id(self) != id(sys.modules[original_name]):
-                msg = ('module object for {!r} substituted in sys.modules '
-                       'during a lazy load')
-            raise ValueError(msg.format(original_name))
-        # Update after loading since that's what would happen in an eager
-        # loading situation.
-        self.__dict__.update(attrs_updated)
+        __spec__ = object.__getattribute__(self, '__spec__')
+        loader_state = __spec__.loader_state
+        # Take the import lock of the module so that threads accessing the
+        # module concurrently wait for it to be loaded once.
+        _imp.acquire_lock()
+        with _ModuleLockManager(__spec__.name):
+            # The module may have been loaded by another thread while waiting
+            # for the lock, or the module's own code is accessing it while it
+            # is being executed by this thread.
+            if (object.__getattribute__(self, '__class__') is not _LazyModule
+                    or loader_state['is_loading']):
+                return object.__getattribute__(self, attr)
+            loader_state['is_loading'] = True
+            # Get the original name to make sure no object substitution
+            # occurred in sys.modules.
+            original_name = __spec__.name
+            # Figure out exactly what attributes were mutated between the
+            # creation of the module and now.
+            attrs_then = loader_state['__dict__']
+            attrs_now = object.__getattribute__(self, '__dict__')
+            attrs_updated = {}
+            for key, value in attrs_now.items():
+                # Code that set the attribute may have kept a reference to the
+                # assigned object, making identity more important than
+                # equality.
+                if key not in attrs_then:
+                    attrs_updated[key] = value
+                elif id(attrs_now[key]) != id(attrs_then[key]):
+                    attrs_updated[key] = value
+            try:
+                __spec__.loader.exec_module(self)
+            except:
+                loader_state['is_loading'] = False
+                raise
+            # Stop triggering this method.
+            self.__class__ = _Module
+            # If exec_module() was used directly there is no guarantee the
+            # module object was put into sys.modules.
+            if original_name in sys.modules:
+                if id(self) != id(sys.modules[original_name]):
+                    msg = ('module object for {!r} substituted in sys.modules '
+                           'during a lazy load')
+                    raise ValueError(msg.format(original_name))
+            # Update after loading since that's what would happen in an eager
+            # loading situation.
+            attrs_now.update(attrs_updated)
         return getattr(self, attr)
 
     def __delattr__(self, attr):
@@ -263,10 +284,16 @@ class LazyLoader(abc.Loader):
     def __check_eager_loader(loader):
         if not hasattr(loader, 'exec_module'):
             raise TypeError('loader must define exec_module()')
-        elif hasattr(loader.__class__, 'create_module'):
-            if abc.Loader.create_module != loader.__class__.create_module:
+        # Importers such as BuiltinImporter are classes used as loaders,
+        # their create_module() is looked up on the class itself.
+        loader_class = loader if isinstance(loader, type) else loader.__class__
+        create_module = getattr(loader_class, 'create_module', None)
+        if create_module is not None:
+            if create_module not in (
+                    abc.Loader.create_module, _LoaderBasics.create_module):
                 # Only care if create_module() is overridden in a subclass of
-                # importlib.abc.Loader.
+                # importlib.abc.Loader, or of the base class of the source
+                # and bytecode loaders.
                 raise TypeError('loader cannot define create_module()')
 
     @classmethod
@@ -291,5 +318,61 @@ class LazyLoader(abc.Loader):
         # on an object would have triggered the load,
         # e.g. ``module.__spec__.loader = None`` would trigger a load from
         # trying to access module.__spec__.
-        module.__spec__.loader_state = module.__dict__.copy()
+        loader_state = {}
+        loader_state['__dict__'] = module.__dict__.copy()
+        loader_state['is_loading'] = False
+        module.__spec__.loader_state = loader_state
         module.__class__ = _LazyModule
+
+
+class LazyFinder(abc.MetaPathFinder):
+
+    """A meta path finder which makes modules load lazily.
+
+    The modules are found by the finders that follow this one on
+    sys.meta_path, and their loaders are wrapped in LazyLoader. If names is
+    given, only those modules and packages, including their submodules, are
+    made lazy.
+    """
+
+    def __init__(self, names=None):
+        self.names = None if names is None else frozenset(names)
+
+    def _is_lazy(self, fullname):
+        if self.names is None:
+            return True
+        name = fullname
+        while name:
+            if name in self.names:
+                return True
+            name = name.rpartition('.')[0]
+        return False
+
+    def find_spec(self, fullname, path=None, target=None):
+        """Find the spec with the following finders and make it lazy."""
+        if not self._is_lazy(fullname):
+            return None
+        finders = sys.meta_path
+        for i, finder in enumerate(finders):
+            if finder is self:
+                finders = finders[i + 1:]
+                break
+        for finder in finders:
+            find_spec = getattr(finder, 'find_spec', None)
+            if find_spec is None:
+                continue
+            spec = find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        # Built-in and frozen modules are cheap to load and are created by
+        # their loaders, leave them alone.
+        if spec.loader is not None and spec.origin not in ('built-in',
+                                                            'frozen'):
+            try:
+                spec.loader = LazyLoader(spec.loader)
+            except TypeError:
+                # E.g. extension modules, which need create_module().
+                pass
+        return spec
@@ -22,7 +22,10 @@ __all__ = [
 ]
 
 import builtins
+import functools
 import io
+import struct
+from binascii import crc32 as _crc32
 from _lzma import *
 from _lzma import _encode_filter_properties, _decode_filter_properties
 import _compression
@@ -33,6 +36,12 @@ _MODE_READ     = 1
 # Value 2 no longer used
 _MODE_WRITE    = 3
 
+_XZ_MAGIC = b"\xfd7zXZ\0"
+
+# Dictionary sizes used by the compression presets 0-9.
+_PRESET_DICT_SIZES = [1 << 18, 1 << 20, 1 << 21, 1 << 22, 1 << 22,
+                      1 << 23, 1 << 23, 1 << 24, 1 << 25, 1 << 26]
+
 
 class LZMAFile(_compression.BaseStream):
 
@@ -46,7 +55,8 @@ class LZMAFile(_compression.BaseStream):
     """
 
     def __init__(self, filename=None, mode="r", *,
-                 format=None, check=-1, preset=None, filters=None):
+                 format=None, check=-1, preset=None, filters=None,
+                 threads=None):
         """Open an LZMA-compressed file in binary mode.
 
         filename can be either an actual file name (given as a str or
@@ -87,10 +97,21 @@ class LZMAFile(_compression.BaseStream):
         filters (if provided) should be a sequence of dicts. Each dict
         should have an entry for "id" indicating ID of the filter, plus
         additional entries for options to the filter.
+
+        If threads is given, up to that many threads are used. When
+        writing, the data is split into blocks of three times the
+        dictionary size, which are compressed concurrently into separate
+        XZ streams; format must be FORMAT_XZ. When reading an XZ file
+        from a seekable file object, its blocks are located using the
+        stream indexes and decompressed concurrently.
         """
         self._fp = None
         self._closefp = False
         self._mode = _MODE_CLOSED
+        self._blocks = None
+
+        if threads is not None and threads < 1:
+            raise ValueError("threads must be a positive integer")
 
         if mode in ("r", "rb"):
             if check != -1:
@@ -106,8 +127,12 @@ class LZMAFile(_compression.BaseStream):
             if format is None:
                 format = FORMAT_XZ
             mode_code = _MODE_WRITE
-            self._compressor = LZMACompressor(format=format, check=check,
-                                              preset=preset, filters=filters)
+            if threads is None:
+                self._compressor = LZMACompressor(format=format, check=check,
+                                                  preset=preset,
+                                                  filters=filters)
+            elif format != FORMAT_XZ:
+                raise ValueError("threads is only supported with FORMAT_XZ")
             self._pos = 0
         else:
             raise ValueError("Invalid mode: {!r}".format(mode))
@@ -125,9 +150,20 @@ class LZMAFile(_compression.BaseStream):
             raise TypeError("filename must be a str or bytes object, or a file")
 
         if self._mode == _MODE_READ:
-            raw = _compression.DecompressReader(self._fp, LZMADecompressor,
-                trailing_error=LZMAError, format=format, filters=filters)
+            raw = None
+            if threads is not None and format in (FORMAT_AUTO, FORMAT_XZ):
+                raw = _parallel_reader(self._fp, threads)
+            if raw is None:
+                raw = _compression.DecompressReader(self._fp,
+                    LZMADecompressor, trailing_error=LZMAError,
+                    format=format, filters=filters)
             self._buffer = io.BufferedReader(raw)
+        elif threads is not None:
+            compress_block = functools.partial(compress, format=FORMAT_XZ,
+                                               check=check, preset=preset,
+                                               filters=filters)
+            self._blocks = _compression.BlockWriter(self._fp, compress_block,
+                _block_size(preset, filters), threads)
 
     def close(self):
         """Flush and close the file.
@@ -141,6 +177,9 @@ class LZMAFile(_compression.BaseStream):
             if self._mode == _MODE_READ:
                 self._buffer.close()
                 self._buffer = None
+            elif self._blocks is not None:
+                self._blocks.close()
+                self._blocks = None
             elif self._mode == _MODE_WRITE:
                 self._fp.write(self._compressor.flush())
                 self._compressor = None
@@ -227,8 +266,11 @@ class LZMAFile(_compression.BaseStream):
         may not reflect the data written until close() is called.
         """
         self._check_can_write()
-        compressed = self._compressor.compress(data)
-        self._fp.write(compressed)
+        if self._blocks is not None:
+            self._blocks.write(data)
+        else:
+            compressed = self._compressor.compress(data)
+            self._fp.write(compressed)
         self._pos += len(data)
         return len(data)
 
@@ -258,9 +300,152 @@ class LZMAFile(_compression.BaseStream):
         return self._pos
 
 
+def _block_size(preset, filters):
+    """Return the amount of data compressed per stream with threads."""
+    dict_size = None
+    if filters is not None:
+        for spec in filters:
+            if "dict_size" in spec:
+                dict_size = spec["dict_size"]
+            elif "preset" in spec:
+                dict_size = _PRESET_DICT_SIZES[spec["preset"] & 0xf]
+    elif preset is not None:
+        dict_size = _PRESET_DICT_SIZES[preset & 0xf]
+    if dict_size is None:
+        dict_size = _PRESET_DICT_SIZES[PRESET_DEFAULT]
+    return 3 * dict_size
+
+
+def _decode_varint(data, pos):
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+        if shift > 63:
+            raise ValueError("invalid variable-length integer")
+
+
+def _encode_varint(value):
+    result = bytearray()
+    while value >= 0x80:
+        result.append(value & 0x7f | 0x80)
+        value >>= 7
+    result.append(value)
+    return bytes(result)
+
+
+def _read_xz_blocks(fp):
+    """Locate the blocks of a seekable XZ file using its stream indexes.
+
+    Return a list of (offset, unpadded size, uncompressed size, stream
+    flags) tuples in file order, or None if the data from the current
+    position of fp to its end is not a sequence of XZ streams.
+    """
+    start = fp.tell()
+    end = fp.seek(0, io.SEEK_END)
+    blocks = []
+    try:
+        while end > start:
+            if end - start < 24:
+                return None
+            fp.seek(end - 12)
+            footer = fp.read(12)
+            if footer[8:] == b"\0\0\0\0":
+                end -= 4  # Stream padding
+                continue
+            if footer[10:] != b"YZ":
+                return None
+            flags = footer[8:10]
+            backward_size = (struct.unpack("<L", footer[4:8])[0] + 1) * 4
+            index_start = end - 12 - backward_size
+            if index_start < start + 12:
+                return None
+            fp.seek(index_start)
+            index = fp.read(backward_size)
+            if index[:1] != b"\0":
+                return None
+            count, pos = _decode_varint(index, 1)
+            records = []
+            for i in range(count):
+                unpadded, pos = _decode_varint(index, pos)
+                uncompressed, pos = _decode_varint(index, pos)
+                records.append((unpadded, uncompressed))
+            offset = index_start - sum((unpadded + 3) & ~3
+                                       for unpadded, _ in records)
+            stream_start = offset - 12
+            if stream_start < start:
+                return None
+            fp.seek(stream_start)
+            if fp.read(8) != _XZ_MAGIC + flags:
+                return None
+            stream_blocks = []
+            for unpadded, uncompressed in records:
+                stream_blocks.append((offset, unpadded, uncompressed, flags))
+                offset += (unpadded + 3) & ~3
+            blocks[:0] = stream_blocks
+            end = stream_start
+    except (IndexError, ValueError):
+        return None
+    finally:
+        fp.seek(start)
+    return blocks
+
+
+def _xz_block_stream(block, unpadded, uncompressed, flags):
+    """Wrap one block of an XZ stream in a complete XZ stream of its own."""
+    index = b"".join((b"\0", _encode_varint(1), _encode_varint(unpadded),
+                      _encode_varint(uncompressed)))
+    index += bytes(-len(index) % 4)
+    index += struct.pack("<L", _crc32(index))
+    backward = struct.pack("<L", len(index) // 4 - 1) + flags
+    return b"".join((_XZ_MAGIC, flags, struct.pack("<L", _crc32(flags)),
+                     block, index, struct.pack("<L", _crc32(backward)),
+                     backward, b"YZ"))
+
+
+def _decompress_block(data, decompressor=None, max_length=-1):
+    if decompressor is None:
+        decompressor = LZMADecompressor(FORMAT_XZ)
+    result = decompressor.decompress(data, max_length)
+    if decompressor.eof:
+        return result, None
+    if decompressor.needs_input:
+        raise LZMAError("Compressed data ended before the "
+                        "end-of-stream marker was reached")
+    return result, decompressor
+
+
+def _parallel_reader(fp, threads):
+    """Return a ParallelDecompressReader over the blocks of an XZ file.
+
+    Return None if fp is not seekable or does not contain XZ streams.
+    """
+    try:
+        if not fp.seekable():
+            return None
+    except AttributeError:
+        return None
+    blocks = _read_xz_blocks(fp)
+    if not blocks:
+        return None
+
+    def iter_chunks():
+        for offset, unpadded, uncompressed, flags in blocks:
+            fp.seek(offset)
+            yield _xz_block_stream(fp.read((unpadded + 3) & ~3),
+                                   unpadded, uncompressed, flags)
+
+    return _compression.ParallelDecompressReader(fp, iter_chunks,
+                                                 _decompress_block, threads)
+
+
 def open(filename, mode="rb", *,
          format=None, check=-1, preset=None, filters=None,
-         encoding=None, errors=None, newline=None):
+         encoding=None, errors=None, newline=None, threads=None):
     """Open an LZMA-compressed file in binary or text mode.
 
     filename can be either an actual file name (given as a str or bytes
@@ -273,7 +458,7 @@ def open(filename, mode="rb", *,
 
     The format, check, preset and filters arguments specify the
     compression settings, as for LZMACompressor, LZMADecompressor and
-    LZMAFile.
+    LZMAFile. threads is passed on to LZMAFile.
 
     For binary mode, this function is equivalent to the LZMAFile
     constructor: LZMAFile(filename, mode, ...). In this case, the
@@ -297,7 +482,7 @@ def open(filename, mode="rb", *,
 
     lz_mode = mode.replace("t", "")
     binary_file = LZMAFile(filename, lz_mode, format=format, check=check,
-                           preset=preset, filters=filters)
+                           preset=preset, filters=filters, threads=threads)
 
     if "t" in mode:
         return io.TextIOWrapper(binary_file, encoding, errors, newline)
@@ -0,0 +1,264 @@
+# A thread-safe pool of sqlite3 connections for multi-threaded programs.
+
+import contextlib
+import weakref
+from time import monotonic as _time
+try:
+    import threading
+except ImportError:
+    import dummy_threading as threading
+
+from _sqlite3 import connect, OperationalError, ProgrammingError
+
+__all__ = ["ConnectionPool"]
+
+
+def _is_private(database, uri):
+    # Each connection to these databases gets a database of its own.
+    if database in (":memory:", ""):
+        return True
+    if not uri or not database.startswith("file:"):
+        return False
+    path, _, query = database[5:].partition("?")
+    params = dict(param.partition("=")[::2] for param in query.split("&"))
+    if path not in (":memory:", "") and params.get("mode") != "memory":
+        return False
+    return params.get("cache") != "shared"
+
+
+class _ThreadConnection:
+    # Holds the connection of a thread in the pool's thread-local storage,
+    # so that the connection goes back to the pool when the thread exits.
+    __slots__ = ("connection", "__weakref__")
+
+
+class ConnectionPool:
+    """A thread-safe pool of connections to a single database.
+
+    Connections are opened lazily, up to *size* of them, and are handed out
+    either by acquire()/release() or, bound to the calling thread, by
+    thread_connection().  As connections are reused, so are the prepared
+    statements in their statement caches.
+    """
+
+    def __init__(self, database, size=5, *, timeout=None, wal=False,
+                 cached_statements=100, **kwargs):
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        if isinstance(database, str) and _is_private(database,
+                                                     kwargs.get("uri")):
+            raise ValueError("each connection to %r would open a separate "
+                             "database; use a shared cache URI such as "
+                             "'file::memory:?cache=shared'" % (database,))
+        self.database = database
+        self.size = size
+        self.timeout = timeout
+        self.wal = wal
+        self._connect_kwargs = dict(kwargs, cached_statements=cached_statements,
+                                    check_same_thread=False)
+        self._cond = threading.Condition(threading.Lock())
+        self._idle = []
+        self._in_use = set()
+        self._local = threading.local()
+        # finalizers of the _ThreadConnection holders, by connection
+        self._finalizers = {}
+        self._closed = False
+        self._open = 0
+        self._created = 0
+        self._waits = 0
+        self._timeouts = 0
+        # statement cache counters of connections that have been closed
+        self._retired_hits = 0
+        self._retired_misses = 0
+
+    def __repr__(self):
+        return "<%s %r size=%d in_use=%d idle=%d>" % (
+            type(self).__name__, self.database, self.size,
+            len(self._in_use), len(self._idle))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _connect(self):
+        con = connect(self.database, **self._connect_kwargs)
+        try:
+            if self.wal:
+                mode, = con.execute("PRAGMA journal_mode=WAL").fetchone()
+                if mode.lower() not in ("wal", "memory"):
+                    raise OperationalError(
+                        "cannot enable WAL mode on %r" % (self.database,))
+        except:
+            con.close()
+            raise
+        return con
+
+    def acquire(self, timeout=None):
+        """Check a connection out of the pool.
+
+        Blocks for at most *timeout* seconds (the pool's default timeout if
+        None) when all connections are in use, then raises
+        OperationalError.
+        """
+        if timeout is None:
+            timeout = self.timeout
+        with self._cond:
+            endtime = None
+            while True:
+                if self._closed:
+                    raise ProgrammingError("Cannot operate on a closed pool.")
+                if self._idle:
+                    con = self._idle.pop()
+                    self._in_use.add(con)
+                    return con
+                if self._open < self.size:
+                    # reserve the slot, connect outside of the lock
+                    self._open += 1
+                    break
+                if endtime is None:
+                    self._waits += 1
+                    if timeout is not None:
+                        endtime = _time() + timeout
+                remaining = None
+                if timeout is not None:
+                    remaining = endtime - _time()
+                    if remaining <= 0:
+                        self._timeouts += 1
+                        raise OperationalError(
+                            "timed out waiting for a pool connection")
+                self._cond.wait(remaining)
+        try:
+            con = self._connect()
+        except:
+            with self._cond:
+                self._open -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._created += 1
+            self._in_use.add(con)
+        return con
+
+    def release(self, con):
+        """Return a connection checked out with acquire() to the pool.
+
+        An open transaction is rolled back.  Connections that have been
+        closed are dropped from the pool.
+        """
+        self._checkin(con)
+
+    def _release_abandoned(self, con):
+        # The thread holding con exited without releasing it.
+        try:
+            self._checkin(con)
+        except ProgrammingError:
+            pass
+
+    def _checkin(self, con):
+        with self._cond:
+            if con not in self._in_use:
+                raise ProgrammingError("connection does not belong to this pool")
+            self._in_use.remove(con)
+            finalizer = self._finalizers.pop(con, None)
+        if finalizer is not None:
+            # Whichever thread gives con back, the thread it was bound to
+            # must neither return it again nor release it when exiting.
+            info = finalizer.detach()
+            if info is not None:
+                info[0].connection = None
+        keep = not self._closed
+        try:
+            con.total_changes
+            if con.in_transaction:
+                con.rollback()
+        except ProgrammingError:
+            # closed by the caller
+            keep = False
+        with self._cond:
+            if keep and not self._closed:
+                self._idle.append(con)
+            else:
+                self._retire(con)
+            self._cond.notify()
+
+    def _retire(self, con):
+        self._open -= 1
+        try:
+            hits, misses, maxsize, currsize = con.statement_cache_info()
+        except ProgrammingError:
+            pass
+        else:
+            self._retired_hits += hits
+            self._retired_misses += misses
+        con.close()
+
+    @contextlib.contextmanager
+    def connection(self, timeout=None):
+        """Context manager checking out a connection for the with block.
+
+        The transaction is committed if the block succeeds and rolled back
+        otherwise.
+        """
+        con = self.acquire(timeout)
+        try:
+            with con:
+                yield con
+        finally:
+            self.release(con)
+
+    def thread_connection(self, timeout=None):
+        """Return the connection bound to the calling thread.
+
+        The first call from a thread checks a connection out of the pool;
+        later calls from the same thread return it again until it is given
+        back with release(), or until the thread exits.
+        """
+        holder = getattr(self._local, "holder", None)
+        if holder is None or holder.connection is None:
+            holder = _ThreadConnection()
+            con = self.acquire(timeout)
+            finalizer = weakref.finalize(holder, self._release_abandoned, con)
+            finalizer.atexit = False
+            holder.connection = con
+            with self._cond:
+                self._finalizers[con] = finalizer
+            self._local.holder = holder
+        return holder.connection
+
+    def close(self):
+        """Close the idle connections and refuse further checkouts.
+
+        Connections still checked out are closed when they are released.
+        """
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            for con in idle:
+                self._retire(con)
+            self._cond.notify_all()
+
+    def stats(self):
+        """Return a dict of pool and statement cache statistics."""
+        with self._cond:
+            hits = self._retired_hits
+            misses = self._retired_misses
+            for con in self._idle + list(self._in_use):
+                try:
+                    info = con.statement_cache_info()
+                except ProgrammingError:
+                    continue
+                hits += info[0]
+                misses += info[1]
+            return {
+                "size": self.size,
+                "in_use": len(self._in_use),
+                "idle": len(self._idle),
+                "open": self._open,
+                "created": self._created,
+                "waits": self._waits,
+                "timeouts": self._timeouts,
+                "statement_cache_hits": hits,
+                "statement_cache_misses": misses,
+            }
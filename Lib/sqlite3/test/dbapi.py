@@ -21,6 +21,7 @@
 #    misrepresented as being the original software.
 # 3. This notice may not be removed or altered from any source distribution.
 
+import array
 import unittest
 import sqlite3 as sqlite
 try:
@@ -480,6 +481,107 @@ class CursorTests(unittest.TestCase):
         res = self.cu.fetchall()
         self.assertEqual(res, [])
 
+    def CheckExecuteColumns(self):
+        self.cu.execute("delete from test")
+        self.cu.executecolumns("insert into test(id, name, income) values (?, ?, ?)",
+                               [array.array('i', [1, 2, 3]), ["a", "b", None],
+                                array.array('d', [1.5, 2.5, 3.5])])
+        self.assertEqual(self.cu.rowcount, 3)
+        self.assertIsNone(self.cu.lastrowid)
+        self.cu.execute("select id, name, income from test order by id")
+        self.assertEqual(self.cu.fetchall(),
+                         [(1, "a", 1.5), (2, "b", 2.5), (3, None, 3.5)])
+
+    def CheckExecuteColumnsTyped(self):
+        self.cu.execute("delete from test")
+        self.cu.executecolumns("insert into test(id, income) values (?, ?)",
+                               [array.array('q', range(1000)),
+                                memoryview(array.array('f', [0.5] * 1000))])
+        self.assertEqual(self.cu.rowcount, 1000)
+        self.cu.execute("select count(*), sum(id), sum(income) from test")
+        self.assertEqual(self.cu.fetchone(), (1000, 499500, 500.0))
+
+    def CheckExecuteColumnsErrors(self):
+        sql = "insert into test(id, name) values (?, ?)"
+        with self.assertRaises(sqlite.ProgrammingError):
+            self.cu.executecolumns(sql, [[1, 2]])
+        with self.assertRaises(sqlite.ProgrammingError):
+            self.cu.executecolumns(sql, [[10, 11], ["a"]])
+        with self.assertRaises(sqlite.ProgrammingError):
+            self.cu.executecolumns("select ?", [[1]])
+        with self.assertRaises(sqlite.IntegrityError):
+            self.cu.executecolumns(sql, [array.array('i', [10, 10]), ["a", "b"]])
+        with self.assertRaises(TypeError):
+            self.cu.executecolumns(sql, 42)
+        with self.assertRaises(ValueError):
+            self.cu.executecolumns(42, [[1], [2]])
+
+    def CheckFetchColumns(self):
+        self.cu.execute("delete from test")
+        self.cu.executemany("insert into test(id, name, income) values (?, ?, ?)",
+                            [(i, str(i), i / 2) for i in range(10)])
+        self.cu.execute("select id, name, income from test order by id")
+        cols = self.cu.fetchcolumns(4)
+        self.assertEqual(cols, [[0, 1, 2, 3], ["0", "1", "2", "3"],
+                                [0.0, 0.5, 1.0, 1.5]])
+        self.assertEqual(self.cu.fetchone(), (4, "4", 2.0))
+        cols = self.cu.fetchcolumns(typecodes=['q', None, 'd'])
+        self.assertEqual(cols[0], array.array('q', range(5, 10)))
+        self.assertEqual(cols[1], ["5", "6", "7", "8", "9"])
+        self.assertEqual(cols[2], array.array('d', [2.5, 3.0, 3.5, 4.0, 4.5]))
+        self.assertEqual(self.cu.fetchcolumns(typecodes=['q', None, 'd']),
+                         [array.array('q'), [], array.array('d')])
+        self.assertIsNone(self.cu.fetchone())
+
+    def CheckFetchColumnsAllTyped(self):
+        self.cu.execute("delete from test")
+        self.cu.executecolumns("insert into test(id, income) values (?, ?)",
+                               [array.array('q', range(500)),
+                                array.array('q', range(500))])
+        self.cu.execute("select id, income from test order by id")
+        ids, incomes = self.cu.fetchcolumns(200, typecodes="qd")
+        self.assertEqual(ids, array.array('q', range(200)))
+        self.assertEqual(incomes, array.array('d', range(200)))
+        ids, incomes = self.cu.fetchcolumns(typecodes="qd")
+        self.assertEqual(ids, array.array('q', range(200, 500)))
+        self.assertEqual(incomes, array.array('d', range(200, 500)))
+
+    def CheckFetchColumnsWrongType(self):
+        self.cu.execute("delete from test")
+        self.cu.executemany("insert into test(id, name) values (?, ?)",
+                            [(1, "a"), (2, None)])
+        self.cu.execute("select id, name from test order by id")
+        with self.assertRaises(sqlite.ProgrammingError):
+            self.cu.fetchcolumns(typecodes=['q'])
+        with self.assertRaises(ValueError):
+            self.cu.fetchcolumns(typecodes=['q', 'x'])
+        with self.assertRaises(sqlite.DataError):
+            self.cu.fetchcolumns(typecodes=['q', 'q'])
+        # the offending row is still available
+        self.assertEqual(self.cu.fetchone(), (1, "a"))
+
+    def CheckFetchColumnsMixedTypes(self):
+        self.cu.execute("delete from test")
+        self.cu.executemany("insert into test(id, name, income) values (?, ?, ?)",
+                            [(1, "a", 1), (2, "b", 2.5), (3, "c", "x"), (4, "d", 4)])
+        for columns, typecodes in [("id, name, income", ['q', None, 'd']),
+                                   ("id, income", ['q', 'd'])]:
+            self.cu.execute("select %s from test order by id" % columns)
+            # the rows before the offending one are returned
+            cols = self.cu.fetchcolumns(typecodes=typecodes)
+            self.assertEqual(cols[0], array.array('q', [1, 2]))
+            self.assertEqual(cols[-1], array.array('d', [1.0, 2.5]))
+            with self.assertRaises(sqlite.DataError):
+                self.cu.fetchcolumns(typecodes=typecodes)
+            self.assertEqual(self.cu.fetchone()[0], 3)
+            cols = self.cu.fetchcolumns(typecodes=typecodes)
+            self.assertEqual(cols[0], array.array('q', [4]))
+            self.assertEqual(cols[-1], array.array('d', [4.0]))
+
+    def CheckFetchColumnsNoStatement(self):
+        cur = self.cx.cursor()
+        self.assertEqual(cur.fetchcolumns(), [])
+
     def CheckSetinputsizes(self):
         self.cu.setinputsizes([3, 4, 5])
 
@@ -874,11 +976,14 @@ class ClosedCurTests(unittest.TestCase):
         cur = con.cursor()
         cur.close()
 
-        for method_name in ("execute", "executemany", "executescript", "fetchall", "fetchmany", "fetchone"):
+        for method_name in ("execute", "executemany", "executecolumns", "executescript",
+                            "fetchall", "fetchmany", "fetchone", "fetchcolumns"):
             if method_name in ("execute", "executescript"):
                 params = ("select 4 union select 5",)
             elif method_name == "executemany":
                 params = ("insert into foo(bar) values (?)", [(3,), (4,)])
+            elif method_name == "executecolumns":
+                params = ("insert into foo(bar) values (?)", [[3, 4]])
             else:
                 params = []
 
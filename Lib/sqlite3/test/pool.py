@@ -0,0 +1,218 @@
+# pysqlite2/test/pool.py: tests for the connection pool
+
+import os
+import unittest
+import sqlite3 as sqlite
+from sqlite3.pool import ConnectionPool
+try:
+    import threading
+except ImportError:
+    threading = None
+
+from test.support import TESTFN
+from test.support.script_helper import assert_python_ok
+
+class ConnectionPoolTests(unittest.TestCase):
+    def setUp(self):
+        self.pool = ConnectionPool(TESTFN, size=2, timeout=0.1)
+        with self.pool.connection() as con:
+            con.execute("create table test(i)")
+
+    def tearDown(self):
+        self.pool.close()
+        for suffix in ("", "-wal", "-shm"):
+            try:
+                os.unlink(TESTFN + suffix)
+            except OSError:
+                pass
+
+    def CheckReuse(self):
+        con = self.pool.acquire()
+        self.pool.release(con)
+        self.assertIs(self.pool.acquire(), con)
+
+    def CheckConnectionCommits(self):
+        with self.pool.connection() as con:
+            con.execute("insert into test(i) values (1)")
+        with self.pool.connection() as con:
+            self.assertEqual(con.execute("select i from test").fetchall(), [(1,)])
+
+    def CheckConnectionRollsBack(self):
+        with self.assertRaises(ZeroDivisionError):
+            with self.pool.connection() as con:
+                con.execute("insert into test(i) values (1)")
+                1/0
+        with self.pool.connection() as con:
+            self.assertEqual(con.execute("select i from test").fetchall(), [])
+
+    def CheckReleaseRollsBack(self):
+        con = self.pool.acquire()
+        con.execute("insert into test(i) values (1)")
+        self.assertTrue(con.in_transaction)
+        self.pool.release(con)
+        self.assertFalse(con.in_transaction)
+        self.assertEqual(con.execute("select i from test").fetchall(), [])
+
+    def CheckTimeout(self):
+        cons = [self.pool.acquire(), self.pool.acquire()]
+        with self.assertRaises(sqlite.OperationalError):
+            self.pool.acquire()
+        with self.assertRaises(sqlite.OperationalError):
+            self.pool.acquire(timeout=0)
+        self.assertEqual(self.pool.stats()["timeouts"], 2)
+        for con in cons:
+            self.pool.release(con)
+
+    def CheckReleaseForeign(self):
+        con = sqlite.connect(":memory:")
+        with self.assertRaises(sqlite.ProgrammingError):
+            self.pool.release(con)
+        con.close()
+
+    def CheckReleaseClosed(self):
+        con = self.pool.acquire()
+        con.close()
+        self.pool.release(con)
+        self.assertIsNot(self.pool.acquire(), con)
+        self.assertEqual(self.pool.stats()["created"], 2)
+
+    def CheckThreadConnection(self):
+        con = self.pool.thread_connection()
+        self.assertIs(self.pool.thread_connection(), con)
+        self.assertEqual(self.pool.stats()["in_use"], 1)
+        self.pool.release(con)
+        self.assertEqual(self.pool.stats()["in_use"], 0)
+
+    @unittest.skipUnless(threading, 'This test requires threading.')
+    def CheckThreads(self):
+        results = []
+        def run(n):
+            con = self.pool.thread_connection(timeout=10)
+            try:
+                with con:
+                    con.execute("insert into test(i) values (?)", (n,))
+                results.append(con.execute("select count(*) from test").fetchone())
+            finally:
+                self.pool.release(con)
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(results), 8)
+        stats = self.pool.stats()
+        self.assertLessEqual(stats["created"], 2)
+        self.assertEqual(stats["in_use"], 0)
+
+    @unittest.skipUnless(threading, 'This test requires threading.')
+    def CheckThreadExit(self):
+        # the connection of a thread goes back to the pool when it exits
+        cons = []
+        def run():
+            cons.append(self.pool.thread_connection())
+            cons[-1].execute("insert into test(i) values (1)")
+        for i in range(3):
+            t = threading.Thread(target=run)
+            t.start()
+            t.join()
+            self.assertEqual(self.pool.stats()["in_use"], 0)
+        self.assertIs(cons[1], cons[0])
+        self.assertIs(self.pool.acquire(timeout=0), cons[0])
+        self.assertFalse(cons[0].in_transaction)
+
+    @unittest.skipUnless(threading, 'This test requires threading.')
+    def CheckThreadReleasedElsewhere(self):
+        # a thread connection released by another thread is neither
+        # returned again nor released when its thread exits
+        acquired = threading.Event()
+        released = threading.Event()
+        cons = []
+        def run():
+            cons.append(self.pool.thread_connection())
+            acquired.set()
+            released.wait()
+            cons.append(self.pool.thread_connection())
+            self.pool.release(cons[-1])
+        t = threading.Thread(target=run)
+        t.start()
+        acquired.wait()
+        self.pool.release(cons[0])
+        con = self.pool.acquire()
+        self.assertIs(con, cons[0])
+        released.set()
+        t.join()
+        self.assertIsNot(cons[1], con)
+        self.assertEqual(self.pool.stats()["in_use"], 1)
+        self.pool.release(con)
+        self.assertEqual(self.pool.stats()["in_use"], 0)
+
+    def CheckStatementCacheStats(self):
+        for i in range(3):
+            with self.pool.connection() as con:
+                con.execute("select i from test where i = ?", (i,))
+        stats = self.pool.stats()
+        self.assertGreaterEqual(stats["statement_cache_hits"], 2)
+        self.assertGreaterEqual(stats["statement_cache_misses"], 1)
+        self.pool.close()
+        self.assertEqual(self.pool.stats()["statement_cache_hits"],
+                         stats["statement_cache_hits"])
+
+    def CheckWal(self):
+        pool = ConnectionPool(TESTFN, wal=True)
+        with pool.connection() as con:
+            mode, = con.execute("pragma journal_mode").fetchone()
+            self.assertEqual(mode.lower(), "wal")
+        pool.close()
+
+    def CheckClosed(self):
+        self.pool.close()
+        with self.assertRaises(sqlite.ProgrammingError):
+            self.pool.acquire()
+
+    def CheckSize(self):
+        with self.assertRaises(ValueError):
+            ConnectionPool(TESTFN, size=0)
+
+    def CheckPrivateDatabase(self):
+        for database in (":memory:", "", "file::memory:",
+                         "file:x?mode=memory"):
+            with self.assertRaises(ValueError):
+                ConnectionPool(database, uri=True)
+        with self.assertRaises(ValueError):
+            ConnectionPool(":memory:")
+        with ConnectionPool("file::memory:?cache=shared", uri=True,
+                            wal=True) as pool:
+            with pool.connection() as con:
+                con.execute("create table t(i)")
+                other = pool.acquire()
+                other.execute("select * from t")
+                pool.release(other)
+
+    def CheckNotImported(self):
+        # importing sqlite3 doesn't import the pool, nor threading
+        assert_python_ok("-c", "import sys, sqlite3; "
+                         "assert 'sqlite3.pool' not in sys.modules")
+
+class StatementCacheInfoTests(unittest.TestCase):
+    def CheckInfo(self):
+        con = sqlite.connect(":memory:", cached_statements=10)
+        self.assertEqual(con.statement_cache_info(), (0, 0, 10, 0))
+        con.execute("select 1")
+        con.execute("select 1")
+        con.execute("select 2")
+        self.assertEqual(con.statement_cache_info(), (1, 2, 10, 2))
+        con.close()
+        with self.assertRaises(sqlite.ProgrammingError):
+            con.statement_cache_info()
+
+def suite():
+    pool_suite = unittest.makeSuite(ConnectionPoolTests, "Check")
+    info_suite = unittest.makeSuite(StatementCacheInfoTests, "Check")
+    return unittest.TestSuite((pool_suite, info_suite))
+
+def test():
+    runner = unittest.TextTestRunner()
+    runner.run(suite())
+
+if __name__ == "__main__":
+    test()
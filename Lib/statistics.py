@@ -33,6 +33,7 @@ median_low          Low median of data.
 median_high         High median of data.
 median_grouped      Median, or 50th percentile, of grouped data.
 mode                Mode (most common value) of data.
+quantiles           Cut points dividing data into equal groups.
 ==================  =============================================
 
 Calculate the arithmetic mean ("the average") of data:
@@ -85,6 +86,19 @@ second argument to the four "spread" functions to avoid recalculating it:
 2.5
 
 
+Streaming data
+--------------
+
+RunningStats accumulates the count, mean, variance, minimum and maximum of
+a stream of values in constant memory:
+
+>>> stats = RunningStats([2.5, 3.25, 5.5])
+>>> stats.add(11.25)
+>>> stats.update([11.75])
+>>> len(stats), stats.mean(), stats.max()
+(5, 6.85, 11.75)
+
+
 Exceptions
 ----------
 
@@ -95,7 +109,7 @@ A single exception is defined: StatisticsError is a subclass of ValueError.
 __all__ = [ 'StatisticsError',
             'pstdev', 'pvariance', 'stdev', 'variance',
             'median',  'median_low', 'median_high', 'median_grouped',
-            'mean', 'mode',
+            'mean', 'mode', 'quantiles', 'RunningStats',
           ]
 
 
@@ -104,7 +118,7 @@ import math
 
 from fractions import Fraction
 from decimal import Decimal
-from itertools import groupby
+from itertools import groupby, chain
 
 
 
@@ -291,6 +305,103 @@ def _convert(value, T):
             raise
 
 
+def _fast_type(data):
+    """Return int or float if every item of data has exactly that type.
+
+    Otherwise return None.  Data of a single builtin type can take the
+    fast paths below, which give the same results as the general code.
+    """
+    types = set(map(type, data))
+    if len(types) == 1:
+        T = types.pop()
+        if T is int or T is float:
+            return T
+    return None
+
+
+# Number of passes _fsum_exact() makes over the data.
+_FSUM_PASSES = 3
+
+def _fsum_exact(data):
+    """_fsum_exact(floats) -> list of floats, or None
+
+    Return floats whose exact sum is the exact sum of the given floats.
+    math.fsum() returns the correctly rounded sum; summing the data again
+    together with the negated partial results recovers the rounding
+    error, until it is zero.  Most data sums exactly in one or two floats.
+
+    None is returned for infinities, NANs or overflow, and if more than
+    _FSUM_PASSES passes would be needed.
+
+    >>> _fsum_exact([0.25, 0.5, 1.0])
+    [1.75]
+    >>> _fsum_exact([1e100, 1.0, -1e100])
+    [1.0]
+    >>> _fsum_exact([1e16, 1.0])
+    [1e+16, 1.0]
+
+    """
+    partials = []
+    for i in range(_FSUM_PASSES):
+        try:
+            total = math.fsum(chain(data, partials))
+        except (OverflowError, ValueError):
+            return None
+        if not total:
+            return [-x for x in partials]
+        if not math.isfinite(total):
+            return None
+        partials.append(-total)
+    return None
+
+
+def _exact_sum(data, T):
+    """Return the exact sum of a list of ints or floats as a Fraction.
+
+    Return None if the sum can't be computed quickly.
+    """
+    if T is int:
+        return Fraction(sum(data))
+    terms = _fsum_exact(data)
+    if terms is None:
+        return None
+    return sum(map(Fraction, terms), Fraction(0))
+
+
+# Lists with at least this many items are partitioned around pivots taken
+# from a sample by _select() instead of being sorted.
+_SELECT_THRESHOLD = 1000
+
+def _select(data, lo, hi):
+    """Return sorted(data)[lo:hi+1] without necessarily sorting all of data.
+
+    For big lists, two pivots are picked from a sorted sample of the data
+    so that they bracket the wanted order statistics with high probability
+    (the Floyd-Rivest algorithm).  Only the values between the pivots are
+    sorted.  If the pivots miss, or the data isn't totally ordered (NANs),
+    the whole list is sorted.
+
+    >>> _select([5, 1, 4, 2, 3], 1, 2)
+    [2, 3]
+
+    """
+    n = len(data)
+    if n >= _SELECT_THRESHOLD:
+        sample = sorted(data[::int(n ** (1/3))])
+        m = len(sample)
+        margin = 2 * int(m ** 0.5)
+        a = sample[max(lo*m//n - margin, 0)]
+        b = sample[min(hi*m//n + margin, m - 1)]
+        below = len([None for x in data if x < a])
+        middle = [x for x in data if a <= x <= b]
+        if below <= lo and below + len(middle) > hi:
+            above = len([None for x in data if x > b])
+            if below + len(middle) + above == n:
+                middle.sort()
+                return middle[lo - below:hi - below + 1]
+    return sorted(data)[lo:hi + 1]
+
+
 def _counts(data):
     # Generate a table of sorted (value, frequency) pairs.
     table = collections.Counter(iter(data)).most_common()
@@ -328,12 +439,21 @@ def mean(data):
     n = len(data)
     if n < 1:
         raise StatisticsError('mean requires at least one data point')
+    T = _fast_type(data)
+    if T is int:
+        return _convert(Fraction(sum(data), n), T)
+    elif T is float:
+        terms = _fsum_exact(data)
+        if terms is not None:
+            if len(terms) <= 1:
+                # the sum is exact, a single division rounds correctly
+                return sum(terms, 0.0)/n
+            return float(sum(map(Fraction, terms))/n)
     T, total, count = _sum(data)
     assert count == n
     return _convert(total/n, T)
 
 
-# FIXME: investigate ways to calculate medians without sorting? Quickselect?
 def median(data):
     """Return the median (middle value) of numeric data.
 
@@ -347,15 +467,17 @@ def median(data):
     4.0
 
     """
-    data = sorted(data)
+    if not isinstance(data, list):
+        data = list(data)
     n = len(data)
     if n == 0:
         raise StatisticsError("no median for empty data")
     if n%2 == 1:
-        return data[n//2]
+        return _select(data, n//2, n//2)[0]
     else:
         i = n//2
-        return (data[i - 1] + data[i])/2
+        a, b = _select(data, i - 1, i)
+        return (a + b)/2
 
 
 def median_low(data):
@@ -370,14 +492,13 @@ def median_low(data):
     3
 
     """
-    data = sorted(data)
+    if not isinstance(data, list):
+        data = list(data)
     n = len(data)
     if n == 0:
         raise StatisticsError("no median for empty data")
-    if n%2 == 1:
-        return data[n//2]
-    else:
-        return data[n//2 - 1]
+    i = n//2 if n%2 == 1 else n//2 - 1
+    return _select(data, i, i)[0]
 
 
 def median_high(data):
@@ -392,11 +513,12 @@ def median_high(data):
     5
 
     """
-    data = sorted(data)
+    if not isinstance(data, list):
+        data = list(data)
     n = len(data)
     if n == 0:
         raise StatisticsError("no median for empty data")
-    return data[n//2]
+    return _select(data, n//2, n//2)[0]
 
 
 def median_grouped(data, interval=1):
@@ -425,7 +547,8 @@ def median_grouped(data, interval=1):
     This function does not check whether the data points are at least
     ``interval`` apart.
     """
-    data = sorted(data)
+    if not isinstance(data, list):
+        data = list(data)
     n = len(data)
     if n == 0:
         raise StatisticsError("no median for empty data")
@@ -433,7 +556,7 @@ def median_grouped(data, interval=1):
         return data[0]
     # Find the value at the midpoint. Remember this corresponds to the
     # centre of the class interval.
-    x = data[n//2]
+    x = _select(data, n//2, n//2)[0]
     for obj in (x, interval):
         if isinstance(obj, (str, bytes)):
             raise TypeError('expected number but got %r' % obj)
@@ -442,9 +565,10 @@ def median_grouped(data, interval=1):
     except TypeError:
         # Mixed type. For now we just coerce to float.
         L = float(x) - float(interval)/2
-    cf = data.index(x)  # Number of values below the median interval.
-    # FIXME The following line could be more efficient for big lists.
-    f = data.count(x)  # Number of data points in the median interval.
+    # Number of values below the median interval.
+    cf = len([None for y in data if y < x])
+    # Number of data points in the median interval.
+    f = len([None for y in data if y == x])
     return L + interval*(n/2 - cf)/f
 
 
@@ -477,6 +601,61 @@ def mode(data):
         raise StatisticsError('no mode for empty data')
 
 
+def quantiles(data, *, n=4, method='exclusive'):
+    """Divide data into n continuous intervals with equal probability.
+
+    Returns a list of n - 1 cut points separating the intervals.
+
+    Set n to 4 for quartiles (the default), to 10 for deciles or to 100
+    for percentiles:
+
+    >>> quantiles([1, 3, 5, 7, 9, 11])
+    [2.5, 6.0, 9.5]
+    >>> quantiles(range(1, 11), n=10)
+    [1.1, 2.2, 3.3, 4.4, 5.5, 6.6, 7.7, 8.8, 9.9]
+
+    The default method, "exclusive", is for data sampled from a population
+    that can have more extreme values than found in the sample.  Method
+    "inclusive" is for population data, or for samples known to include
+    the most extreme values of the population:
+
+    >>> quantiles([1, 3, 5, 7, 9, 11], method='inclusive')
+    [3.5, 6.0, 8.5]
+
+    The median (n=2) is found by selection, without sorting the data.
+    """
+    if n < 1:
+        raise StatisticsError('n must be at least 1')
+    if not isinstance(data, list):
+        data = list(data)
+    ld = len(data)
+    if ld < 2:
+        raise StatisticsError('must have at least two data points')
+    if method == 'inclusive':
+        m = ld - 1
+        points = []
+        for i in range(1, n):
+            j, delta = divmod(i * m, n)
+            points.append((j, delta))
+    elif method == 'exclusive':
+        m = ld + 1
+        points = []
+        for i in range(1, n):
+            j = i * m // n                      # rescale i to m/n
+            j = 1 if j < 1 else ld-1 if j > ld-1 else j  # clamp to 1 .. ld-1
+            delta = i*m - j*n                   # exact integer math
+            points.append((j - 1, delta))
+    else:
+        raise ValueError('Unknown method: %r' % (method,))
+    if n == 2:
+        pairs = [_select(data, j, j + 1) for j, delta in points]
+    else:
+        data = sorted(data)
+        pairs = [data[j:j + 2] for j, delta in points]
+    return [(a * (n - delta) + b * delta) / n
+            for (a, b), (j, delta) in zip(pairs, points)]
+
+
 # === Measures of spread ===
 
 # See http://mathworld.wolfram.com/Variance.html
@@ -500,6 +679,18 @@ def _ss(data, c=None):
     """
     if c is None:
         c = mean(data)
+    T = _fast_type(data)
+    if T is not None and (type(c) is int or type(c) is float):
+        # Same computation as below with the sums done by _exact_sum().
+        if type(c) is float:
+            T = float
+        deviations = [x - c for x in data]
+        total = _exact_sum([d**2 for d in deviations], T)
+        total2 = _exact_sum(deviations, T)
+        if total is not None and total2 is not None:
+            total -= total2**2/len(data)
+            assert not total < 0, 'negative sum of square deviations: %f' % total
+            return (T, total)
     T, total, count = _sum((x-c)**2 for x in data)
     # The following sum should mathematically equal zero, but due to rounding
     # error may not.
@@ -601,7 +792,6 @@ def pvariance(data, mu=None):
     n = len(data)
     if n < 1:
         raise StatisticsError('pvariance requires at least one data point')
-    ss = _ss(data, mu)
     T, ss = _ss(data, mu)
     return _convert(ss/n, T)
 
@@ -636,3 +826,137 @@ def pstdev(data, mu=None):
         return var.sqrt()
     except AttributeError:
         return math.sqrt(var)
+
+
+# === Streaming statistics ===
+
+class RunningStats:
+    """Running count, mean, variance, minimum and maximum of a data stream.
+
+    Values are added one at a time with ``add`` or from an iterable with
+    ``update``, and are not stored: memory use is constant however many
+    values are seen.  Values are converted to float, and the mean and
+    variance are updated with Welford's numerically stable algorithm.
+
+    >>> stats = RunningStats([2, 4, 4, 4, 5, 5, 7, 9])
+    >>> len(stats), stats.mean(), stats.pstdev()
+    (8, 5.0, 2.0)
+    >>> stats.min(), stats.max()
+    (2.0, 9.0)
+
+    Accumulators fed with different parts of the data can be combined:
+
+    >>> a = RunningStats([2, 4, 4, 4])
+    >>> a.merge(RunningStats([5, 5, 7, 9]))
+    >>> a.pvariance()
+    4.0
+
+    """
+
+    __slots__ = ('_n', '_mean', '_m2', '_min', '_max')
+
+    def __init__(self, data=()):
+        self._n = 0
+        self._mean = 0.0
+        self._m2 = 0.0      # sum of squares of differences from the mean
+        self._min = self._max = None
+        self.update(data)
+
+    def __repr__(self):
+        return '<%s n=%d>' % (type(self).__name__, self._n)
+
+    def __len__(self):
+        return self._n
+
+    def add(self, x):
+        """Add the value x."""
+        x = float(x)
+        n = self._n + 1
+        delta = x - self._mean
+        self._mean += delta/n
+        self._m2 += delta*(x - self._mean)
+        self._n = n
+        if n == 1:
+            self._min = self._max = x
+        elif x < self._min:
+            self._min = x
+        elif x > self._max:
+            self._max = x
+
+    def update(self, data):
+        """Add all the values of the iterable data."""
+        n = self._n
+        mean = self._mean
+        m2 = self._m2
+        lo = self._min
+        hi = self._max
+        for x in map(float, data):
+            n += 1
+            delta = x - mean
+            mean += delta/n
+            m2 += delta*(x - mean)
+            if lo is None:
+                lo = hi = x
+            elif x < lo:
+                lo = x
+            elif x > hi:
+                hi = x
+        self._n = n
+        self._mean = mean
+        self._m2 = m2
+        self._min = lo
+        self._max = hi
+
+    def merge(self, other):
+        """Add the values seen by the RunningStats other."""
+        if not other._n:
+            return
+        if not self._n:
+            self._n, self._mean, self._m2 = other._n, other._mean, other._m2
+            self._min, self._max = other._min, other._max
+            return
+        n = self._n + other._n
+        delta = other._mean - self._mean
+        self._m2 += other._m2 + delta*delta*self._n*other._n/n
+        self._mean += delta*other._n/n
+        self._n = n
+        self._min = min(self._min, other._min)
+        self._max = max(self._max, other._max)
+
+    def mean(self):
+        """Return the arithmetic mean of the values."""
+        if self._n < 1:
+            raise StatisticsError('mean requires at least one data point')
+        return self._mean
+
+    def min(self):
+        """Return the smallest value."""
+        if self._n < 1:
+            raise StatisticsError('min requires at least one data point')
+        return self._min
+
+    def max(self):
+        """Return the largest value."""
+        if self._n < 1:
+            raise StatisticsError('max requires at least one data point')
+        return self._max
+
+    def variance(self):
+        """Return the sample variance of the values."""
+        if self._n < 2:
+            raise StatisticsError('variance requires at least two data points')
+        return max(self._m2, 0.0)/(self._n - 1)
+
+    def pvariance(self):
+        """Return the population variance of the values."""
+        if self._n < 1:
+            raise StatisticsError('pvariance requires at least one data point')
+        return max(self._m2, 0.0)/self._n
+
+    def stdev(self):
+        """Return the sample standard deviation of the values."""
+        return math.sqrt(self.variance())
+
+    def pstdev(self):
+        """Return the population standard deviation of the values."""
+        return math.sqrt(self.pvariance())
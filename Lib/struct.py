@@ -1,7 +1,7 @@
 __all__ = [
     # Functions
     'calcsize', 'pack', 'pack_into', 'unpack', 'unpack_from',
-    'iter_unpack',
+    'iter_unpack', 'unpack_columns', 'pack_columns_into',
 
     # Classes
     'Struct',
@@ -48,6 +48,7 @@ import time
 import struct
 import copy
 import re
+import collections
 
 try:
     import grp, pwd
@@ -228,17 +229,18 @@ def calc_chksums(buf):
     signed_chksum = 256 + sum(struct.unpack_from("148b8x356b", buf))
     return unsigned_chksum, signed_chksum
 
-def copyfileobj(src, dst, length=None, exception=OSError):
+def copyfileobj(src, dst, length=None, exception=OSError, bufsize=None):
     """Copy length bytes from fileobj src to fileobj dst.
-       If length is None, copy the entire content.
+       If length is None, copy the entire content. bufsize is the size
+       of the chunks that are read and written at a time.
     """
+    BUFSIZE = bufsize or 16 * 1024
     if length == 0:
         return
     if length is None:
-        shutil.copyfileobj(src, dst)
+        shutil.copyfileobj(src, dst, BUFSIZE)
         return
 
-    BUFSIZE = 16 * 1024
     blocks, remainder = divmod(length, BUFSIZE)
     for b in range(blocks):
         buf = src.read(BUFSIZE)
@@ -714,6 +716,103 @@ class ExFileObject(io.BufferedReader):
         super().__init__(fileobj)
 #class ExFileObject
 
+def _write_data(targetpath, data):
+    """Write the data of a regular file member to targetpath.
+    """
+    with bltn_open(targetpath, "wb") as target:
+        target.write(data)
+
+class _ExtractPool:
+    """Write the data of regular file members on a pool of threads for
+       TarFile.extractall(). The archive is read sequentially by the
+       calling thread, so this also works on streams. The attributes of
+       the written files are set in batches once their data is complete.
+    """
+
+    maxsize = 16 * 1024 * 1024  # Larger members are extracted directly.
+
+    def __init__(self, tarfile, threads, numeric_owner):
+        from concurrent.futures import ThreadPoolExecutor
+        self.tarfile = tarfile
+        self.numeric_owner = numeric_owner
+        self.executor = ThreadPoolExecutor(threads)
+        self.maxpending = 4 * threads
+        self.pending = collections.deque()  # (future, tarinfo, targetpath)
+        self.done = []                      # (tarinfo, targetpath)
+        self.paths = set()
+
+    def extract(self, tarinfo, path):
+        """Queue tarinfo for extraction below path and return True, or
+           return False if it must be extracted by TarFile.extract().
+        """
+        tarfile = self.tarfile
+        targetpath = os.path.join(path, tarinfo.name)
+        targetpath = targetpath.rstrip("/").replace("/", os.sep)
+        if targetpath in self.paths:
+            self.drain()
+
+        if (not tarinfo.isreg() or tarinfo.sparse is not None or
+                tarinfo.size > self.maxsize or
+                type(tarfile).makefile is not TarFile.makefile):
+            # Links, devices and the like may refer to files that are
+            # still being written. Directories are safe to create.
+            if not tarinfo.isdir():
+                self.drain()
+            return False
+
+        try:
+            upperdirs = os.path.dirname(targetpath)
+            if upperdirs and not os.path.exists(upperdirs):
+                os.makedirs(upperdirs)
+            tarfile._dbg(1, tarinfo.name)
+
+            source = tarfile.fileobj
+            source.seek(tarinfo.offset_data)
+            data = source.read(tarinfo.size)
+            if len(data) < tarinfo.size:
+                raise ReadError("unexpected end of data")
+        except OSError as e:
+            tarfile._handle_fatal_error(e)
+            return True
+
+        future = self.executor.submit(_write_data, targetpath, data)
+        self.pending.append((future, tarinfo, targetpath))
+        self.paths.add(targetpath)
+        while len(self.pending) > self.maxpending:
+            self._complete()
+        return True
+
+    def _complete(self):
+        future, tarinfo, targetpath = self.pending.popleft()
+        try:
+            future.result()
+        except OSError as e:
+            self.tarfile._handle_fatal_error(e)
+        else:
+            self.done.append((tarinfo, targetpath))
+
+    def drain(self):
+        """Wait for all queued members and set their attributes.
+        """
+        tarfile = self.tarfile
+        while self.pending:
+            self._complete()
+        for tarinfo, targetpath in self.done:
+            try:
+                tarfile.chown(tarinfo, targetpath, self.numeric_owner)
+                tarfile.chmod(tarinfo, targetpath)
+                tarfile.utime(tarinfo, targetpath)
+            except OSError as e:
+                tarfile._handle_fatal_error(e)
+            except ExtractError as e:
+                tarfile._handle_nonfatal_error(e)
+        self.done.clear()
+        self.paths.clear()
+
+    def shutdown(self):
+        self.executor.shutdown()
+#class _ExtractPool
+
 #------------------
 # Exported Classes
 #------------------
@@ -1400,6 +1499,9 @@ class TarFile(object):
 
     fileobject = ExFileObject   # The file-object for extractfile().
 
+    copybufsize = 1024 * 1024   # The size of the chunks in which file data
+                                # is copied during extraction.
+
     def __init__(self, name=None, mode="r", fileobj=None, format=None,
             tarinfo=None, dereference=None, ignore_zeros=None, encoding=None,
             errors="surrogateescape", pax_headers=None, debug=None, errorlevel=None):
@@ -1756,6 +1858,65 @@ class TarFile(object):
         """
         return [tarinfo.name for tarinfo in self.getmembers()]
 
+    _index_fields = ("name", "mode", "uid", "gid", "size", "mtime", "chksum",
+                     "linkname", "uname", "gname", "devmajor", "devminor",
+                     "offset", "offset_data", "pax_headers")
+
+    def save_index(self, fileobj):
+        """Write an index of all members of the archive as JSON to the
+           text file object `fileobj'. The index can be passed to
+           load_index() to access the members of the same archive without
+           scanning it again.
+        """
+        import json
+        members = []
+        for tarinfo in self.getmembers():
+            member = {key: getattr(tarinfo, key) for key in self._index_fields}
+            member["type"] = tarinfo.type.decode("latin-1")
+            member["sparse"] = tarinfo.sparse
+            members.append(member)
+        json.dump({"version": 1, "members": members}, fileobj)
+
+    def load_index(self, fileobj):
+        """Read the members of the archive from an index that was written
+           by save_index(). Afterwards, getmember() and extract() seek
+           directly to a member without scanning the archive. A ReadError
+           is raised if the index does not belong to the archive.
+        """
+        import json
+        self._check("r")
+        try:
+            index = json.load(fileobj)
+            if index["version"] != 1:
+                raise ValueError("unsupported index version")
+            members = []
+            for member in index["members"]:
+                tarinfo = self.tarinfo()
+                for key in self._index_fields:
+                    setattr(tarinfo, key, member[key])
+                tarinfo.type = member["type"].encode("latin-1")
+                if member["sparse"] is not None:
+                    tarinfo.sparse = [tuple(s) for s in member["sparse"]]
+                tarinfo.tarfile = self
+                members.append(tarinfo)
+        except (ValueError, KeyError, TypeError) as e:
+            raise ReadError("invalid index: %s" % e) from None
+
+        if self.firstmember is not None:
+            first = self.firstmember
+        elif self.members:
+            first = self.members[0]
+        else:
+            first = None
+        if first is not None and (not members or
+                                  members[0].name != first.name or
+                                  members[0].offset != first.offset or
+                                  members[0].size != first.size):
+            raise ReadError("index does not match the archive")
+        self.members = members
+        self.firstmember = None
+        self._loaded = True
+
     def gettarinfo(self, name=None, arcname=None, fileobj=None):
         """Create a TarInfo object for either the file `name' or the file
            object `fileobj' (using os.fstat on its file descriptor). You can
@@ -1973,28 +2134,48 @@ class TarFile(object):
 
         self.members.append(tarinfo)
 
-    def extractall(self, path=".", members=None, *, numeric_owner=False):
+    def extractall(self, path=".", members=None, *, numeric_owner=False,
+                   threads=None):
         """Extract all members from the archive to the current working
            directory and set owner, modification time and permissions on
            directories afterwards. `path' specifies a different directory
            to extract to. `members' is optional and must be a subset of the
            list returned by getmembers(). If `numeric_owner` is True, only
            the numbers for user/group names are used and not the names.
+           If `threads' is given, the data of regular files is written by
+           a pool of that many threads while the archive is being read,
+           and their attributes are set in batches.
         """
         directories = []
 
         if members is None:
             members = self
 
-        for tarinfo in members:
-            if tarinfo.isdir():
-                # Extract directories with a safe mode.
-                directories.append(tarinfo)
-                tarinfo = copy.copy(tarinfo)
-                tarinfo.mode = 0o700
-            # Do not set_attrs directories, as we will do that further down
-            self.extract(tarinfo, path, set_attrs=not tarinfo.isdir(),
-                         numeric_owner=numeric_owner)
+        if threads is None:
+            pool = None
+        else:
+            self._check("r")
+            if threads < 1:
+                raise ValueError("threads must be a positive integer")
+            pool = _ExtractPool(self, threads, numeric_owner)
+
+        try:
+            for tarinfo in members:
+                if pool is not None and pool.extract(tarinfo, path):
+                    continue
+                if tarinfo.isdir():
+                    # Extract directories with a safe mode.
+                    directories.append(tarinfo)
+                    tarinfo = copy.copy(tarinfo)
+                    tarinfo.mode = 0o700
+                # Do not set_attrs directories, as we will do that further down
+                self.extract(tarinfo, path, set_attrs=not tarinfo.isdir(),
+                             numeric_owner=numeric_owner)
+            if pool is not None:
+                pool.drain()
+        finally:
+            if pool is not None:
+                pool.shutdown()
 
         # Reverse sort directories.
         directories.sort(key=lambda a: a.name)
@@ -2008,10 +2189,7 @@ class TarFile(object):
                 self.utime(tarinfo, dirpath)
                 self.chmod(tarinfo, dirpath)
             except ExtractError as e:
-                if self.errorlevel > 1:
-                    raise
-                else:
-                    self._dbg(1, "tarfile: %s" % e)
+                self._handle_nonfatal_error(e)
 
     def extract(self, member, path="", set_attrs=True, *, numeric_owner=False):
         """Extract a member from the archive to the current working directory,
@@ -2038,18 +2216,29 @@ class TarFile(object):
                                  set_attrs=set_attrs,
                                  numeric_owner=numeric_owner)
         except OSError as e:
-            if self.errorlevel > 0:
-                raise
-            else:
-                if e.filename is None:
-                    self._dbg(1, "tarfile: %s" % e.strerror)
-                else:
-                    self._dbg(1, "tarfile: %s %r" % (e.strerror, e.filename))
+            self._handle_fatal_error(e)
         except ExtractError as e:
-            if self.errorlevel > 1:
-                raise
-            else:
-                self._dbg(1, "tarfile: %s" % e)
+            self._handle_nonfatal_error(e)
+
+    def _handle_fatal_error(self, e):
+        """Handle an OSError raised during extraction according to
+           errorlevel.
+        """
+        if self.errorlevel > 0:
+            raise
+        elif e.filename is None:
+            self._dbg(1, "tarfile: %s" % e.strerror)
+        else:
+            self._dbg(1, "tarfile: %s %r" % (e.strerror, e.filename))
+
+    def _handle_nonfatal_error(self, e):
+        """Handle an ExtractError raised during extraction according to
+           errorlevel.
+        """
+        if self.errorlevel > 1:
+            raise
+        else:
+            self._dbg(1, "tarfile: %s" % e)
 
     def extractfile(self, member):
         """Extract a member from the archive as a file object. `member' may be
@@ -2150,9 +2339,11 @@ class TarFile(object):
             if tarinfo.sparse is not None:
                 for offset, size in tarinfo.sparse:
                     target.seek(offset)
-                    copyfileobj(source, target, size, ReadError)
+                    copyfileobj(source, target, size, ReadError,
+                                self.copybufsize)
             else:
-                copyfileobj(source, target, tarinfo.size, ReadError)
+                copyfileobj(source, target, tarinfo.size, ReadError,
+                            self.copybufsize)
             target.seek(tarinfo.size)
             target.truncate()
 
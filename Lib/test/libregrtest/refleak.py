@@ -6,6 +6,18 @@ import warnings
 from inspect import isabstract
 from test import support
 
+try:
+    from _abc import _get_dump
+except ImportError:
+    import weakref
+
+    def _get_dump(cls):
+        # Reimplement _get_dump() for the pure Python implementation of
+        # the abc module (Lib/_py_abc.py)
+        registry_weakrefs = set(weakref.ref(obj) for obj in cls._abc_registry)
+        return (registry_weakrefs, cls._abc_cache,
+                cls._abc_negative_cache, cls._abc_negative_cache_version)
+
 
 try:
     MAXFD = os.sysconf("SC_OPEN_MAX")
@@ -66,7 +78,7 @@ def dash_R(the_module, test, indirect_test, huntrleaks):
         if not isabstract(abc):
             continue
         for obj in abc.__subclasses__() + [abc]:
-            abcs[obj] = obj._abc_registry.copy()
+            abcs[obj] = _get_dump(obj)[0]
 
     nwarmup, ntracked, fname = huntrleaks
     fname = os.path.join(support.SAVEDCWD, fname)
@@ -126,7 +138,6 @@ def dash_R_cleanup(fs, ps, pic, zdc, abcs):
     import urllib.parse, urllib.request, mimetypes, doctest
     import struct, filecmp, collections.abc
     from distutils.dir_util import _path_created
-    from weakref import WeakSet
 
     # Clear the warnings registry, so they can be displayed again
     for mod in sys.modules.values():
@@ -155,9 +166,13 @@ def dash_R_cleanup(fs, ps, pic, zdc, abcs):
         if not isabstract(abc):
             continue
         for obj in abc.__subclasses__() + [abc]:
-            obj._abc_registry = abcs.get(obj, WeakSet()).copy()
-            obj._abc_cache.clear()
-            obj._abc_negative_cache.clear()
+            obj._abc_registry_clear()
+            obj._abc_caches_clear()
+            for ref in abcs.get(obj, set()):
+                subclass = ref()
+                if subclass is not None:
+                    obj.register(subclass)
+            obj._abc_caches_clear()
 
     # Flush standard output, so that buffered data is sent to the OS and
     # associated Python objects are reclaimed.
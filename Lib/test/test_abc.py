@@ -3,14 +3,20 @@
 
 """Unit tests for abc.py."""
 
+import gc
+import io
 import unittest
 from test import support
+from test.support import import_fresh_module
 
 import abc
 from inspect import isabstract
 
+py_abc = import_fresh_module('abc', blocked=['_abc'])
+c_abc = import_fresh_module('abc', fresh=['_abc'])
 
-class TestLegacyAPI(unittest.TestCase):
+
+class TestLegacyAPI:
 
     def test_abstractproperty_basics(self):
         @abc.abstractproperty
@@ -19,7 +25,7 @@ class TestLegacyAPI(unittest.TestCase):
         def bar(self): pass
         self.assertFalse(hasattr(bar, "__isabstractmethod__"))
 
-        class C(metaclass=abc.ABCMeta):
+        class C(metaclass=self.abc.ABCMeta):
             @abc.abstractproperty
             def foo(self): return 3
         self.assertRaises(TypeError, C)
@@ -37,7 +43,7 @@ class TestLegacyAPI(unittest.TestCase):
         def bar(cls): pass
         self.assertFalse(getattr(bar, "__isabstractmethod__", False))
 
-        class C(metaclass=abc.ABCMeta):
+        class C(metaclass=self.abc.ABCMeta):
             @abc.abstractclassmethod
             def foo(cls): return cls.__name__
         self.assertRaises(TypeError, C)
@@ -55,7 +61,7 @@ class TestLegacyAPI(unittest.TestCase):
         def bar(): pass
         self.assertFalse(getattr(bar, "__isabstractmethod__", False))
 
-        class C(metaclass=abc.ABCMeta):
+        class C(metaclass=self.abc.ABCMeta):
             @abc.abstractstaticmethod
             def foo(): return 3
         self.assertRaises(TypeError, C)
@@ -66,15 +72,15 @@ class TestLegacyAPI(unittest.TestCase):
         self.assertEqual(D().foo(), 4)
 
 
-class TestABC(unittest.TestCase):
+class TestABC:
 
     def test_ABC_helper(self):
         # create an ABC using the helper class and perform basic checks
-        class C(abc.ABC):
+        class C(self.abc.ABC):
             @classmethod
             @abc.abstractmethod
             def foo(cls): return cls.__name__
-        self.assertEqual(type(C), abc.ABCMeta)
+        self.assertEqual(type(C), self.abc.ABCMeta)
         self.assertRaises(TypeError, C)
         class D(C):
             @classmethod
@@ -96,7 +102,7 @@ class TestABC(unittest.TestCase):
         def bar(self): pass
         self.assertFalse(getattr(bar, "__isabstractmethod__", False))
 
-        class C(metaclass=abc.ABCMeta):
+        class C(metaclass=self.abc.ABCMeta):
             @property
             @abc.abstractmethod
             def foo(self): return 3
@@ -115,7 +121,7 @@ class TestABC(unittest.TestCase):
         def bar(cls): pass
         self.assertFalse(getattr(bar, "__isabstractmethod__", False))
 
-        class C(metaclass=abc.ABCMeta):
+        class C(metaclass=self.abc.ABCMeta):
             @classmethod
             @abc.abstractmethod
             def foo(cls): return cls.__name__
@@ -135,7 +141,7 @@ class TestABC(unittest.TestCase):
         def bar(): pass
         self.assertFalse(getattr(bar, "__isabstractmethod__", False))
 
-        class C(metaclass=abc.ABCMeta):
+        class C(metaclass=self.abc.ABCMeta):
             @staticmethod
             @abc.abstractmethod
             def foo(): return 3
@@ -150,7 +156,7 @@ class TestABC(unittest.TestCase):
         for abstractthing in [abc.abstractmethod, abc.abstractproperty,
                               abc.abstractclassmethod,
                               abc.abstractstaticmethod]:
-            class C(metaclass=abc.ABCMeta):
+            class C(metaclass=self.abc.ABCMeta):
                 @abstractthing
                 def foo(self): pass  # abstract
                 def bar(self): pass  # concrete
@@ -175,7 +181,7 @@ class TestABC(unittest.TestCase):
             self.assertTrue(isabstract(F))
 
     def test_descriptors_with_abstractmethod(self):
-        class C(metaclass=abc.ABCMeta):
+        class C(metaclass=self.abc.ABCMeta):
             @property
             @abc.abstractmethod
             def foo(self): return 3
@@ -218,7 +224,7 @@ class TestABC(unittest.TestCase):
             def __isabstractmethod__(self):
                 return (getattr(self._fget, '__isabstractmethod__', False)
                         or getattr(self._fset, '__isabstractmethod__', False))
-        class C(metaclass=abc.ABCMeta):
+        class C(metaclass=self.abc.ABCMeta):
             @Descriptor
             @abc.abstractmethod
             def foo(self): return 3
@@ -237,7 +243,7 @@ class TestABC(unittest.TestCase):
 
     def test_metaclass_abc(self):
         # Metaclasses can be ABCs, too.
-        class A(metaclass=abc.ABCMeta):
+        class A(metaclass=self.abc.ABCMeta):
             @abc.abstractmethod
             def x(self):
                 pass
@@ -249,7 +255,7 @@ class TestABC(unittest.TestCase):
             pass
 
     def test_registration_basics(self):
-        class A(metaclass=abc.ABCMeta):
+        class A(metaclass=self.abc.ABCMeta):
             pass
         class B(object):
             pass
@@ -273,7 +279,7 @@ class TestABC(unittest.TestCase):
         self.assertIsInstance(c, (A,))
 
     def test_register_as_class_deco(self):
-        class A(metaclass=abc.ABCMeta):
+        class A(metaclass=self.abc.ABCMeta):
             pass
         @A.register
         class B(object):
@@ -294,22 +300,22 @@ class TestABC(unittest.TestCase):
         self.assertIs(C, A.register(C))
 
     def test_isinstance_invalidation(self):
-        class A(metaclass=abc.ABCMeta):
+        class A(metaclass=self.abc.ABCMeta):
             pass
         class B:
             pass
         b = B()
         self.assertFalse(isinstance(b, A))
         self.assertFalse(isinstance(b, (A,)))
-        token_old = abc.get_cache_token()
+        token_old = self.abc.get_cache_token()
         A.register(B)
-        token_new = abc.get_cache_token()
+        token_new = self.abc.get_cache_token()
         self.assertNotEqual(token_old, token_new)
         self.assertTrue(isinstance(b, A))
         self.assertTrue(isinstance(b, (A,)))
 
     def test_registration_builtins(self):
-        class A(metaclass=abc.ABCMeta):
+        class A(metaclass=self.abc.ABCMeta):
             pass
         A.register(int)
         self.assertIsInstance(42, A)
@@ -328,7 +334,7 @@ class TestABC(unittest.TestCase):
         self.assertTrue(issubclass(C, (A,)))
 
     def test_registration_edge_cases(self):
-        class A(metaclass=abc.ABCMeta):
+        class A(metaclass=self.abc.ABCMeta):
             pass
         A.register(A)  # should pass silently
         class A1(A):
@@ -345,23 +351,23 @@ class TestABC(unittest.TestCase):
         C.register(B)  # ok
 
     def test_register_non_class(self):
-        class A(metaclass=abc.ABCMeta):
+        class A(metaclass=self.abc.ABCMeta):
             pass
         self.assertRaisesRegex(TypeError, "Can only register classes",
                                A.register, 4)
 
     def test_registration_transitiveness(self):
-        class A(metaclass=abc.ABCMeta):
+        class A(metaclass=self.abc.ABCMeta):
             pass
         self.assertTrue(issubclass(A, A))
         self.assertTrue(issubclass(A, (A,)))
-        class B(metaclass=abc.ABCMeta):
+        class B(metaclass=self.abc.ABCMeta):
             pass
         self.assertFalse(issubclass(A, B))
         self.assertFalse(issubclass(A, (B,)))
         self.assertFalse(issubclass(B, A))
         self.assertFalse(issubclass(B, (A,)))
-        class C(metaclass=abc.ABCMeta):
+        class C(metaclass=self.abc.ABCMeta):
             pass
         A.register(B)
         class B1(B):
@@ -390,7 +396,7 @@ class TestABC(unittest.TestCase):
         self.assertIsInstance(42, (A,))
 
     def test_all_new_methods_are_called(self):
-        class A(metaclass=abc.ABCMeta):
+        class A(metaclass=self.abc.ABCMeta):
             pass
         class B(object):
             counter = 0
@@ -403,6 +409,88 @@ class TestABC(unittest.TestCase):
         C()
         self.assertEqual(B.counter, 1)
 
+    def test_cache_does_not_keep_classes_alive(self):
+        class A(metaclass=self.abc.ABCMeta):
+            pass
+        class B:
+            pass
+        class C:
+            pass
+        A.register(B)
+        self.assertTrue(issubclass(B, A))
+        self.assertFalse(issubclass(C, A))
+        self.assertFalse(isinstance(C(), A))
+        del B, C
+        gc.collect()
+        dump = io.StringIO()
+        A._dump_registry(dump)
+        self.assertNotIn("<weakref at", dump.getvalue())
+        self.assertNotIn("WeakSet([<", dump.getvalue())
+
+    def test_registry_and_caches_clear(self):
+        class A(metaclass=self.abc.ABCMeta):
+            pass
+        class B:
+            pass
+        class C:
+            pass
+        A.register(B)
+        self.assertTrue(issubclass(B, A))
+        self.assertFalse(issubclass(C, A))
+        A._abc_registry_clear()
+        self.assertTrue(issubclass(B, A))  # still cached
+        A._abc_caches_clear()
+        self.assertFalse(issubclass(B, A))
+        A.register(C)
+        self.assertTrue(issubclass(C, A))
+
+    def test_unweakrefable_instances(self):
+        class A(metaclass=self.abc.ABCMeta):
+            pass
+        # a class whose __class__ can't be weakly referenced
+        class X:
+            __class__ = 42
+        with self.assertRaises(TypeError):
+            isinstance(X(), A)
+        self.assertFalse(issubclass(int, A))
+        with self.assertRaises(TypeError):
+            A.register(42)
+
+    def test_subclasshook_result(self):
+        class A(metaclass=self.abc.ABCMeta):
+            @classmethod
+            def __subclasshook__(cls, C):
+                return 1
+        with self.assertRaises(AssertionError):
+            issubclass(int, A)
+
+
+class TestLegacyAPIPython(TestLegacyAPI, unittest.TestCase):
+    abc = py_abc
+
+
+@unittest.skipUnless(c_abc, 'requires _abc')
+class TestLegacyAPIC(TestLegacyAPI, unittest.TestCase):
+    abc = c_abc
+
+
+class TestABCPython(TestABC, unittest.TestCase):
+    abc = py_abc
+
+
+@unittest.skipUnless(c_abc, 'requires _abc')
+class TestABCC(TestABC, unittest.TestCase):
+    abc = c_abc
+
+    def test_abc_impl(self):
+        class A(metaclass=self.abc.ABCMeta):
+            pass
+        self.assertIn('_abc_impl', A.__dict__)
+        self.assertNotIn('_abc_registry', A.__dict__)
+        A._abc_impl = None
+        with self.assertRaises(TypeError):
+            isinstance(1, A)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -232,6 +232,21 @@ class BaseTest:
             b.byteswap()
             self.assertEqual(a, b)
 
+    def test_byteswap_byteorder(self):
+        a = array.array(self.typecode, self.example)
+        b = array.array(self.typecode, self.example)
+        b.byteswap(sys.byteorder)
+        self.assertEqual(a.tobytes(), b.tobytes())
+        other = 'big' if sys.byteorder == 'little' else 'little'
+        b.byteswap(other)
+        c = array.array(self.typecode, self.example)
+        c.byteswap()
+        self.assertEqual(b.tobytes(), c.tobytes())
+        b.byteswap(other)
+        self.assertEqual(a.tobytes(), b.tobytes())
+        self.assertRaises(ValueError, b.byteswap, 'middle')
+        self.assertRaises(TypeError, b.byteswap, b'big')
+
     def test_copy(self):
         import copy
         a = array.array(self.typecode, self.example)
@@ -1094,6 +1109,20 @@ class UnicodeTest(StringTest, unittest.TestCase):
         self.assertRaises(ValueError, a.tounicode)
         self.assertRaises(ValueError, str, a)
 
+class UnicodeNumericTest(unittest.TestCase):
+
+    def test_numeric_methods(self):
+        a = array.array('u', 'abc')
+        for name in ('sum', 'min', 'max'):
+            self.assertRaises(TypeError, getattr(a, name))
+        for name in ('add', 'subtract', 'multiply', 'divide'):
+            self.assertRaises(TypeError, getattr(a, name), a)
+        self.assertRaises(TypeError, a.compare, '<', a)
+        self.assertRaises(TypeError, a.astype, 'i')
+        self.assertRaises(TypeError, array.array('i', [1]).astype, 'u')
+        self.assertEqual(a.astype('u'), a)
+
+
 class NumberTest(BaseTest):
 
     def test_extslice(self):
@@ -1168,6 +1197,51 @@ class NumberTest(BaseTest):
         self.assertRaises(OverflowError, array.array, self.typecode, [upper+1])
         self.assertRaises(OverflowError, a.__setitem__, 0, upper+1)
 
+    def check_integer_operations(self, lower, upper):
+        # method to be used by subclasses
+        a = array.array(self.typecode, [lower, upper, upper, lower])
+        self.assertEqual(a.sum(), 2 * (lower + upper))
+        self.assertEqual(a.min(), lower)
+        self.assertEqual(a.max(), upper)
+        self.assertEqual(array.array(self.typecode, [upper] * 100).sum(),
+                         100 * upper)
+        # results out of range raise OverflowError and leave a unchanged
+        b = a[:]
+        self.assertRaises(OverflowError, a.add, 1)
+        self.assertRaises(OverflowError, a.subtract, 1)
+        self.assertRaises(OverflowError, a.multiply, 2)
+        self.assertRaises(OverflowError, a.add, upper + 1)
+        self.assertEqual(a, b)
+        self.assertRaises(TypeError, a.divide, 1)
+        self.assertRaises(TypeError, a.add, 1.0)
+        c = array.array(self.typecode, [upper])
+        c.subtract(upper)
+        c.add(lower)
+        self.assertEqual(c, array.array(self.typecode, [lower]))
+        self.assertEqual(a.compare('==', upper),
+                         array.array('B', [0, 1, 1, 0]))
+        self.assertEqual(a.compare('<', upper + 1),
+                         array.array('B', [1, 1, 1, 1]))
+        # floats are compared exactly, also beyond 2**53
+        for x in (float(upper), float(lower), upper - 0.5, lower + 0.5):
+            for op, func in (('<', operator.lt), ('==', operator.eq),
+                             ('>=', operator.ge)):
+                self.assertEqual(a.compare(op, x),
+                                 array.array('B', [func(y, x) for y in a]))
+        # conversions
+        for typecode in typecodes:
+            if typecode in 'fdu':
+                continue
+            target = array.array(typecode)
+            tbits = target.itemsize * 8
+            tlower, tupper = ((-1 << (tbits - 1), (1 << (tbits - 1)) - 1)
+                              if typecode.islower() else (0, (1 << tbits) - 1))
+            if tlower <= lower and upper <= tupper:
+                self.assertEqual(list(a.astype(typecode)), list(a))
+            else:
+                self.assertRaises(OverflowError, a.astype, typecode)
+        self.assertEqual(a.astype('d'), array.array('d', map(float, a)))
+
     def test_subclassing(self):
         typecode = self.typecode
         class ExaggeratingArray(array.array):
@@ -1192,6 +1266,76 @@ class NumberTest(BaseTest):
         b = array.array(self.typecode, a)
         self.assertEqual(a, b)
 
+    def test_reductions(self):
+        a = array.array(self.typecode, self.example)
+        self.assertEqual(a.sum(), sum(self.example))
+        self.assertIs(type(a.sum()), type(a[0]))
+        self.assertEqual(a.min(), min(a))
+        self.assertEqual(a.max(), max(a))
+        a = array.array(self.typecode)
+        self.assertEqual(a.sum(), 0)
+        self.assertRaises(ValueError, a.min)
+        self.assertRaises(ValueError, a.max)
+
+    def test_arithmetic(self):
+        a = array.array(self.typecode, range(10))
+        b = array.array(self.typecode, range(10, 0, -1))
+        a.add(b)
+        self.assertEqual(a, array.array(self.typecode, [10] * 10))
+        a.subtract(b)
+        self.assertEqual(a, array.array(self.typecode, range(10)))
+        a.multiply(2)
+        self.assertEqual(a, array.array(self.typecode, range(0, 20, 2)))
+        a.subtract(a)
+        self.assertEqual(a, array.array(self.typecode, [0] * 10))
+        a.add(3)
+        self.assertEqual(a, array.array(self.typecode, [3] * 10))
+        a.multiply(b)
+        self.assertEqual(a, array.array(self.typecode, range(30, 0, -3)))
+        e = array.array(self.typecode)
+        e.add(1)
+        self.assertEqual(e, array.array(self.typecode))
+
+    def test_arithmetic_errors(self):
+        a = array.array(self.typecode, range(10))
+        self.assertRaises(ValueError, a.add, a[:5])
+        other = 'd' if a.typecode != 'd' else 'f'
+        self.assertRaises(TypeError, a.add, array.array(other, range(10)))
+        self.assertRaises(TypeError, a.add, 'x')
+        self.assertRaises(TypeError, a.add)
+        self.assertEqual(a, array.array(self.typecode, range(10)))
+
+    def test_compare(self):
+        a = array.array(self.typecode, range(10))
+        b = array.array(self.typecode, range(10, 0, -1))
+        ops = {'<': operator.lt, '<=': operator.le, '==': operator.eq,
+               '!=': operator.ne, '>': operator.gt, '>=': operator.ge}
+        for op, func in ops.items():
+            mask = a.compare(op, 5)
+            self.assertEqual(mask, array.array('B', [func(x, 5) for x in a]))
+            mask = a.compare(op, b)
+            self.assertEqual(mask,
+                             array.array('B', [func(x, y) for x, y in zip(a, b)]))
+            for y in (5.0, 5.5, -0.5, -1e300, float('inf'), float('nan')):
+                mask = a.compare(op, y)
+                self.assertEqual(mask,
+                                 array.array('B', [func(x, y) for x in a]))
+        self.assertEqual(a.compare('<', 1 << 200), array.array('B', [1] * 10))
+        self.assertEqual(a.compare('>', -1 << 200), array.array('B', [1] * 10))
+        self.assertRaises(ValueError, a.compare, '<>', 5)
+        self.assertRaises(ValueError, a.compare, '<', a[:5])
+
+    def test_astype(self):
+        a = array.array(self.typecode, self.example)
+        for typecode in ('d', 'f', self.typecode):
+            b = a.astype(typecode)
+            self.assertEqual(b, array.array(typecode, a))
+            self.assertIsNot(b, a)
+        self.assertRaises(ValueError, a.astype, 'x')
+        self.assertRaises(TypeError, a.astype, 'dd')
+        self.assertEqual(ArraySubclass(self.typecode).astype(self.typecode),
+                         array.array(self.typecode))
+
 class SignedNumberTest(NumberTest):
     example = [-1, 0, 1, 42, 0x7f]
     smallerexample = [-1, 0, 1, 42, 0x7e]
@@ -1204,6 +1348,15 @@ class SignedNumberTest(NumberTest):
         upper = int(pow(2, a.itemsize * 8 - 1)) - 1
         self.check_overflow(lower, upper)
 
+    def test_integer_operations(self):
+        a = array.array(self.typecode)
+        lower = -1 * int(pow(2, a.itemsize * 8 - 1))
+        upper = int(pow(2, a.itemsize * 8 - 1)) - 1
+        self.check_integer_operations(lower, upper)
+        a = array.array(self.typecode, [-5, 3])
+        a.add(-10)
+        self.assertEqual(a, array.array(self.typecode, [-15, -7]))
+
 class UnsignedNumberTest(NumberTest):
     example = [0, 1, 17, 23, 42, 0xff]
     smallerexample = [0, 1, 17, 23, 42, 0xfe]
@@ -1216,6 +1369,14 @@ class UnsignedNumberTest(NumberTest):
         upper = int(pow(2, a.itemsize * 8)) - 1
         self.check_overflow(lower, upper)
 
+    def test_integer_operations(self):
+        a = array.array(self.typecode)
+        lower = 0
+        upper = int(pow(2, a.itemsize * 8)) - 1
+        self.check_integer_operations(lower, upper)
+        a = array.array(self.typecode, [5])
+        self.assertRaises(OverflowError, a.add, -1)
+
     def test_bytes_extend(self):
         s = bytes(self.example)
 
@@ -1301,6 +1462,32 @@ class FPTest(NumberTest):
             b.byteswap()
             self.assertEqual(a, b)
 
+    def test_float_operations(self):
+        a = array.array(self.typecode, [1.0, -2.5, 4.0])
+        a.divide(2)
+        self.assertEqual(a, array.array(self.typecode, [0.5, -1.25, 2.0]))
+        a.divide(array.array(self.typecode, [0.5, 1.0, -4.0]))
+        self.assertEqual(a, array.array(self.typecode, [1.0, -1.25, -0.5]))
+        self.assertRaises(ZeroDivisionError, a.divide, 0)
+        self.assertRaises(ZeroDivisionError, a.divide,
+                          array.array(self.typecode, [1.0, 0.0, 1.0]))
+        self.assertEqual(a, array.array(self.typecode, [1.0, -1.25, -0.5]))
+        a.multiply(0.5)
+        self.assertEqual(a, array.array(self.typecode, [0.5, -0.625, -0.25]))
+        self.assertRaises(TypeError, a.astype, 'i')
+
+    def test_nan(self):
+        nan = float('nan')
+        a = array.array(self.typecode, [1.0, nan, -2.0])
+        self.assertEqual(a.compare('==', a), array.array('B', [1, 0, 1]))
+        self.assertEqual(a.compare('!=', a), array.array('B', [0, 1, 0]))
+        self.assertEqual(a.compare('<', nan), array.array('B', [0, 0, 0]))
+        self.assertTrue(math.isnan(a.sum()))
+        # same as the builtin functions
+        self.assertEqual(a.min(), -2.0)
+        self.assertEqual(a.max(), 1.0)
+        self.assertTrue(math.isnan(a[1:].max()))
+
 class FloatTest(FPTest, unittest.TestCase):
     typecode = 'f'
     minitemsize = 4
@@ -246,6 +246,111 @@ class BZ2FileTest(BaseTest):
         # This call will deadlock if the above call failed to release the lock.
         self.assertRaises(ValueError, bz2f.readlines)
 
+    @support.reap_threads
+    def testWriteThreads(self):
+        data = self.BIG_TEXT * 3
+        outputs = []
+        for threads in 1, 2:
+            with BytesIO() as dst:
+                with BZ2File(dst, "w", compresslevel=1, threads=threads) as f:
+                    f.write(data[:1000])
+                    f.write(data[1000:])
+                    self.assertEqual(f.tell(), len(data))
+                outputs.append(dst.getvalue())
+        self.assertEqual(outputs[0], outputs[1])
+        # One stream per 100 kB block of input.
+        self.assertEqual(outputs[0].count(b"BZh11AY&SY"),
+                         -(-len(data) // 100000))
+        self.assertEqual(self.decompress(outputs[0]), data)
+
+    @support.reap_threads
+    def testReadThreads(self):
+        self.createTempFile(streams=5)
+        with BZ2File(self.filename, threads=2) as bz2f:
+            self.assertEqual(bz2f.read(), self.TEXT * 5)
+            bz2f.seek(len(self.TEXT) + 5)
+            self.assertEqual(bz2f.read(10), self.TEXT[5:15])
+
+    @support.reap_threads
+    def testReadThreadsTrailingJunk(self):
+        self.createTempFile(streams=5, suffix=self.BAD_DATA)
+        with BZ2File(self.filename, threads=2) as bz2f:
+            self.assertEqual(bz2f.read(), self.TEXT * 5)
+
+    @support.reap_threads
+    def testReadThreadsTrailingJunkChunk(self):
+        # Junk starting a piece of its own is ignored like by the serial
+        # reader, as is everything after it.
+        junks = [b"BZh91AY&SY" + self.BAD_DATA,
+                 b"BZh91AY&SY" + self.BAD_DATA + self.DATA,
+                 self.BAD_DATA * 100 + self.DATA]
+        saved_split_size = bz2._SPLIT_SIZE
+        bz2._SPLIT_SIZE = 100
+        try:
+            for junk in junks:
+                data = self.DATA * 3 + junk
+                with BZ2File(BytesIO(data)) as bz2f:
+                    expected = bz2f.read()
+                self.assertEqual(expected, self.TEXT * 3)
+                with BZ2File(BytesIO(data), threads=2) as bz2f:
+                    self.assertEqual(bz2f.read(), expected)
+                    bz2f.seek(0)
+                    self.assertEqual(bz2f.read(), expected)
+        finally:
+            bz2._SPLIT_SIZE = saved_split_size
+
+    @support.reap_threads
+    def testReadThreadsBadFile(self):
+        self.createTempFile(streams=0, suffix=self.BAD_DATA)
+        with BZ2File(self.filename, threads=2) as bz2f:
+            self.assertRaises(OSError, bz2f.read)
+
+    @support.reap_threads
+    def testReadThreadsTruncated(self):
+        with BZ2File(BytesIO(self.DATA * 2 + self.DATA[:-10]),
+                     threads=2) as bz2f:
+            self.assertRaises(EOFError, bz2f.read)
+
+    @support.reap_threads
+    def testReadThreadsLargeStream(self):
+        # Streams larger than the split size are decompressed sequentially.
+        data = self.BIG_DATA + self.DATA + self.BIG_DATA
+        saved_split_size = bz2._SPLIT_SIZE
+        bz2._SPLIT_SIZE = 1000
+        try:
+            with BZ2File(BytesIO(data), threads=3) as bz2f:
+                self.assertEqual(bz2f.read(),
+                                 self.BIG_TEXT + self.TEXT + self.BIG_TEXT)
+        finally:
+            bz2._SPLIT_SIZE = saved_split_size
+
+    @support.reap_threads
+    def testReadThreadsMemoryBounded(self):
+        # Large streams are not decompressed in full ahead of the reader.
+        tracemalloc = support.import_module("tracemalloc")
+        size = 16 * 1024 * 1024
+        data = bz2.compress(bytes(size)) * 2
+        with support.swap_attr(_compression, "PARALLEL_BUFFER_SIZE",
+                               2 * 1024 * 1024):
+            tracemalloc.start()
+            try:
+                total = 0
+                with BZ2File(BytesIO(data), threads=2) as bz2f:
+                    while True:
+                        chunk = bz2f.read(64 * 1024)
+                        if not chunk:
+                            break
+                        self.assertFalse(chunk.strip(b"\0"))
+                        total += len(chunk)
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+        self.assertEqual(total, 2 * size)
+        self.assertLess(peak, 8 * 1024 * 1024)
+
+    def testThreadsBadArgs(self):
+        self.assertRaises(ValueError, BZ2File, BytesIO(), "w", threads=0)
+
     def testWrite(self):
         with BZ2File(self.filename, "w") as bz2f:
             self.assertRaises(TypeError, bz2f.write)
@@ -423,6 +423,47 @@ class TestNamedTuple(unittest.TestCase):
         a.w = 5
         self.assertEqual(a.__dict__, {'w': 5})
 
+    def test_field_descriptor(self):
+        Point = namedtuple('Point', 'x y')
+        p = Point(11, 22)
+        self.assertEqual(Point.x.__get__(p), 11)
+        self.assertIs(Point.x.__get__(None, Point), Point.x)
+        self.assertEqual(Point.y.__doc__, 'Alias for field number 1')
+        with self.assertRaises(AttributeError):
+            p.x = 33
+        with self.assertRaises(AttributeError):
+            del p.x
+        self.assertRaises(TypeError, Point.x.__get__, [11, 22])
+        self.assertRaises(TypeError, Point.x.__get__, 'ab')
+        self.assertEqual(Point.y.__get__((1, 2, 3)), 2)
+        self.assertRaises(IndexError, Point.y.__get__, (1,))
+        self.assertEqual(Point.x.__get__(tuple.__new__(Point, (1, 2))), 1)
+        # the descriptors themselves pickle and copy
+        for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+            d = pickle.loads(pickle.dumps(Point.y, proto))
+            self.assertEqual(d.__get__(p), 22)
+            self.assertEqual(d.__doc__, Point.y.__doc__)
+        self.assertEqual(copy.copy(Point.x).__get__(p), 11)
+
+    def test_methods_introspection(self):
+        Point = namedtuple('Point', 'x y')
+        self.assertEqual(Point.__new__.__qualname__, 'Point.__new__')
+        self.assertEqual(Point._make.__qualname__, 'Point._make')
+        self.assertEqual(Point._replace.__qualname__, 'Point._replace')
+        self.assertEqual(Point.__new__.__doc__,
+                         'Create new instance of Point(x, y)')
+        self.assertEqual(list(inspect.signature(Point).parameters),
+                         ['x', 'y'])
+        self.assertEqual(Point.__new__.__globals__['__name__'],
+                         'namedtuple_Point')
+
+    def test_no_exec_of_source(self):
+        # building the class must not depend on the _source template
+        with support.swap_attr(collections, '_class_template', '{typename}'):
+            Point = namedtuple('Point', 'x y')
+        self.assertEqual(Point._source, 'Point')
+        self.assertEqual(Point(1, 2).y, 2)
+
 
 ################################################################################
 ### Abstract Base Classes
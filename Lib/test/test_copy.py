@@ -7,6 +7,10 @@ import abc
 from operator import le, lt, ge, gt, eq, ne
 
 import unittest
+from test import support
+
+py_copy = support.import_fresh_module('copy', blocked=['_copy'])
+c_copy = support.import_fresh_module('copy', fresh=['_copy'])
 
 order_comparisons = le, lt, ge, gt
 equality_comparisons = eq, ne
@@ -828,6 +832,118 @@ class TestCopy(unittest.TestCase):
         g.b()
 
 
+class DeepcopyTests:
+
+    def test_nested(self):
+        x = {'a': [1, 2.5, 'x', None, (3, 4)], 'b': {'c': [{}], 1: (b'',)},
+             (1, 2): [[], [[]]]}
+        y = self.copy.deepcopy(x)
+        self.assertEqual(y, x)
+        self.assertIsNot(y['a'], x['a'])
+        self.assertIs(y['a'][4], x['a'][4])
+        self.assertIsNot(y['b']['c'][0], x['b']['c'][0])
+        self.assertIs(y['b'][1], x['b'][1])
+
+    def test_shared_and_recursive(self):
+        shared = [1]
+        x = [shared, (shared,), {'s': shared}]
+        x.append(x)
+        y = self.copy.deepcopy(x)
+        self.assertIs(y[0], y[1][0])
+        self.assertIs(y[0], y[2]['s'])
+        self.assertIs(y[3], y)
+        self.assertIsNot(y[0], shared)
+
+    def test_memo(self):
+        shared = [1]
+        x = [shared, [2]]
+        memo = {id(shared): shared}
+        y = self.copy.deepcopy(x, memo)
+        self.assertIs(y[0], shared)
+        self.assertIs(memo[id(x)], y)
+        self.assertIs(memo[id(x[1])], y[1])
+        self.assertEqual(len(memo[id(memo)]), 2)
+        # a copy in the same memo returns the same objects
+        self.assertIs(self.copy.deepcopy(x, memo), y)
+
+    def test_memo_mapping(self):
+        class Memo(dict):
+            pass
+        memo = Memo()
+        x = [[1], ([2],)]
+        y = self.copy.deepcopy(x, memo=memo)
+        self.assertEqual(y, x)
+        self.assertIs(memo[id(x)], y)
+
+    def test_subclasses(self):
+        class L(list):
+            pass
+        class D(dict):
+            pass
+        class I(int):
+            pass
+        x = [L([[1]]), D(a=[2]), I(3)]
+        y = self.copy.deepcopy(x)
+        self.assertEqual(y, x)
+        self.assertIs(type(y[0]), L)
+        self.assertIsNot(y[0][0], x[0][0])
+        self.assertIs(type(y[1]), D)
+        self.assertIs(type(y[2]), I)
+
+    def test_callbacks(self):
+        class C:
+            def __init__(self, items):
+                self.items = items
+            def __deepcopy__(self, memo):
+                return C(self.copy.deepcopy(self.items, memo))
+        C.copy = self.copy
+        items = [1, [2]]
+        x = [items, C(items)]
+        y = self.copy.deepcopy(x)
+        self.assertIs(y[1].items, y[0])
+
+    def test_dict_changed_size(self):
+        class Grow:
+            def __deepcopy__(self, memo):
+                x['new'] = 1
+                return self
+        x = {'a': Grow(), 'b': 2}
+        self.assertRaises(RuntimeError, self.copy.deepcopy, x)
+
+    def test_list_changed_size(self):
+        class Grow:
+            def __deepcopy__(self, memo):
+                x.append(len(x))
+                return self
+        g = Grow()
+        x = [g, 0]
+        y = self.copy.deepcopy(x)
+        self.assertEqual(y, [g, 0, 2])
+
+    def test_deep_nesting(self):
+        x = []
+        for i in range(100000):
+            x = [x]
+        self.assertRaises(RecursionError, self.copy.deepcopy, x)
+
+
+class PyDeepcopyTests(DeepcopyTests, unittest.TestCase):
+    copy = py_copy
+
+@unittest.skipUnless(c_copy, 'requires the C _copy module')
+class CDeepcopyTests(DeepcopyTests, unittest.TestCase):
+    copy = c_copy
+
+    def test_accelerated(self):
+        self.assertIsNot(self.copy.deepcopy, self.copy._py_deepcopy)
+
+    def test_atomic_not_looked_up(self):
+        # immutable atomic values bypass the memo
+        x = 'spam'
+        memo = {id(x): 'eggs'}
+        self.assertIs(self.copy.deepcopy(x, memo), x)
+
+
 def global_foo(x, y): return x+y
 
 if __name__ == "__main__":
@@ -1097,6 +1097,118 @@ class TestUnicode(unittest.TestCase):
             self.assertEqual(fileobj.read(), expected)
 
 
+class TestReadBatch(unittest.TestCase):
+    def test_rows(self):
+        r = csv.reader(StringIO("a,1\r\nb,2\r\nc,3\r\n"))
+        self.assertEqual(r.readbatch(2), [["a", "1"], ["b", "2"]])
+        self.assertEqual(r.line_num, 2)
+        self.assertEqual(r.readbatch(), [["c", "3"]])
+        self.assertEqual(r.readbatch(), [])
+
+    def test_converters(self):
+        r = csv.reader(StringIO('1,2.5,x,y\r\n -3 ,"1e3",z\r\n'))
+        rows = r.readbatch(converters=[int, float, str.upper])
+        self.assertEqual(rows, [[1, 2.5, "X", "y"], [-3, 1000.0, "Z"]])
+        self.assertIs(type(rows[0][0]), int)
+        self.assertIs(type(rows[0][1]), float)
+        r = csv.reader(StringIO("nan,inf,%s\r\n" % ("9" * 100)))
+        row, = r.readbatch(converters=[float, float, int])
+        self.assertNotEqual(row[0], row[0])
+        self.assertEqual(row[1:], [float("inf"), int("9" * 100)])
+
+    def test_converters_non_ascii(self):
+        # non-ASCII digits go through int() and float() themselves
+        r = csv.reader(StringIO("\u0661\u0662,\u0663.5\r\n"))
+        self.assertEqual(r.readbatch(converters=[int, float]), [[12, 3.5]])
+
+    def test_converter_errors(self):
+        r = csv.reader(StringIO("1,x\r\n"))
+        with self.assertRaisesRegex(ValueError, "could not convert"):
+            r.readbatch(converters=[int, float])
+        r = csv.reader(StringIO("\r\n"))
+        with self.assertRaises(TypeError):
+            r.readbatch(converters=42)
+        r = csv.reader(StringIO("1\r\n"))
+        with self.assertRaises(ZeroDivisionError):
+            r.readbatch(converters=[lambda s: 1/0])
+        # the converters don't stick
+        r = csv.reader(StringIO("1\r\n2\r\n"))
+        self.assertEqual(r.readbatch(1, converters=[int]), [[1]])
+        self.assertEqual(next(r), ["2"])
+
+    def test_columns(self):
+        r = csv.reader(StringIO("a,1\r\n\r\nb,2\r\n"))
+        self.assertEqual(r.readbatch(converters=[None, int], columns=True),
+                         [["a", "b"], [1, 2]])
+        self.assertEqual(r.readbatch(columns=True), [])
+        r = csv.reader(StringIO("a,1\r\nb\r\n"))
+        with self.assertRaises(csv.Error):
+            r.readbatch(columns=True)
+
+    def test_quote_nonnumeric(self):
+        r = csv.reader(StringIO('1,"2",3\r\n'), quoting=csv.QUOTE_NONNUMERIC)
+        self.assertEqual(r.readbatch(converters=[int]), [[1, "2", 3.0]])
+
+
+class TestReadChunks(unittest.TestCase):
+    def setUp(self):
+        self.rows = [[i, i / 7, ["a", 'b "q"', "x\ny", "p,q", ""][i % 5]]
+                     for i in range(500)]
+        with open(support.TESTFN, "w", newline="") as f:
+            w = csv.writer(f)
+            w.writerow(["id", "val", "s"])
+            w.writerows(self.rows)
+
+    def tearDown(self):
+        support.unlink(support.TESTFN)
+
+    def test_chunk_offsets(self):
+        size = os.path.getsize(support.TESTFN)
+        with open(support.TESTFN, "rb") as f:
+            for chunksize in (1, 10, 100, 10000):
+                offsets = csv.chunk_offsets(f, chunksize)
+                self.assertEqual(offsets[0][0], 0)
+                self.assertEqual(offsets[-1][1], size)
+                for (a, b), (c, d) in zip(offsets, offsets[1:]):
+                    self.assertEqual(b, c)
+                # no chunk starts inside a quoted field
+                for start, stop in offsets:
+                    f.seek(start)
+                    chunk = f.read(stop - start).decode()
+                    self.assertEqual(chunk.count('"') % 2, 0)
+
+    def test_chunk_offsets_escapechar(self):
+        with open(support.TESTFN, "rb") as f:
+            with self.assertRaises(ValueError):
+                csv.chunk_offsets(f, 100, escapechar="\\")
+
+    def read(self, **kwargs):
+        result = []
+        for batch in csv.read_chunks(support.TESTFN, [int, float],
+                                     skip_header=True, **kwargs):
+            result.extend(batch)
+        return result
+
+    def test_serial(self):
+        for chunksize in (1, 100, 1 << 20):
+            self.assertEqual(self.read(chunksize=chunksize, max_workers=1),
+                             self.rows)
+
+    def test_columns(self):
+        columns = [[], [], []]
+        for batch in csv.read_chunks(support.TESTFN, [int, float],
+                                     skip_header=True, columns=True,
+                                     chunksize=1000, max_workers=1):
+            for column, part in zip(columns, batch):
+                column.extend(part)
+        self.assertEqual(columns, [list(c) for c in zip(*self.rows)])
+
+    def test_processes(self):
+        support.import_module("concurrent.futures")
+        support.import_module("multiprocessing.synchronize")
+        self.assertEqual(self.read(chunksize=2000, max_workers=2), self.rows)
+
+
 class MiscTestCase(unittest.TestCase):
     def test__all__(self):
         extra = {'__doc__', '__version__'}
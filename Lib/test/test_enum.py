@@ -7,6 +7,7 @@ from enum import Enum, IntEnum, EnumMeta, unique
 from io import StringIO
 from pickle import dumps, loads, PicklingError, HIGHEST_PROTOCOL
 from test import support
+import types
 
 # for pickle tests
 try:
@@ -1725,6 +1726,77 @@ class TestStdLib(unittest.TestCase):
             self.fail("result does not equal expected, see print above")
 
 
+py_enum = support.import_fresh_module('enum', blocked=['_enum'])
+c_enum = support.import_fresh_module('enum', fresh=['_enum'])
+
+class MemberAccessTests:
+
+    def setUp(self):
+        class Color(self.module.Enum):
+            red = 1
+            green = 2
+            blue = 3
+            crimson = 1
+        class Unhashable(self.module.Enum):
+            a = [1]
+            b = [2]
+        self.Color = Color
+        self.Unhashable = Unhashable
+
+    def test_lookup(self):
+        Color = self.Color
+        self.assertIs(Color(2), Color.green)
+        self.assertIs(Color(1), Color.red)
+        self.assertIs(Color(Color.blue), Color.blue)
+        self.assertIs(Color(2.0), Color.green)
+        self.assertRaises(ValueError, Color, 4)
+        self.assertRaises(ValueError, Color, None)
+        self.assertRaises(ValueError, Color, [1])
+        self.assertIs(self.Unhashable([2]), self.Unhashable.b)
+        self.assertRaises(ValueError, self.Unhashable, [3])
+
+    def test_name_value(self):
+        Color = self.Color
+        self.assertEqual(Color.crimson.name, 'red')
+        self.assertEqual(Color.blue.value, 3)
+        for name in ('name', 'value'):
+            attr = self.module.Enum.__dict__[name]
+            self.assertIsInstance(attr, types.DynamicClassAttribute)
+            with self.assertRaises(AttributeError):
+                getattr(Color, name)
+            with self.assertRaises(AttributeError):
+                setattr(Color.red, name, 5)
+            with self.assertRaises(AttributeError):
+                delattr(Color.red, name)
+        self.assertEqual(self.module.Enum.__dict__['value'].__doc__,
+                         'The value of the Enum member.')
+
+    def test_redefined_getter(self):
+        def shout(member):
+            return member._name_.upper()
+        class Shade(self.module.Enum):
+            dark = 1
+            name = self.module.Enum.__dict__['name'].getter(shout)
+        self.assertEqual(Shade.dark.name, 'DARK')
+        self.assertEqual(Shade.dark.value, 1)
+
+
+class PyMemberAccessTests(MemberAccessTests, unittest.TestCase):
+    module = py_enum
+
+@unittest.skipUnless(c_enum, 'requires the C _enum module')
+class CMemberAccessTests(MemberAccessTests, unittest.TestCase):
+    module = c_enum
+
+    def test_member_getter(self):
+        getter = self.module._member_getter('_value_')
+        self.assertEqual(getter.attr, '_value_')
+        self.assertEqual(getter.__get__(self.Color.green), 2)
+        self.assertRaises(AttributeError, getter.__get__, None, self.Color)
+        self.assertRaises(AttributeError, getter.__get__, object())
+        self.assertRaises(TypeError, self.module._member_getter, 1)
+
+
 class MiscTestCase(unittest.TestCase):
     def test__all__(self):
         support.check__all__(self, enum)
@@ -8,6 +8,7 @@ import sys
 from test import support
 import unittest
 from weakref import proxy
+import weakref
 try:
     import threading
 except ImportError:
@@ -1323,8 +1324,10 @@ class TestLRUC(TestLRU, unittest.TestCase):
 
 
 class TestSingleDispatch(unittest.TestCase):
+    module = py_functools
+
     def test_simple_overloads(self):
-        @functools.singledispatch
+        @self.module.singledispatch
         def g(obj):
             return "base"
         def g_int(i):
@@ -1335,7 +1338,7 @@ class TestSingleDispatch(unittest.TestCase):
         self.assertEqual(g([1,2,3]), "base")
 
     def test_mro(self):
-        @functools.singledispatch
+        @self.module.singledispatch
         def g(obj):
             return "base"
         class A:
@@ -1358,7 +1361,7 @@ class TestSingleDispatch(unittest.TestCase):
         self.assertEqual(g(D()), "B")
 
     def test_register_decorator(self):
-        @functools.singledispatch
+        @self.module.singledispatch
         def g(obj):
             return "base"
         @g.register(int)
@@ -1372,7 +1375,7 @@ class TestSingleDispatch(unittest.TestCase):
         # @singledispatch returns the wrapper.
 
     def test_wrapping_attributes(self):
-        @functools.singledispatch
+        @self.module.singledispatch
         def g(obj):
             "Simple test"
             return "Test"
@@ -1383,7 +1386,7 @@ class TestSingleDispatch(unittest.TestCase):
     @unittest.skipUnless(decimal, 'requires _decimal')
     @support.cpython_only
     def test_c_classes(self):
-        @functools.singledispatch
+        @self.module.singledispatch
         def g(obj):
             return "base"
         @g.register(decimal.DecimalException)
@@ -1402,7 +1405,7 @@ class TestSingleDispatch(unittest.TestCase):
     def test_compose_mro(self):
         # None of the examples in this test depend on haystack ordering.
         c = collections
-        mro = functools._compose_mro
+        mro = self.module._compose_mro
         bases = [c.Sequence, c.MutableMapping, c.Mapping, c.Set]
         for haystack in permutations(bases):
             m = mro(dict, haystack)
@@ -1457,7 +1460,7 @@ class TestSingleDispatch(unittest.TestCase):
         s = {object(), None}
         f = frozenset(s)
         t = (1, 2, 3)
-        @functools.singledispatch
+        @self.module.singledispatch
         def g(obj):
             return "base"
         self.assertEqual(g(d), "base")
@@ -1546,7 +1549,7 @@ class TestSingleDispatch(unittest.TestCase):
 
     def test_c3_abc(self):
         c = collections
-        mro = functools._c3_mro
+        mro = self.module._c3_mro
         class A(object):
             pass
         class B(A):
@@ -1576,7 +1579,7 @@ class TestSingleDispatch(unittest.TestCase):
             pass
         class AA(A):
             pass
-        @functools.singledispatch
+        @self.module.singledispatch
         def fun(a):
             return 'base A'
         @fun.register(A)
@@ -1587,7 +1590,7 @@ class TestSingleDispatch(unittest.TestCase):
 
     def test_mro_conflicts(self):
         c = collections
-        @functools.singledispatch
+        @self.module.singledispatch
         def g(arg):
             return "base"
         class O(c.Sized):
@@ -1633,7 +1636,7 @@ class TestSingleDispatch(unittest.TestCase):
         c.Set.register(Q)
         self.assertEqual(g(q), "set")     # because c.Set is a subclass of
                                           # c.Sized and c.Iterable
-        @functools.singledispatch
+        @self.module.singledispatch
         def h(arg):
             return "base"
         @h.register(c.Sized)
@@ -1658,7 +1661,7 @@ class TestSingleDispatch(unittest.TestCase):
         class R(c.defaultdict):
             pass
         c.MutableSequence.register(R)
-        @functools.singledispatch
+        @self.module.singledispatch
         def i(arg):
             return "base"
         @i.register(c.MutableMapping)
@@ -1698,7 +1701,7 @@ class TestSingleDispatch(unittest.TestCase):
         class V(c.Sized, S):
             def __len__(self):
                 return 0
-        @functools.singledispatch
+        @self.module.singledispatch
         def j(arg):
             return "base"
         @j.register(S)
@@ -1729,11 +1732,11 @@ class TestSingleDispatch(unittest.TestCase):
                 self.data[key] = value
             def clear(self):
                 self.data.clear()
-        _orig_wkd = functools.WeakKeyDictionary
+        _orig_wkd = self.module.WeakKeyDictionary
         td = TracingDict()
-        functools.WeakKeyDictionary = lambda: td
+        self.module.WeakKeyDictionary = lambda: td
         c = collections
-        @functools.singledispatch
+        @self.module.singledispatch
         def g(arg):
             return "base"
         d = {}
@@ -1763,13 +1766,13 @@ class TestSingleDispatch(unittest.TestCase):
         self.assertEqual(td.get_ops, [list, dict])
         self.assertEqual(td.set_ops, [dict, list, dict])
         self.assertEqual(td.data[dict],
-                         functools._find_impl(dict, g.registry))
+                         self.module._find_impl(dict, g.registry))
         self.assertEqual(g(l), "list")
         self.assertEqual(len(td), 2)
         self.assertEqual(td.get_ops, [list, dict])
         self.assertEqual(td.set_ops, [dict, list, dict, list])
         self.assertEqual(td.data[list],
-                         functools._find_impl(list, g.registry))
+                         self.module._find_impl(list, g.registry))
         class X:
             pass
         c.MutableMapping.register(X)   # Will not invalidate the cache,
@@ -1812,7 +1815,87 @@ class TestSingleDispatch(unittest.TestCase):
         self.assertEqual(g(l), "list")
         g._clear_cache()
         self.assertEqual(len(td), 0)
-        functools.WeakKeyDictionary = _orig_wkd
+        self.module.WeakKeyDictionary = _orig_wkd
+
+
+@unittest.skipUnless(c_functools, 'requires the C _functools module')
+class TestSingleDispatchC(TestSingleDispatch):
+    if c_functools:
+        module = c_functools
+
+    def test_c_wrapper(self):
+        @self.module.singledispatch
+        def g(obj):
+            "Simple test"
+            return "base"
+        self.assertIsInstance(g, self.module._singledispatch_wrapper)
+        self.assertEqual(g.__wrapped__(1), "base")
+        self.assertIs(copy.copy(g), g)
+        self.assertIs(copy.deepcopy(g), g)
+        self.assertIsNotNone(weakref.ref(g)())
+
+    def test_cache_invalidation(self):
+        # The C wrapper doesn't use a WeakKeyDictionary, check the results
+        # of the dispatch instead.
+        c = collections
+        @self.module.singledispatch
+        def g(arg):
+            return "base"
+        d = {}
+        l = []
+        self.assertEqual(g(d), "base")
+        self.assertEqual(g(l), "base")
+        g.register(list, lambda arg: "list")
+        self.assertEqual(g(d), "base")
+        self.assertEqual(g(l), "list")
+        class X:
+            pass
+        c.MutableMapping.register(X)
+        g.register(c.Sized, lambda arg: "sized")
+        self.assertEqual(g(d), "sized")
+        self.assertEqual(g(l), "list")
+        self.assertEqual(g(X()), "sized")
+        class Y:
+            def __len__(self):
+                return 0
+        self.assertEqual(g(Y()), "sized")
+        c.MutableSet.register(Y)       # Will invalidate the cache.
+        g.register(c.Set, lambda arg: "set")
+        self.assertEqual(g(Y()), "set")
+        class Z:
+            pass
+        self.assertEqual(g(Z()), "base")
+        c.MutableMapping.register(Z)   # Invalidates the cache, not g's.
+        self.assertEqual(g(Z()), "sized")
+        g._clear_cache()
+        self.assertEqual(g(d), "sized")
+
+    def test_class_override(self):
+        @self.module.singledispatch
+        def g(obj):
+            return "base"
+        g.register(int, lambda obj: "int")
+        class Proxy:
+            @property
+            def __class__(self):
+                return int
+        self.assertEqual(g(Proxy()), "int")
+
+    def test_dead_classes(self):
+        @self.module.singledispatch
+        def g(obj):
+            return "base"
+        g.register(int, lambda obj: "int")
+        refs = []
+        for i in range(100):
+            class A(int):
+                pass
+            refs.append(weakref.ref(A))
+            self.assertEqual(g(A()), "int")
+        del A
+        support.gc_collect()
+        self.assertEqual([r for r in refs if r() is not None], [])
+        self.assertEqual(g(1), "int")
 
 
 if __name__ == '__main__':
@@ -261,6 +261,70 @@ class TestGzip(BaseTest):
                 f.seek(pos)
                 f.write(b'GZ\n')
 
+    @support.reap_threads
+    def test_write_threads(self):
+        data = data1 * 5000 + data2 * 5000
+        outputs = []
+        for threads in 1, 3:
+            buf = io.BytesIO()
+            with gzip.GzipFile(fileobj=buf, mode='wb', mtime=0,
+                               threads=threads) as f:
+                f.write(data[:1000])
+                f.write(data[1000:])
+                self.assertEqual(f.tell(), len(data))
+            outputs.append(buf.getvalue())
+        self.assertEqual(outputs[0], outputs[1])
+        compressed = outputs[0]
+        self.assertEqual(compressed[:4], b'\037\213\010\004')
+        self.assertEqual(compressed[12:16], b'BC\002\000')
+        self.assertTrue(compressed.endswith(gzip._BGZF_EOF))
+        self.assertEqual(gzip.decompress(compressed), data)
+
+    @support.reap_threads
+    def test_write_threads_flush(self):
+        buf = io.BytesIO()
+        with gzip.GzipFile(fileobj=buf, mode='wb', threads=2) as f:
+            f.write(data1)
+            f.flush()
+            self.assertEqual(gzip.decompress(buf.getvalue()), data1)
+            f.write(data2)
+        self.assertEqual(gzip.decompress(buf.getvalue()), data1 + data2)
+
+    def test_write_threads_invalid(self):
+        with self.assertRaises(ValueError):
+            gzip.GzipFile(fileobj=io.BytesIO(), mode='wb', threads=0)
+
+    @support.reap_threads
+    def test_seek_blocks(self):
+        data = bytes(range(256)) * 2000
+        with gzip.open(self.filename, 'wb', threads=2) as f:
+            f.write(data)
+        with gzip.open(self.filename) as f:
+            raw = f._buffer.raw
+            f.seek(len(data) - 10)
+            self.assertEqual(f.read(), data[-10:])
+            # Only the block headers were read to get there.
+            self.assertEqual(raw._member_pos[-2],
+                             len(data) // gzip.BLOCK_SIZE * gzip.BLOCK_SIZE)
+            for offset in 300000, 5, gzip.BLOCK_SIZE, 200000:
+                f.seek(offset)
+                self.assertEqual(f.read(100), data[offset:offset + 100])
+            f.seek(-20, 2)
+            self.assertEqual(f.read(), data[-20:])
+
+    def test_seek_members(self):
+        data = data1 * 50 + data2 * 50
+        with open(self.filename, 'wb') as f:
+            f.write(gzip.compress(data[:3000]))
+            f.write(gzip.compress(data[3000:]))
+        with gzip.open(self.filename) as f:
+            self.assertEqual(f.read(), data)
+            self.assertEqual(f._buffer.raw._member_pos, [0, 3000])
+            f.seek(3500)
+            self.assertEqual(f.read(10), data[3500:3510])
+            f.seek(10)
+            self.assertEqual(f.read(10), data[10:20])
+
     def test_mode(self):
         self.test_write()
         with gzip.GzipFile(self.filename, 'r') as f:
@@ -8,6 +8,7 @@
 
 import array
 import hashlib
+import io
 import itertools
 import os
 import sys
@@ -193,6 +194,67 @@ class HashLibTestCase(unittest.TestCase):
             self.assertEqual(m1.digest(), m4_copy.digest())
             self.assertEqual(m4.digest(), m4_digest)
 
+    def test_digest_many(self):
+        data = [b'', b'abc', bytearray(b'x' * 3000), memoryview(b'y' * 100),
+                array.array('b', range(10))]
+        # more buffers than hashed in a single batch
+        data += [str(i).encode() for i in range(1000)]
+        for cons in self.hash_constructors:
+            h = cons(b'salt')
+            expected = [cons(b'salt' + bytes(d)).digest() for d in data]
+            self.assertEqual(h.digest_many(data), expected)
+            self.assertEqual(h.digest_many(iter(data)), expected)
+            self.assertEqual(h.digest_many([]), [])
+            # the hash object is left unchanged
+            self.assertEqual(h.digest(), cons(b'salt').digest())
+
+    def test_digest_many_errors(self):
+        for cons in self.hash_constructors:
+            h = cons()
+            self.assertRaises(TypeError, h.digest_many, 42)
+            self.assertRaises(TypeError, h.digest_many, [b'a', 'b'])
+            self.assertRaises(TypeError, h.digest_many, [b'a', 42])
+            self.assertRaises(TypeError, h.digest_many)
+            def gen():
+                yield b'a'
+                raise ZeroDivisionError
+            self.assertRaises(ZeroDivisionError, h.digest_many, gen())
+            self.assertEqual(h.digest(), cons().digest())
+
+    def test_file_digest(self):
+        data = b'a' * 65536 + b'b' * 1000 + b'c'
+        self.addCleanup(support.unlink, support.TESTFN)
+        with open(support.TESTFN, 'wb') as f:
+            f.write(data)
+
+        for name in self.supported_hash_names:
+            if not name.islower():
+                continue
+            expected = hashlib.new(name, data).hexdigest()
+            with self.subTest(name=name):
+                digestobj = hashlib.file_digest(io.BytesIO(data), name)
+                self.assertEqual(digestobj.hexdigest(), expected)
+                with open(support.TESTFN, 'rb') as f:
+                    digestobj = hashlib.file_digest(f, name)
+                self.assertEqual(digestobj.hexdigest(), expected)
+                with open(support.TESTFN, 'rb') as f:
+                    digestobj = hashlib.file_digest(f, name, _bufsize=1000)
+                self.assertEqual(digestobj.hexdigest(), expected)
+
+        with open(support.TESTFN, 'rb', buffering=0) as f:
+            digestobj = hashlib.file_digest(f, hashlib.sha256)
+        self.assertEqual(digestobj.hexdigest(),
+                         hashlib.sha256(data).hexdigest())
+
+        with self.assertRaises(ValueError):
+            hashlib.file_digest(None, 'sha256')
+        with open(support.TESTFN, 'r') as f:
+            with self.assertRaises(ValueError):
+                hashlib.file_digest(f, 'sha256')
+        with open(support.TESTFN, 'wb') as f:
+            with self.assertRaises(ValueError):
+                hashlib.file_digest(f, 'sha256')
+
     def check(self, name, data, hexdigest):
         hexdigest = hexdigest.lower()
         constructors = self.constructors_to_test[name]
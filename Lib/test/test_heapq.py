@@ -1,5 +1,6 @@
 """Unittests for heapq."""
 
+import gc
 import sys
 import random
 import unittest
@@ -11,10 +12,9 @@ from operator import itemgetter
 py_heapq = support.import_fresh_module('heapq', blocked=['_heapq'])
 c_heapq = support.import_fresh_module('heapq', fresh=['_heapq'])
 
-# _heapq.nlargest/nsmallest are saved in heapq._nlargest/_smallest when
-# _heapq is imported, so check them there
 func_names = ['heapify', 'heappop', 'heappush', 'heappushpop', 'heapreplace',
-              '_heappop_max', '_heapreplace_max', '_heapify_max']
+              '_heappop_max', '_heapreplace_max', '_heapify_max',
+              'merge', 'nlargest', 'nsmallest']
 
 class TestModules(TestCase):
     def test_py_functions(self):
@@ -211,6 +211,92 @@ class TestHeap:
                 self.assertEqual(list(self.module.nlargest(n, data, key=f)),
                                  sorted(data, key=f, reverse=True)[:n])
 
+    def test_merge_key_stability(self):
+        inputs = [[(i // 7, stream, i) for i in range(100)]
+                  for stream in range(5)]
+        for reverse in (False, True):
+            seqs = [sorted(seq, key=itemgetter(0), reverse=reverse)
+                    for seq in inputs]
+            self.assertEqual(
+                list(self.module.merge(*seqs, key=itemgetter(0),
+                                       reverse=reverse)),
+                sorted(chain(*seqs), key=itemgetter(0), reverse=reverse))
+
+    def test_merge_is_lazy(self):
+        it = iter([1, 3, 5])
+        merged = self.module.merge(it, [0, 2])
+        self.assertEqual(list(it), [1, 3, 5])
+        it = iter([1, 3, 5])
+        merged = self.module.merge(it, [0, 2])
+        self.assertEqual(next(merged), 0)
+        self.assertEqual(next(it), 3)
+        self.assertEqual(list(merged), [1, 2, 5])
+
+    def test_merge_single_input(self):
+        calls = []
+        def key(x):
+            calls.append(x)
+            return x
+        self.assertEqual(list(self.module.merge([1, 2, 3], key=key)),
+                         [1, 2, 3])
+        # the key isn't needed once a single input is left
+        self.assertEqual(calls, [1])
+        self.assertEqual(list(self.module.merge(iter('abc'))), list('abc'))
+
+    def test_merge_reentrant(self):
+        def key(x):
+            next(merged)
+            return x
+        merged = self.module.merge([1], [2], key=key)
+        self.assertRaises(ValueError, next, merged)
+
+    def test_merge_exhausted_after_error(self):
+        def key(x):
+            if x == 3:
+                raise ZeroDivisionError
+            return x
+        merged = self.module.merge([1, 3], [2, 4], key=key)
+        self.assertEqual(next(merged), 1)
+        self.assertRaises(ZeroDivisionError, list, merged)
+        self.assertEqual(list(merged), [])
+
+    def test_merge_gc_during_comparison(self):
+        # the garbage collector may visit the heap while it is reordered
+        class Key:
+            def __init__(self, value):
+                self.value = value
+            def __lt__(self, other):
+                gc.collect()
+                return self.value < other.value
+        inputs = [[Key(i) for i in range(j, 40, 5)] for j in range(5)]
+        merged = [k.value for k in self.module.merge(*inputs)]
+        self.assertEqual(merged, list(range(40)))
+        merged = self.module.merge(*[[i] for i in range(5)],
+                                   key=lambda x: Key(-x))
+        self.assertEqual(list(merged), [4, 3, 2, 1, 0])
+
+    def test_nsmallest_nlargest_stability(self):
+        data = [(i % 5, i) for i in range(200)]
+        key = itemgetter(0)
+        for n in (0, 1, 2, 10, 100, 199, 200, 300):
+            self.assertEqual(self.module.nsmallest(n, iter(data), key=key),
+                             sorted(data, key=key)[:n])
+            self.assertEqual(self.module.nlargest(n, iter(data), key=key),
+                             sorted(data, key=key, reverse=True)[:n])
+            self.assertEqual(self.module.nsmallest(n, data, key=key),
+                             sorted(data, key=key)[:n])
+            self.assertEqual(self.module.nlargest(n, data, key=key),
+                             sorted(data, key=key, reverse=True)[:n])
+
+    def test_nsmallest_nlargest_huge_n(self):
+        data = [random.random() for i in range(100)]
+        self.assertEqual(self.module.nsmallest(sys.maxsize, iter(data)),
+                         sorted(data))
+        self.assertEqual(self.module.nlargest(sys.maxsize, iter(data)),
+                         sorted(data, reverse=True))
+        self.assertEqual(self.module.nsmallest(-1, iter(data)), [])
+        self.assertEqual(self.module.nlargest(-1, iter(data)), [])
+
     def test_comparison_operator(self):
         # Issue 3051: Make sure heapq works with both __lt__
         # For python 3.0, __le__ alone is not enough
@@ -399,6 +485,21 @@ class TestErrorHandling:
                 self.assertRaises(TypeError, f, 2, N(s))
                 self.assertRaises(ZeroDivisionError, f, 2, E(s))
 
+    def test_merge_args(self):
+        for s in ("123", "", range(1000), range(2000,2200,5)):
+            for g in (G, I, Ig, L, R):
+                self.assertEqual(list(self.module.merge(g(s), s)),
+                                 sorted(chain(s, s)))
+            self.assertEqual(list(self.module.merge(S(s), s)), list(s))
+            self.assertRaises(TypeError, list, self.module.merge(s, X(s)))
+            self.assertRaises(TypeError, list, self.module.merge(s, N(s)))
+            self.assertRaises(ZeroDivisionError, list,
+                              self.module.merge(s, E(s)))
+        self.assertRaises(TypeError, self.module.merge, [], spam=1)
+        seq = [CmpErr(), CmpErr()]
+        self.assertRaises(ZeroDivisionError, list,
+                          self.module.merge(seq, seq))
+
     # Issue #17278: the heap may change size while it's being walked.
 
     def test_heappush_mutating_heap(self):
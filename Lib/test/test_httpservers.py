@@ -395,6 +395,97 @@ class SimpleHTTPServerTestCase(BaseTestCase):
         self.assertEqual(response.getheader('content-type'),
                          'application/octet-stream')
 
+    def test_head_accept_ranges(self):
+        response = self.request(
+            self.tempdir_name + '/test', method='HEAD',
+            headers={'Range': 'bytes=3-6'})
+        self.check_status_and_reason(response, HTTPStatus.PARTIAL_CONTENT)
+        self.assertEqual(response.getheader('content-length'), '4')
+        self.assertEqual(response.getheader('accept-ranges'), 'bytes')
+
+    def test_range(self):
+        url = self.tempdir_name + '/test'
+        size = len(self.data)
+        for spec, first, last in [('bytes=0-0', 0, 0),
+                                  ('bytes=3-6', 3, 6),
+                                  ('bytes=7-', 7, size - 1),
+                                  ('bytes=7-1000', 7, size - 1),
+                                  ('bytes=-4', size - 4, size - 1),
+                                  ('bytes=-1000', 0, size - 1)]:
+            with self.subTest(spec=spec):
+                response = self.request(url, headers={'Range': spec})
+                self.check_status_and_reason(response,
+                                             HTTPStatus.PARTIAL_CONTENT,
+                                             data=self.data[first:last + 1])
+                self.assertEqual(response.getheader('content-range'),
+                                 'bytes %d-%d/%d' % (first, last, size))
+                self.assertEqual(response.getheader('content-length'),
+                                 str(last - first + 1))
+
+    def test_range_unsatisfiable(self):
+        url = self.tempdir_name + '/test'
+        for spec in ['bytes=%d-' % len(self.data), 'bytes=1000-2000',
+                     'bytes=-0']:
+            with self.subTest(spec=spec):
+                response = self.request(url, headers={'Range': spec})
+                self.check_status_and_reason(
+                    response, HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+                self.assertEqual(response.getheader('content-range'),
+                                 'bytes */%d' % len(self.data))
+
+    def test_range_ignored(self):
+        url = self.tempdir_name + '/test'
+        for spec in ['bytes=0-1,4-5', 'bytes=5-2', 'bytes=x-', 'bytes=-',
+                     'items=0-1', 'bytes 0-1', 'bytes=\xb2-',
+                     'bytes=-\xb2']:
+            with self.subTest(spec=spec):
+                response = self.request(url, headers={'Range': spec})
+                self.check_status_and_reason(response, HTTPStatus.OK,
+                                             data=self.data)
+
+    def test_get_without_sendfile(self):
+        self.request_handler.use_sendfile = False
+        try:
+            response = self.request(self.tempdir_name + '/test')
+            self.check_status_and_reason(response, HTTPStatus.OK,
+                                         data=self.data)
+            response = self.request(self.tempdir_name + '/test',
+                                    headers={'Range': 'bytes=4-'})
+            self.check_status_and_reason(response, HTTPStatus.PARTIAL_CONTENT,
+                                         data=self.data[4:])
+        finally:
+            del self.request_handler.use_sendfile
+
+    def test_range_old_copyfile(self):
+        # copyfile() overridden without the count argument
+        copied = []
+        def copyfile(handler, source, outputfile):
+            data = source.read()
+            copied.append(data)
+            outputfile.write(data)
+        self.request_handler.copyfile = copyfile
+        try:
+            response = self.request(self.tempdir_name + '/test',
+                                    headers={'Range': 'bytes=3-6'})
+            self.check_status_and_reason(response, HTTPStatus.PARTIAL_CONTENT,
+                                         data=self.data[3:7])
+            self.assertEqual(copied, [self.data[3:7]])
+        finally:
+            del self.request_handler.copyfile
+
+    def test_file_info_cache(self):
+        path = os.path.join(self.tempdir, 'test')
+        response = self.request(self.tempdir_name + '/test', method='HEAD')
+        self.check_status_and_reason(response, HTTPStatus.OK)
+        first_modified = response.getheader('last-modified')
+        os.utime(path, (0, 0))
+        response = self.request(self.tempdir_name + '/test', method='HEAD')
+        self.check_status_and_reason(response, HTTPStatus.OK)
+        self.assertNotEqual(response.getheader('last-modified'),
+                            first_modified)
+        self.assertEqual(response.getheader('last-modified'),
+                         'Thu, 01 Jan 1970 00:00:00 GMT')
+
     def test_invalid_requests(self):
         response = self.request('/', method='FOO')
         self.check_status_and_reason(response, HTTPStatus.NOT_IMPLEMENTED)
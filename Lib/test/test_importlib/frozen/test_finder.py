@@ -3,6 +3,8 @@ from .. import util
 
 machinery = util.import_importlib('importlib.machinery')
 
+import _imp
+import sysconfig
 import unittest
 
 
@@ -80,5 +82,24 @@ class FinderTests(abc.FinderTests):
  ) = util.test_both(FinderTests, machinery=machinery)
 
 
+@unittest.skipUnless(sysconfig.get_config_var('Py_FROZEN_STARTUP'),
+                     'requires --with-frozen-startup')
+class StartupModulesTests(unittest.TestCase):
+
+    """Test the stdlib modules frozen by --with-frozen-startup."""
+
+    def test_frozen(self):
+        for name in ('abc', 'codecs', 'io', 'os', 'site'):
+            with self.subTest(name=name):
+                self.assertTrue(_imp.is_frozen(name))
+                self.assertFalse(_imp.is_frozen_package(name))
+                module = __import__(name)
+                self.assertEqual(module.__spec__.origin, 'frozen')
+
+    def test_packages_not_frozen(self):
+        # encodings must be able to find its submodules on sys.path.
+        self.assertFalse(_imp.is_frozen('encodings'))
+
+
 if __name__ == '__main__':
     unittest.main()
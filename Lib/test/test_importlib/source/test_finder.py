@@ -201,6 +201,90 @@ class FinderTestsPEP451(FinderTests):
  ) = util.test_both(FinderTestsPEP451, machinery=machinery)
 
 
+class DirectoryCacheTests(FinderTestsPEP451):
+
+    def setUp(self):
+        self.cache = self.machinery.DirectoryCache()
+        FileFinder = self.machinery.FileFinder
+        self.addCleanup(setattr, FileFinder, 'directory_cache',
+                        FileFinder.directory_cache)
+        FileFinder.directory_cache = self.cache
+
+    def test_snapshot_shared(self):
+        with util.create_modules('mod', 'pkg.__init__') as mapping:
+            root = mapping['.root']
+            self.assertIsNotNone(self._find(self.get_finder(root), 'mod'))
+            self.assertEqual(self.cache.scans, 1)
+            self.assertIsNotNone(self._find(self.get_finder(root), 'pkg'))
+            # Only the package directory had to be listed.
+            self.assertEqual(self.cache.scans, 2)
+            self.assertGreater(self.cache.stats_avoided, 0)
+
+    def test_new_module(self):
+        with util.create_modules('mod') as mapping:
+            root = mapping['.root']
+            finder = self.get_finder(root)
+            self.assertIsNotNone(self._find(finder, 'mod'))
+            scans = self.cache.scans
+            self.assertIsNone(self._find(finder, 'new'))
+            self.assertEqual(self.cache.scans, scans)
+            with open(os.path.join(root, 'new.py'), 'w') as file:
+                file.write('# new module')
+            # The snapshot is taken again when the directory's mtime changes.
+            os.utime(root, (0, 0))
+            self.assertIsNotNone(self._find(finder, 'new'))
+            self.assertEqual(self.cache.scans, scans + 1)
+
+    def test_lookups_use_snapshot(self):
+        # Lookups are answered by the snapshot validated by the search.
+        with util.create_modules('mod') as mapping:
+            root = mapping['.root']
+            path = mapping['mod']
+            self.assertIsNotNone(self._find(self.get_finder(root), 'mod'))
+            avoided = self.cache.stats_avoided
+            os.unlink(path)
+            self.assertTrue(self.cache.isfile(path))
+            self.assertFalse(self.cache.isdir(path))
+            self.assertEqual(self.cache.stats_avoided, avoided + 2)
+            os.utime(root, (0, 0))
+            self.assertIsNone(self._find(self.get_finder(root), 'mod'))
+            self.assertFalse(self.cache.isfile(path))
+
+    def test_path_stats(self):
+        # The source file is stat'ed through its entry in the snapshot.
+        with util.create_modules('mod') as mapping:
+            root = mapping['.root']
+            path = mapping['mod']
+            loader = self._find(self.get_finder(root), 'mod')
+            stats = loader.path_stats(path)
+            self.assertEqual(stats['mtime'], os.stat(path).st_mtime)
+            self.assertEqual(stats['size'], os.stat(path).st_size)
+            os.utime(path, (0, 0))
+            self.assertEqual(loader.path_stats(path), stats)
+            self.get_finder(root).invalidate_caches()
+            self._find(self.get_finder(root), 'mod')
+            self.assertEqual(loader.path_stats(path)['mtime'], 0)
+
+    def test_path_hook(self):
+        with util.create_modules('pkg.__init__') as mapping:
+            root = mapping['.root']
+            hook = self.machinery.FileFinder.path_hook(
+                (self.machinery.SourceFileLoader,
+                 self.machinery.SOURCE_SUFFIXES))
+            self._find(hook(root), 'pkg')
+            avoided = self.cache.stats_avoided
+            self.assertIsInstance(hook(os.path.join(root, 'pkg')),
+                                  self.machinery.FileFinder)
+            self.assertEqual(self.cache.stats_avoided, avoided + 1)
+            with self.assertRaises(ImportError):
+                hook(os.path.join(root, 'pkg', '__init__.py'))
+
+
+(Frozen_DirectoryCacheTests,
+ Source_DirectoryCacheTests
+ ) = util.test_both(DirectoryCacheTests, machinery=machinery)
+
+
 class FinderTestsPEP420(FinderTests):
 
     NOT_FOUND = (None, [])
@@ -1,8 +1,13 @@
 import importlib
 from importlib import abc
+from importlib import machinery
 from importlib import util
+import sys
+import time
 import unittest
 
+from test import support
+
 from . import util as test_util
 
 
@@ -120,6 +125,30 @@ class LazyLoaderTests(unittest.TestCase):
         del module.__name__
         self.assertFalse(hasattr(module, '__name__'))
 
+    @support.reap_threads
+    def test_threads(self):
+        # Concurrent attribute accesses execute the module only once, and
+        # wait for it to be fully executed.
+        threading = support.import_module('threading')
+        source_code = ('import time; time.sleep(0.05); attr = 42; '
+                       'count = globals().get("count", 0) + 1')
+        module = self.new_module(source_code)
+        results = []
+        def access():
+            results.append((module.attr, module.count))
+        threads = [threading.Thread(target=access) for i in range(5)]
+        with support.start_threads(threads):
+            pass
+        self.assertEqual(results, [(42, 1)] * 5)
+
+    def test_exec_error(self):
+        # A failed load is retried on the next access.
+        module = self.new_module('attr = 42; 1/0')
+        with self.assertRaises(ZeroDivisionError):
+            module.attr
+        with self.assertRaises(ZeroDivisionError):
+            module.attr
+
     def test_module_substitution_error(self):
         source_code = 'import sys; sys.modules[__name__] = 42'
         module = self.new_module(source_code)
@@ -128,5 +157,72 @@ class LazyLoaderTests(unittest.TestCase):
                 module.__name__
 
 
+class PlainImporter(TestingImporter):
+
+    """Finds the test module without making it lazy itself."""
+
+    def find_spec(self, name, path, target=None):
+        if name not in (self.module_name, 'other_' + self.module_name):
+            return None
+        return util.spec_from_loader(name, self)
+
+
+class LazyFinderTests(unittest.TestCase):
+
+    def import_module(self, finder, name=PlainImporter.module_name):
+        importer = PlainImporter()
+        with test_util.uncache(name):
+            with test_util.import_state(meta_path=[finder, importer]):
+                module = importlib.import_module(name)
+        return importer, module
+
+    def test_lazy(self):
+        importer, module = self.import_module(util.LazyFinder())
+        self.assertIsNone(importer.loaded)
+        self.assertEqual(module.attr, 42)
+        self.assertIs(importer.loaded, module)
+
+    def test_names(self):
+        finder = util.LazyFinder([PlainImporter.module_name])
+        importer, module = self.import_module(finder)
+        self.assertIsNone(importer.loaded)
+        importer, module = self.import_module(
+            finder, 'other_' + PlainImporter.module_name)
+        self.assertIs(importer.loaded, module)
+
+    def test_not_found(self):
+        finder = util.LazyFinder()
+        with test_util.import_state(meta_path=[finder]):
+            self.assertIsNone(finder.find_spec('lazy_finder_test', None))
+
+    def test_source(self):
+        # Modules loaded from source files are made lazy.
+        finder = util.LazyFinder(['lazy_source_test'])
+        path_hook = machinery.FileFinder.path_hook(
+            (machinery.SourceFileLoader, machinery.SOURCE_SUFFIXES))
+        with test_util.create_modules('lazy_source_test') as mapping:
+            with test_util.import_state(meta_path=[finder,
+                                                   machinery.PathFinder],
+                                        path=[mapping['.root']],
+                                        path_hooks=[path_hook]):
+                module = importlib.import_module('lazy_source_test')
+            self.assertIsInstance(module, util._LazyModule)
+            self.assertEqual(module.attr, 'lazy_source_test')
+            self.assertNotIsInstance(module, util._LazyModule)
+
+    @unittest.skipUnless('pwd' in sys.builtin_module_names,
+                         'pwd is not a built-in module')
+    def test_builtin(self):
+        # Built-in modules are created by their loader, not made lazy.
+        with self.assertRaises(TypeError):
+            util.LazyLoader(machinery.BuiltinImporter)
+        finder = util.LazyFinder()
+        with test_util.uncache('pwd'):
+            with test_util.import_state(meta_path=[finder,
+                                                   machinery.BuiltinImporter]):
+                module = importlib.import_module('pwd')
+            self.assertNotIsInstance(module, util._LazyModule)
+            self.assertTrue(hasattr(module, 'getpwuid'))
+
 if __name__ == '__main__':
     unittest.main()
@@ -6,7 +6,8 @@ import random
 import unittest
 
 from test.support import (
-    _4G, TESTFN, import_module, bigmemtest, run_unittest, unlink
+    _4G, TESTFN, import_module, bigmemtest, reap_threads, run_unittest,
+    swap_attr, unlink
 )
 
 lzma = import_module("lzma")
@@ -937,6 +938,84 @@ class FileTestCase(unittest.TestCase):
         self.assertLessEqual(decomp._buffer.raw.tell(), max_decomp,
             "Excessive amount of data was decompressed")
 
+    @reap_threads
+    def test_write_threads(self):
+        filters = [{"id": lzma.FILTER_LZMA2, "dict_size": 4096}]
+        data = INPUT * 200
+        outputs = []
+        for threads in 1, 2:
+            with BytesIO() as dst:
+                with LZMAFile(dst, "w", filters=filters,
+                              threads=threads) as f:
+                    f.write(data[:100])
+                    f.write(data[100:])
+                    self.assertEqual(f.tell(), len(data))
+                outputs.append(dst.getvalue())
+        self.assertEqual(outputs[0], outputs[1])
+        self.assertEqual(lzma.decompress(outputs[0]), data)
+        # One stream per block of three times the dictionary size.
+        blocks = lzma._read_xz_blocks(BytesIO(outputs[0]))
+        self.assertEqual(len(blocks), -(-len(data) // (3 * 4096)))
+        self.assertEqual(sum(block[2] for block in blocks), len(data))
+
+    def test_write_threads_bad_args(self):
+        with self.assertRaises(ValueError):
+            LZMAFile(BytesIO(), "w", threads=0)
+        with self.assertRaises(ValueError):
+            LZMAFile(BytesIO(), "w", format=lzma.FORMAT_ALONE, threads=2)
+
+    @reap_threads
+    def test_read_threads(self):
+        padding = bytes(8)
+        with LZMAFile(BytesIO(COMPRESSED_XZ * 3 + padding + COMPRESSED_XZ),
+                      threads=2) as f:
+            self.assertIsInstance(f._buffer.raw,
+                                  _compression.ParallelDecompressReader)
+            self.assertEqual(f.read(), INPUT * 4)
+            f.seek(len(INPUT) + 10)
+            self.assertEqual(f.read(10), INPUT[10:20])
+
+    def test_read_threads_fallback(self):
+        # Formats and files without an XZ index are read sequentially.
+        for data in [COMPRESSED_ALONE, COMPRESSED_XZ + COMPRESSED_ALONE,
+                     COMPRESSED_XZ + COMPRESSED_BOGUS]:
+            with LZMAFile(BytesIO(data), threads=2) as f:
+                self.assertNotIsInstance(f._buffer.raw,
+                                         _compression.ParallelDecompressReader)
+                self.assertTrue(f.read().startswith(INPUT))
+
+    @reap_threads
+    def test_read_threads_corrupt(self):
+        data = bytearray(COMPRESSED_XZ * 2)
+        data[40] ^= 0xff
+        with LZMAFile(BytesIO(data), threads=2) as f:
+            self.assertRaises(LZMAError, f.read)
+
+    @reap_threads
+    def test_read_threads_memory_bounded(self):
+        # Large blocks are not decompressed in full ahead of the reader.
+        tracemalloc = import_module("tracemalloc")
+        size = 16 * 1024 * 1024
+        data = lzma.compress(bytes(size), preset=0) * 2
+        with swap_attr(_compression, "PARALLEL_BUFFER_SIZE", 2 * 1024 * 1024):
+            tracemalloc.start()
+            try:
+                total = 0
+                with LZMAFile(BytesIO(data), threads=2) as f:
+                    self.assertIsInstance(f._buffer.raw,
+                                          _compression.ParallelDecompressReader)
+                    while True:
+                        chunk = f.read(64 * 1024)
+                        if not chunk:
+                            break
+                        self.assertFalse(chunk.strip(b"\0"))
+                        total += len(chunk)
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+        self.assertEqual(total, 2 * size)
+        self.assertLess(peak, 8 * 1024 * 1024)
+
     def test_write(self):
         with BytesIO() as dst:
             with LZMAFile(dst, "w") as f:
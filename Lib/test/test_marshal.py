@@ -446,6 +446,36 @@ class InterningTestCase(unittest.TestCase, HelperMixin):
         s2 = sys.intern(s)
         self.assertNotEqual(id(s2), id(s))
 
+class MmapTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.mmap = support.import_module('mmap')
+        self.addCleanup(support.unlink, support.TESTFN)
+
+    def test_load(self):
+        samples = [b'header', compile('x = 1', 'mod', 'exec'),
+                   {'a': (1, 2.5, 'b')}, sys.intern('name')]
+        with open(support.TESTFN, 'wb') as f:
+            for sample in samples:
+                marshal.dump(sample, f)
+            size = f.tell()
+        with open(support.TESTFN, 'rb') as f, \
+             self.mmap.mmap(f.fileno(), 0, access=self.mmap.ACCESS_READ) as m:
+            self.assertEqual(marshal.load(m), samples[0])
+            code = marshal.load(m)
+            ns = {}
+            exec(code, ns)
+            self.assertEqual(ns['x'], 1)
+            self.assertEqual(marshal.load(m), samples[2])
+            self.assertIs(marshal.load(m), samples[3])
+            self.assertEqual(m.tell(), size)
+            self.assertRaises(EOFError, marshal.load, m)
+
+    def test_loads_view(self):
+        data = b'garbage' + marshal.dumps(('spam', 42))
+        self.assertEqual(marshal.loads(memoryview(data)[7:]), ('spam', 42))
+
+
 @support.cpython_only
 @unittest.skipUnless(_testcapi, 'requires _testcapi')
 class CAPI_TestCase(unittest.TestCase, HelperMixin):
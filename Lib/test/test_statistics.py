@@ -13,6 +13,7 @@ import unittest
 
 from decimal import Decimal
 from fractions import Fraction
+from test import support
 
 
 # Module to be tested.
@@ -1381,6 +1382,19 @@ class TestMean(NumericTestCase, AverageMixin, UnivariateTypeMixin):
             self.assertEqual(statistics.mean([big]*n), big)
             self.assertEqual(statistics.mean([tiny]*n), tiny)
 
+    def test_float_exact(self):
+        # The float fast path gives the correctly rounded mean.
+        self.assertEqual(self.func([1e16, 1.0, 1.0]), 3333333333333334.0)
+        self.assertEqual(self.func([1e100, 1.0, -1e100, 1.0]), 0.5)
+        data = [random.uniform(-1e6, 1e6) for _ in range(500)]
+        expected = float(sum(map(Fraction, data))/len(data))
+        self.assertEqual(self.func(data), expected)
+
+    def test_int_exact(self):
+        data = [random.randrange(-10**20, 10**20) for _ in range(500)]
+        expected = float(Fraction(sum(data), len(data)))
+        self.assertEqual(self.func(data), expected)
+
 
 class TestMedian(NumericTestCase, AverageMixin):
     # Common tests for median and all median.* functions.
@@ -1506,6 +1520,42 @@ class TestMedianHigh(TestMedian, UnivariateTypeMixin):
         self.assertEqual(self.func(data), D('4.4'))
 
 
+class TestSelect(unittest.TestCase):
+    # Tests for the private _select() helper used by the median functions.
+    def check_select(self, data):
+        expected = sorted(data)
+        n = len(data)
+        for lo, hi in [(0, 0), (n//2 - 1, n//2), (n//4, n//4), (n - 1, n - 1),
+                       (0, n - 1)]:
+            self.assertEqual(statistics._select(data, lo, hi),
+                             expected[lo:hi + 1])
+
+    def test_small(self):
+        self.check_select([5, 1, 4, 2, 3])
+
+    def test_large(self):
+        n = statistics._SELECT_THRESHOLD * 3
+        self.check_select([random.random() for _ in range(n)])
+        self.check_select(list(range(n)))
+        self.check_select(list(range(n, 0, -1)))
+        self.check_select([random.randrange(5) for _ in range(n)])
+
+    def test_data_unchanged(self):
+        data = [random.random() for _ in range(statistics._SELECT_THRESHOLD)]
+        copy = data[:]
+        statistics._select(data, 10, 20)
+        self.assertEqual(data, copy)
+
+    def test_nan(self):
+        # Without a total order the result matches sorting.
+        n = statistics._SELECT_THRESHOLD * 2
+        data = [random.random() for _ in range(n)]
+        data[::7] = [float('nan')] * len(data[::7])
+        expected = sorted(data)[n//2:n//2 + 1]
+        result = statistics._select(data, n//2, n//2)
+        self.assertEqual(repr(result), repr(expected))
+
+
 class TestMedianGrouped(TestMedian):
     # Test median_grouped.
     # Doesn't conserve data element types, so don't use TestMedianType.
@@ -1664,6 +1714,65 @@ class TestMode(NumericTestCase, AverageMixin, UnivariateTypeMixin):
 
 # === Tests for variances and standard deviations ===
 
+class TestQuantiles(unittest.TestCase):
+
+    def test_specific_cases(self):
+        quantiles = statistics.quantiles
+        data = [120, 200, 250, 320, 350]
+        self.assertEqual(quantiles(data, n=1), [])
+        self.assertEqual(quantiles(data, n=2), [250.0])
+        self.assertEqual(quantiles(data, n=4), [160.0, 250.0, 335.0])
+        self.assertEqual(quantiles(data, n=4, method='inclusive'),
+                         [200.0, 250.0, 320.0])
+        self.assertEqual(quantiles(data, n=5),
+                         [136.0, 220.0, 292.0, 344.0])
+        self.assertEqual(quantiles(data, n=5, method='inclusive'),
+                         [184.0, 230.0, 278.0, 326.0])
+        self.assertEqual(quantiles(iter(data), n=2), [250.0])
+
+    def test_types(self):
+        quantiles = statistics.quantiles
+        F = Fraction
+        self.assertEqual(quantiles([F(1, 2), F(3, 2), F(5, 2)], n=2),
+                         [F(3, 2)])
+        self.assertEqual(quantiles([Decimal('1.5'), Decimal('2.5')], n=2),
+                         [Decimal('2.0')])
+
+    def test_median(self):
+        # With n=2, the single cut point is the median.
+        for n in (2, 3, 4, 5, 2000, 2001):
+            data = [random.random() for _ in range(n)]
+            self.assertEqual(statistics.quantiles(data, n=2),
+                             [statistics.median(data)])
+            self.assertEqual(
+                statistics.quantiles(data, n=2, method='inclusive'),
+                [statistics.median(data)])
+
+    def test_large(self):
+        # Results don't depend on how the cut points are located.
+        data = [random.random() for _ in range(3000)]
+        for method in ('exclusive', 'inclusive'):
+            quartiles = statistics.quantiles(data, method=method)
+            octiles = statistics.quantiles(data, n=8, method=method)
+            self.assertEqual(quartiles, octiles[1::2])
+            self.assertEqual(statistics.quantiles(data, n=2, method=method),
+                             quartiles[1:2])
+
+    def test_error_cases(self):
+        quantiles = statistics.quantiles
+        StatisticsError = statistics.StatisticsError
+        with self.assertRaises(StatisticsError):
+            quantiles([10, 20, 30], n=0)
+        with self.assertRaises(StatisticsError):
+            quantiles([10], n=4)
+        with self.assertRaises(StatisticsError):
+            quantiles([], n=4)
+        with self.assertRaises(ValueError):
+            quantiles([10, 20, 30], method='X')
+        with self.assertRaises(TypeError):
+            quantiles([10, 20, 30], 4)
+
+
 class VarianceStdevMixin(UnivariateCommonMixin):
     # Mixin class holding common tests for variance and std dev.
 
@@ -1831,6 +1940,103 @@ class TestStdev(VarianceStdevMixin, NumericTestCase):
         self.assertEqual(self.func(data), expected)
 
 
+class TestFastPaths(unittest.TestCase):
+    # The int and float fast paths give the same results as the general
+    # code.
+    def general(self, func, *args):
+        with support.swap_attr(statistics, '_fast_type', lambda data: None):
+            return func(*args)
+
+    def check(self, data):
+        for func in (statistics.mean, statistics.variance,
+                     statistics.pvariance):
+            self.assertEqual(func(data), self.general(func, data),
+                             func.__name__)
+
+    def test_floats(self):
+        self.check([random.uniform(-1e3, 1e3) for _ in range(500)])
+        self.check([random.expovariate(1e-5) for _ in range(500)])
+        self.check([1e16, 1.0, 3.0, -2.5])
+
+    def test_ints(self):
+        self.check([random.randrange(10**12) for _ in range(500)])
+
+    def test_variance_with_mean(self):
+        data = [random.uniform(-5, 5) for _ in range(100)]
+        for c in (1, 0.25):
+            self.assertEqual(statistics.pvariance(data, c),
+                             self.general(statistics.pvariance, data, c))
+
+    def test_non_finite(self):
+        inf = float('inf')
+        self.assertTrue(math.isnan(statistics.variance([1.0, inf, 2.0])))
+        self.assertEqual(statistics.mean([1.0, inf]), inf)
+        self.assertTrue(math.isnan(statistics.mean([1.0, float('nan')])))
+
+
+class TestRunningStats(unittest.TestCase):
+
+    def test_empty(self):
+        stats = statistics.RunningStats()
+        self.assertEqual(len(stats), 0)
+        for method in (stats.mean, stats.min, stats.max, stats.pvariance,
+                       stats.pstdev, stats.variance, stats.stdev):
+            self.assertRaises(statistics.StatisticsError, method)
+
+    def test_single_value(self):
+        stats = statistics.RunningStats([3])
+        self.assertEqual(stats.mean(), 3.0)
+        self.assertEqual(stats.min(), 3.0)
+        self.assertEqual(stats.max(), 3.0)
+        self.assertEqual(stats.pvariance(), 0.0)
+        self.assertRaises(statistics.StatisticsError, stats.variance)
+
+    def test_compare_to_functions(self):
+        data = [random.uniform(-10, 30) for _ in range(1000)]
+        stats = statistics.RunningStats(data)
+        self.assertEqual(len(stats), len(data))
+        self.assertEqual(stats.min(), min(data))
+        self.assertEqual(stats.max(), max(data))
+        self.assertAlmostEqual(stats.mean(), statistics.mean(data))
+        self.assertAlmostEqual(stats.variance(), statistics.variance(data))
+        self.assertAlmostEqual(stats.pvariance(), statistics.pvariance(data))
+        self.assertAlmostEqual(stats.stdev(), statistics.stdev(data))
+        self.assertAlmostEqual(stats.pstdev(), statistics.pstdev(data))
+
+    def test_add_update(self):
+        data = [random.uniform(-10, 30) for _ in range(100)]
+        a = statistics.RunningStats()
+        for x in data:
+            a.add(x)
+        b = statistics.RunningStats()
+        b.update(iter(data))
+        self.assertEqual(len(a), len(b))
+        self.assertEqual(a.mean(), b.mean())
+        self.assertEqual(a.variance(), b.variance())
+        self.assertEqual((a.min(), a.max()), (b.min(), b.max()))
+
+    def test_merge(self):
+        data = [random.uniform(-10, 30) for _ in range(100)]
+        whole = statistics.RunningStats(data)
+        for i in (0, 1, 50, 100):
+            a = statistics.RunningStats(data[:i])
+            a.merge(statistics.RunningStats(data[i:]))
+            self.assertEqual(len(a), len(whole))
+            self.assertAlmostEqual(a.mean(), whole.mean())
+            self.assertAlmostEqual(a.variance(), whole.variance())
+            self.assertEqual((a.min(), a.max()), (whole.min(), whole.max()))
+
+    def test_large_offset(self):
+        # Welford's method doesn't lose the variance to cancellation.
+        stats = statistics.RunningStats(x + 1e9 for x in [4, 7, 13, 16])
+        self.assertEqual(stats.variance(), 30.0)
+
+    def test_non_numeric(self):
+        stats = statistics.RunningStats()
+        self.assertRaises(TypeError, stats.add, None)
+        self.assertRaises(ValueError, stats.update, ['spam'])
+
+
 # === Run tests ===
 
 def load_tests(loader, tests, ignore):
@@ -660,5 +660,213 @@ class UnpackIteratorTest(unittest.TestCase):
         self.assertRaises(StopIteration, next, it)
 
 
+class ColumnsTest(unittest.TestCase):
+    """
+    Tests for columnar unpacking and packing (struct.Struct.unpack_columns
+    and struct.Struct.pack_columns_into).
+    """
+
+    # two sample values for each format code of a record
+    samples = {'b': (0, -100), 'B': (0, 200), 'h': (1, -30000),
+               'H': (1, 60000), 'i': (-1, -2**31), 'I': (1, 2**32 - 1),
+               'l': (-1, -2**31), 'L': (1, 2**32 - 1), 'q': (-1, -2**63),
+               'Q': (1, 2**64 - 1), 'n': (-1, -2**31), 'N': (1, 2**32 - 1),
+               'f': (1.5, -0.0), 'd': (-2.25, 1e300), '?': (False, True),
+               'c': (b'\0', b'x'), 's': (b'\0\0', b'ab'), 'p': (b'a', b''),
+               'P': (0, 12345)}
+
+    def records(self, fmt, n):
+        codes = [c for c in fmt if c in self.samples]
+        return [tuple(self.samples[c][i % 2] for c in codes)
+                for i in range(n)]
+
+    def check(self, fmt, n=5):
+        s = struct.Struct(fmt)
+        records = self.records(fmt, n)
+        data = b''.join(s.pack(*r) for r in records)
+        columns = s.unpack_columns(data)
+        self.assertEqual(len(columns), len(records[0]))
+        self.assertEqual(list(zip(*columns)), records)
+        out = bytearray(len(data))
+        self.assertEqual(s.pack_columns_into(out, 0, *columns), n)
+        self.assertEqual(out, data)
+        out = bytearray(len(data))
+        s.pack_columns_into(out, 0, *[list(c) for c in columns])
+        self.assertEqual(out, data)
+        return columns
+
+    def test_integer_formats(self):
+        for code, byteorder in iter_integer_formats():
+            with self.subTest(code=code, byteorder=byteorder):
+                fmt = byteorder + code
+                column, = self.check(fmt)
+                self.assertIsInstance(column, array.array)
+                self.assertEqual(column.itemsize, struct.calcsize(fmt))
+                self.assertEqual(column.typecode.islower(), code.islower())
+                if byteorder in ('', '@') and code not in 'nN':
+                    self.assertEqual(column.typecode, code)
+
+    def test_float_formats(self):
+        for code in 'fd':
+            for byteorder in byteorders:
+                with self.subTest(code=code, byteorder=byteorder):
+                    column, = self.check(byteorder + code)
+                    self.assertIsInstance(column, array.array)
+                    self.assertEqual(column.typecode, code)
+
+    def test_mixed_formats(self):
+        for byteorder in byteorders:
+            with self.subTest(byteorder=byteorder):
+                fmt = byteorder + 'bxh?i2sd3pcq'
+                columns = self.check(fmt, n=100)
+                self.assertEqual([type(c) for c in columns],
+                                 [array.array, array.array, list,
+                                  array.array, list, array.array, list,
+                                  list, array.array])
+        columns = self.check('P')
+        self.assertIsInstance(columns[0], list)
+
+    def test_repeat_counts(self):
+        s = struct.Struct('<3h')
+        data = s.pack(1, 2, 3) + s.pack(4, 5, 6)
+        self.assertEqual(s.unpack_columns(data),
+                         (array.array('h', [1, 4]), array.array('h', [2, 5]),
+                          array.array('h', [3, 6])))
+
+    def test_unpack_offset_count(self):
+        s = struct.Struct('>IB')
+        data = bytes(range(1, 16))
+        self.assertEqual(s.unpack_columns(data, 5),
+                         (array.array('I', [0x06070809, 0x0b0c0d0e]),
+                          array.array('B', [10, 15])))
+        self.assertEqual(s.unpack_columns(data, offset=-5),
+                         (array.array('I', [0x0b0c0d0e]),
+                          array.array('B', [15])))
+        self.assertEqual(s.unpack_columns(data, count=2),
+                         (array.array('I', [0x01020304, 0x06070809]),
+                          array.array('B', [5, 10])))
+        self.assertEqual(s.unpack_columns(data, 1, 0),
+                         (array.array('I'), array.array('B')))
+        self.assertEqual(s.unpack_columns(b''),
+                         (array.array('I'), array.array('B')))
+        self.assertEqual(s.unpack_columns(memoryview(data)[:5]),
+                         (array.array('I', [0x01020304]),
+                          array.array('B', [5])))
+        # Wrong lengths
+        self.assertRaises(struct.error, s.unpack_columns, data[:-1])
+        self.assertRaises(struct.error, s.unpack_columns, data, 1)
+        self.assertRaises(struct.error, s.unpack_columns, data, count=4)
+        self.assertRaises(struct.error, s.unpack_columns, data, 16)
+        self.assertRaises(struct.error, s.unpack_columns, data, -16)
+        # Zero-length struct
+        s = struct.Struct('>')
+        self.assertRaises(struct.error, s.unpack_columns, b'')
+        self.assertEqual(s.unpack_columns(b'', count=3), ())
+
+    def test_pack_into_buffers(self):
+        s = struct.Struct('<Hd')
+        columns = (array.array('H', range(1000)),
+                   array.array('d', [x / 4 for x in range(1000)]))
+        expected = b''.join(s.pack(*r) for r in zip(*columns))
+        # bytearray with an offset, pad bytes are cleared
+        out = bytearray(b'\xff' * (len(expected) + 3))
+        self.assertEqual(s.pack_columns_into(out, 3, *columns), 1000)
+        self.assertEqual(out, b'\xff' * 3 + expected)
+        # negative offset
+        out = bytearray(len(expected) + 3)
+        s.pack_columns_into(out, -len(expected), *columns)
+        self.assertEqual(out[3:], expected)
+        # writable memoryview
+        out = bytearray(len(expected))
+        s.pack_columns_into(memoryview(out), 0, *columns)
+        self.assertEqual(out, expected)
+        # buffers of another C type or byte order are converted
+        out = bytearray(len(expected))
+        s.pack_columns_into(out, 0, array.array('i', columns[0]),
+                            memoryview(columns[1]).cast('B').cast('d'))
+        self.assertEqual(out, expected)
+        out = bytearray(len(expected))
+        s.pack_columns_into(out, 0, tuple(columns[0]), columns[1][:])
+        self.assertEqual(out, expected)
+        # the pad bytes of the Struct are cleared
+        s = struct.Struct('bxxxi')
+        out = bytearray(b'\xff' * 16)
+        s.pack_columns_into(out, 0, [1, 2], [3, 4])
+        self.assertEqual(out, s.pack(1, 3) + s.pack(2, 4))
+
+    def test_pack_into_overlapping(self):
+        # columns sharing memory with the records are read before the
+        # records are written
+        out = bytearray(struct.pack('<4i', 1, 2, 3, 4))
+        struct.pack_columns_into('<i', out, 4, memoryview(out).cast('i')[:3])
+        self.assertEqual(struct.unpack('<4i', out), (1, 1, 2, 3))
+        # fields swapped in place, and converted items
+        s = struct.Struct('=ii')
+        out = bytearray(s.pack(1, 2) + s.pack(3, 4))
+        m = memoryview(out).cast('i')
+        s.pack_columns_into(out, 0, m[1::2], m[::2])
+        self.assertEqual(s.unpack_columns(out),
+                         (array.array('i', [2, 4]), array.array('i', [1, 3])))
+        out = bytearray(s.pack(1, 2) + s.pack(3, 4))
+        m = memoryview(out).cast('i')
+        s.pack_columns_into(out, 0, m[1::2].tolist(), m[::2])
+        self.assertEqual(s.unpack_columns(out),
+                         (array.array('i', [2, 4]), array.array('i', [1, 3])))
+
+    def test_pack_into_mmap(self):
+        mmap = support.import_module('mmap')
+        s = struct.Struct('>iq')
+        m = mmap.mmap(-1, s.size * 4)
+        try:
+            s.pack_columns_into(m, 0, array.array('i', [1, -2, 3, -4]),
+                                range(4))
+            self.assertEqual(s.unpack_columns(m),
+                             (array.array('i', [1, -2, 3, -4]),
+                              array.array('q', [0, 1, 2, 3])))
+        finally:
+            m.close()
+
+    def test_pack_errors(self):
+        s = struct.Struct('<hs')
+        out = bytearray(12)
+        self.assertRaises(struct.error, s.pack_columns_into)
+        self.assertRaises(struct.error, s.pack_columns_into, out)
+        self.assertRaises(struct.error, s.pack_columns_into, out, 0, [1])
+        self.assertRaises(struct.error, s.pack_columns_into, out, 0,
+                          [1], [b'a'], [2])
+        # columns of different lengths
+        self.assertRaises(struct.error, s.pack_columns_into, out, 0,
+                          [1, 2], [b'a'])
+        # buffer too small
+        self.assertRaises(struct.error, s.pack_columns_into, out, 0,
+                          [1] * 5, [b'a'] * 5)
+        self.assertRaises(struct.error, s.pack_columns_into, out, 10,
+                          [1], [b'a'])
+        self.assertRaises(struct.error, s.pack_columns_into, out, -13,
+                          [1], [b'a'])
+        self.assertRaises(TypeError, s.pack_columns_into, bytes(12), 0,
+                          [1], [b'a'])
+        self.assertRaises(TypeError, s.pack_columns_into, out, 0, 1, 2)
+        # bad items
+        self.assertRaises(struct.error, s.pack_columns_into, out, 0,
+                          [1, 2**20], [b'a', b'b'])
+        self.assertRaises(struct.error, s.pack_columns_into, out, 0,
+                          [1, 2], [b'a', 'b'])
+        self.assertEqual(s.pack_columns_into(out, 0, [], []), 0)
+
+    def test_module_funcs(self):
+        data = struct.pack('<2h', 1, 2) + struct.pack('<2h', 3, 4)
+        columns = struct.unpack_columns('<2h', data)
+        self.assertEqual(columns, (array.array('h', [1, 3]),
+                                   array.array('h', [2, 4])))
+        self.assertEqual(struct.unpack_columns('<2h', data, offset=4),
+                         (array.array('h', [3]), array.array('h', [4])))
+        out = bytearray(8)
+        self.assertEqual(struct.pack_columns_into('<2h', out, 0, *columns), 2)
+        self.assertEqual(out, data)
+        self.assertRaises(TypeError, struct.unpack_columns)
+        self.assertRaises(TypeError, struct.pack_columns_into)
+
+
 if __name__ == '__main__':
     unittest.main()
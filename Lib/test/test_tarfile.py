@@ -561,6 +561,73 @@ class MiscReadTestBase(CommonReadTest):
             tar.close()
             support.rmtree(DIR)
 
+    @support.reap_threads
+    def test_extractall_threads(self):
+        DIR1 = os.path.join(TEMPDIR, "extractall1")
+        DIR2 = os.path.join(TEMPDIR, "extractall2")
+        self.addCleanup(support.rmtree, DIR1)
+        self.addCleanup(support.rmtree, DIR2)
+        with tarfile.open(self.tarname, mode=self.mode,
+                          encoding="iso8859-1") as tar:
+            members = []
+            for tarinfo in tar:
+                # Devices cannot be created without privileges.
+                if tarinfo.ischr() or tarinfo.isblk():
+                    continue
+                try:
+                    os.fsencode(tarinfo.name)
+                except UnicodeEncodeError:
+                    continue
+                members.append(tarinfo)
+            tar.extractall(DIR1, members)
+            tar.extractall(DIR2, members, threads=3)
+            with self.assertRaises(ValueError):
+                tar.extractall(DIR2, members, threads=0)
+        for tarinfo in members:
+            if not tarinfo.isreg():
+                continue
+            path1 = os.path.join(DIR1, tarinfo.name)
+            path2 = os.path.join(DIR2, tarinfo.name)
+            with open(path1, "rb") as f1, open(path2, "rb") as f2:
+                self.assertEqual(f1.read(), f2.read(), tarinfo.name)
+            st1 = os.stat(path1)
+            st2 = os.stat(path2)
+            self.assertEqual(st1.st_mode, st2.st_mode, tarinfo.name)
+            self.assertEqual(st1.st_mtime, st2.st_mtime, tarinfo.name)
+
+    def test_index(self):
+        with tarfile.open(self.tarname, mode=self.mode,
+                          encoding="iso8859-1") as tar:
+            names = tar.getnames()
+            index = io.StringIO()
+            tar.save_index(index)
+        index.seek(0)
+        with tarfile.open(self.tarname, mode=self.mode,
+                          encoding="iso8859-1") as tar:
+            tar.load_index(index)
+            self.assertEqual(tar.getnames(), names)
+            tarinfo = tar.getmember("gnu/sparse")
+            self.assertIs(tarinfo.tarfile, tar)
+            self.assertEqual(tarinfo.type, tarfile.GNUTYPE_SPARSE)
+            self.assertIsNotNone(tarinfo.sparse)
+            with tar.extractfile("ustar/regtype") as fobj:
+                self.assertEqual(md5sum(fobj.read()), md5_regtype)
+            with tar.extractfile("gnu/sparse") as fobj:
+                self.assertEqual(md5sum(fobj.read()), md5_sparse)
+
+    def test_index_mismatch(self):
+        with tarfile.open(self.tarname, mode=self.mode,
+                          encoding="iso8859-1") as tar:
+            index = io.StringIO()
+            tar.save_index(index)
+        index = index.getvalue().replace('"offset": 0,', '"offset": 512,')
+        with tarfile.open(self.tarname, mode=self.mode,
+                          encoding="iso8859-1") as tar:
+            with self.assertRaises(tarfile.ReadError):
+                tar.load_index(io.StringIO(index))
+            with self.assertRaises(tarfile.ReadError):
+                tar.load_index(io.StringIO("{}"))
+
     def test_extract_directory(self):
         dirtype = "ustar/dirtype"
         DIR = os.path.join(TEMPDIR, "extractdir")
@@ -341,14 +341,39 @@ class ElementTreeTest(unittest.TestCase):
         from xml.etree import ElementPath
 
         elem = ET.XML(SAMPLE_XML)
-        for i in range(10): ET.ElementTree(elem).find('./'+str(i))
+        for i in range(10): ElementPath.find(elem, './'+str(i))
         cache_len_10 = len(ElementPath._cache)
-        for i in range(10): ET.ElementTree(elem).find('./'+str(i))
+        for i in range(10): ElementPath.find(elem, './'+str(i))
         self.assertEqual(len(ElementPath._cache), cache_len_10)
-        for i in range(20): ET.ElementTree(elem).find('./'+str(i))
+        for i in range(20): ElementPath.find(elem, './'+str(i))
         self.assertGreater(len(ElementPath._cache), cache_len_10)
-        for i in range(600): ET.ElementTree(elem).find('./'+str(i))
+        for i in range(600): ElementPath.find(elem, './'+str(i))
         self.assertLess(len(ElementPath._cache), 500)
+        # recently used paths are kept
+        for i in range(600):
+            ElementPath.find(elem, './0')
+            ElementPath.find(elem, './'+str(i))
+        self.assertIn(('./0', None), ElementPath._cache)
+
+    def test_path_compile(self):
+        from xml.etree import ElementPath
+        ns = {'ns': 'urn:x'}
+        self.assertEqual(ElementPath._compile('a/*/./b'),
+                         (('child', 'a'), ('star',), ('self',),
+                          ('child', 'b')))
+        self.assertEqual(ElementPath._compile('a/'),
+                         (('child', 'a'), ('star',)))
+        self.assertEqual(ElementPath._compile('.//ns:a//*', ns),
+                         (('self',), ('descendant', '{urn:x}a'),
+                          ('descendant', None)))
+        self.assertEqual(ElementPath._compile(
+                            "a[@k][@k='v'][b][b='t']"),
+                         (('child', 'a'), ('attr', 'k'), ('attr=', 'k', 'v'),
+                          ('tag', 'b'), ('tag=', 'b', 't')))
+        # left to iterfind
+        for path in ('a/..', 'a[1]', 'a[last()]', '/a', 'a[', '//[',
+                     'ns:a', 'a[@k=]'):
+            self.assertIsNone(ElementPath._compile(path), path)
 
     def test_copy(self):
         # Test copy handling (etc).
@@ -1164,6 +1189,70 @@ class XMLPullParserTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             ET.XMLPullParser(events=('start', 'end', 'bogus'))
 
+    def test_stream_tag(self):
+        parser = ET.XMLPullParser(events=('start', 'end'), tag='item')
+        self._feed(parser, "<root><a><item id='1'><x/></item>t", 5)
+        events = list(parser.read_events())
+        self.assertEqual([(action, elem.get('id')) for action, elem in events],
+                         [('start', '1'), ('end', '1')])
+        # the reported element keeps its children
+        self.assertEqual([e.tag for e in events[1][1]], ['x'])
+        self._feed(parser, "<b/><item id='2'><item id='3'/></item></a></root>")
+        self.assertEqual([(action, elem.get('id'))
+                          for action, elem in parser.read_events()],
+                         [('start', '2'), ('start', '3'), ('end', '3'),
+                          ('end', '2')])
+        root = parser._close_and_return_root()
+        # completed elements were discarded
+        self.assertEqual(ET.tostring(root), b'<root />')
+
+    def test_stream_nested_match(self):
+        parser = ET.XMLPullParser(tag='item')
+        self._feed(parser, "<root><item id='1'><item id='2'/></item></root>")
+        elems = [elem for action, elem in parser.read_events()]
+        self.assertEqual([e.get('id') for e in elems], ['2', '1'])
+        # an inner match stays in its enclosing match
+        self.assertIs(elems[1][0], elems[0])
+
+    def test_stream_path(self):
+        xml = ("<root xmlns:n='urn:n'><a><b/><c><b/></c></a>"
+               "<n:b/><d><a><b/></a></d></root>")
+        for tag, expected in [('a/b', ['b', 'b']),
+                              ('root/*', ['a', '{urn:n}b', 'd']),
+                              ('{urn:n}b', ['{urn:n}b']),
+                              ('root/a/b', ['b']),
+                              ('*/*/*/*', ['b', 'b'])]:
+            with self.subTest(tag=tag):
+                parser = ET.XMLPullParser(tag=tag)
+                self._feed(parser, xml)
+                self.assert_event_tags(parser, [('end', t) for t in expected])
+
+    def test_stream_ns_events(self):
+        parser = ET.XMLPullParser(events=('start-ns', 'end'), tag='{urn:n}b')
+        self._feed(parser, "<a xmlns='urn:n'><b/><c/></a>")
+        self.assertEqual(list(parser.read_events())[0], ('start-ns', ('', 'urn:n')))
+
+    def test_stream_iterparse(self):
+        source = io.BytesIO(b"<root>" + b"<rec><v>1</v></rec>" * 1000 + b"</root>")
+        context = ET.iterparse(source, tag="rec")
+        self.assertEqual(sum(int(elem[0].text) for action, elem in context),
+                         1000)
+        self.assertEqual(len(context.root), 0)
+
+    def test_stream_needs_treebuilder(self):
+        class Target:
+            def start(self, tag, attrib): pass
+            def end(self, tag): pass
+        parser = ET.XMLParser(target=Target())
+        with self.assertRaises(TypeError):
+            ET.XMLPullParser(tag='a', _parser=parser)
+
+    def test_stream_invalid_tag(self):
+        for tag in ('', 'a//b', '/a'):
+            with self.subTest(tag=tag):
+                with self.assertRaises(ValueError):
+                    ET.XMLPullParser(tag=tag)
+
 
 #
 # xinclude tests (samples from appendix C of the xinclude specification)
@@ -1889,7 +1978,7 @@ class BadElementPathTest(ElementTestCase, unittest.TestCase):
         super().setUp()
         from xml.etree import ElementPath
         self.path_cache = ElementPath._cache
-        ElementPath._cache = {}
+        ElementPath._cache = type(self.path_cache)()
 
     def tearDown(self):
         from xml.etree import ElementPath
@@ -54,6 +54,65 @@ class MiscTests(unittest.TestCase):
             del element.attrib
         self.assertEqual(element.attrib, {'A': 'B', 'C': 'D'})
 
+    def test_path_cache(self):
+        import _elementtree
+        cache = _elementtree._path_cache
+        cache.clear()
+        e = cET.XML('<a><b/><c/></a>')
+        for i in range(1000):
+            e.find('./0')
+            e.find('./x%d' % i)
+        self.assertLessEqual(len(cache), 512)
+        self.assertIn('./0', cache)
+        # paths ElementPath evaluates itself are cached as None
+        e.find('b/..')
+        self.assertIsNone(cache['b/..'])
+        e.find('b', {'p': 'urn:x'})
+        self.assertIn(('b', frozenset({('p', 'urn:x')})), cache)
+
+    def test_compiled_path(self):
+        pyET = import_fresh_module('xml.etree.ElementTree',
+                                   blocked=['_elementtree'])
+        xml = ('<r xmlns:n="urn:n"><a k="1"><b>x<c/>y</b><n:b/></a>'
+               '<a k="2"><a k="3"><b/></a><d>xy</d></a>'
+               '<b k=""><c/><c k="1"/></b></r>')
+        paths = ['a', 'a/b', 'a/*', './a/.', '*/b', './/b', './/*', 'a//b',
+                 './/a//*', 'a/', 'a[@k]', "a[@k='2']", "*[@k='']",
+                 'a[b]', "a[d='xy']", "a[b='xy']", "b/c[@k]", './/n:b',
+                 '{urn:n}b', './/{urn:n}b', 'x', 'a/x', 'a/b/../..']
+        c = cET.XML(xml)
+        p = pyET.XML(xml)
+        for path in paths:
+            with self.subTest(path=path):
+                ns = {'n': 'urn:n'}
+                expected = [(e.tag, e.get('k'))
+                            for e in p.findall(path, ns)]
+                self.assertEqual([(e.tag, e.get('k'))
+                                  for e in c.findall(path, ns)],
+                                 expected)
+                self.assertEqual([(e.tag, e.get('k'))
+                                  for e in c.iterfind(path, ns)],
+                                 expected)
+                found = c.find(path, ns)
+                self.assertEqual(found is None, not expected)
+                if expected:
+                    self.assertEqual((found.tag, found.get('k')),
+                                     expected[0])
+                self.assertEqual(c.findtext(path, 'no', ns),
+                                 p.findtext(path, 'no', ns))
+        with self.assertRaises(SyntaxError):
+            c.findall('/a')
+        with self.assertRaises(SyntaxError):
+            c.find('a[@k=]')
+
+    def test_iterfind_is_lazy(self):
+        e = cET.XML('<a><b/><c><b/></c></a>')
+        it = e.iterfind('.//b')
+        self.assertIs(next(it), e[0])
+        # elements added after the iteration started are found
+        cET.SubElement(e, 'b')
+        self.assertEqual(list(it), [e[1][0], e[2]])
+
 
 @unittest.skipUnless(cET, 'requires _elementtree')
 class TestAliasWorking(unittest.TestCase):
@@ -14,7 +14,8 @@ from random import randint, random, getrandbits
 
 from test.support import (TESTFN, findfile, unlink, rmtree,
                           requires_zlib, requires_bz2, requires_lzma,
-                          captured_stdout, check_warnings)
+                          captured_stdout, check_warnings, reap_threads,
+                          import_module)
 
 TESTFN2 = TESTFN + "2"
 TESTFNDIR = TESTFN + "d"
@@ -361,6 +362,22 @@ class AbstractTestsWithSourceFile:
                 self.assertIn('[closed]', repr(zipopen))
             self.assertIn('[closed]', repr(zipfp))
 
+    def test_read_mmap(self):
+        self.make_test_archive(TESTFN2, self.compression)
+        with zipfile.ZipFile(TESTFN2, "r", use_mmap=True) as zipfp:
+            with zipfp.open(TESTFN) as zipopen:
+                # The data is read from the map without copying it first.
+                self.assertIsInstance(zipopen._fileobj.read(0), memoryview)
+                self.assertEqual(zipopen.readline(), self.line_gen[0])
+                self.assertEqual(zipopen.peek(1)[:1], self.line_gen[1][:1])
+                self.assertEqual(zipopen.read1(5), self.line_gen[1][:5])
+                data = zipopen.read()
+                self.assertIs(type(data), bytes)
+                self.assertEqual(data, self.data[len(self.line_gen[0]) + 5:])
+            self.assertEqual(zipfp.read("strfile"), self.data)
+            mapping = zipfp._mmap
+        self.assertTrue(mapping.closed)
+
     def tearDown(self):
         unlink(TESTFN)
         unlink(TESTFN2)
@@ -1271,6 +1288,39 @@ class OtherTests(unittest.TestCase):
 
                 self.assertEqual(f.read(), b"O, for a Muse of Fire!")
 
+    def test_lazy_index(self):
+        with zipfile.ZipFile(TESTFN, "w") as zipfp:
+            for i in range(10):
+                zipfp.writestr("dir/name%d" % i, b"data%d" % i)
+            zipfp.writestr("dir/name3", b"duplicate")
+        with zipfile.ZipFile(TESTFN, "r") as zipfp:
+            self.assertEqual(zipfp.namelist(),
+                             ["dir/name%d" % i for i in range(10)] +
+                             ["dir/name3"])
+            info = zipfp.getinfo("dir/name5")
+            self.assertIs(zipfp.getinfo("dir/name5"), info)
+            self.assertEqual(zipfp.read(info), b"data5")
+            self.assertEqual(zipfp.read("dir/name3"), b"duplicate")
+            with self.assertRaises(KeyError):
+                zipfp.getinfo("dir/name10")
+            infos = zipfp.infolist()
+            self.assertEqual(len(infos), 11)
+            self.assertIs(infos[5], info)
+            self.assertIs(zipfp.NameToInfo["dir/name3"], infos[10])
+        # The names can still be listed after the archive was closed.
+        self.assertEqual(len(zipfp.namelist()), 11)
+
+    def test_truncated_while_open(self):
+        # Without use_mmap, an archive truncated after it was opened is
+        # reported as an error.
+        with zipfile.ZipFile(TESTFN, "w") as zipfp:
+            zipfp.writestr("big", getrandbits(8 * 100000).to_bytes(100000,
+                                                                   'little'))
+        with zipfile.ZipFile(TESTFN, "r") as zipfp:
+            os.truncate(TESTFN, 4096)
+            with self.assertRaises((EOFError, zipfile.BadZipFile)):
+                zipfp.read("big")
+
     def test_open_non_existent_item(self):
         """Check that attempting to call open() for an item that doesn't
         exist in the archive raises a RuntimeError."""
@@ -1870,6 +1920,30 @@ class TestsWithMultipleOpens(unittest.TestCase):
         with open(os.devnull) as f:
             self.assertLess(f.fileno(), 100)
 
+    @reap_threads
+    def test_read_concurrently(self):
+        for use_mmap in (False, True):
+            with self.subTest(use_mmap=use_mmap):
+                self.check_read_concurrently(use_mmap)
+
+    def check_read_concurrently(self, use_mmap):
+        threading = import_module('threading')
+        self.make_test_archive(TESTFN2)
+        results = {}
+        with zipfile.ZipFile(TESTFN2, mode="r", use_mmap=use_mmap) as zipf:
+            def reader(name):
+                for i in range(20):
+                    results[name, i] = zipf.read(name)
+            threads = [threading.Thread(target=reader, args=(name,))
+                       for name in ('ones', 'twos') * 2]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        self.assertEqual(len(results), 40)
+        for (name, i), data in results.items():
+            self.assertEqual(data, self.data1 if name == 'ones' else self.data2)
+
     def tearDown(self):
         unlink(TESTFN2)
 
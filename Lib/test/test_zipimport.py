@@ -8,6 +8,7 @@ import time
 import unittest
 
 from test import support
+from test.support import script_helper
 
 from zipfile import ZipFile, ZipInfo, ZIP_STORED, ZIP_DEFLATED
 
@@ -183,6 +184,63 @@ class UncompressedZipImportTestCase(ImportHooksBaseTestCase):
                  TESTMOD + pyc_ext: (NOW, test_pyc)}
         self.doTest(pyc_ext, files, TESTMOD)
 
+    def testRewrittenArchive(self):
+        # Changes to the archive are picked up, also when it is read through
+        # a memory map.
+        def make(value, padding):
+            src = "x = {!r}\n".format(value)
+            files = {TESTMOD + pyc_ext: (NOW, make_pyc(compile(src, "???", "exec"),
+                                                     NOW, len(src))),
+                     "padding": (NOW, padding)}
+            self.makeZip(files)
+            sys.path_importer_cache.pop(TEMP_ZIP, None)
+            zipimport._zip_directory_cache.clear()
+
+        sys.path.insert(0, TEMP_ZIP)
+        make(1, b"")
+        self.assertEqual(importlib.import_module(TESTMOD).x, 1)
+        del sys.modules[TESTMOD]
+        make("spam", b"a" * 1000)
+        self.assertEqual(importlib.import_module(TESTMOD).x, "spam")
+        z = zipimport.zipimporter(TEMP_ZIP)
+        self.assertEqual(z.get_data("padding"), b"a" * 1000)
+
+    def testTruncatedArchive(self):
+        # An archive truncated after it was read is reported as an error.
+        self.makeZip({TESTMOD + ".py": (NOW, test_src),
+                      "padding": (NOW, os.urandom(10000))})
+        z = zipimport.zipimporter(TEMP_ZIP)
+        with open(TEMP_ZIP, "r+b") as f:
+            f.truncate(4096)
+        with self.assertRaises((zipimport.ZipImportError, OSError)):
+            z.get_data("padding")
+
+    @unittest.skipUnless(hasattr(zipimport, "_zip_mapping_cache"),
+                         "requires mmap")
+    def testMemoryMap(self):
+        # Archives are read through a memory map with -X zipimportmmap.
+        src = "x = 42\n"
+        self.makeZip({TESTMOD + pyc_ext:
+                          (NOW, make_pyc(compile(src, "???", "exec"),
+                                         NOW, len(src))),
+                      "padding": (NOW, b"a" * 1000)})
+        code = ("import sys, zipimport; sys.path.insert(0, %r); "
+                "import %s; assert %s.x == 42; "
+                "assert list(zipimport._zip_mapping_cache) == [%r]; "
+                "z = zipimport.zipimporter(%r); "
+                "assert z.get_data('padding') == b'a' * 1000"
+                % (TEMP_ZIP, TESTMOD, TESTMOD, TEMP_ZIP, TEMP_ZIP))
+        script_helper.assert_python_ok("-X", "zipimportmmap", "-c", code)
+        # Without the option, the archive is read as a file.
+        sys.path.insert(0, TEMP_ZIP)
+        try:
+            mod = importlib.import_module(TESTMOD)
+            self.assertEqual(mod.x, 42)
+        finally:
+            del sys.path[0]
+            sys.modules.pop(TESTMOD, None)
+        self.assertEqual(zipimport._zip_mapping_cache, {})
+
     def testEmptyPy(self):
         files = {TESTMOD + ".py": (NOW, "")}
         self.doTest(None, files, TESTMOD)
@@ -57,6 +57,7 @@
 ##
 
 import re
+from collections import OrderedDict
 
 xpath_tokenizer_re = re.compile(
     "("
@@ -144,24 +145,27 @@ def prepare_parent(next, token):
                     yield parent
     return select
 
-def prepare_predicate(next, token):
+def parse_predicate(next):
     # FIXME: replace with real parser!!! refs:
     # http://effbot.org/zone/simple-iterator-parser.htm
     # http://javascript.crockford.com/tdop/tdop.html
     signature = []
     predicate = []
     while 1:
-        try:
-            token = next()
-        except StopIteration:
-            return
+        token = next()
         if token[0] == "]":
             break
         if token[0] and token[0][:1] in "'\"":
             token = "'", token[0][1:-1]
         signature.append(token[0] or "-")
         predicate.append(token[1])
-    signature = "".join(signature)
+    return "".join(signature), predicate
+
+def prepare_predicate(next, token):
+    try:
+        signature, predicate = parse_predicate(next)
+    except StopIteration:
+        return
     # use signature to determine predicate type
     if signature == "@-":
         # [@attribute] predicate
@@ -241,7 +245,8 @@ ops = {
     "[": prepare_predicate,
     }
 
-_cache = {}
+_cache = OrderedDict()
+_MAXCACHE = 100
 
 class _SelectorContext:
     parent_map = None
@@ -262,8 +267,6 @@ def iterfind(elem, path, namespaces=None):
     try:
         selector = _cache[cache_key]
     except KeyError:
-        if len(_cache) > 100:
-            _cache.clear()
         if path[:1] == "/":
             raise SyntaxError("cannot use absolute path on element")
         next = iter(xpath_tokenizer(path, namespaces)).__next__
@@ -284,6 +287,10 @@ def iterfind(elem, path, namespaces=None):
             except StopIteration:
                 break
         _cache[cache_key] = selector
+        if len(_cache) > _MAXCACHE:
+            _cache.popitem(last=False)
+    else:
+        _cache.move_to_end(cache_key)
     # execute selector pattern
     result = [elem]
     context = _SelectorContext(elem)
@@ -291,6 +298,64 @@ def iterfind(elem, path, namespaces=None):
         result = select(context, result)
     return result
 
+##
+# Compile a path into a tuple of steps for the matcher in the C
+# accelerator.  Each step is a tuple of an operation name and its
+# arguments.  Returns None for paths that only iterfind can evaluate
+# (parent and position selectors) and for invalid paths, so that the
+# caller falls back to iterfind and gets the same results and errors.
+
+def _compile(path, namespaces=None):
+    if path[-1:] == "/":
+        path = path + "*"
+    if path[:1] == "/":
+        return None
+    next = iter(xpath_tokenizer(path, namespaces)).__next__
+    steps = []
+    try:
+        token = next()
+        while 1:
+            op = token[0]
+            if op == "":
+                steps.append(("child", token[1]))
+            elif op == "*":
+                steps.append(("star",))
+            elif op == ".":
+                steps.append(("self",))
+            elif op == "//":
+                token = next()
+                if token[0] == "*":
+                    steps.append(("descendant", None))
+                elif not token[0]:
+                    steps.append(("descendant", token[1]))
+                else:
+                    return None
+            elif op == "[":
+                signature, predicate = parse_predicate(next)
+                if signature == "@-":
+                    steps.append(("attr", predicate[1]))
+                elif signature == "@-='":
+                    steps.append(("attr=", predicate[1], predicate[-1]))
+                elif (signature == "-" and
+                      not re.match("\-?\d+$", predicate[0])):
+                    steps.append(("tag", predicate[0]))
+                elif (signature == "-='" and
+                      not re.match("\-?\d+$", predicate[0])):
+                    steps.append(("tag=", predicate[0], predicate[-1]))
+                else:
+                    return None
+            else:
+                return None
+            try:
+                token = next()
+                if token[0] == "/":
+                    token = next()
+            except StopIteration:
+                break
+    except (StopIteration, SyntaxError):
+        return None
+    return tuple(steps)
+
 ##
 # Find first matching object.
 
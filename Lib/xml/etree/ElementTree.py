@@ -1186,7 +1186,7 @@ def parse(source, parser=None):
     return tree
 
 
-def iterparse(source, events=None, parser=None):
+def iterparse(source, events=None, parser=None, *, tag=None):
     """Incrementally parse XML document into ElementTree.
 
     This class also reports what's going on to the user based on the
@@ -1197,13 +1197,14 @@ def iterparse(source, events=None, parser=None):
 
     *source* is a filename or file object containing XML data, *events* is
     a list of events to report back, *parser* is an optional parser instance.
+    If *tag* is given, see XMLPullParser for the streaming mode it enables.
 
     Returns an iterator providing (event, elem) pairs.
 
     """
     # Use the internal, undocumented _parser argument for now; When the
     # parser argument of iterparse is removed, this can be killed.
-    pullparser = XMLPullParser(events=events, _parser=parser)
+    pullparser = XMLPullParser(events=events, tag=tag, _parser=parser)
     def iterator():
         try:
             while True:
@@ -1234,9 +1235,36 @@ def iterparse(source, events=None, parser=None):
     return it
 
 
+def _stream_path(tag):
+    # Split a path like "a/{ns}b/*" into a tuple of tags, None for "*".
+    parts = re.findall(r"(?:\{[^}]*\}|[^/{])+", tag)
+    if not parts or "/".join(parts) != tag:
+        raise ValueError("invalid tag path %r" % (tag,))
+    return tuple(None if part == "*" else part for part in parts)
+
+def _stream_match(stack, path):
+    # stack holds the open elements, the one to check last.
+    if len(path) > len(stack):
+        return False
+    for want, elem in zip(reversed(path), reversed(stack)):
+        if want is not None and elem.tag != want:
+            return False
+    return True
+
+
 class XMLPullParser:
+    """Feed-based incremental XML parser.
+
+    If *tag* is given, the parser streams: only "start" and "end" events of
+    elements matching *tag* are reported, and every completed element that
+    isn't part of a matching element is removed from its parent, so that
+    memory use doesn't grow with the size of the document.  *tag* is a tag
+    name or a path of tag names separated by "/" that the element and its
+    nearest ancestors must match; "*" matches any tag.
 
-    def __init__(self, events=None, *, _parser=None):
+    """
+
+    def __init__(self, events=None, *, tag=None, _parser=None):
         # The _parser argument is for internal use only and must not be relied
         # upon in user code. It will be removed in a future release.
         # See http://bugs.python.org/issue17741 for more details.
@@ -1246,7 +1274,11 @@ class XMLPullParser:
         # wire up the parser for event reporting
         if events is None:
             events = ("end",)
-        self._parser._setevents(self._events_queue, events)
+        if tag is None:
+            self._parser._setevents(self._events_queue, events)
+        else:
+            self._parser._setevents(self._events_queue, events,
+                                    _stream_path(tag))
 
     def feed(self, data):
         """Feed encoded data to parser."""
@@ -1474,15 +1506,20 @@ class XMLParser:
         except AttributeError:
             pass # unknown
 
-    def _setevents(self, events_queue, events_to_report):
+    def _setevents(self, events_queue, events_to_report, stream_path=None):
         # Internal API for XMLPullParser
         # events_to_report: a list of events to report during parsing (same as
         # the *events* of XMLPullParser's constructor.
         # events_queue: a list of actual parsing events that will be populated
         # by the underlying parser.
+        # stream_path: a tuple of tags for XMLPullParser's streaming mode.
         #
         parser = self._parser
         append = events_queue.append
+        if stream_path is not None:
+            self._setstream(append, events_to_report, stream_path)
+            events_to_report = [event for event in events_to_report
+                                if event not in ("start", "end")]
         for event_name in events_to_report:
             if event_name == "start":
                 parser.ordered_attributes = 1
@@ -1507,6 +1544,39 @@ class XMLParser:
             else:
                 raise ValueError("unknown event %r" % event_name)
 
+    def _setstream(self, append, events_to_report, path):
+        try:
+            stack = self.target._elem
+        except AttributeError:
+            raise TypeError("streaming only supported for "
+                            "ElementTree.TreeBuilder targets") from None
+        for event_name in events_to_report:
+            if event_name not in ("start", "end", "start-ns", "end-ns"):
+                raise ValueError("unknown event %r" % event_name)
+        report_start = "start" in events_to_report
+        report_end = "end" in events_to_report
+        matches = []    # matching elements still open
+        parser = self._parser
+        parser.ordered_attributes = 1
+        parser.specified_attributes = 1
+        def start_handler(tag, attrib_in, start=self._start):
+            elem = start(tag, attrib_in)
+            if _stream_match(stack, path):
+                matches.append(elem)
+                if report_start:
+                    append(("start", elem))
+        def end_handler(tag, end=self._end):
+            elem = end(tag)
+            if matches and matches[-1] is elem:
+                del matches[-1]
+                if report_end:
+                    append(("end", elem))
+            # drop completed elements outside of a matching element
+            if not matches and stack:
+                stack[-1].remove(elem)
+        parser.StartElementHandler = start_handler
+        parser.EndElementHandler = end_handler
+
     def _raiseerror(self, value):
         err = ParseError(value)
         err.code = value.code
@@ -13,6 +13,7 @@ import stat
 import shutil
 import struct
 import binascii
+import array
 
 try:
     import threading
@@ -36,6 +37,11 @@ try:
 except ImportError:
     lzma = None
 
+try:
+    import mmap # Used to read archives opened by name with use_mmap
+except ImportError:
+    mmap = None
+
 __all__ = ["BadZipFile", "BadZipfile", "error",
            "ZIP_STORED", "ZIP_DEFLATED", "ZIP_BZIP2", "ZIP_LZMA",
            "is_zipfile", "ZipInfo", "ZipFile", "PyZipFile", "LargeZipFile"]
@@ -670,6 +676,32 @@ class _SharedFile:
             self._file = None
             self._close(fileobj)
 
+class _MappedFile:
+    # Reads from a memory map need neither a lock nor a file position,
+    # so members can be read from several threads at the same time.  They
+    # return memoryviews of the map rather than copies, which must not be
+    # kept once the read data has been used.
+    def __init__(self, file, map, pos, close):
+        self._file = file
+        self._map = map
+        self._pos = pos
+        self._close = close
+
+    def read(self, n=-1):
+        if n is None or n < 0:
+            end = len(self._map)
+        else:
+            end = min(self._pos + n, len(self._map))
+        data = memoryview(self._map)[self._pos:end]
+        self._pos = max(end, self._pos)
+        return data
+
+    def close(self):
+        if self._file is not None:
+            fileobj = self._file
+            self._file = None
+            self._close(fileobj)
+
 # Provide the tell method for unseekable stream
 class _Tellable:
     def __init__(self, fp):
@@ -908,7 +940,9 @@ class ZipExtFile(io.BufferedIOBase):
         if self._compress_type == ZIP_DEFLATED:
             ## Handle unconsumed data.
             data = self._decompressor.unconsumed_tail
-            if n > len(data):
+            if not data:
+                data = self._read2(n)
+            elif n > len(data):
                 data += self._read2(n - len(data))
         else:
             data = self._read2(n)
@@ -932,7 +966,8 @@ class ZipExtFile(io.BufferedIOBase):
         if self._left <= 0:
             self._eof = True
         self._update_crc(data)
-        return data
+        # Stored data may still be a memoryview of a memory map.
+        return bytes(data)
 
     def _read2(self, n):
         if self._compress_left <= 0:
@@ -958,6 +993,100 @@ class ZipExtFile(io.BufferedIOBase):
             super().close()
 
 
+class _ZipIndex:
+    """Compact index of the central directory of a ZIP file.
+
+    Only the offsets of the central directory records are kept, in an
+    array.  ZipInfo objects are created from the records on first use, and
+    the mapping from names to records is built on the first lookup.
+    """
+
+    def __init__(self, data, offsets, concat):
+        self._data = data           # raw central directory
+        self._offsets = offsets     # array of record offsets in data
+        self._concat = concat       # offset of the archive in the file
+        self._infos = {}            # ZipInfo objects created so far
+        self._names = None          # list of file names
+        self._lookup = None         # file name -> record number
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def info(self, i):
+        """Return the ZipInfo for the i-th record."""
+        x = self._infos.get(i)
+        if x is not None:
+            return x
+        data = self._data
+        pos = self._offsets[i]
+        centdir = struct.unpack_from(structCentralDir, data, pos)
+        pos += sizeCentralDir
+        end = pos + centdir[_CD_FILENAME_LENGTH]
+        filename = self._decode(data[pos:end], centdir[_CD_FLAG_BITS])
+        # Create ZipInfo instance to store file information
+        x = ZipInfo(filename)
+        pos, end = end, end + centdir[_CD_EXTRA_FIELD_LENGTH]
+        x.extra = data[pos:end]
+        pos, end = end, end + centdir[_CD_COMMENT_LENGTH]
+        x.comment = data[pos:end]
+        x.header_offset = centdir[_CD_LOCAL_HEADER_OFFSET]
+        (x.create_version, x.create_system, x.extract_version, x.reserved,
+         x.flag_bits, x.compress_type, t, d,
+         x.CRC, x.compress_size, x.file_size) = centdir[1:12]
+        x.volume, x.internal_attr, x.external_attr = centdir[15:18]
+        # Convert date/time code to (year, month, day, hour, min, sec)
+        x._raw_time = t
+        x.date_time = ( (d>>9)+1980, (d>>5)&0xF, d&0x1F,
+                        t>>11, (t>>5)&0x3F, (t&0x1F) * 2 )
+
+        x._decodeExtra()
+        x.header_offset = x.header_offset + self._concat
+        return self._infos.setdefault(i, x)
+
+    def infolist(self):
+        return [self.info(i) for i in range(len(self._offsets))]
+
+    def namelist(self):
+        if self._names is None:
+            data = self._data
+            unpack_from = struct.Struct("<8xH18xH").unpack_from
+            names = []
+            append = names.append
+            for pos in self._offsets:
+                flags, namelen = unpack_from(data, pos)
+                pos += sizeCentralDir
+                name = data[pos:pos + namelen]
+                try:
+                    # Both encodings are supersets of ASCII.
+                    name = name.decode('ascii')
+                except UnicodeDecodeError:
+                    name = self._decode(name, flags)
+                if "\0" in name or (os.sep != "/" and os.sep in name):
+                    # Normalize the name like ZipInfo does.
+                    name = ZipInfo(name).filename
+                append(name)
+            self._names = names
+        return self._names
+
+    def lookup(self, name):
+        """Return the ZipInfo for the last record called name, or None."""
+        if self._lookup is None:
+            self._lookup = {name: i for i, name in enumerate(self.namelist())}
+        i = self._lookup.get(name)
+        if i is None:
+            return None
+        return self.info(i)
+
+    @staticmethod
+    def _decode(filename, flags):
+        if flags & 0x800:
+            # UTF-8 file names extension
+            return filename.decode('utf-8')
+        else:
+            # Historical ZIP filename encoding
+            return filename.decode('cp437')
+
+
 class ZipFile:
     """ Class with methods to open, read, write, close, list zip files.
 
@@ -972,13 +1101,19 @@ class ZipFile:
     allowZip64: if True ZipFile will create files with ZIP64 extensions when
                 needed, otherwise it will raise an exception when this would
                 be necessary.
+    use_mmap: if True and file is a path opened for reading, the archive is
+              read through a memory map, so that members can be read from
+              several threads concurrently.  The archive must not be
+              truncated while it is open.
 
     """
 
     fp = None                   # Set here since __del__ checks it
     _windows_illegal_name_trans_table = None
+    _index = None               # Lazy index of the archive members
 
-    def __init__(self, file, mode="r", compression=ZIP_STORED, allowZip64=True):
+    def __init__(self, file, mode="r", compression=ZIP_STORED, allowZip64=True,
+                 *, use_mmap=False):
         """Open the ZIP file with mode read 'r', write 'w', exclusive create 'x',
         or append 'a'."""
         if mode not in ('r', 'w', 'x', 'a'):
@@ -989,8 +1124,8 @@ class ZipFile:
         self._allowZip64 = allowZip64
         self._didModify = False
         self.debug = 0  # Level of printing: 0 through 3
-        self.NameToInfo = {}    # Find file info given name
-        self.filelist = []      # List of ZipInfo instances for archive
+        self._NameToInfo = {}   # Find file info given name
+        self._filelist = []     # List of ZipInfo instances for archive
         self.compression = compression  # Method of compression
         self.mode = mode
         self.pwd = None
@@ -1020,6 +1155,18 @@ class ZipFile:
         self._fileRefCnt = 1
         self._lock = threading.RLock()
         self._seekable = True
+        self._mmap = None
+
+        if (use_mmap and mode == 'r' and not self._filePassed and
+            mmap is not None):
+            # Read the archive from a memory map.  Accessing the map past
+            # the end of a file truncated meanwhile raises SIGBUS, hence
+            # this is opt-in.
+            try:
+                self._mmap = mmap.mmap(self.fp.fileno(), 0,
+                                       access=mmap.ACCESS_READ)
+            except (AttributeError, OSError, ValueError):
+                pass
 
         try:
             if mode == 'r':
@@ -1108,48 +1255,29 @@ class ZipFile:
             print("given, inferred, offset", offset_cd, inferred, concat)
         # self.start_dir:  Position of start of central directory
         self.start_dir = offset_cd + concat
-        fp.seek(self.start_dir, 0)
-        data = fp.read(size_cd)
-        fp = io.BytesIO(data)
+        if self._mmap is not None:
+            data = self._mmap[self.start_dir:self.start_dir + size_cd]
+        else:
+            fp.seek(self.start_dir, 0)
+            data = fp.read(size_cd)
+        size_cd = len(data)
+        # Only the offsets of the records are collected here, the ZipInfo
+        # objects are created by the index when they are needed.
+        offsets = array.array('Q')
+        unpack_from = struct.Struct(structCentralDir).unpack_from
         total = 0
         while total < size_cd:
-            centdir = fp.read(sizeCentralDir)
-            if len(centdir) != sizeCentralDir:
+            if total + sizeCentralDir > size_cd:
                 raise BadZipFile("Truncated central directory")
-            centdir = struct.unpack(structCentralDir, centdir)
+            centdir = unpack_from(data, total)
             if centdir[_CD_SIGNATURE] != stringCentralDir:
                 raise BadZipFile("Bad magic number for central directory")
             if self.debug > 2:
                 print(centdir)
-            filename = fp.read(centdir[_CD_FILENAME_LENGTH])
-            flags = centdir[5]
-            if flags & 0x800:
-                # UTF-8 file names extension
-                filename = filename.decode('utf-8')
-            else:
-                # Historical ZIP filename encoding
-                filename = filename.decode('cp437')
-            # Create ZipInfo instance to store file information
-            x = ZipInfo(filename)
-            x.extra = fp.read(centdir[_CD_EXTRA_FIELD_LENGTH])
-            x.comment = fp.read(centdir[_CD_COMMENT_LENGTH])
-            x.header_offset = centdir[_CD_LOCAL_HEADER_OFFSET]
-            (x.create_version, x.create_system, x.extract_version, x.reserved,
-             x.flag_bits, x.compress_type, t, d,
-             x.CRC, x.compress_size, x.file_size) = centdir[1:12]
-            if x.extract_version > MAX_EXTRACT_VERSION:
+            if centdir[_CD_EXTRACT_VERSION] > MAX_EXTRACT_VERSION:
                 raise NotImplementedError("zip file version %.1f" %
-                                          (x.extract_version / 10))
-            x.volume, x.internal_attr, x.external_attr = centdir[15:18]
-            # Convert date/time code to (year, month, day, hour, min, sec)
-            x._raw_time = t
-            x.date_time = ( (d>>9)+1980, (d>>5)&0xF, d&0x1F,
-                            t>>11, (t>>5)&0x3F, (t&0x1F) * 2 )
-
-            x._decodeExtra()
-            x.header_offset = x.header_offset + concat
-            self.filelist.append(x)
-            self.NameToInfo[x.filename] = x
+                                          (centdir[_CD_EXTRACT_VERSION] / 10))
+            offsets.append(total)
 
             # update total bytes read from central directory
             total = (total + sizeCentralDir + centdir[_CD_FILENAME_LENGTH]
@@ -1158,10 +1286,34 @@ class ZipFile:
 
             if self.debug > 2:
                 print("total", total)
+        self._index = _ZipIndex(data, offsets, concat)
+
+    @property
+    def filelist(self):
+        """List of ZipInfo instances for the archive."""
+        if self._index is not None:
+            self._loadindex()
+        return self._filelist
 
+    @property
+    def NameToInfo(self):
+        """Dictionary mapping file names to ZipInfo instances."""
+        if self._index is not None:
+            self._loadindex()
+        return self._NameToInfo
+
+    def _loadindex(self):
+        # Create the ZipInfo objects for all members.
+        index = self._index
+        for x in index.infolist():
+            self._filelist.append(x)
+            self._NameToInfo[x.filename] = x
+        self._index = None
 
     def namelist(self):
         """Return a list of file names in the archive."""
+        if self._index is not None:
+            return list(self._index.namelist())
         return [data.filename for data in self.filelist]
 
     def infolist(self):
@@ -1193,7 +1345,10 @@ class ZipFile:
 
     def getinfo(self, name):
         """Return the instance of ZipInfo given 'name'."""
-        info = self.NameToInfo.get(name)
+        if self._index is not None:
+            info = self._index.lookup(name)
+        else:
+            info = self.NameToInfo.get(name)
         if info is None:
             raise KeyError(
                 'There is no item named %r in the archive' % name)
@@ -1255,7 +1410,12 @@ class ZipFile:
             zinfo = self.getinfo(name)
 
         self._fileRefCnt += 1
-        zef_file = _SharedFile(self.fp, zinfo.header_offset, self._fpclose, self._lock)
+        if self._mmap is not None:
+            zef_file = _MappedFile(self.fp, self._mmap, zinfo.header_offset,
+                                   self._fpclose)
+        else:
+            zef_file = _SharedFile(self.fp, zinfo.header_offset,
+                                   self._fpclose, self._lock)
         try:
             # Skip the file header:
             fheader = zef_file.read(sizeFileHeader)
@@ -1265,7 +1425,7 @@ class ZipFile:
             if fheader[_FH_SIGNATURE] != stringFileHeader:
                 raise BadZipFile("Bad magic number for file header")
 
-            fname = zef_file.read(fheader[_FH_FILENAME_LENGTH])
+            fname = bytes(zef_file.read(fheader[_FH_FILENAME_LENGTH]))
             if fheader[_FH_EXTRA_FIELD_LENGTH]:
                 zef_file.read(fheader[_FH_EXTRA_FIELD_LENGTH])
 
@@ -1716,6 +1876,14 @@ class ZipFile:
         assert self._fileRefCnt > 0
         self._fileRefCnt -= 1
         if not self._fileRefCnt and not self._filePassed:
+            if self._mmap is not None:
+                try:
+                    self._mmap.close()
+                except BufferError:
+                    # Data read from the map is still referenced; the map
+                    # is released along with it.
+                    pass
+                self._mmap = None
             fp.close()
 
 
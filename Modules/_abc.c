@@ -0,0 +1,887 @@
+/* ABCMeta implementation */
+
+#include "Python.h"
+
+/*[clinic input]
+module _abc
+[clinic start generated code]*/
+/*[clinic end generated code: output=da39a3ee5e6b4b0d input=964f5328e1aefcda]*/
+
+PyDoc_STRVAR(_abc__doc__,
+"Module contains faster C implementation of abc.ABCMeta");
+
+_Py_IDENTIFIER(__abstractmethods__);
+_Py_IDENTIFIER(__bases__);
+_Py_IDENTIFIER(__class__);
+_Py_IDENTIFIER(__dict__);
+_Py_IDENTIFIER(__isabstractmethod__);
+_Py_IDENTIFIER(__mro__);
+_Py_IDENTIFIER(__subclasscheck__);
+_Py_IDENTIFIER(__subclasses__);
+_Py_IDENTIFIER(__subclasshook__);
+_Py_IDENTIFIER(_abc_impl);
+
+/* A global counter that is incremented each time a class is
+   registered as a virtual subclass of anything.  It forces the
+   negative cache to be cleared before its next use.
+   Note: this counter is private.  Use `abc.get_cache_token()` for
+   external code. */
+static PY_LONG_LONG abc_invalidation_counter = 0;
+
+/* This object stores internal state for ABCs.
+   Note that we can use normal sets for caches,
+   since they are never iterated over. */
+typedef struct {
+    PyObject_HEAD
+    PyObject *_abc_registry;
+    PyObject *_abc_cache; /* Normal set of weak references. */
+    PyObject *_abc_negative_cache; /* Normal set of weak references. */
+    PY_LONG_LONG _abc_negative_cache_version;
+} _abc_data;
+
+static void
+abc_data_dealloc(_abc_data *self)
+{
+    Py_XDECREF(self->_abc_registry);
+    Py_XDECREF(self->_abc_cache);
+    Py_XDECREF(self->_abc_negative_cache);
+    Py_TYPE(self)->tp_free(self);
+}
+
+static PyObject *
+abc_data_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
+{
+    _abc_data *self = (_abc_data *) type->tp_alloc(type, 0);
+    if (self == NULL) {
+        return NULL;
+    }
+
+    self->_abc_registry = NULL;
+    self->_abc_cache = NULL;
+    self->_abc_negative_cache = NULL;
+    self->_abc_negative_cache_version = abc_invalidation_counter;
+    return (PyObject *) self;
+}
+
+PyDoc_STRVAR(abc_data_doc,
+"Internal state held by ABC machinery.");
+
+static PyTypeObject _abc_data_type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    "_abc_data",                        /*tp_name*/
+    sizeof(_abc_data),                  /*tp_basicsize*/
+    0,                                  /*tp_itemsize*/
+    (destructor)abc_data_dealloc,       /*tp_dealloc*/
+    0,                                  /*tp_print*/
+    0,                                  /*tp_getattr*/
+    0,                                  /*tp_setattr*/
+    0,                                  /*tp_reserved*/
+    0,                                  /*tp_repr*/
+    0,                                  /*tp_as_number*/
+    0,                                  /*tp_as_sequence*/
+    0,                                  /*tp_as_mapping*/
+    0,                                  /*tp_hash*/
+    0,                                  /*tp_call*/
+    0,                                  /*tp_str*/
+    0,                                  /*tp_getattro*/
+    0,                                  /*tp_setattro*/
+    0,                                  /*tp_as_buffer*/
+    Py_TPFLAGS_DEFAULT,                 /*tp_flags*/
+    abc_data_doc,                       /*tp_doc*/
+    0,                                  /*tp_traverse*/
+    0,                                  /*tp_clear*/
+    0,                                  /*tp_richcompare*/
+    0,                                  /*tp_weaklistoffset*/
+    0,                                  /*tp_iter*/
+    0,                                  /*tp_iternext*/
+    0,                                  /*tp_methods*/
+    0,                                  /*tp_members*/
+    0,                                  /*tp_getset*/
+    0,                                  /*tp_base*/
+    0,                                  /*tp_dict*/
+    0,                                  /*tp_descr_get*/
+    0,                                  /*tp_descr_set*/
+    0,                                  /*tp_dictoffset*/
+    0,                                  /*tp_init*/
+    0,                                  /*tp_alloc*/
+    abc_data_new,                       /*tp_new*/
+};
+
+static _abc_data *
+_get_impl(PyObject *self)
+{
+    PyObject *impl = _PyObject_GetAttrId(self, &PyId__abc_impl);
+    if (impl == NULL) {
+        return NULL;
+    }
+    if (Py_TYPE(impl) != &_abc_data_type) {
+        PyErr_SetString(PyExc_TypeError, "_abc_impl is set to a wrong type");
+        Py_DECREF(impl);
+        return NULL;
+    }
+    return (_abc_data *)impl;
+}
+
+/* Is obj in the set of weak references?  Like WeakSet, objects that don't
+   support weak references are never found. */
+static int
+_in_weak_set(PyObject *set, PyObject *obj)
+{
+    PyObject *ref;
+    int res;
+
+    if (set == NULL || PySet_GET_SIZE(set) == 0) {
+        return 0;
+    }
+    ref = PyWeakref_NewRef(obj, NULL);
+    if (ref == NULL) {
+        if (PyErr_ExceptionMatches(PyExc_TypeError)) {
+            PyErr_Clear();
+            return 0;
+        }
+        return -1;
+    }
+    res = PySet_Contains(set, ref);
+    Py_DECREF(ref);
+    return res;
+}
+
+/* Weak reference callback removing a dead reference from its set; the set
+   itself is only weakly referenced by the callback. */
+static PyObject *
+_destroy(PyObject *setweakref, PyObject *objweakref)
+{
+    PyObject *set;
+    set = PyWeakref_GET_OBJECT(setweakref);
+    if (set == Py_None) {
+        Py_RETURN_NONE;
+    }
+    Py_INCREF(set);
+    if (PySet_Discard(set, objweakref) < 0) {
+        Py_DECREF(set);
+        return NULL;
+    }
+    Py_DECREF(set);
+    Py_RETURN_NONE;
+}
+
+static PyMethodDef _destroy_def = {
+    "_destroy", (PyCFunction) _destroy, METH_O
+};
+
+static int
+_add_to_weak_set(PyObject **pset, PyObject *obj)
+{
+    PyObject *set, *ref, *wr, *destroy_cb;
+    int ret;
+
+    if (*pset == NULL) {
+        *pset = PySet_New(NULL);
+        if (*pset == NULL) {
+            return -1;
+        }
+    }
+
+    set = *pset;
+    wr = PyWeakref_NewRef(set, NULL);
+    if (wr == NULL) {
+        return -1;
+    }
+    destroy_cb = PyCFunction_NewEx(&_destroy_def, wr, NULL);
+    Py_DECREF(wr);
+    if (destroy_cb == NULL) {
+        return -1;
+    }
+    ref = PyWeakref_NewRef(obj, destroy_cb);
+    Py_DECREF(destroy_cb);
+    if (ref == NULL) {
+        return -1;
+    }
+    ret = PySet_Add(set, ref);
+    Py_DECREF(ref);
+    return ret;
+}
+
+/*[clinic input]
+_abc._reset_registry
+
+    self: object
+    /
+
+Internal ABC helper to reset registry of a given class.
+
+Should be only used by refleak.py
+[clinic start generated code]*/
+
+static PyObject *
+_abc__reset_registry(PyModuleDef *module, PyObject *self)
+/*[clinic end generated code: output=12833b2a1055bec2 input=12a0b7eb339ac35c]*/
+{
+    _abc_data *impl = _get_impl(self);
+    if (impl == NULL) {
+        return NULL;
+    }
+    if (impl->_abc_registry != NULL && PySet_Clear(impl->_abc_registry) < 0) {
+        Py_DECREF(impl);
+        return NULL;
+    }
+    Py_DECREF(impl);
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+_abc._reset_caches
+
+    self: object
+    /
+
+Internal ABC helper to reset both caches of a given class.
+
+Should be only used by refleak.py
+[clinic start generated code]*/
+
+static PyObject *
+_abc__reset_caches(PyModuleDef *module, PyObject *self)
+/*[clinic end generated code: output=c0eb0a076bed1e81 input=c0ac616fd8acfb6f]*/
+{
+    _abc_data *impl = _get_impl(self);
+    if (impl == NULL) {
+        return NULL;
+    }
+    if (impl->_abc_cache != NULL && PySet_Clear(impl->_abc_cache) < 0) {
+        Py_DECREF(impl);
+        return NULL;
+    }
+    /* also the second cache */
+    if (impl->_abc_negative_cache != NULL &&
+            PySet_Clear(impl->_abc_negative_cache) < 0) {
+        Py_DECREF(impl);
+        return NULL;
+    }
+    Py_DECREF(impl);
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+_abc._get_dump
+
+    self: object
+    /
+
+Internal ABC helper for cache and registry debugging.
+
+Return shallow copies of registry, of both caches, and
+negative cache version. Don't call this function directly,
+instead use ABC._dump_registry() for a nice repr.
+[clinic start generated code]*/
+
+static PyObject *
+_abc__get_dump(PyModuleDef *module, PyObject *self)
+/*[clinic end generated code: output=a8c0ec88c976b7c7 input=2c5deb1bfe9e3c79]*/
+{
+    PyObject *res;
+    _abc_data *impl = _get_impl(self);
+    if (impl == NULL) {
+        return NULL;
+    }
+    res = Py_BuildValue("NNNL",
+                        PySet_New(impl->_abc_registry),
+                        PySet_New(impl->_abc_cache),
+                        PySet_New(impl->_abc_negative_cache),
+                        impl->_abc_negative_cache_version);
+    Py_DECREF(impl);
+    return res;
+}
+
+/* Is the attribute __isabstractmethod__ of obj true? */
+static int
+_is_abstract(PyObject *obj)
+{
+    int res;
+    PyObject *isabstract;
+
+    isabstract = _PyObject_GetAttrId(obj, &PyId___isabstractmethod__);
+    if (isabstract == NULL) {
+        if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
+            PyErr_Clear();
+            return 0;
+        }
+        return -1;
+    }
+    res = PyObject_IsTrue(isabstract);
+    Py_DECREF(isabstract);
+    return res;
+}
+
+/* Set self.__abstractmethods__ to the names of the abstract methods
+   defined or inherited, but not overridden, by self. */
+static int
+compute_abstract_methods(PyObject *self)
+{
+    int ret = -1;
+    PyObject *abstracts = NULL;
+    PyObject *ns = NULL, *items = NULL, *bases = NULL;
+    PyObject *frozen;
+    Py_ssize_t pos;
+
+    abstracts = PySet_New(NULL);
+    if (abstracts == NULL) {
+        return -1;
+    }
+
+    /* Stage 1: direct abstract methods. */
+    ns = _PyObject_GetAttrId(self, &PyId___dict__);
+    if (ns == NULL) {
+        goto error;
+    }
+    items = PyMapping_Items(ns);
+    if (items == NULL) {
+        goto error;
+    }
+    for (pos = 0; pos < PyList_GET_SIZE(items); pos++) {
+        PyObject *it = PyList_GET_ITEM(items, pos);
+        int is_abstract;
+
+        if (!PyTuple_Check(it) || PyTuple_GET_SIZE(it) != 2) {
+            PyErr_SetString(PyExc_TypeError,
+                            "items() returned item which is not a 2-tuple");
+            goto error;
+        }
+        is_abstract = _is_abstract(PyTuple_GET_ITEM(it, 1));
+        if (is_abstract < 0) {
+            goto error;
+        }
+        if (is_abstract &&
+            PySet_Add(abstracts, PyTuple_GET_ITEM(it, 0)) < 0) {
+            goto error;
+        }
+    }
+
+    /* Stage 2: inherited abstract methods. */
+    bases = _PyObject_GetAttrId(self, &PyId___bases__);
+    if (bases == NULL) {
+        goto error;
+    }
+    if (!PyTuple_Check(bases)) {
+        PyErr_SetString(PyExc_TypeError, "__bases__ is not tuple");
+        goto error;
+    }
+
+    for (pos = 0; pos < PyTuple_GET_SIZE(bases); pos++) {
+        PyObject *item = PyTuple_GET_ITEM(bases, pos);
+        PyObject *base_abstracts, *iter, *key;
+
+        base_abstracts = _PyObject_GetAttrId(item, &PyId___abstractmethods__);
+        if (base_abstracts == NULL) {
+            if (!PyErr_ExceptionMatches(PyExc_AttributeError)) {
+                goto error;
+            }
+            PyErr_Clear();
+            continue;
+        }
+        iter = PyObject_GetIter(base_abstracts);
+        Py_DECREF(base_abstracts);
+        if (iter == NULL) {
+            goto error;
+        }
+        while ((key = PyIter_Next(iter))) {
+            PyObject *value = PyObject_GetAttr(self, key);
+            int is_abstract;
+
+            if (value == NULL) {
+                if (!PyErr_ExceptionMatches(PyExc_AttributeError)) {
+                    Py_DECREF(key);
+                    Py_DECREF(iter);
+                    goto error;
+                }
+                PyErr_Clear();
+                Py_DECREF(key);
+                continue;
+            }
+            is_abstract = _is_abstract(value);
+            Py_DECREF(value);
+            if (is_abstract < 0 ||
+                (is_abstract && PySet_Add(abstracts, key) < 0)) {
+                Py_DECREF(key);
+                Py_DECREF(iter);
+                goto error;
+            }
+            Py_DECREF(key);
+        }
+        Py_DECREF(iter);
+        if (PyErr_Occurred()) {
+            goto error;
+        }
+    }
+
+    frozen = PyFrozenSet_New(abstracts);
+    if (frozen == NULL) {
+        goto error;
+    }
+    ret = _PyObject_SetAttrId(self, &PyId___abstractmethods__, frozen);
+    Py_DECREF(frozen);
+
+error:
+    Py_DECREF(abstracts);
+    Py_XDECREF(ns);
+    Py_XDECREF(items);
+    Py_XDECREF(bases);
+    return ret;
+}
+
+/*[clinic input]
+_abc._abc_init
+
+    self: object
+    /
+
+Internal ABC helper for class set-up. Should be never used outside abc module.
+[clinic start generated code]*/
+
+static PyObject *
+_abc__abc_init(PyModuleDef *module, PyObject *self)
+/*[clinic end generated code: output=f6a06d6f2f725f36 input=8d7fe470ff77f029]*/
+{
+    PyObject *data;
+    if (compute_abstract_methods(self) < 0) {
+        return NULL;
+    }
+
+    /* Set up inheritance registry. */
+    data = abc_data_new(&_abc_data_type, NULL, NULL);
+    if (data == NULL) {
+        return NULL;
+    }
+    if (_PyObject_SetAttrId(self, &PyId__abc_impl, data) < 0) {
+        Py_DECREF(data);
+        return NULL;
+    }
+    Py_DECREF(data);
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+_abc._abc_register
+
+    self: object
+    subclass: object
+    /
+
+Internal ABC helper for subclass registration. Should be never used outside abc module.
+[clinic start generated code]*/
+
+static PyObject *
+_abc__abc_register_impl(PyModuleDef *module, PyObject *self,
+                        PyObject *subclass)
+/*[clinic end generated code: output=d79f5c39afb4a1fe input=fdf6a8117da33121]*/
+{
+    int result;
+    _abc_data *impl;
+
+    result = PyObject_IsInstance(subclass, (PyObject *)&PyType_Type);
+    if (result < 0) {
+        return NULL;
+    }
+    if (!result) {
+        PyErr_SetString(PyExc_TypeError, "Can only register classes");
+        return NULL;
+    }
+    result = PyObject_IsSubclass(subclass, self);
+    if (result > 0) {
+        Py_INCREF(subclass);
+        return subclass;  /* Already a subclass. */
+    }
+    if (result < 0) {
+        return NULL;
+    }
+    /* Subtle: test for cycles *after* testing for "already a subclass";
+       this means we allow X.register(X) and interpret it as a no-op. */
+    result = PyObject_IsSubclass(self, subclass);
+    if (result > 0) {
+        /* This would create a cycle, which is bad for the algorithm below. */
+        PyErr_SetString(PyExc_RuntimeError,
+                        "Refusing to create an inheritance cycle");
+        return NULL;
+    }
+    if (result < 0) {
+        return NULL;
+    }
+    impl = _get_impl(self);
+    if (impl == NULL) {
+        return NULL;
+    }
+    if (_add_to_weak_set(&impl->_abc_registry, subclass) < 0) {
+        Py_DECREF(impl);
+        return NULL;
+    }
+    Py_DECREF(impl);
+
+    /* Invalidate negative cache */
+    abc_invalidation_counter++;
+
+    Py_INCREF(subclass);
+    return subclass;
+}
+
+/*[clinic input]
+_abc._abc_instancecheck
+
+    self: object
+    instance: object
+    /
+
+Internal ABC helper for instance checks. Should be never used outside abc module.
+[clinic start generated code]*/
+
+static PyObject *
+_abc__abc_instancecheck_impl(PyModuleDef *module, PyObject *self,
+                             PyObject *instance)
+/*[clinic end generated code: output=82ae32cdcb0b2aca input=a4f4525679261084]*/
+{
+    PyObject *subtype, *r, *result = NULL, *subclass = NULL;
+    _abc_data *impl;
+    int incache, ok, i;
+
+    impl = _get_impl(self);
+    if (impl == NULL) {
+        return NULL;
+    }
+
+    subclass = _PyObject_GetAttrId(instance, &PyId___class__);
+    if (subclass == NULL) {
+        Py_DECREF(impl);
+        return NULL;
+    }
+    /* Inline the cache checking. */
+    incache = _in_weak_set(impl->_abc_cache, subclass);
+    if (incache < 0) {
+        goto end;
+    }
+    if (incache > 0) {
+        result = Py_True;
+        Py_INCREF(result);
+        goto end;
+    }
+    subtype = (PyObject *)Py_TYPE(instance);
+    if (subtype == subclass) {
+        if (impl->_abc_negative_cache_version == abc_invalidation_counter) {
+            incache = _in_weak_set(impl->_abc_negative_cache, subclass);
+            if (incache < 0) {
+                goto end;
+            }
+            if (incache > 0) {
+                result = Py_False;
+                Py_INCREF(result);
+                goto end;
+            }
+        }
+        /* Fall back to the subclass check. */
+        result = _PyObject_CallMethodIdObjArgs(self, &PyId___subclasscheck__,
+                                               subclass, NULL);
+        goto end;
+    }
+    /* Any of the two classes. */
+    for (i = 0; i < 2; i++) {
+        r = _PyObject_CallMethodIdObjArgs(self, &PyId___subclasscheck__,
+                                          i ? subtype : subclass, NULL);
+        if (r == NULL) {
+            goto end;
+        }
+        ok = PyObject_IsTrue(r);
+        Py_DECREF(r);
+        if (ok < 0) {
+            goto end;
+        }
+        if (ok || i) {
+            result = PyBool_FromLong(ok);
+            goto end;
+        }
+    }
+
+end:
+    Py_XDECREF(impl);
+    Py_XDECREF(subclass);
+    return result;
+}
+
+/* Return -1 when exception occurred.
+   Return 1 when result is set.
+   Return 0 otherwise. */
+static int subclasscheck_check_registry(_abc_data *impl, PyObject *subclass,
+                                        PyObject **result);
+
+/*[clinic input]
+_abc._abc_subclasscheck
+
+    self: object
+    subclass: object
+    /
+
+Internal ABC helper for subclass checks. Should be never used outside abc module.
+[clinic start generated code]*/
+
+static PyObject *
+_abc__abc_subclasscheck_impl(PyModuleDef *module, PyObject *self,
+                             PyObject *subclass)
+/*[clinic end generated code: output=d45406b2dc98fcd1 input=cbdb5c2c34f1d9eb]*/
+{
+    PyObject *ok, *mro = NULL, *subclasses = NULL, *iter = NULL, *scls;
+    PyObject *result = NULL;
+    _abc_data *impl;
+    int incache, r;
+
+    impl = _get_impl(self);
+    if (impl == NULL) {
+        return NULL;
+    }
+
+    /* 1. Check cache. */
+    incache = _in_weak_set(impl->_abc_cache, subclass);
+    if (incache < 0) {
+        goto end;
+    }
+    if (incache > 0) {
+        result = Py_True;
+        goto end;
+    }
+
+    /* 2. Check negative cache; may have to invalidate. */
+    if (impl->_abc_negative_cache_version < abc_invalidation_counter) {
+        /* Invalidate the negative cache. */
+        if (impl->_abc_negative_cache != NULL &&
+                PySet_Clear(impl->_abc_negative_cache) < 0) {
+            goto end;
+        }
+        impl->_abc_negative_cache_version = abc_invalidation_counter;
+    }
+    else {
+        incache = _in_weak_set(impl->_abc_negative_cache, subclass);
+        if (incache < 0) {
+            goto end;
+        }
+        if (incache > 0) {
+            result = Py_False;
+            goto end;
+        }
+    }
+
+    /* 3. Check the subclass hook. */
+    ok = _PyObject_CallMethodIdObjArgs(self, &PyId___subclasshook__,
+                                       subclass, NULL);
+    if (ok == NULL) {
+        goto end;
+    }
+    if (ok == Py_True) {
+        Py_DECREF(ok);
+        if (_add_to_weak_set(&impl->_abc_cache, subclass) < 0) {
+            goto end;
+        }
+        result = Py_True;
+        goto end;
+    }
+    if (ok == Py_False) {
+        Py_DECREF(ok);
+        if (_add_to_weak_set(&impl->_abc_negative_cache, subclass) < 0) {
+            goto end;
+        }
+        result = Py_False;
+        goto end;
+    }
+    if (ok != Py_NotImplemented) {
+        Py_DECREF(ok);
+        PyErr_SetString(PyExc_AssertionError, "__subclasshook__ must return either"
+                                              " False, True, or NotImplemented");
+        goto end;
+    }
+    Py_DECREF(ok);
+
+    /* 4. Check if it's a direct subclass. */
+    if (PyType_Check(subclass)) {
+        mro = ((PyTypeObject *)subclass)->tp_mro;
+        Py_XINCREF(mro);
+    }
+    else {
+        mro = _PyObject_GetAttrId(subclass, &PyId___mro__);
+        if (mro == NULL) {
+            if (!PyErr_ExceptionMatches(PyExc_AttributeError)) {
+                goto end;
+            }
+            PyErr_Clear();
+        }
+    }
+    if (mro != NULL) {
+        r = PySequence_Contains(mro, self);
+        if (r < 0) {
+            goto end;
+        }
+        if (r > 0) {
+            if (_add_to_weak_set(&impl->_abc_cache, subclass) < 0) {
+                goto end;
+            }
+            result = Py_True;
+            goto end;
+        }
+    }
+
+    /* 5. Check if it's a subclass of a registered class (recursive). */
+    if (subclasscheck_check_registry(impl, subclass, &result)) {
+        /* Exception occurred or result is set. */
+        goto end;
+    }
+
+    /* 6. Check if it's a subclass of a subclass (recursive). */
+    subclasses = _PyObject_CallMethodId(self, &PyId___subclasses__, NULL);
+    if (subclasses == NULL) {
+        goto end;
+    }
+    iter = PyObject_GetIter(subclasses);
+    if (iter == NULL) {
+        goto end;
+    }
+    while ((scls = PyIter_Next(iter))) {
+        r = PyObject_IsSubclass(subclass, scls);
+        Py_DECREF(scls);
+        if (r > 0) {
+            if (_add_to_weak_set(&impl->_abc_cache, subclass) < 0) {
+                goto end;
+            }
+            result = Py_True;
+            goto end;
+        }
+        if (r < 0) {
+            goto end;
+        }
+    }
+    if (PyErr_Occurred()) {
+        goto end;
+    }
+
+    /* No dice; update negative cache. */
+    if (_add_to_weak_set(&impl->_abc_negative_cache, subclass) < 0) {
+        goto end;
+    }
+    result = Py_False;
+
+end:
+    Py_DECREF(impl);
+    Py_XDECREF(mro);
+    Py_XDECREF(subclasses);
+    Py_XDECREF(iter);
+    Py_XINCREF(result);
+    return result;
+}
+
+
+static int
+subclasscheck_check_registry(_abc_data *impl, PyObject *subclass,
+                             PyObject **result)
+{
+    /* Fast path: check subclass is in weakref directly. */
+    int ret = _in_weak_set(impl->_abc_registry, subclass);
+    Py_ssize_t i;
+    PyObject *copy;
+
+    if (ret < 0) {
+        return -1;
+    }
+    if (ret > 0) {
+        if (_add_to_weak_set(&impl->_abc_cache, subclass) < 0) {
+            return -1;
+        }
+        *result = Py_True;
+        return 1;
+    }
+
+    if (impl->_abc_registry == NULL || PySet_GET_SIZE(impl->_abc_registry) == 0) {
+        return 0;
+    }
+    /* Iterate over a snapshot, the checks below can modify the registry. */
+    copy = PySequence_Tuple(impl->_abc_registry);
+    if (copy == NULL) {
+        return -1;
+    }
+
+    for (i = 0; i < PyTuple_GET_SIZE(copy); i++) {
+        PyObject *rkey = PyWeakref_GetObject(PyTuple_GET_ITEM(copy, i));
+        int r;
+
+        if (rkey == NULL) {
+            Py_DECREF(copy);
+            return -1;
+        }
+        if (rkey == Py_None) {
+            continue;
+        }
+        Py_INCREF(rkey);
+        r = PyObject_IsSubclass(subclass, rkey);
+        Py_DECREF(rkey);
+        if (r < 0) {
+            Py_DECREF(copy);
+            return -1;
+        }
+        if (r > 0) {
+            Py_DECREF(copy);
+            if (_add_to_weak_set(&impl->_abc_cache, subclass) < 0) {
+                return -1;
+            }
+            *result = Py_True;
+            return 1;
+        }
+    }
+
+    Py_DECREF(copy);
+    return 0;
+}
+
+/*[clinic input]
+_abc.get_cache_token
+
+Returns the current ABC cache token.
+
+The token is an opaque object (supporting equality testing) identifying the
+current version of the ABC cache for virtual subclasses. The token changes
+with every call to register() on any ABC.
+[clinic start generated code]*/
+
+static PyObject *
+_abc_get_cache_token_impl(PyModuleDef *module)
+/*[clinic end generated code: output=60f28d8482ddb130 input=70413d1c423ad9f9]*/
+{
+    return PyLong_FromLongLong(abc_invalidation_counter);
+}
+
+#include "clinic/_abc.c.h"
+
+static struct PyMethodDef module_functions[] = {
+    _ABC_GET_CACHE_TOKEN_METHODDEF
+    _ABC__ABC_INIT_METHODDEF
+    _ABC__RESET_REGISTRY_METHODDEF
+    _ABC__RESET_CACHES_METHODDEF
+    _ABC__GET_DUMP_METHODDEF
+    _ABC__ABC_REGISTER_METHODDEF
+    _ABC__ABC_INSTANCECHECK_METHODDEF
+    _ABC__ABC_SUBCLASSCHECK_METHODDEF
+    {NULL,       NULL}          /* sentinel */
+};
+
+static struct PyModuleDef _abcmodule = {
+    PyModuleDef_HEAD_INIT,
+    "_abc",
+    _abc__doc__,
+    -1,
+    module_functions,
+    NULL,
+    NULL,
+    NULL,
+    NULL
+};
+
+
+PyMODINIT_FUNC
+PyInit__abc(void)
+{
+    if (PyType_Ready(&_abc_data_type) < 0) {
+        return NULL;
+    }
+    return PyModule_Create(&_abcmodule);
+}
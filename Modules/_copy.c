@@ -0,0 +1,344 @@
+/* C accelerator for copy.deepcopy()
+ *
+ * Atomic values and the builtin containers list, dict and tuple are copied
+ * here; every other object is passed to the pure Python implementation,
+ * copy._py_deepcopy(), which handles __deepcopy__(), the copyreg dispatch
+ * table and __reduce_ex__().  The memo is the same dictionary the Python
+ * code uses, mapping id(original) to its copy, with the originals kept alive
+ * in a list stored at memo[id(memo)].
+ */
+
+#include "Python.h"
+#include "code.h"
+
+/*[clinic input]
+module _copy
+[clinic start generated code]*/
+/*[clinic end generated code: output=da39a3ee5e6b4b0d input=b34c1b75f49dbfff]*/
+
+#include "clinic/_copy.c.h"
+
+_Py_IDENTIFIER(append);
+_Py_IDENTIFIER(_py_deepcopy);
+
+typedef struct {
+    PyObject *memo;         /* dict, created on first use */
+    PyObject *keepalive;    /* the list at memo[id(memo)], or NULL */
+} copystate;
+
+static PyObject *do_deepcopy(PyObject *x, copystate *st);
+
+/* Objects of these exact types are their own deep copies.  Unlike the
+   Python implementation, they are not even looked up in the memo. */
+static int
+is_atomic(PyObject *x)
+{
+    PyTypeObject *tp = Py_TYPE(x);
+
+    return (x == Py_None ||
+            tp == &PyLong_Type ||
+            tp == &PyUnicode_Type ||
+            tp == &PyFloat_Type ||
+            tp == &PyBool_Type ||
+            tp == &PyBytes_Type ||
+            tp == &PyComplex_Type ||
+            x == Py_Ellipsis ||
+            tp == &PyCode_Type ||
+            tp == &PyRange_Type ||
+            tp == &PyCFunction_Type ||
+            tp == &PyFunction_Type ||
+            tp == &_PyWeakref_RefType ||
+            PyType_Check(x));
+}
+
+static int
+ensure_memo(copystate *st)
+{
+    if (st->memo == NULL) {
+        st->memo = PyDict_New();
+        if (st->memo == NULL)
+            return -1;
+    }
+    return 0;
+}
+
+/* Equivalent of copy._keep_alive(): append x to memo[id(memo)] */
+static int
+keep_alive(copystate *st, PyObject *x)
+{
+    PyObject *res;
+
+    if (st->keepalive == NULL) {
+        PyObject *key = PyLong_FromVoidPtr(st->memo);
+        if (key == NULL)
+            return -1;
+        st->keepalive = PyDict_GetItemWithError(st->memo, key);
+        if (st->keepalive != NULL) {
+            Py_INCREF(st->keepalive);
+        }
+        else if (PyErr_Occurred() ||
+                 (st->keepalive = PyList_New(0)) == NULL ||
+                 PyDict_SetItem(st->memo, key, st->keepalive) < 0) {
+            Py_DECREF(key);
+            return -1;
+        }
+        Py_DECREF(key);
+    }
+    if (PyList_CheckExact(st->keepalive))
+        return PyList_Append(st->keepalive, x);
+    res = _PyObject_CallMethodId(st->keepalive, &PyId_append, "(O)", x);
+    if (res == NULL)
+        return -1;
+    Py_DECREF(res);
+    return 0;
+}
+
+/* Record y as the copy of x, key being id(x) */
+static int
+memoize(copystate *st, PyObject *key, PyObject *x, PyObject *y)
+{
+    if (ensure_memo(st) < 0)
+        return -1;
+    if (PyDict_SetItem(st->memo, key, y) < 0)
+        return -1;
+    return keep_alive(st, x);
+}
+
+static PyObject *
+deepcopy_list(PyObject *x, PyObject *key, copystate *st)
+{
+    PyObject *y, *item, *copy;
+    Py_ssize_t i;
+
+    y = PyList_New(0);
+    if (y == NULL)
+        return NULL;
+    /* memoize before copying the items in case x contains itself */
+    if (memoize(st, key, x, y) < 0)
+        goto error;
+    /* x may change size while its items are copied */
+    for (i = 0; i < PyList_GET_SIZE(x); i++) {
+        item = PyList_GET_ITEM(x, i);
+        Py_INCREF(item);
+        copy = do_deepcopy(item, st);
+        Py_DECREF(item);
+        if (copy == NULL)
+            goto error;
+        if (PyList_Append(y, copy) < 0) {
+            Py_DECREF(copy);
+            goto error;
+        }
+        Py_DECREF(copy);
+    }
+    return y;
+
+error:
+    Py_DECREF(y);
+    return NULL;
+}
+
+static PyObject *
+deepcopy_dict(PyObject *x, PyObject *key, copystate *st)
+{
+    PyObject *y, *k, *v, *kcopy, *vcopy;
+    Py_ssize_t pos = 0, size;
+    int rc;
+
+    y = PyDict_New();
+    if (y == NULL)
+        return NULL;
+    if (memoize(st, key, x, y) < 0)
+        goto error;
+    size = PyDict_Size(x);
+    while (PyDict_Next(x, &pos, &k, &v)) {
+        Py_INCREF(k);
+        Py_INCREF(v);
+        /* same order as y[deepcopy(key)] = deepcopy(value) */
+        vcopy = do_deepcopy(v, st);
+        kcopy = vcopy == NULL ? NULL : do_deepcopy(k, st);
+        Py_DECREF(k);
+        Py_DECREF(v);
+        if (kcopy == NULL) {
+            Py_XDECREF(vcopy);
+            goto error;
+        }
+        if (PyDict_Size(x) != size) {
+            PyErr_SetString(PyExc_RuntimeError,
+                            "dictionary changed size during iteration");
+            rc = -1;
+        }
+        else
+            rc = PyDict_SetItem(y, kcopy, vcopy);
+        Py_DECREF(kcopy);
+        Py_DECREF(vcopy);
+        if (rc < 0)
+            goto error;
+    }
+    return y;
+
+error:
+    Py_DECREF(y);
+    return NULL;
+}
+
+static PyObject *
+deepcopy_tuple(PyObject *x, PyObject *key, copystate *st)
+{
+    PyObject *y, *item, *copy;
+    Py_ssize_t i, n = PyTuple_GET_SIZE(x);
+    int all_identical = 1;
+
+    y = PyTuple_New(n);
+    if (y == NULL)
+        return NULL;
+    for (i = 0; i < n; i++) {
+        item = PyTuple_GET_ITEM(x, i);
+        copy = do_deepcopy(item, st);
+        if (copy == NULL)
+            goto error;
+        PyTuple_SET_ITEM(y, i, copy);
+        if (copy != item)
+            all_identical = 0;
+    }
+    /* The tuple itself isn't memoized before copying its items, but one of
+       them may have led back to it and made a copy already. */
+    if (st->memo != NULL) {
+        copy = PyDict_GetItemWithError(st->memo, key);
+        if (copy != NULL) {
+            Py_INCREF(copy);
+            Py_DECREF(y);
+            return copy;
+        }
+        if (PyErr_Occurred())
+            goto error;
+    }
+    if (all_identical) {
+        /* a tuple of immutables is immutable too; don't memoize it */
+        Py_DECREF(y);
+        Py_INCREF(x);
+        return x;
+    }
+    if (memoize(st, key, x, y) < 0)
+        goto error;
+    return y;
+
+error:
+    Py_DECREF(y);
+    return NULL;
+}
+
+static PyObject *
+py_deepcopy(PyObject *x, PyObject *memo)
+{
+    PyObject *copymodule, *y;
+
+    copymodule = PyImport_ImportModule("copy");
+    if (copymodule == NULL)
+        return NULL;
+    y = _PyObject_CallMethodId(copymodule, &PyId__py_deepcopy, "OO", x, memo);
+    Py_DECREF(copymodule);
+    return y;
+}
+
+static PyObject *
+do_deepcopy(PyObject *x, copystate *st)
+{
+    PyTypeObject *tp = Py_TYPE(x);
+    PyObject *key, *y;
+
+    if (is_atomic(x)) {
+        Py_INCREF(x);
+        return x;
+    }
+    key = PyLong_FromVoidPtr(x);
+    if (key == NULL)
+        return NULL;
+    if (st->memo != NULL) {
+        y = PyDict_GetItemWithError(st->memo, key);
+        if (y != NULL || PyErr_Occurred()) {
+            Py_XINCREF(y);
+            Py_DECREF(key);
+            return y;
+        }
+    }
+    if (tp == &PyList_Type || tp == &PyDict_Type || tp == &PyTuple_Type) {
+        if (Py_EnterRecursiveCall(" while deep-copying an object")) {
+            Py_DECREF(key);
+            return NULL;
+        }
+        if (tp == &PyList_Type)
+            y = deepcopy_list(x, key, st);
+        else if (tp == &PyDict_Type)
+            y = deepcopy_dict(x, key, st);
+        else
+            y = deepcopy_tuple(x, key, st);
+        Py_LeaveRecursiveCall();
+    }
+    else if (ensure_memo(st) < 0)
+        y = NULL;
+    else
+        y = py_deepcopy(x, st->memo);
+    Py_DECREF(key);
+    return y;
+}
+
+/*[clinic input]
+_copy.deepcopy
+
+    x: object
+    memo: object = None
+
+Deep copy operation on arbitrary Python objects.
+
+See the copy module's __doc__ string for more info.
+[clinic start generated code]*/
+
+static PyObject *
+_copy_deepcopy_impl(PyModuleDef *module, PyObject *x, PyObject *memo)
+/*[clinic end generated code: output=ff755b453a67670d input=40bc32185a149189]*/
+{
+    copystate st;
+    PyObject *y;
+
+    if (memo == Py_None)
+        st.memo = NULL;
+    else if (PyDict_CheckExact(memo)) {
+        Py_INCREF(memo);
+        st.memo = memo;
+    }
+    else {
+        /* some other mapping, let the Python code deal with it */
+        return py_deepcopy(x, memo);
+    }
+    st.keepalive = NULL;
+    y = do_deepcopy(x, &st);
+    Py_XDECREF(st.memo);
+    Py_XDECREF(st.keepalive);
+    return y;
+}
+
+static PyMethodDef copy_methods[] = {
+    _COPY_DEEPCOPY_METHODDEF
+    {NULL, NULL}
+};
+
+PyDoc_STRVAR(module_doc,
+"C accelerator for the copy module.");
+
+static struct PyModuleDef _copymodule = {
+    PyModuleDef_HEAD_INIT,
+    "_copy",
+    module_doc,
+    -1,
+    copy_methods,
+    NULL,
+    NULL,
+    NULL,
+    NULL
+};
+
+PyMODINIT_FUNC
+PyInit__copy(void)
+{
+    return PyModule_Create(&_copymodule);
+}
@@ -101,6 +101,7 @@ typedef struct {
     Py_ssize_t field_len;       /* length of current field */
     int numeric_field;          /* treat field as numeric */
     unsigned long line_num;     /* Source-file line number */
+    PyObject *converters;       /* per-column converters during readbatch() */
 } ReaderObj;
 
 static PyTypeObject Reader_Type;
@@ -532,17 +533,94 @@ _call_dialect(PyObject *dialect_inst, PyObject *kwargs)
 /*
  * READER
  */
+/* Converts the current field with int or float without creating a str
+ * first.  Returns NULL without an exception set if the field isn't plain
+ * ASCII or doesn't parse, so that the caller can fall back to calling the
+ * converter, which then reports the error. */
+static PyObject *
+parse_convert_number(ReaderObj *self, PyObject *converter)
+{
+    char stackbuf[64];
+    char *buf = stackbuf;
+    char *start, *stop, *end;
+    PyObject *result = NULL;
+    Py_ssize_t i;
+    double x;
+
+    if (self->field_len >= (Py_ssize_t)sizeof(stackbuf)) {
+        buf = PyMem_Malloc(self->field_len + 1);
+        if (buf == NULL)
+            return NULL;
+    }
+    for (i = 0; i < self->field_len; i++) {
+        if (self->field[i] >= 128)
+            goto done;
+        buf[i] = (char)self->field[i];
+    }
+    buf[i] = '\0';
+
+    if (converter == (PyObject *)&PyLong_Type) {
+        result = PyLong_FromString(buf, NULL, 10);
+    }
+    else {
+        start = buf;
+        stop = buf + self->field_len;
+        while (start < stop && Py_ISSPACE(*start))
+            start++;
+        while (stop > start && Py_ISSPACE(stop[-1]))
+            stop--;
+        *stop = '\0';
+        x = PyOS_string_to_double(start, &end, NULL);
+        if (end == stop && !(x == -1.0 && PyErr_Occurred()))
+            result = PyFloat_FromDouble(x);
+    }
+    if (result == NULL)
+        PyErr_Clear();
+done:
+    if (buf != stackbuf)
+        PyMem_Free(buf);
+    return result;
+}
+
 static int
 parse_save_field(ReaderObj *self)
 {
     PyObject *field;
+    PyObject *converter = Py_None;
+
+    if (self->converters != NULL) {
+        Py_ssize_t col = PyList_GET_SIZE(self->fields);
+        if (col < PySequence_Fast_GET_SIZE(self->converters))
+            converter = PySequence_Fast_GET_ITEM(self->converters, col);
+    }
+    if (converter == (PyObject *)&PyLong_Type ||
+        converter == (PyObject *)&PyFloat_Type) {
+        field = parse_convert_number(self, converter);
+        if (field != NULL) {
+            self->field_len = 0;
+            self->numeric_field = 0;
+            goto append;
+        }
+        if (PyErr_Occurred())
+            return -1;
+    }
 
     field = PyUnicode_FromKindAndData(PyUnicode_4BYTE_KIND,
                                       (void *) self->field, self->field_len);
     if (field == NULL)
         return -1;
     self->field_len = 0;
-    if (self->numeric_field) {
+    if (converter != Py_None) {
+        PyObject *tmp;
+
+        self->numeric_field = 0;
+        tmp = PyObject_CallFunctionObjArgs(converter, field, NULL);
+        Py_DECREF(field);
+        if (tmp == NULL)
+            return -1;
+        field = tmp;
+    }
+    else if (self->numeric_field) {
         PyObject *tmp;
 
         self->numeric_field = 0;
@@ -552,6 +630,7 @@ parse_save_field(ReaderObj *self)
             return -1;
         field = tmp;
     }
+append:
     if (PyList_Append(self->fields, field) < 0) {
         Py_DECREF(field);
         return -1;
@@ -869,6 +948,7 @@ Reader_dealloc(ReaderObj *self)
     Py_XDECREF(self->dialect);
     Py_XDECREF(self->input_iter);
     Py_XDECREF(self->fields);
+    Py_XDECREF(self->converters);
     if (self->field != NULL)
         PyMem_Free(self->field);
     PyObject_GC_Del(self);
@@ -880,6 +960,7 @@ Reader_traverse(ReaderObj *self, visitproc visit, void *arg)
     Py_VISIT(self->dialect);
     Py_VISIT(self->input_iter);
     Py_VISIT(self->fields);
+    Py_VISIT(self->converters);
     return 0;
 }
 
@@ -889,6 +970,7 @@ Reader_clear(ReaderObj *self)
     Py_CLEAR(self->dialect);
     Py_CLEAR(self->input_iter);
     Py_CLEAR(self->fields);
+    Py_CLEAR(self->converters);
     return 0;
 }
 
@@ -899,7 +981,105 @@ PyDoc_STRVAR(Reader_Type_doc,
 "in CSV format.\n"
 );
 
+PyDoc_STRVAR(csv_readbatch_doc,
+"readbatch(size=-1, converters=None, columns=False)\n"
+"\n"
+"Read up to size rows (all remaining rows if size is negative) and\n"
+"return them as a list.  converters is a sequence with a callable or\n"
+"None for each column; int and float are applied without creating an\n"
+"intermediate string.  If columns is true, return a list of columns\n"
+"instead of a list of rows, skipping empty rows.");
+
+static PyObject *
+csv_readbatch(ReaderObj *self, PyObject *args, PyObject *kwargs)
+{
+    static char *kwlist[] = {"size", "converters", "columns", NULL};
+    Py_ssize_t size = -1;
+    PyObject *converters = Py_None;
+    int columns = 0;
+    PyObject *rows = NULL, *row, *result = NULL, *column;
+    Py_ssize_t i, j, nrows, ncols;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "|nOp:readbatch", kwlist,
+                                     &size, &converters, &columns))
+        return NULL;
+    if (self->converters != NULL) {
+        PyErr_SetString(PyExc_RuntimeError,
+                        "readbatch() called recursively");
+        return NULL;
+    }
+    if (converters != Py_None) {
+        self->converters = PySequence_Fast(converters,
+                                           "converters must be a sequence");
+        if (self->converters == NULL)
+            return NULL;
+    }
+
+    rows = PyList_New(0);
+    if (rows == NULL)
+        goto done;
+    while (size < 0 || PyList_GET_SIZE(rows) < size) {
+        row = Reader_iternext(self);
+        if (row == NULL) {
+            if (PyErr_Occurred())
+                goto done;
+            break;
+        }
+        if (columns && PyList_GET_SIZE(row) == 0) {
+            Py_DECREF(row);
+            continue;
+        }
+        if (PyList_Append(rows, row) < 0) {
+            Py_DECREF(row);
+            goto done;
+        }
+        Py_DECREF(row);
+    }
+
+    if (!columns) {
+        result = rows;
+        rows = NULL;
+        goto done;
+    }
+
+    nrows = PyList_GET_SIZE(rows);
+    ncols = nrows ? PyList_GET_SIZE(PyList_GET_ITEM(rows, 0)) : 0;
+    result = PyList_New(ncols);
+    if (result == NULL)
+        goto done;
+    for (j = 0; j < ncols; j++) {
+        column = PyList_New(nrows);
+        if (column == NULL) {
+            Py_CLEAR(result);
+            goto done;
+        }
+        PyList_SET_ITEM(result, j, column);
+    }
+    for (i = 0; i < nrows; i++) {
+        row = PyList_GET_ITEM(rows, i);
+        if (PyList_GET_SIZE(row) != ncols) {
+            PyErr_Format(_csvstate_global->error_obj,
+                         "row %zd has %zd fields, expected %zd",
+                         i, PyList_GET_SIZE(row), ncols);
+            Py_CLEAR(result);
+            goto done;
+        }
+        for (j = 0; j < ncols; j++) {
+            PyObject *item = PyList_GET_ITEM(row, j);
+            Py_INCREF(item);
+            PyList_SET_ITEM(PyList_GET_ITEM(result, j), i, item);
+        }
+    }
+
+done:
+    Py_CLEAR(self->converters);
+    Py_XDECREF(rows);
+    return result;
+}
+
 static struct PyMethodDef Reader_methods[] = {
+    { "readbatch", (PyCFunction)csv_readbatch, METH_VARARGS | METH_KEYWORDS,
+      csv_readbatch_doc},
     { NULL, NULL }
 };
 #define R_OFF(x) offsetof(ReaderObj, x)
@@ -962,6 +1142,7 @@ csv_reader(PyObject *module, PyObject *args, PyObject *keyword_args)
     self->field = NULL;
     self->field_size = 0;
     self->line_num = 0;
+    self->converters = NULL;
 
     if (parse_reset(self) < 0) {
         Py_DECREF(self);
@@ -85,6 +85,7 @@ typedef struct {
     PyObject *parseerror_obj;
     PyObject *deepcopy_obj;
     PyObject *elementpath_obj;
+    PyObject *path_cache;
 } elementtreestate;
 
 static struct PyModuleDef elementtreemodule;
@@ -107,6 +108,7 @@ elementtree_clear(PyObject *m)
     Py_CLEAR(st->parseerror_obj);
     Py_CLEAR(st->deepcopy_obj);
     Py_CLEAR(st->elementpath_obj);
+    Py_CLEAR(st->path_cache);
     return 0;
 }
 
@@ -117,6 +119,7 @@ elementtree_traverse(PyObject *m, visitproc visit, void *arg)
     Py_VISIT(st->parseerror_obj);
     Py_VISIT(st->deepcopy_obj);
     Py_VISIT(st->elementpath_obj);
+    Py_VISIT(st->path_cache);
     return 0;
 }
 
@@ -1157,6 +1160,29 @@ _elementtree_Element_extend(ElementObject *self, PyObject *elements)
     Py_RETURN_NONE;
 }
 
+static PyObject *path_compile(elementtreestate *st, PyObject *path,
+                              PyObject *namespaces);
+static PyObject *path_select(PyObject *capsule, ElementObject *elem,
+                             Py_ssize_t limit);
+
+/* Select the elements matching path with the compiled matcher.  Returns a
+ * list of at most limit elements, or None if ElementPath has to evaluate
+ * the path.
+ */
+static PyObject *
+element_select(ElementObject *self, PyObject *path, PyObject *namespaces,
+               Py_ssize_t limit)
+{
+    PyObject *prog, *result;
+
+    prog = path_compile(ET_STATE_GLOBAL, path, namespaces);
+    if (!prog || prog == Py_None)
+        return prog;
+    result = path_select(prog, self, limit);
+    Py_DECREF(prog);
+    return result;
+}
+
 /*[clinic input]
 _elementtree.Element.find
 
@@ -1175,6 +1201,17 @@ _elementtree_Element_find_impl(ElementObject *self, PyObject *path,
 
     if (checkpath(path) || namespaces != Py_None) {
         _Py_IDENTIFIER(find);
+        PyObject *found = element_select(self, path, namespaces, 1);
+        if (found != Py_None) {
+            PyObject *item;
+            if (!found)
+                return NULL;
+            item = PyList_GET_SIZE(found) ? PyList_GET_ITEM(found, 0) : Py_None;
+            Py_INCREF(item);
+            Py_DECREF(found);
+            return item;
+        }
+        Py_DECREF(found);
         return _PyObject_CallMethodId(
             st->elementpath_obj, &PyId_find, "OOO", self, path, namespaces
             );
@@ -1219,10 +1256,30 @@ _elementtree_Element_findtext_impl(ElementObject *self, PyObject *path,
     _Py_IDENTIFIER(findtext);
     elementtreestate *st = ET_STATE_GLOBAL;
 
-    if (checkpath(path) || namespaces != Py_None)
+    if (checkpath(path) || namespaces != Py_None) {
+        PyObject *found = element_select(self, path, namespaces, 1);
+        if (found != Py_None) {
+            PyObject *text;
+            if (!found)
+                return NULL;
+            if (!PyList_GET_SIZE(found)) {
+                Py_DECREF(found);
+                Py_INCREF(default_value);
+                return default_value;
+            }
+            text = element_get_text((ElementObject *)PyList_GET_ITEM(found, 0));
+            if (text == Py_None)
+                text = PyUnicode_New(0, 0);
+            else
+                Py_XINCREF(text);
+            Py_DECREF(found);
+            return text;
+        }
+        Py_DECREF(found);
         return _PyObject_CallMethodId(
             st->elementpath_obj, &PyId_findtext, "OOOO", self, path, default_value, namespaces
             );
+    }
 
     if (!self->extra) {
         Py_INCREF(default_value);
@@ -1275,6 +1332,10 @@ _elementtree_Element_findall_impl(ElementObject *self, PyObject *path,
 
     if (checkpath(tag) || namespaces != Py_None) {
         _Py_IDENTIFIER(findall);
+        out = element_select(self, tag, namespaces, PY_SSIZE_T_MAX);
+        if (out != Py_None)
+            return out;
+        Py_DECREF(out);
         return _PyObject_CallMethodId(
             st->elementpath_obj, &PyId_findall, "OOO", self, tag, namespaces
             );
@@ -1322,6 +1383,9 @@ _elementtree_Element_iterfind_impl(ElementObject *self, PyObject *path,
     _Py_IDENTIFIER(iterfind);
     elementtreestate *st = ET_STATE_GLOBAL;
 
+    /* Not evaluated with the compiled matcher, which collects all the
+       matching elements before returning: iterfind() walks the tree lazily
+       as the elements are consumed. */
     return _PyObject_CallMethodId(
         st->elementpath_obj, &PyId_iterfind, "OOO", self, tag, namespaces);
 }
@@ -2262,6 +2326,426 @@ create_elementiter(ElementObject *self, PyObject *tag, int gettext)
     return (PyObject *)it;
 }
 
+/* -------------------------------------------------------------------- */
+/* compiled ElementPath expressions */
+
+/* Paths other than plain tags are compiled by ElementPath._compile into a
+ * list of steps, which are kept in a per-module LRU cache and evaluated here
+ * without going through the selector generators of ElementPath.  Paths that
+ * _compile doesn't handle are cached as None and passed to ElementPath.
+ */
+
+#define PATH_CACHE_SIZE 512
+
+enum {
+    PATH_CHILD,         /* tag */
+    PATH_STAR,          /* * */
+    PATH_SELF,          /* . */
+    PATH_DESCENDANT,    /* //tag, or any tag if arg is NULL */
+    PATH_ATTR,          /* [@key] */
+    PATH_ATTR_EQ,       /* [@key='value'] */
+    PATH_TAG,           /* [tag] */
+    PATH_TAG_EQ         /* [tag='value'] */
+};
+
+typedef struct {
+    int op;
+    PyObject *arg;
+    PyObject *value;
+} PathStep;
+
+typedef struct {
+    Py_ssize_t length;
+    PathStep steps[1];
+} PathProgram;
+
+#define PATH_CAPSULE_NAME "_elementtree.path"
+
+static void
+path_program_free(PyObject *capsule)
+{
+    PathProgram *prog = PyCapsule_GetPointer(capsule, PATH_CAPSULE_NAME);
+    Py_ssize_t i;
+
+    for (i = 0; i < prog->length; i++) {
+        Py_XDECREF(prog->steps[i].arg);
+        Py_XDECREF(prog->steps[i].value);
+    }
+    PyMem_Free(prog);
+}
+
+/* Convert the tuple of steps returned by ElementPath._compile. */
+static PyObject *
+path_program_new(PyObject *steps)
+{
+    static const char * const names[] = {
+        "child", "star", "self", "descendant", "attr", "attr=", "tag", "tag="
+    };
+    PathProgram *prog;
+    PyObject *capsule;
+    Py_ssize_t i, length;
+    int op;
+
+    if (!PyTuple_Check(steps)) {
+        PyErr_SetString(PyExc_TypeError, "expected a tuple of path steps");
+        return NULL;
+    }
+    length = PyTuple_GET_SIZE(steps);
+    prog = PyMem_Malloc(sizeof(PathProgram) + length * sizeof(PathStep));
+    if (!prog)
+        return PyErr_NoMemory();
+    prog->length = 0;
+    capsule = PyCapsule_New(prog, PATH_CAPSULE_NAME, path_program_free);
+    if (!capsule) {
+        PyMem_Free(prog);
+        return NULL;
+    }
+
+    for (i = 0; i < length; i++) {
+        PyObject *step = PyTuple_GET_ITEM(steps, i);
+        PathStep *s = &prog->steps[i];
+        if (!PyTuple_Check(step) || PyTuple_GET_SIZE(step) < 1)
+            goto error;
+        for (op = 0; op < (int)Py_ARRAY_LENGTH(names); op++) {
+            if (PyUnicode_Check(PyTuple_GET_ITEM(step, 0)) &&
+                PyUnicode_CompareWithASCIIString(PyTuple_GET_ITEM(step, 0),
+                                                 names[op]) == 0)
+                break;
+        }
+        if (op == (int)Py_ARRAY_LENGTH(names))
+            goto error;
+        s->op = op;
+        s->arg = s->value = NULL;
+        if (PyTuple_GET_SIZE(step) > 1 && PyTuple_GET_ITEM(step, 1) != Py_None) {
+            s->arg = PyTuple_GET_ITEM(step, 1);
+            Py_INCREF(s->arg);
+        }
+        if (PyTuple_GET_SIZE(step) > 2) {
+            s->value = PyTuple_GET_ITEM(step, 2);
+            Py_INCREF(s->value);
+        }
+        prog->length++;
+        if ((s->arg == NULL && op != PATH_STAR && op != PATH_SELF &&
+             op != PATH_DESCENDANT) ||
+            (s->value == NULL && (op == PATH_ATTR_EQ || op == PATH_TAG_EQ)))
+            goto error;
+    }
+    return capsule;
+
+  error:
+    Py_DECREF(capsule);
+    PyErr_SetString(PyExc_ValueError, "invalid path step");
+    return NULL;
+}
+
+/* Return the compiled form of path for the given namespaces: a capsule, or
+ * None if the path has to be evaluated by ElementPath.
+ */
+static PyObject *
+path_compile(elementtreestate *st, PyObject *path, PyObject *namespaces)
+{
+    _Py_IDENTIFIER(_compile);
+    _Py_IDENTIFIER(move_to_end);
+    _Py_IDENTIFIER(popitem);
+    PyObject *key, *prog, *steps, *res;
+
+    if (!PyUnicode_Check(path) ||
+        (namespaces != Py_None && !PyDict_Check(namespaces))) {
+        Py_RETURN_NONE;
+    }
+
+    if (namespaces == Py_None) {
+        key = path;
+        Py_INCREF(key);
+    }
+    else {
+        PyObject *items = PyDict_Items(namespaces);
+        PyObject *nskey;
+        if (!items)
+            return NULL;
+        nskey = PyFrozenSet_New(items);
+        Py_DECREF(items);
+        if (!nskey)
+            return NULL;
+        key = PyTuple_Pack(2, path, nskey);
+        Py_DECREF(nskey);
+        if (!key)
+            return NULL;
+    }
+
+    /* OrderedDict is a dict subclass, so the lookup can bypass it */
+    prog = PyDict_GetItemWithError(st->path_cache, key);
+    if (prog) {
+        Py_INCREF(prog);
+        res = _PyObject_CallMethodId(st->path_cache, &PyId_move_to_end,
+                                     "(O)", key);
+        Py_DECREF(key);
+        if (!res) {
+            Py_DECREF(prog);
+            return NULL;
+        }
+        Py_DECREF(res);
+        return prog;
+    }
+    if (PyErr_Occurred()) {
+        Py_DECREF(key);
+        return NULL;
+    }
+
+    steps = _PyObject_CallMethodId(st->elementpath_obj, &PyId__compile,
+                                   "OO", path, namespaces);
+    if (!steps) {
+        Py_DECREF(key);
+        return NULL;
+    }
+    if (steps == Py_None)
+        prog = steps;
+    else {
+        prog = path_program_new(steps);
+        Py_DECREF(steps);
+        if (!prog) {
+            Py_DECREF(key);
+            return NULL;
+        }
+    }
+
+    if (PyObject_SetItem(st->path_cache, key, prog) < 0)
+        goto error;
+    if (PyObject_Size(st->path_cache) > PATH_CACHE_SIZE) {
+        res = _PyObject_CallMethodId(st->path_cache, &PyId_popitem,
+                                     "O", Py_False);
+        if (!res)
+            goto error;
+        Py_DECREF(res);
+    }
+    Py_DECREF(key);
+    return prog;
+
+  error:
+    Py_DECREF(key);
+    Py_DECREF(prog);
+    return NULL;
+}
+
+/* Is this element's tag equal to tag?  NULL matches any tag. */
+LOCAL(int)
+path_match_tag(PyObject *elem, PyObject *tag)
+{
+    if (tag == NULL)
+        return 1;
+    return PyObject_RichCompareBool(((ElementObject *)elem)->tag, tag, Py_EQ);
+}
+
+LOCAL(int)
+path_has_attrib(ElementObject *elem, PyObject *key, PyObject **value)
+{
+    if (!elem->extra || elem->extra->attrib == Py_None)
+        return 0;
+    *value = PyDict_GetItem(elem->extra->attrib, key);
+    return *value != NULL && *value != Py_None;
+}
+
+static int path_walk(PathStep *step, PathStep *end, ElementObject *elem,
+                     PyObject *out, Py_ssize_t limit);
+
+/* Continue the walk from the children of elem that match tag.  The
+ * children are looked up by index on every round, since comparing tags can
+ * run arbitrary code that modifies the element.
+ */
+static int
+path_walk_children(PathStep *step, PathStep *end, ElementObject *elem,
+                   PyObject *tag, PyObject *out, Py_ssize_t limit)
+{
+    Py_ssize_t i;
+    int rc;
+
+    for (i = 0; elem->extra && i < elem->extra->length; i++) {
+        PyObject *child = elem->extra->children[i];
+        if (!PyObject_TypeCheck(child, &Element_Type))
+            continue;
+        Py_INCREF(child);
+        rc = path_match_tag(child, tag);
+        if (rc > 0)
+            rc = path_walk(step + 1, end, (ElementObject *)child, out, limit);
+        Py_DECREF(child);
+        if (rc != 0)
+            return rc;
+    }
+    return 0;
+}
+
+/* Same as path_walk_children, for all descendants in document order. */
+static int
+path_walk_descendants(PathStep *step, PathStep *end, ElementObject *elem,
+                      PyObject *tag, PyObject *out, Py_ssize_t limit)
+{
+    ParentLocator *stack;
+    Py_ssize_t used = 0, allocated = INIT_PARENT_STACK_SIZE;
+    int rc = 0;
+
+    stack = PyMem_New(ParentLocator, allocated);
+    if (!stack) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    Py_INCREF(elem);
+    stack[0].parent = elem;
+    stack[0].child_index = 0;
+    used = 1;
+
+    while (used) {
+        ParentLocator *top = &stack[used - 1];
+        ElementObject *parent = top->parent;
+        PyObject *child;
+
+        if (!parent->extra || top->child_index >= parent->extra->length) {
+            Py_DECREF(parent);
+            used--;
+            continue;
+        }
+        child = parent->extra->children[top->child_index++];
+        if (!PyObject_TypeCheck(child, &Element_Type))
+            continue;
+        Py_INCREF(child);
+        rc = path_match_tag(child, tag);
+        if (rc > 0)
+            rc = path_walk(step + 1, end, (ElementObject *)child, out, limit);
+        if (rc != 0) {
+            Py_DECREF(child);
+            break;
+        }
+        if (used == allocated) {
+            ParentLocator *resized = stack;
+            PyMem_Resize(resized, ParentLocator, 2 * allocated);
+            if (!resized) {
+                Py_DECREF(child);
+                PyErr_NoMemory();
+                rc = -1;
+                break;
+            }
+            stack = resized;
+            allocated *= 2;
+        }
+        /* the stack takes over the reference */
+        stack[used].parent = (ElementObject *)child;
+        stack[used].child_index = 0;
+        used++;
+    }
+
+    while (used)
+        Py_DECREF(stack[--used].parent);
+    PyMem_Free(stack);
+    return rc;
+}
+
+/* Does elem have a child with the given tag, and whose text content equals
+ * value if value isn't NULL?
+ */
+static int
+path_has_child(ElementObject *elem, PyObject *tag, PyObject *value)
+{
+    Py_ssize_t i;
+    int rc;
+
+    for (i = 0; elem->extra && i < elem->extra->length; i++) {
+        PyObject *child = elem->extra->children[i];
+        if (!PyObject_TypeCheck(child, &Element_Type))
+            continue;
+        Py_INCREF(child);
+        rc = path_match_tag(child, tag);
+        if (rc > 0 && value) {
+            PyObject *it, *list, *text;
+            it = create_elementiter((ElementObject *)child, Py_None, 1);
+            list = it ? PySequence_List(it) : NULL;
+            Py_XDECREF(it);
+            text = list ? list_join(list) : NULL;
+            if (!text) {
+                Py_XDECREF(list);
+                Py_DECREF(child);
+                return -1;
+            }
+            rc = PyObject_RichCompareBool(text, value, Py_EQ);
+            Py_DECREF(text);
+        }
+        Py_DECREF(child);
+        if (rc != 0)
+            return rc;
+    }
+    return 0;
+}
+
+/* Append the elements selected by the steps from step to end, starting at
+ * elem, to out.  Returns -1 on error, 1 when out holds limit elements and 0
+ * otherwise.
+ */
+static int
+path_walk(PathStep *step, PathStep *end, ElementObject *elem,
+          PyObject *out, Py_ssize_t limit)
+{
+    PyObject *value;
+    int rc;
+
+    if (step == end) {
+        if (PyList_Append(out, (PyObject *)elem) < 0)
+            return -1;
+        return PyList_GET_SIZE(out) >= limit;
+    }
+
+    switch (step->op) {
+    case PATH_CHILD:
+        return path_walk_children(step, end, elem, step->arg, out, limit);
+    case PATH_STAR:
+        return path_walk_children(step, end, elem, NULL, out, limit);
+    case PATH_DESCENDANT:
+        return path_walk_descendants(step, end, elem, step->arg, out, limit);
+    case PATH_SELF:
+        return path_walk(step + 1, end, elem, out, limit);
+    case PATH_ATTR:
+        if (!path_has_attrib(elem, step->arg, &value))
+            return 0;
+        return path_walk(step + 1, end, elem, out, limit);
+    case PATH_ATTR_EQ:
+        if (!path_has_attrib(elem, step->arg, &value))
+            return 0;
+        Py_INCREF(value);
+        rc = PyObject_RichCompareBool(value, step->value, Py_EQ);
+        Py_DECREF(value);
+        if (rc <= 0)
+            return rc;
+        return path_walk(step + 1, end, elem, out, limit);
+    case PATH_TAG:
+    case PATH_TAG_EQ:
+        rc = path_has_child(elem, step->arg, step->value);
+        if (rc <= 0)
+            return rc;
+        return path_walk(step + 1, end, elem, out, limit);
+    }
+    PyErr_SetString(PyExc_SystemError, "invalid path step");
+    return -1;
+}
+
+/* Evaluate a compiled path on elem; returns a new list of up to limit
+ * matching elements, in the order ElementPath.iterfind would yield them.
+ */
+static PyObject *
+path_select(PyObject *capsule, ElementObject *elem, Py_ssize_t limit)
+{
+    PathProgram *prog = PyCapsule_GetPointer(capsule, PATH_CAPSULE_NAME);
+    PyObject *out;
+
+    if (!prog)
+        return NULL;
+    out = PyList_New(0);
+    if (!out)
+        return NULL;
+    if (path_walk(prog->steps, prog->steps + prog->length,
+                  elem, out, limit) < 0) {
+        Py_DECREF(out);
+        return NULL;
+    }
+    return out;
+}
+
 
 /* ==================================================================== */
 /* the tree builder type */
@@ -2287,6 +2771,11 @@ typedef struct {
     PyObject *end_event_obj;
     PyObject *start_ns_event_obj;
     PyObject *end_ns_event_obj;
+
+    /* streaming: tuple of tags (None for any tag) that elements and their
+       nearest ancestors must match to be reported, or NULL */
+    PyObject *stream_path;
+    PyObject *stream_matches; /* list of the matching elements still open */
 } TreeBuilderObject;
 
 #define TreeBuilder_CheckExact(op) (Py_TYPE(op) == &TreeBuilder_Type)
@@ -2320,6 +2809,7 @@ treebuilder_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         t->events_append = NULL;
         t->start_event_obj = t->end_event_obj = NULL;
         t->start_ns_event_obj = t->end_ns_event_obj = NULL;
+        t->stream_path = t->stream_matches = NULL;
     }
     return (PyObject *)t;
 }
@@ -2353,12 +2843,15 @@ treebuilder_gc_traverse(TreeBuilderObject *self, visitproc visit, void *arg)
     Py_VISIT(self->data);
     Py_VISIT(self->stack);
     Py_VISIT(self->element_factory);
+    Py_VISIT(self->stream_matches);
     return 0;
 }
 
 static int
 treebuilder_gc_clear(TreeBuilderObject *self)
 {
+    Py_CLEAR(self->stream_matches);
+    Py_CLEAR(self->stream_path);
     Py_CLEAR(self->end_ns_event_obj);
     Py_CLEAR(self->start_ns_event_obj);
     Py_CLEAR(self->end_event_obj);
@@ -2457,6 +2950,70 @@ treebuilder_append_event(TreeBuilderObject *self, PyObject *action,
     return 0;
 }
 
+/* Checks whether the element just pushed on the stack and its nearest
+   ancestors match the stream path. */
+static int
+treebuilder_stream_match(TreeBuilderObject *self, PyObject *node)
+{
+    _Py_IDENTIFIER(tag);
+    Py_ssize_t n = PyTuple_GET_SIZE(self->stream_path);
+    Py_ssize_t i;
+    PyObject *elem = node;
+    PyObject *want, *tag;
+    int r;
+
+    /* stack[index - 1] is the parent, stack[0] is always None */
+    if (n > self->index)
+        return 0;
+    for (i = 0; i < n; i++) {
+        if (i > 0)
+            elem = PyList_GET_ITEM(self->stack, self->index - i);
+        want = PyTuple_GET_ITEM(self->stream_path, n - 1 - i);
+        if (want == Py_None)
+            continue;
+        if (Element_CheckExact(elem)) {
+            tag = ((ElementObject *)elem)->tag;
+            Py_INCREF(tag);
+        }
+        else {
+            tag = _PyObject_GetAttrId(elem, &PyId_tag);
+            if (tag == NULL)
+                return -1;
+        }
+        r = PyObject_RichCompareBool(tag, want, Py_EQ);
+        Py_DECREF(tag);
+        if (r <= 0)
+            return r;
+    }
+    return 1;
+}
+
+/* Drops the just completed last child of parent. */
+static int
+treebuilder_stream_discard(PyObject *parent, PyObject *child)
+{
+    _Py_IDENTIFIER(remove);
+
+    if (parent == Py_None)
+        return 0;
+    if (Element_CheckExact(parent)) {
+        ElementObject *elem = (ElementObject *)parent;
+        if (elem->extra && elem->extra->length > 0 &&
+            elem->extra->children[elem->extra->length - 1] == child) {
+            elem->extra->length--;
+            Py_DECREF(child);
+        }
+        return 0;
+    }
+    else {
+        PyObject *res = _PyObject_CallMethodId(parent, &PyId_remove, "O", child);
+        if (res == NULL)
+            return -1;
+        Py_DECREF(res);
+        return 0;
+    }
+}
+
 /* -------------------------------------------------------------------- */
 /* handlers */
 
@@ -2528,6 +3085,19 @@ treebuilder_handle_start(TreeBuilderObject* self, PyObject* tag,
     Py_INCREF(node);
     Py_SETREF(self->last, node);
 
+    if (self->stream_path) {
+        int match = treebuilder_stream_match(self, node);
+        if (match < 0)
+            goto error;
+        if (match) {
+            if (PyList_Append(self->stream_matches, node) < 0)
+                goto error;
+            if (treebuilder_append_event(self, self->start_event_obj, node) < 0)
+                goto error;
+        }
+        return node;
+    }
+
     if (treebuilder_append_event(self, self->start_event_obj, node) < 0)
         goto error;
 
@@ -2606,6 +3176,26 @@ treebuilder_handle_end(TreeBuilderObject* self, PyObject* tag)
     Py_INCREF(self->this);
     Py_DECREF(item);
 
+    if (self->stream_path) {
+        /* Report matching elements, and drop all completed elements that
+           aren't part of a matching element still being built, so that
+           the tree only holds the open elements. */
+        Py_ssize_t nmatches = PyList_GET_SIZE(self->stream_matches);
+        if (nmatches > 0 &&
+            PyList_GET_ITEM(self->stream_matches, nmatches - 1) == self->last) {
+            if (treebuilder_append_event(self, self->end_event_obj, self->last) < 0)
+                return NULL;
+            if (PyList_SetSlice(self->stream_matches, nmatches - 1, nmatches, NULL) < 0)
+                return NULL;
+            nmatches--;
+        }
+        if (nmatches == 0 &&
+            treebuilder_stream_discard(self->this, self->last) < 0)
+            return NULL;
+        Py_INCREF(self->last);
+        return (PyObject*) self->last;
+    }
+
     if (treebuilder_append_event(self, self->end_event_obj, self->last) < 0)
         return NULL;
 
@@ -3554,6 +4144,7 @@ _elementtree.XMLParser._setevents
 
     events_queue: object
     events_to_report: object = None
+    stream_path: object = None
     /
 
 [clinic start generated code]*/
@@ -3561,8 +4152,9 @@ _elementtree.XMLParser._setevents
 static PyObject *
 _elementtree_XMLParser__setevents_impl(XMLParserObject *self,
                                        PyObject *events_queue,
-                                       PyObject *events_to_report)
-/*[clinic end generated code: output=1440092922b13ed1 input=abf90830a1c3b0fc]*/
+                                       PyObject *events_to_report,
+                                       PyObject *stream_path)
+/*[clinic end generated code: output=15e097cdb26aeecf input=1871b0b467bd9e12]*/
 {
     /* activate element event reporting */
     Py_ssize_t i;
@@ -3591,6 +4183,25 @@ _elementtree_XMLParser__setevents_impl(XMLParserObject *self,
     Py_CLEAR(target->start_ns_event_obj);
     Py_CLEAR(target->end_ns_event_obj);
 
+    if (stream_path == Py_None) {
+        Py_CLEAR(target->stream_path);
+        Py_CLEAR(target->stream_matches);
+    }
+    else {
+        if (!PyTuple_Check(stream_path) || PyTuple_GET_SIZE(stream_path) == 0) {
+            PyErr_SetString(PyExc_TypeError,
+                            "stream_path must be a non-empty tuple");
+            return NULL;
+        }
+        if (target->stream_matches == NULL) {
+            target->stream_matches = PyList_New(0);
+            if (target->stream_matches == NULL)
+                return NULL;
+        }
+        Py_INCREF(stream_path);
+        Py_SETREF(target->stream_path, stream_path);
+    }
+
     if (events_to_report == Py_None) {
         /* default is "end" only */
         target->end_event_obj = PyUnicode_FromString("end");
@@ -3935,6 +4546,11 @@ PyInit__elementtree(void)
     if (!(st->elementpath_obj = PyImport_ImportModule("xml.etree.ElementPath")))
         return NULL;
 
+    if (!(st->path_cache = PyODict_New()))
+        return NULL;
+    Py_INCREF(st->path_cache);
+    PyModule_AddObject(m, "_path_cache", st->path_cache);
+
     /* link against pyexpat */
     expat_capi = PyCapsule_Import(PyExpat_CAPSULE_NAME, 0);
     if (expat_capi) {
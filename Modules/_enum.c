@@ -0,0 +1,152 @@
+/* C helpers for the enum module */
+
+#include "Python.h"
+#include "structmember.h"
+
+/* member_getter: read-only attribute of enum members ************************/
+
+/* Base class of the descriptors backing Enum.name and Enum.value.  Accessed
+   on a member it returns the member's attribute `attr` (e.g. '_value_')
+   without calling into Python code; accessed on the class it raises
+   AttributeError, like types.DynamicClassAttribute, so that the enum
+   metaclass' __getattr__ can find members called 'name' or 'value'. */
+
+typedef struct {
+    PyObject_HEAD
+    PyObject *attr;
+} membergetterobject;
+
+static PyObject *
+membergetter_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
+{
+    membergetterobject *self;
+    PyObject *attr;
+
+    if (!PyArg_ParseTuple(args, "U:member_getter", &attr))
+        return NULL;
+    self = (membergetterobject *)type->tp_alloc(type, 0);
+    if (self == NULL)
+        return NULL;
+    Py_INCREF(attr);
+    PyUnicode_InternInPlace(&attr);
+    self->attr = attr;
+    return (PyObject *)self;
+}
+
+static void
+membergetter_dealloc(membergetterobject *self)
+{
+    Py_CLEAR(self->attr);
+    Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+static PyObject *
+membergetter_descr_get(PyObject *self, PyObject *obj, PyObject *type)
+{
+    if (obj == NULL || obj == Py_None) {
+        PyErr_SetNone(PyExc_AttributeError);
+        return NULL;
+    }
+    return PyObject_GetAttr(obj, ((membergetterobject *)self)->attr);
+}
+
+static int
+membergetter_descr_set(PyObject *self, PyObject *obj, PyObject *value)
+{
+    if (value == NULL)
+        PyErr_SetString(PyExc_AttributeError, "can't delete attribute");
+    else
+        PyErr_SetString(PyExc_AttributeError, "can't set attribute");
+    return -1;
+}
+
+static PyMemberDef membergetter_members[] = {
+    {"attr", T_OBJECT, offsetof(membergetterobject, attr), READONLY,
+     "name of the member attribute returned by the descriptor"},
+    {NULL}
+};
+
+PyDoc_STRVAR(membergetter_doc,
+"member_getter(attr) --> descriptor\n\
+\n\
+Read-only descriptor returning getattr(member, attr) when accessed on an\n\
+enum member and raising AttributeError when accessed on the class.");
+
+static PyTypeObject membergetter_type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    "_enum.member_getter",                      /* tp_name */
+    sizeof(membergetterobject),                 /* tp_basicsize */
+    0,                                          /* tp_itemsize */
+    /* methods */
+    (destructor)membergetter_dealloc,           /* tp_dealloc */
+    0,                                          /* tp_print */
+    0,                                          /* tp_getattr */
+    0,                                          /* tp_setattr */
+    0,                                          /* tp_reserved */
+    0,                                          /* tp_repr */
+    0,                                          /* tp_as_number */
+    0,                                          /* tp_as_sequence */
+    0,                                          /* tp_as_mapping */
+    0,                                          /* tp_hash */
+    0,                                          /* tp_call */
+    0,                                          /* tp_str */
+    0,                                          /* tp_getattro */
+    0,                                          /* tp_setattro */
+    0,                                          /* tp_as_buffer */
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE,   /* tp_flags */
+    membergetter_doc,                           /* tp_doc */
+    0,                                          /* tp_traverse */
+    0,                                          /* tp_clear */
+    0,                                          /* tp_richcompare */
+    0,                                          /* tp_weaklistoffset */
+    0,                                          /* tp_iter */
+    0,                                          /* tp_iternext */
+    0,                                          /* tp_methods */
+    membergetter_members,                       /* tp_members */
+    0,                                          /* tp_getset */
+    0,                                          /* tp_base */
+    0,                                          /* tp_dict */
+    membergetter_descr_get,                     /* tp_descr_get */
+    membergetter_descr_set,                     /* tp_descr_set */
+    0,                                          /* tp_dictoffset */
+    0,                                          /* tp_init */
+    0,                                          /* tp_alloc */
+    membergetter_new,                           /* tp_new */
+    0,                                          /* tp_free */
+};
+
+/* module level code ********************************************************/
+
+PyDoc_STRVAR(module_doc,
+"C helpers for the enum module.");
+
+static struct PyModuleDef _enummodule = {
+    PyModuleDef_HEAD_INIT,
+    "_enum",
+    module_doc,
+    -1,
+    NULL,
+    NULL,
+    NULL,
+    NULL,
+    NULL
+};
+
+PyMODINIT_FUNC
+PyInit__enum(void)
+{
+    PyObject *m;
+
+    if (PyType_Ready(&membergetter_type) < 0)
+        return NULL;
+    m = PyModule_Create(&_enummodule);
+    if (m == NULL)
+        return NULL;
+    Py_INCREF(&membergetter_type);
+    if (PyModule_AddObject(m, "member_getter",
+                           (PyObject *)&membergetter_type) < 0) {
+        Py_DECREF(m);
+        return NULL;
+    }
+    return m;
+}
@@ -1171,6 +1171,356 @@ static PyTypeObject lru_cache_type = {
     lru_cache_new,                      /* tp_new */
 };
 
+/* singledispatch wrapper ***************************************************/
+
+/* The dispatch cache maps the basic weak reference (the one without a
+   callback, which PyWeakref_NewRef() shares) of each class seen so far to
+   its implementation.  Looking a class up creates no new object once its
+   reference is in the cache, and the dictionary finds it by identity.
+   Entries of classes that have died are swept out when the cache has grown
+   to twice its size after the previous sweep. */
+
+#define SINGLEDISPATCH_MIN_SWEEP 16
+
+typedef struct {
+    PyObject_HEAD
+    PyObject *registry;         /* dict of the registered implementations */
+    PyObject *find_impl;        /* find_impl(cls, registry) */
+    PyObject *get_cache_token;  /* abc.get_cache_token() */
+    PyObject *cache_token;      /* None until an ABC is registered */
+    PyObject *cache;
+    Py_ssize_t sweep_size;
+    PyObject *dict;
+    PyObject *weakreflist;
+} singledispatchobject;
+
+_Py_IDENTIFIER(__class__);
+
+/* object.__class__, found on instances of classes that don't override it */
+static PyObject *object_class_descr = NULL;
+
+static PyObject *
+singledispatch_new(PyTypeObject *type, PyObject *args, PyObject *kw)
+{
+    PyObject *registry, *find_impl, *get_cache_token, *cache;
+    singledispatchobject *obj;
+    static char *keywords[] = {"registry", "find_impl", "get_cache_token",
+                               NULL};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kw, "O!OO:_singledispatch_wrapper",
+                                     keywords, &PyDict_Type, &registry,
+                                     &find_impl, &get_cache_token)) {
+        return NULL;
+    }
+
+    if (!(cache = PyDict_New()))
+        return NULL;
+
+    obj = (singledispatchobject *)type->tp_alloc(type, 0);
+    if (obj == NULL) {
+        Py_DECREF(cache);
+        return NULL;
+    }
+
+    Py_INCREF(registry);
+    obj->registry = registry;
+    Py_INCREF(find_impl);
+    obj->find_impl = find_impl;
+    Py_INCREF(get_cache_token);
+    obj->get_cache_token = get_cache_token;
+    obj->cache = cache;
+    obj->sweep_size = SINGLEDISPATCH_MIN_SWEEP;
+
+    return (PyObject *)obj;
+}
+
+static void
+singledispatch_dealloc(singledispatchobject *obj)
+{
+    PyObject_GC_UnTrack(obj);
+    if (obj->weakreflist != NULL)
+        PyObject_ClearWeakRefs((PyObject *)obj);
+    Py_XDECREF(obj->registry);
+    Py_XDECREF(obj->find_impl);
+    Py_XDECREF(obj->get_cache_token);
+    Py_XDECREF(obj->cache_token);
+    Py_XDECREF(obj->cache);
+    Py_XDECREF(obj->dict);
+    Py_TYPE(obj)->tp_free(obj);
+}
+
+/* Remove the entries of classes that no longer exist */
+static int
+singledispatch_sweep(singledispatchobject *self)
+{
+    PyObject *dead, *key, *value;
+    Py_ssize_t pos = 0, i;
+
+    dead = PyList_New(0);
+    if (dead == NULL)
+        return -1;
+    while (PyDict_Next(self->cache, &pos, &key, &value)) {
+        if (PyWeakref_GET_OBJECT(key) == Py_None &&
+            PyList_Append(dead, key) < 0) {
+            Py_DECREF(dead);
+            return -1;
+        }
+    }
+    for (i = 0; i < PyList_GET_SIZE(dead); i++) {
+        if (PyDict_DelItem(self->cache, PyList_GET_ITEM(dead, i)) < 0) {
+            Py_DECREF(dead);
+            return -1;
+        }
+    }
+    Py_DECREF(dead);
+    self->sweep_size = Py_MAX(2 * PyDict_Size(self->cache),
+                              SINGLEDISPATCH_MIN_SWEEP);
+    return 0;
+}
+
+/* Return a new reference to the implementation for cls */
+static PyObject *
+singledispatch_dispatch_impl(singledispatchobject *self, PyObject *cls)
+{
+    PyObject *key, *impl, *token;
+    int changed;
+
+    if (self->cache_token != NULL && self->cache_token != Py_None) {
+        /* an ABC was registered, the cache is stale if any ABC has
+           registered a virtual subclass since it was filled */
+        token = PyObject_CallObject(self->get_cache_token, NULL);
+        if (token == NULL)
+            return NULL;
+        changed = PyObject_RichCompareBool(self->cache_token, token, Py_NE);
+        if (changed < 0) {
+            Py_DECREF(token);
+            return NULL;
+        }
+        if (changed) {
+            PyDict_Clear(self->cache);
+            Py_SETREF(self->cache_token, token);
+        }
+        else
+            Py_DECREF(token);
+    }
+
+    key = PyWeakref_NewRef(cls, NULL);
+    if (key == NULL)
+        return NULL;
+    impl = PyDict_GetItemWithError(self->cache, key);
+    if (impl != NULL) {
+        Py_DECREF(key);
+        Py_INCREF(impl);
+        return impl;
+    }
+    if (PyErr_Occurred())
+        goto error;
+
+    impl = PyDict_GetItemWithError(self->registry, cls);
+    if (impl != NULL)
+        Py_INCREF(impl);
+    else if (PyErr_Occurred())
+        goto error;
+    else {
+        impl = PyObject_CallFunctionObjArgs(self->find_impl, cls,
+                                            self->registry, NULL);
+        if (impl == NULL)
+            goto error;
+    }
+    if (PyDict_SetItem(self->cache, key, impl) < 0) {
+        Py_DECREF(impl);
+        goto error;
+    }
+    Py_DECREF(key);
+    if (PyDict_Size(self->cache) >= self->sweep_size &&
+        singledispatch_sweep(self) < 0) {
+        Py_DECREF(impl);
+        return NULL;
+    }
+    return impl;
+
+error:
+    Py_DECREF(key);
+    return NULL;
+}
+
+/* Equivalent of obj.__class__ */
+static PyObject *
+singledispatch_get_class(PyObject *obj)
+{
+    PyTypeObject *tp = Py_TYPE(obj);
+
+    if (tp->tp_getattro == PyObject_GenericGetAttr &&
+        _PyType_LookupId(tp, &PyId___class__) == object_class_descr) {
+        Py_INCREF(tp);
+        return (PyObject *)tp;
+    }
+    return _PyObject_GetAttrId(obj, &PyId___class__);
+}
+
+static PyObject *
+singledispatch_call(singledispatchobject *self, PyObject *args, PyObject *kw)
+{
+    PyObject *cls, *impl, *result;
+
+    if (PyTuple_GET_SIZE(args) == 0) {
+        PyErr_SetString(PyExc_TypeError,
+                        "singledispatch function requires at least "
+                        "1 positional argument");
+        return NULL;
+    }
+    cls = singledispatch_get_class(PyTuple_GET_ITEM(args, 0));
+    if (cls == NULL)
+        return NULL;
+    impl = singledispatch_dispatch_impl(self, cls);
+    Py_DECREF(cls);
+    if (impl == NULL)
+        return NULL;
+    result = PyObject_Call(impl, args, kw);
+    Py_DECREF(impl);
+    return result;
+}
+
+static PyObject *
+singledispatch_descr_get(PyObject *self, PyObject *obj, PyObject *type)
+{
+    if (obj == Py_None || obj == NULL) {
+        Py_INCREF(self);
+        return self;
+    }
+    return PyMethod_New(self, obj);
+}
+
+PyDoc_STRVAR(singledispatch_dispatch_doc,
+"generic_func.dispatch(cls) -> <function implementation>\n\
+\n\
+Runs the dispatch algorithm to return the best available implementation\n\
+for the given *cls* registered on *generic_func*.");
+
+static PyObject *
+singledispatch_dispatch(singledispatchobject *self, PyObject *cls)
+{
+    return singledispatch_dispatch_impl(self, cls);
+}
+
+static PyObject *
+singledispatch_clear_cache(singledispatchobject *self, PyObject *unused)
+{
+    PyDict_Clear(self->cache);
+    self->sweep_size = SINGLEDISPATCH_MIN_SWEEP;
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+singledispatch_reduce(PyObject *self, PyObject *unused)
+{
+    return PyObject_GetAttrString(self, "__qualname__");
+}
+
+static PyObject *
+singledispatch_copy(PyObject *self, PyObject *unused)
+{
+    Py_INCREF(self);
+    return self;
+}
+
+static int
+singledispatch_traverse(singledispatchobject *self, visitproc visit, void *arg)
+{
+    Py_VISIT(self->registry);
+    Py_VISIT(self->find_impl);
+    Py_VISIT(self->get_cache_token);
+    Py_VISIT(self->cache_token);
+    Py_VISIT(self->cache);
+    Py_VISIT(self->dict);
+    return 0;
+}
+
+static int
+singledispatch_clear(singledispatchobject *self)
+{
+    Py_CLEAR(self->registry);
+    Py_CLEAR(self->find_impl);
+    Py_CLEAR(self->get_cache_token);
+    Py_CLEAR(self->cache_token);
+    Py_CLEAR(self->cache);
+    Py_CLEAR(self->dict);
+    return 0;
+}
+
+PyDoc_STRVAR(singledispatch_doc,
+"Create a generic function dispatching on the class of its first argument.\n\
+\n\
+registry:           dict mapping classes to their implementations\n\
+find_impl:          find_impl(cls, registry) returns the implementation\n\
+                    for a class which isn't a key of registry\n\
+get_cache_token:    abc.get_cache_token, the dispatch cache is cleared\n\
+                    when its result changes once _cache_token is set\n"
+);
+
+static PyMethodDef singledispatch_methods[] = {
+    {"dispatch", (PyCFunction)singledispatch_dispatch, METH_O,
+     singledispatch_dispatch_doc},
+    {"_clear_cache", (PyCFunction)singledispatch_clear_cache, METH_NOARGS},
+    {"__reduce__", (PyCFunction)singledispatch_reduce, METH_NOARGS},
+    {"__copy__", (PyCFunction)singledispatch_copy, METH_VARARGS},
+    {"__deepcopy__", (PyCFunction)singledispatch_copy, METH_VARARGS},
+    {NULL}
+};
+
+static PyMemberDef singledispatch_members[] = {
+    {"_cache_token", T_OBJECT, offsetof(singledispatchobject, cache_token), 0},
+    {NULL}
+};
+
+static PyGetSetDef singledispatch_getsetlist[] = {
+    {"__dict__", PyObject_GenericGetDict, PyObject_GenericSetDict},
+    {NULL}
+};
+
+static PyTypeObject singledispatch_type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    "functools._singledispatch_wrapper",        /* tp_name */
+    sizeof(singledispatchobject),               /* tp_basicsize */
+    0,                                          /* tp_itemsize */
+    /* methods */
+    (destructor)singledispatch_dealloc,         /* tp_dealloc */
+    0,                                          /* tp_print */
+    0,                                          /* tp_getattr */
+    0,                                          /* tp_setattr */
+    0,                                          /* tp_reserved */
+    0,                                          /* tp_repr */
+    0,                                          /* tp_as_number */
+    0,                                          /* tp_as_sequence */
+    0,                                          /* tp_as_mapping */
+    0,                                          /* tp_hash */
+    (ternaryfunc)singledispatch_call,           /* tp_call */
+    0,                                          /* tp_str */
+    0,                                          /* tp_getattro */
+    0,                                          /* tp_setattro */
+    0,                                          /* tp_as_buffer */
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC,
+                                                /* tp_flags */
+    singledispatch_doc,                         /* tp_doc */
+    (traverseproc)singledispatch_traverse,      /* tp_traverse */
+    (inquiry)singledispatch_clear,              /* tp_clear */
+    0,                                          /* tp_richcompare */
+    offsetof(singledispatchobject, weakreflist),/* tp_weaklistoffset */
+    0,                                          /* tp_iter */
+    0,                                          /* tp_iternext */
+    singledispatch_methods,                     /* tp_methods */
+    singledispatch_members,                     /* tp_members */
+    singledispatch_getsetlist,                  /* tp_getset */
+    0,                                          /* tp_base */
+    0,                                          /* tp_dict */
+    singledispatch_descr_get,                   /* tp_descr_get */
+    0,                                          /* tp_descr_set */
+    offsetof(singledispatchobject, dict),       /* tp_dictoffset */
+    0,                                          /* tp_init */
+    0,                                          /* tp_alloc */
+    singledispatch_new,                         /* tp_new */
+};
+
 /* module level code ********************************************************/
 
 PyDoc_STRVAR(module_doc,
@@ -1210,6 +1560,7 @@ PyInit__functools(void)
     PyTypeObject *typelist[] = {
         &partial_type,
         &lru_cache_type,
+        &singledispatch_type,
         NULL
     };
 
@@ -1223,6 +1574,13 @@ PyInit__functools(void)
         return NULL;
     }
 
+    object_class_descr = _PyType_LookupId(&PyBaseObject_Type,
+                                          &PyId___class__);
+    if (object_class_descr == NULL) {
+        Py_DECREF(m);
+        return NULL;
+    }
+
     for (i=0 ; typelist[i] != NULL ; i++) {
         if (PyType_Ready(typelist[i]) < 0) {
             Py_DECREF(m);
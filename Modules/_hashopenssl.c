@@ -77,7 +77,7 @@ newEVPobject(PyObject *name)
 }
 
 static void
-EVP_hash(EVPobject *self, const void *vp, Py_ssize_t len)
+EVP_hash_ctx(EVP_MD_CTX *ctx, const void *vp, Py_ssize_t len)
 {
     unsigned int process;
     const unsigned char *cp = (const unsigned char *)vp;
@@ -86,12 +86,38 @@ EVP_hash(EVPobject *self, const void *vp, Py_ssize_t len)
             process = MUNCH_SIZE;
         else
             process = Py_SAFE_DOWNCAST(len, Py_ssize_t, unsigned int);
-        EVP_DigestUpdate(&self->ctx, (const void*)cp, process);
+        EVP_DigestUpdate(ctx, (const void*)cp, process);
         len -= process;
         cp += process;
     }
 }
 
+static void
+EVP_hash(EVPobject *self, const void *vp, Py_ssize_t len)
+{
+    EVP_hash_ctx(&self->ctx, vp, len);
+}
+
+/* hashlib_batch_func for EVP_digest_many(), state is an EVP_MD_CTX */
+static void
+EVP_digest_batch(void *state, const Py_buffer *views, Py_ssize_t n,
+                 unsigned char *digests)
+{
+    EVP_MD_CTX *base_ctx = (EVP_MD_CTX *)state;
+    EVP_MD_CTX temp_ctx;
+    unsigned int digest_size = EVP_MD_CTX_size(base_ctx);
+    Py_ssize_t i;
+
+    /* reuse the same context for all the buffers */
+    EVP_MD_CTX_init(&temp_ctx);
+    for (i = 0; i < n; i++) {
+        EVP_MD_CTX_copy_ex(&temp_ctx, base_ctx);
+        EVP_hash_ctx(&temp_ctx, views[i].buf, views[i].len);
+        EVP_DigestFinal_ex(&temp_ctx, digests + i * digest_size, NULL);
+    }
+    EVP_MD_CTX_cleanup(&temp_ctx);
+}
+
 /* Internal methods for a hash object */
 
 static void
@@ -207,11 +233,32 @@ EVP_update(EVPobject *self, PyObject *args)
     Py_RETURN_NONE;
 }
 
+PyDoc_STRVAR(EVP_digest_many__doc__,
+"Return a list with the digest of each buffer in iterable.\n\
+\n\
+Each digest is that of a copy of this hash object updated with the\n\
+buffer; the hash object itself is left unchanged.");
+
+static PyObject *
+EVP_digest_many(EVPobject *self, PyObject *iterable)
+{
+    EVP_MD_CTX base_ctx;
+    PyObject *retval;
+
+    /* the GIL may be released, so hash a copy of the context */
+    locked_EVP_MD_CTX_copy(&base_ctx, self);
+    retval = _hashlib_digest_many(iterable, EVP_digest_batch, &base_ctx,
+                                  EVP_MD_CTX_size(&base_ctx));
+    EVP_MD_CTX_cleanup(&base_ctx);
+    return retval;
+}
+
 static PyMethodDef EVP_methods[] = {
     {"update",    (PyCFunction)EVP_update,    METH_VARARGS, EVP_update__doc__},
     {"digest",    (PyCFunction)EVP_digest,    METH_NOARGS,  EVP_digest__doc__},
     {"hexdigest", (PyCFunction)EVP_hexdigest, METH_NOARGS,  EVP_hexdigest__doc__},
     {"copy",      (PyCFunction)EVP_copy,      METH_NOARGS,  EVP_copy__doc__},
+    {"digest_many", (PyCFunction)EVP_digest_many, METH_O,   EVP_digest_many__doc__},
     {NULL, NULL}  /* sentinel */
 };
 
@@ -474,6 +474,540 @@ heapify_max(PyObject *self, PyObject *heap)
 
 PyDoc_STRVAR(heapify_max_doc, "Maxheap variant of heapify.");
 
+/* Heaps of undecorated entries, for merge(), nsmallest() and nlargest().
+
+   The Python versions of these functions keep lists of decorated tuples
+   such as [key, order, value, next] in a heap.  Here the entries are C
+   structs and the order is only used to break ties between equal keys, so
+   that each comparison costs a single call of the __lt__ method of the
+   keys, as for the tuples whose orders never tie. */
+
+typedef struct {
+    PyObject *key;      /* key(value), or a new reference to value */
+    PyObject *value;
+    Py_ssize_t order;   /* position of value in the input, breaks ties */
+    PyObject *it;       /* merge(): iterator value was taken from */
+} heapentry;
+
+static void
+entry_clear(heapentry *entry)
+{
+    Py_CLEAR(entry->key);
+    Py_CLEAR(entry->value);
+    Py_CLEAR(entry->it);
+}
+
+/* Return 1 if entry a comes before entry b in the output, 0 if not and -1
+   on error: a's key is smaller (larger if reverse is true), or the keys are
+   equal and a comes first in the input. */
+static int
+entry_before(heapentry *a, heapentry *b, int reverse)
+{
+    int cmp;
+
+    if (a->order < b->order) {
+        /* a comes first unless b is strictly before */
+        if (reverse)
+            cmp = PyObject_RichCompareBool(a->key, b->key, Py_LT);
+        else
+            cmp = PyObject_RichCompareBool(b->key, a->key, Py_LT);
+        return cmp < 0 ? -1 : !cmp;
+    }
+    if (reverse)
+        return PyObject_RichCompareBool(b->key, a->key, Py_LT);
+    return PyObject_RichCompareBool(a->key, b->key, Py_LT);
+}
+
+/* Move the entry at pos down the heap of size entries to its place.  The
+   top of the heap is the entry coming first in the output, or last if
+   worst_first is true.
+
+   Entries are swapped rather than shifted, so that the heap always holds
+   each entry exactly once: the comparisons may run arbitrary code,
+   including the garbage collector and merge_traverse(). */
+static int
+entries_siftup(heapentry *heap, Py_ssize_t size, Py_ssize_t pos,
+               int reverse, int worst_first)
+{
+    heapentry tmp;
+    Py_ssize_t childpos;
+    int cmp;
+
+    while ((childpos = 2*pos + 1) < size) {
+        /* Set childpos to the child that belongs nearer to the top. */
+        if (childpos + 1 < size) {
+            if (worst_first)
+                cmp = entry_before(&heap[childpos], &heap[childpos + 1],
+                                   reverse);
+            else
+                cmp = entry_before(&heap[childpos + 1], &heap[childpos],
+                                   reverse);
+            if (cmp < 0)
+                return -1;
+            childpos += cmp;
+        }
+        if (worst_first)
+            cmp = entry_before(&heap[pos], &heap[childpos], reverse);
+        else
+            cmp = entry_before(&heap[childpos], &heap[pos], reverse);
+        if (cmp <= 0)
+            return cmp;
+        tmp = heap[pos];
+        heap[pos] = heap[childpos];
+        heap[childpos] = tmp;
+        pos = childpos;
+    }
+    return 0;
+}
+
+static int
+entries_heapify(heapentry *heap, Py_ssize_t size, int reverse, int worst_first)
+{
+    Py_ssize_t i;
+
+    for (i = size / 2 - 1; i >= 0; i--) {
+        if (entries_siftup(heap, size, i, reverse, worst_first) < 0)
+            return -1;
+    }
+    return 0;
+}
+
+/* Fill entry with value and its key, stealing the reference to value. */
+static int
+entry_set(heapentry *entry, PyObject *value, PyObject *keyfunc)
+{
+    PyObject *key, *old_key, *old_value;
+
+    if (keyfunc == NULL) {
+        Py_INCREF(value);
+        key = value;
+    }
+    else {
+        key = PyObject_CallFunctionObjArgs(keyfunc, value, NULL);
+        if (key == NULL) {
+            Py_DECREF(value);
+            return -1;
+        }
+    }
+    /* replace before releasing, the entry may be visited meanwhile */
+    old_key = entry->key;
+    old_value = entry->value;
+    entry->key = key;
+    entry->value = value;
+    Py_XDECREF(old_key);
+    Py_XDECREF(old_value);
+    return 0;
+}
+
+/* The n first items of sorted(iterable, key=keyfunc, reverse=reverse) */
+static PyObject *
+sorted_head(Py_ssize_t n, PyObject *iterable, PyObject *keyfunc, int reverse)
+{
+    PyObject *result, *sort, *args = NULL, *kwargs = NULL, *res = NULL;
+
+    result = PySequence_List(iterable);
+    if (result == NULL)
+        return NULL;
+    sort = PyObject_GetAttrString(result, "sort");
+    if (sort == NULL)
+        goto done;
+    args = PyTuple_New(0);
+    kwargs = Py_BuildValue("{sOsO}", "key", keyfunc ? keyfunc : Py_None,
+                           "reverse", reverse ? Py_True : Py_False);
+    if (args != NULL && kwargs != NULL)
+        res = PyObject_Call(sort, args, kwargs);
+    Py_DECREF(sort);
+    if (res != NULL && PyList_GET_SIZE(result) > n) {
+        if (PyList_SetSlice(result, n, PyList_GET_SIZE(result), NULL) < 0)
+            Py_CLEAR(res);
+    }
+
+done:
+    Py_XDECREF(args);
+    Py_XDECREF(kwargs);
+    if (res == NULL) {
+        Py_DECREF(result);
+        return NULL;
+    }
+    Py_DECREF(res);
+    return result;
+}
+
+/* Guts of nsmallest() and nlargest() */
+static PyObject *
+nextreme(PyObject *args, PyObject *kwds, const char *fname, int reverse)
+{
+    static char *kwlist[] = {"n", "iterable", "key", NULL};
+    char format[32];
+    Py_ssize_t n, size, count = 0, allocated = 0, order, i;
+    PyObject *iterable, *keyfunc = Py_None, *it, *value, *result = NULL;
+    heapentry *heap = NULL, *newheap, entry = {NULL, NULL, 0, NULL};
+    int cmp;
+
+    PyOS_snprintf(format, sizeof(format), "nO|O:%s", fname);
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, format, kwlist,
+                                     &n, &iterable, &keyfunc))
+        return NULL;
+    if (keyfunc == Py_None)
+        keyfunc = NULL;
+
+    /* When n>=size, it's faster to use sorted() */
+    size = PyObject_Size(iterable);
+    if (size < 0) {
+        if (!PyErr_ExceptionMatches(PyExc_TypeError) &&
+            !PyErr_ExceptionMatches(PyExc_AttributeError))
+            return NULL;
+        PyErr_Clear();
+    }
+    else if (n >= size)
+        return sorted_head(n, iterable, keyfunc, reverse);
+
+    it = PyObject_GetIter(iterable);
+    if (it == NULL)
+        return NULL;
+
+    /* Keep the n entries coming first in a heap with the worst one on top.
+       The heap grows as needed, n may be much larger than the input. */
+    while (count < n && (value = PyIter_Next(it)) != NULL) {
+        if (count == allocated) {
+            allocated = allocated ? allocated * 2 : 16;
+            if (allocated > n)
+                allocated = n;
+            newheap = PyMem_Resize(heap, heapentry, allocated);
+            if (newheap == NULL) {
+                Py_DECREF(value);
+                PyErr_NoMemory();
+                goto error;
+            }
+            heap = newheap;
+        }
+        if (entry_set(&entry, value, keyfunc) < 0)
+            goto error;
+        entry.order = count;
+        heap[count++] = entry;
+        entry.key = entry.value = NULL;
+    }
+    if (PyErr_Occurred())
+        goto error;
+    if (entries_heapify(heap, count, reverse, 1) < 0)
+        goto error;
+
+    /* Replace the top with the new values coming before it */
+    order = count;
+    if (count > 0 && count == n) {
+        while ((value = PyIter_Next(it)) != NULL) {
+            if (entry_set(&entry, value, keyfunc) < 0)
+                goto error;
+            entry.order = order++;
+            cmp = entry_before(&entry, &heap[0], reverse);
+            if (cmp < 0)
+                goto error;
+            if (cmp) {
+                heapentry top = heap[0];
+                heap[0] = entry;
+                entry = top;
+                if (entries_siftup(heap, count, 0, reverse, 1) < 0)
+                    goto error;
+            }
+        }
+        if (PyErr_Occurred())
+            goto error;
+    }
+
+    /* Sort the heap in place, moving the worst entry to the end first */
+    for (i = count - 1; i > 0; i--) {
+        heapentry top = heap[0];
+        heap[0] = heap[i];
+        heap[i] = top;
+        if (entries_siftup(heap, i, 0, reverse, 1) < 0)
+            goto error;
+    }
+
+    result = PyList_New(count);
+    if (result == NULL)
+        goto error;
+    for (i = 0; i < count; i++) {
+        PyList_SET_ITEM(result, i, heap[i].value);
+        heap[i].value = NULL;
+    }
+
+error:
+    entry_clear(&entry);
+    for (i = 0; i < count; i++)
+        entry_clear(&heap[i]);
+    PyMem_Free(heap);
+    Py_DECREF(it);
+    return result;
+}
+
+static PyObject *
+nsmallest(PyObject *self, PyObject *args, PyObject *kwds)
+{
+    return nextreme(args, kwds, "nsmallest", 0);
+}
+
+PyDoc_STRVAR(nsmallest_doc,
+"Find the n smallest elements in a dataset.\n\
+\n\
+Equivalent to:  sorted(iterable, key=key)[:n]");
+
+static PyObject *
+nlargest(PyObject *self, PyObject *args, PyObject *kwds)
+{
+    return nextreme(args, kwds, "nlargest", 1);
+}
+
+PyDoc_STRVAR(nlargest_doc,
+"Find the n largest elements in a dataset.\n\
+\n\
+Equivalent to:  sorted(iterable, key=key, reverse=True)[:n]");
+
+/* merge object ************************************************************/
+
+typedef struct {
+    PyObject_HEAD
+    PyObject *iterables;    /* tuple of the inputs, until the first call */
+    PyObject *keyfunc;      /* or NULL */
+    int reverse;
+    int running;            /* guards against reentrant calls */
+    int advance;            /* the top value was returned, replace it */
+    heapentry *heap;        /* one entry per non-exhausted input */
+    Py_ssize_t size;
+} mergeobject;
+
+static PyTypeObject merge_type;
+
+static PyObject *
+merge_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
+{
+    static char *kwlist[] = {"key", "reverse", NULL};
+    PyObject *empty, *keyfunc = Py_None;
+    mergeobject *mo;
+    int reverse = 0;
+
+    empty = PyTuple_New(0);
+    if (empty == NULL)
+        return NULL;
+    if (!PyArg_ParseTupleAndKeywords(empty, kwds, "|Op:merge", kwlist,
+                                     &keyfunc, &reverse)) {
+        Py_DECREF(empty);
+        return NULL;
+    }
+    Py_DECREF(empty);
+
+    mo = (mergeobject *)type->tp_alloc(type, 0);
+    if (mo == NULL)
+        return NULL;
+    Py_INCREF(args);
+    mo->iterables = args;
+    if (keyfunc != Py_None) {
+        Py_INCREF(keyfunc);
+        mo->keyfunc = keyfunc;
+    }
+    mo->reverse = reverse;
+    mo->running = 0;
+    mo->advance = 0;
+    mo->heap = NULL;
+    mo->size = 0;
+    return (PyObject *)mo;
+}
+
+/* Drop the inputs, merge() is exhausted */
+static void
+merge_clear_heap(mergeobject *mo)
+{
+    Py_ssize_t i;
+
+    for (i = 0; i < mo->size; i++)
+        entry_clear(&mo->heap[i]);
+    PyMem_Free(mo->heap);
+    mo->heap = NULL;
+    mo->size = 0;
+    Py_CLEAR(mo->iterables);
+}
+
+static void
+merge_dealloc(mergeobject *mo)
+{
+    PyObject_GC_UnTrack(mo);
+    merge_clear_heap(mo);
+    Py_XDECREF(mo->keyfunc);
+    Py_TYPE(mo)->tp_free(mo);
+}
+
+static int
+merge_traverse(mergeobject *mo, visitproc visit, void *arg)
+{
+    Py_ssize_t i;
+
+    Py_VISIT(mo->iterables);
+    Py_VISIT(mo->keyfunc);
+    for (i = 0; i < mo->size; i++) {
+        Py_VISIT(mo->heap[i].key);
+        Py_VISIT(mo->heap[i].value);
+        Py_VISIT(mo->heap[i].it);
+    }
+    return 0;
+}
+
+/* Take the first value of each input */
+static int
+merge_start(mergeobject *mo)
+{
+    PyObject *iterables = mo->iterables, *it, *value;
+    Py_ssize_t i, n = PyTuple_GET_SIZE(iterables);
+    heapentry *entry;
+
+    mo->heap = PyMem_New(heapentry, n);
+    if (mo->heap == NULL) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    for (i = 0; i < n; i++) {
+        it = PyObject_GetIter(PyTuple_GET_ITEM(iterables, i));
+        if (it == NULL)
+            return -1;
+        value = PyIter_Next(it);
+        if (value == NULL) {
+            Py_DECREF(it);
+            if (PyErr_Occurred())
+                return -1;
+            continue;
+        }
+        entry = &mo->heap[mo->size];
+        entry->key = entry->value = NULL;
+        entry->order = i;
+        entry->it = it;
+        mo->size++;
+        if (entry_set(entry, value, mo->keyfunc) < 0)
+            return -1;
+    }
+    /* the heap holds references to the iterators now */
+    Py_CLEAR(mo->iterables);
+    return entries_heapify(mo->heap, mo->size, mo->reverse, 0);
+}
+
+/* Replace the value at the top by the next one of its input */
+static int
+merge_advance(mergeobject *mo)
+{
+    heapentry *top = &mo->heap[0];
+    PyObject *value;
+
+    value = PyIter_Next(top->it);
+    if (value == NULL) {
+        if (PyErr_Occurred())
+            return -1;
+        /* remove the exhausted input */
+        entry_clear(top);
+        mo->size--;
+        if (mo->size == 0)
+            return 0;
+        *top = mo->heap[mo->size];
+    }
+    else if (mo->size == 1) {
+        /* fast case when only a single input remains: no more
+           comparisons, so skip the key function */
+        Py_SETREF(top->value, value);
+        return 0;
+    }
+    else if (entry_set(top, value, mo->keyfunc) < 0)
+        return -1;
+    return entries_siftup(mo->heap, mo->size, 0, mo->reverse, 0);
+}
+
+static PyObject *
+merge_next(mergeobject *mo)
+{
+    PyObject *value;
+    int rc = 0;
+
+    if (mo->running) {
+        PyErr_SetString(PyExc_ValueError, "merge() already executing");
+        return NULL;
+    }
+    mo->running = 1;
+    if (mo->iterables != NULL)
+        rc = merge_start(mo);
+    else if (mo->advance && mo->size > 0)
+        rc = merge_advance(mo);
+    mo->running = 0;
+    mo->advance = 0;
+    if (rc < 0) {
+        merge_clear_heap(mo);
+        return NULL;
+    }
+    if (mo->size == 0)
+        return NULL;
+    value = mo->heap[0].value;
+    Py_INCREF(value);
+    mo->advance = 1;
+    return value;
+}
+
+PyDoc_STRVAR(merge_doc,
+"merge(*iterables, key=None, reverse=False) --> merge object\n\
+\n\
+Merge multiple sorted inputs into a single sorted output.\n\
+\n\
+Similar to sorted(itertools.chain(*iterables)) but returns an iterator,\n\
+does not pull the data into memory all at once, and assumes that each of\n\
+the input streams is already sorted (smallest to largest).\n\
+\n\
+>>> list(merge([1,3,5,7], [0,2,4,8], [5,10,15,20], [], [25]))\n\
+[0, 1, 2, 3, 4, 5, 5, 7, 8, 10, 15, 20, 25]\n\
+\n\
+If *key* is not None, applies a key function to each element to determine\n\
+its sort order.\n\
+\n\
+>>> list(merge(['dog', 'horse'], ['cat', 'fish', 'kangaroo'], key=len))\n\
+['dog', 'cat', 'fish', 'horse', 'kangaroo']\n\
+");
+
+static PyTypeObject merge_type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    "_heapq.merge",                     /* tp_name */
+    sizeof(mergeobject),                /* tp_basicsize */
+    0,                                  /* tp_itemsize */
+    /* methods */
+    (destructor)merge_dealloc,          /* tp_dealloc */
+    0,                                  /* tp_print */
+    0,                                  /* tp_getattr */
+    0,                                  /* tp_setattr */
+    0,                                  /* tp_reserved */
+    0,                                  /* tp_repr */
+    0,                                  /* tp_as_number */
+    0,                                  /* tp_as_sequence */
+    0,                                  /* tp_as_mapping */
+    0,                                  /* tp_hash */
+    0,                                  /* tp_call */
+    0,                                  /* tp_str */
+    PyObject_GenericGetAttr,            /* tp_getattro */
+    0,                                  /* tp_setattro */
+    0,                                  /* tp_as_buffer */
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC |
+        Py_TPFLAGS_BASETYPE,            /* tp_flags */
+    merge_doc,                          /* tp_doc */
+    (traverseproc)merge_traverse,       /* tp_traverse */
+    0,                                  /* tp_clear */
+    0,                                  /* tp_richcompare */
+    0,                                  /* tp_weaklistoffset */
+    PyObject_SelfIter,                  /* tp_iter */
+    (iternextfunc)merge_next,           /* tp_iternext */
+    0,                                  /* tp_methods */
+    0,                                  /* tp_members */
+    0,                                  /* tp_getset */
+    0,                                  /* tp_base */
+    0,                                  /* tp_dict */
+    0,                                  /* tp_descr_get */
+    0,                                  /* tp_descr_set */
+    0,                                  /* tp_dictoffset */
+    0,                                  /* tp_init */
+    0,                                  /* tp_alloc */
+    merge_new,                          /* tp_new */
+    PyObject_GC_Del,                    /* tp_free */
+};
+
 static PyMethodDef heapq_methods[] = {
     {"heappush",        (PyCFunction)heappush,
         METH_VARARGS,           heappush_doc},
@@ -491,6 +1025,10 @@ static PyMethodDef heapq_methods[] = {
         METH_VARARGS,           heapreplace_max_doc},
     {"_heapify_max",    (PyCFunction)heapify_max,
         METH_O,                 heapify_max_doc},
+    {"nsmallest",       (PyCFunction)nsmallest,
+        METH_VARARGS | METH_KEYWORDS,   nsmallest_doc},
+    {"nlargest",        (PyCFunction)nlargest,
+        METH_VARARGS | METH_KEYWORDS,   nlargest_doc},
     {NULL,              NULL}           /* sentinel */
 };
 
@@ -637,11 +1175,15 @@ PyInit__heapq(void)
 {
     PyObject *m, *about;
 
+    if (PyType_Ready(&merge_type) < 0)
+        return NULL;
     m = PyModule_Create(&_heapqmodule);
     if (m == NULL)
         return NULL;
     about = PyUnicode_DecodeUTF8(__about__, strlen(__about__), NULL);
     PyModule_AddObject(m, "__about__", about);
+    Py_INCREF(&merge_type);
+    PyModule_AddObject(m, "merge", (PyObject *)&merge_type);
     return m;
 }
 
@@ -72,6 +72,8 @@ int pysqlite_cache_init(pysqlite_Cache* self, PyObject* args, PyObject* kwargs)
     self->size = size;
     self->first = NULL;
     self->last = NULL;
+    self->hits = 0;
+    self->misses = 0;
 
     self->mapping = PyDict_New();
     if (!self->mapping) {
@@ -122,6 +124,7 @@ PyObject* pysqlite_cache_get(pysqlite_Cache* self, PyObject* args)
     node = (pysqlite_Node*)PyDict_GetItem(self->mapping, key);
     if (node) {
         /* an entry for this key already exists in the cache */
+        self->hits++;
 
         /* increase usage counter of the node found */
         if (node->count < LONG_MAX) {
@@ -161,6 +164,7 @@ PyObject* pysqlite_cache_get(pysqlite_Cache* self, PyObject* args)
         /* There is no entry for this key in the cache, yet. We'll insert a new
          * entry in the cache, and make space if necessary by throwing the
          * least used item out of the cache. */
+        self->misses++;
 
         if (PyDict_Size(self->mapping) == self->size) {
             if (self->last) {
@@ -56,6 +56,10 @@ typedef struct
     /* if set, decrement the factory function when the Cache is deallocated.
      * this is almost always desirable, but not in the pysqlite context */
     int decref_factory;
+
+    /* lookup statistics */
+    Py_ssize_t hits;
+    Py_ssize_t misses;
 } pysqlite_Cache;
 
 extern PyTypeObject pysqlite_NodeType;
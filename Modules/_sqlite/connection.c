@@ -1169,6 +1169,19 @@ static PyObject* pysqlite_connection_get_total_changes(pysqlite_Connection* self
     }
 }
 
+static PyObject* pysqlite_connection_statement_cache_info(pysqlite_Connection* self, PyObject* args)
+{
+    pysqlite_Cache* cache;
+
+    if (!pysqlite_check_connection(self)) {
+        return NULL;
+    }
+
+    cache = self->statement_cache;
+    return Py_BuildValue("nnin", cache->hits, cache->misses, cache->size,
+                         PyDict_Size(cache->mapping));
+}
+
 static int pysqlite_connection_set_isolation_level(pysqlite_Connection* self, PyObject* isolation_level)
 {
     PyObject* res;
@@ -1666,6 +1679,8 @@ static PyMethodDef connection_methods[] = {
         PyDoc_STR("Creates a collation function. Non-standard.")},
     {"interrupt", (PyCFunction)pysqlite_connection_interrupt, METH_NOARGS,
         PyDoc_STR("Abort any pending database operation. Non-standard.")},
+    {"statement_cache_info", (PyCFunction)pysqlite_connection_statement_cache_info, METH_NOARGS,
+        PyDoc_STR("Returns (hits, misses, maxsize, currsize) of the statement cache. Non-standard.")},
     {"iterdump", (PyCFunction)pysqlite_connection_iterdump, METH_NOARGS,
         PyDoc_STR("Returns iterator to the dump of the database in an SQL text format. Non-standard.")},
     {"__enter__", (PyCFunction)pysqlite_connection_enter, METH_NOARGS,
@@ -257,137 +257,136 @@ PyObject* _pysqlite_build_column_name(const char* colname)
 }
 
 /*
- * Returns a row from the currently active SQLite statement
- *
- * Precondidition:
- * - sqlite3_step() has been called before and it returned SQLITE_ROW.
+ * Returns the value of column i of the current row of the active SQLite
+ * statement, converted as configured on the connection.
  */
-PyObject* _pysqlite_fetch_one_row(pysqlite_Cursor* self)
+static PyObject* _pysqlite_fetch_cell(pysqlite_Cursor* self, int i)
 {
-    int i, numcols;
-    PyObject* row;
-    PyObject* item = NULL;
+    PyObject* item;
     int coltype;
     PyObject* converter;
     PyObject* converted;
     Py_ssize_t nbytes;
-    PyObject* buffer;
     const char* val_str;
     char buf[200];
     const char* colname;
     PyObject* buf_bytes;
     PyObject* error_obj;
 
-    if (self->reset) {
-        PyErr_SetString(pysqlite_InterfaceError, errmsg_fetch_across_rollback);
-        return NULL;
+    if (self->connection->detect_types) {
+        converter = PyList_GetItem(self->row_cast_map, i);
+        if (!converter) {
+            PyErr_Clear();
+            converter = Py_None;
+        }
+    } else {
+        converter = Py_None;
     }
 
-    Py_BEGIN_ALLOW_THREADS
-    numcols = sqlite3_data_count(self->statement->st);
-    Py_END_ALLOW_THREADS
-
-    row = PyTuple_New(numcols);
-    if (!row)
-        return NULL;
-
-    for (i = 0; i < numcols; i++) {
-        if (self->connection->detect_types) {
-            converter = PyList_GetItem(self->row_cast_map, i);
-            if (!converter) {
-                converter = Py_None;
-            }
+    if (converter != Py_None) {
+        nbytes = sqlite3_column_bytes(self->statement->st, i);
+        val_str = (const char*)sqlite3_column_blob(self->statement->st, i);
+        if (!val_str) {
+            Py_INCREF(Py_None);
+            converted = Py_None;
         } else {
-            converter = Py_None;
+            item = PyBytes_FromStringAndSize(val_str, nbytes);
+            if (!item)
+                return NULL;
+            converted = PyObject_CallFunction(converter, "O", item);
+            Py_DECREF(item);
         }
-
-        if (converter != Py_None) {
+    } else {
+        Py_BEGIN_ALLOW_THREADS
+        coltype = sqlite3_column_type(self->statement->st, i);
+        Py_END_ALLOW_THREADS
+        if (coltype == SQLITE_NULL) {
+            Py_INCREF(Py_None);
+            converted = Py_None;
+        } else if (coltype == SQLITE_INTEGER) {
+            converted = _pysqlite_long_from_int64(sqlite3_column_int64(self->statement->st, i));
+        } else if (coltype == SQLITE_FLOAT) {
+            converted = PyFloat_FromDouble(sqlite3_column_double(self->statement->st, i));
+        } else if (coltype == SQLITE_TEXT) {
+            val_str = (const char*)sqlite3_column_text(self->statement->st, i);
             nbytes = sqlite3_column_bytes(self->statement->st, i);
-            val_str = (const char*)sqlite3_column_blob(self->statement->st, i);
-            if (!val_str) {
-                Py_INCREF(Py_None);
-                converted = Py_None;
-            } else {
-                item = PyBytes_FromStringAndSize(val_str, nbytes);
-                if (!item)
-                    goto error;
-                converted = PyObject_CallFunction(converter, "O", item);
-                Py_DECREF(item);
-                if (!converted)
-                    break;
-            }
-        } else {
-            Py_BEGIN_ALLOW_THREADS
-            coltype = sqlite3_column_type(self->statement->st, i);
-            Py_END_ALLOW_THREADS
-            if (coltype == SQLITE_NULL) {
-                Py_INCREF(Py_None);
-                converted = Py_None;
-            } else if (coltype == SQLITE_INTEGER) {
-                converted = _pysqlite_long_from_int64(sqlite3_column_int64(self->statement->st, i));
-            } else if (coltype == SQLITE_FLOAT) {
-                converted = PyFloat_FromDouble(sqlite3_column_double(self->statement->st, i));
-            } else if (coltype == SQLITE_TEXT) {
-                val_str = (const char*)sqlite3_column_text(self->statement->st, i);
-                nbytes = sqlite3_column_bytes(self->statement->st, i);
-                if (self->connection->text_factory == (PyObject*)&PyUnicode_Type) {
-                    converted = PyUnicode_FromStringAndSize(val_str, nbytes);
-                    if (!converted) {
-                        PyErr_Clear();
-                        colname = sqlite3_column_name(self->statement->st, i);
-                        if (!colname) {
-                            colname = "<unknown column name>";
-                        }
-                        PyOS_snprintf(buf, sizeof(buf) - 1, "Could not decode to UTF-8 column '%s' with text '%s'",
-                                     colname , val_str);
-                        buf_bytes = PyByteArray_FromStringAndSize(buf, strlen(buf));
-                        if (!buf_bytes) {
+            if (self->connection->text_factory == (PyObject*)&PyUnicode_Type) {
+                converted = PyUnicode_FromStringAndSize(val_str, nbytes);
+                if (!converted) {
+                    PyErr_Clear();
+                    colname = sqlite3_column_name(self->statement->st, i);
+                    if (!colname) {
+                        colname = "<unknown column name>";
+                    }
+                    PyOS_snprintf(buf, sizeof(buf) - 1, "Could not decode to UTF-8 column '%s' with text '%s'",
+                                 colname , val_str);
+                    buf_bytes = PyByteArray_FromStringAndSize(buf, strlen(buf));
+                    if (!buf_bytes) {
+                        PyErr_SetString(pysqlite_OperationalError, "Could not decode to UTF-8");
+                    } else {
+                        error_obj = PyUnicode_FromEncodedObject(buf_bytes, "ascii", "replace");
+                        if (!error_obj) {
                             PyErr_SetString(pysqlite_OperationalError, "Could not decode to UTF-8");
                         } else {
-                            error_obj = PyUnicode_FromEncodedObject(buf_bytes, "ascii", "replace");
-                            if (!error_obj) {
-                                PyErr_SetString(pysqlite_OperationalError, "Could not decode to UTF-8");
-                            } else {
-                                PyErr_SetObject(pysqlite_OperationalError, error_obj);
-                                Py_DECREF(error_obj);
-                            }
-                            Py_DECREF(buf_bytes);
+                            PyErr_SetObject(pysqlite_OperationalError, error_obj);
+                            Py_DECREF(error_obj);
                         }
+                        Py_DECREF(buf_bytes);
                     }
-                } else if (self->connection->text_factory == (PyObject*)&PyBytes_Type) {
-                    converted = PyBytes_FromStringAndSize(val_str, nbytes);
-                } else if (self->connection->text_factory == (PyObject*)&PyByteArray_Type) {
-                    converted = PyByteArray_FromStringAndSize(val_str, nbytes);
-                } else {
-                    converted = PyObject_CallFunction(self->connection->text_factory, "y#", val_str, nbytes);
                 }
+            } else if (self->connection->text_factory == (PyObject*)&PyBytes_Type) {
+                converted = PyBytes_FromStringAndSize(val_str, nbytes);
+            } else if (self->connection->text_factory == (PyObject*)&PyByteArray_Type) {
+                converted = PyByteArray_FromStringAndSize(val_str, nbytes);
             } else {
-                /* coltype == SQLITE_BLOB */
-                nbytes = sqlite3_column_bytes(self->statement->st, i);
-                buffer = PyBytes_FromStringAndSize(
-                    sqlite3_column_blob(self->statement->st, i), nbytes);
-                if (!buffer)
-                    break;
-                converted = buffer;
+                converted = PyObject_CallFunction(self->connection->text_factory, "y#", val_str, nbytes);
             }
-        }
-
-        if (converted) {
-            PyTuple_SetItem(row, i, converted);
         } else {
-            Py_INCREF(Py_None);
-            PyTuple_SetItem(row, i, Py_None);
+            /* coltype == SQLITE_BLOB */
+            nbytes = sqlite3_column_bytes(self->statement->st, i);
+            converted = PyBytes_FromStringAndSize(
+                sqlite3_column_blob(self->statement->st, i), nbytes);
         }
     }
 
-    if (PyErr_Occurred())
-        goto error;
+    return converted;
+}
 
-    return row;
+/*
+ * Returns a row from the currently active SQLite statement
+ *
+ * Precondidition:
+ * - sqlite3_step() has been called before and it returned SQLITE_ROW.
+ */
+PyObject* _pysqlite_fetch_one_row(pysqlite_Cursor* self)
+{
+    int i, numcols;
+    PyObject* row;
+    PyObject* converted;
 
-error:
-    Py_DECREF(row);
-    return NULL;
+    if (self->reset) {
+        PyErr_SetString(pysqlite_InterfaceError, errmsg_fetch_across_rollback);
+        return NULL;
+    }
+
+    Py_BEGIN_ALLOW_THREADS
+    numcols = sqlite3_data_count(self->statement->st);
+    Py_END_ALLOW_THREADS
+
+    row = PyTuple_New(numcols);
+    if (!row)
+        return NULL;
+
+    for (i = 0; i < numcols; i++) {
+        converted = _pysqlite_fetch_cell(self, i);
+        if (!converted) {
+            Py_DECREF(row);
+            return NULL;
+        }
+        PyTuple_SET_ITEM(row, i, converted);
+    }
+
+    return row;
 }
 
 /*
@@ -415,6 +414,210 @@ static int check_cursor(pysqlite_Cursor* cur)
     return pysqlite_check_thread(cur->connection) && pysqlite_check_connection(cur->connection);
 }
 
+/*
+ * A column passed to executecolumns(): either a one-dimensional buffer of
+ * a fixed-size numeric type, which can be bound without touching Python
+ * objects, or any other sequence.
+ */
+typedef struct {
+    char code;              /* struct format character, 0 for a sequence */
+    Py_buffer view;
+    PyObject* seq;          /* result of PySequence_Fast() if code == 0 */
+} pysqlite_column;
+
+static char _pysqlite_buffer_code(Py_buffer* view)
+{
+    const char* fmt = view->format;
+
+    if (fmt == NULL) {
+        return 'B';
+    }
+    if (fmt[0] == '@') {
+        fmt++;
+    }
+    if (fmt[0] == '\0' || fmt[1] != '\0' || strchr("bBhHiIlqfd", fmt[0]) == NULL) {
+        return 0;
+    }
+    return fmt[0];
+}
+
+/* Binds the n-th item of a typed column.  Doesn't need the GIL. */
+static int _pysqlite_bind_typed(sqlite3_stmt* st, int pos, pysqlite_column* col, Py_ssize_t n)
+{
+    const char* p = (const char*)col->view.buf + n * col->view.itemsize;
+
+    switch (col->code) {
+        case 'b': { signed char v; memcpy(&v, p, sizeof(v)); return sqlite3_bind_int(st, pos, v); }
+        case 'B': { unsigned char v; memcpy(&v, p, sizeof(v)); return sqlite3_bind_int(st, pos, v); }
+        case 'h': { short v; memcpy(&v, p, sizeof(v)); return sqlite3_bind_int(st, pos, v); }
+        case 'H': { unsigned short v; memcpy(&v, p, sizeof(v)); return sqlite3_bind_int(st, pos, v); }
+        case 'i': { int v; memcpy(&v, p, sizeof(v)); return sqlite3_bind_int64(st, pos, v); }
+        case 'I': { unsigned int v; memcpy(&v, p, sizeof(v)); return sqlite3_bind_int64(st, pos, v); }
+        case 'l': { long v; memcpy(&v, p, sizeof(v)); return sqlite3_bind_int64(st, pos, v); }
+        case 'q': { PY_LONG_LONG v; memcpy(&v, p, sizeof(v)); return sqlite3_bind_int64(st, pos, v); }
+        case 'f': { float v; memcpy(&v, p, sizeof(v)); return sqlite3_bind_double(st, pos, v); }
+        case 'd': { double v; memcpy(&v, p, sizeof(v)); return sqlite3_bind_double(st, pos, v); }
+    }
+    return SQLITE_MISUSE;
+}
+
+/*
+ * Executes the current statement once for every row of `columns`, a
+ * sequence of equally long columns, one per statement parameter.  If every
+ * column is a typed buffer the whole batch runs without the GIL.
+ */
+static void _pysqlite_execute_columns(pysqlite_Cursor* self, PyObject* columns, int statement_type)
+{
+    PyObject* columns_seq;
+    pysqlite_column* cols = NULL;
+    sqlite3_stmt* st = self->statement->st;
+    Py_ssize_t ncols, nrows = 0, row, i, len;
+    Py_ssize_t initialized = 0;
+    int all_typed = 1;
+    int rc = SQLITE_DONE;
+    int bind_rc = SQLITE_OK;
+    long changes = 0;
+
+    Py_INCREF(Py_None);
+    Py_SETREF(self->lastrowid, Py_None);
+
+    columns_seq = PySequence_Fast(columns, "columns must be a sequence");
+    if (!columns_seq) {
+        return;
+    }
+    ncols = PySequence_Fast_GET_SIZE(columns_seq);
+
+    if (st == NULL) {
+        /* a statement without any SQL in it, e.g. only a comment */
+        goto finally;
+    }
+    if (ncols != sqlite3_bind_parameter_count(st)) {
+        PyErr_Format(pysqlite_ProgrammingError, "Incorrect number of bindings supplied. The current statement uses %d, and there are %zd supplied.",
+                     sqlite3_bind_parameter_count(st), ncols);
+        goto finally;
+    }
+
+    cols = PyMem_New(pysqlite_column, ncols);
+    if (cols == NULL && ncols > 0) {
+        PyErr_NoMemory();
+        goto finally;
+    }
+    for (i = 0; i < ncols; i++) {
+        PyObject* item = PySequence_Fast_GET_ITEM(columns_seq, i);
+
+        cols[i].code = 0;
+        cols[i].seq = NULL;
+        if (PyObject_CheckBuffer(item)) {
+            if (PyObject_GetBuffer(item, &cols[i].view, PyBUF_FORMAT | PyBUF_ND) < 0) {
+                PyErr_Clear();
+            } else if (cols[i].view.ndim != 1 ||
+                       (cols[i].code = _pysqlite_buffer_code(&cols[i].view)) == 0) {
+                PyBuffer_Release(&cols[i].view);
+            }
+        }
+        if (cols[i].code) {
+            len = cols[i].view.shape[0];
+        } else {
+            cols[i].seq = PySequence_Fast(item, "each column must be a sequence");
+            if (!cols[i].seq) {
+                goto finally;
+            }
+            len = PySequence_Fast_GET_SIZE(cols[i].seq);
+            all_typed = 0;
+        }
+        initialized = i + 1;
+
+        if (i == 0) {
+            nrows = len;
+        } else if (len != nrows) {
+            PyErr_SetString(pysqlite_ProgrammingError,
+                            "All columns passed to executecolumns() must have the same length.");
+            goto finally;
+        }
+    }
+
+    if (all_typed) {
+        Py_BEGIN_ALLOW_THREADS
+        for (row = 0; row < nrows; row++) {
+            for (i = 0; i < ncols; i++) {
+                bind_rc = _pysqlite_bind_typed(st, (int)i + 1, &cols[i], row);
+                if (bind_rc != SQLITE_OK) {
+                    break;
+                }
+            }
+            if (bind_rc != SQLITE_OK) {
+                break;
+            }
+            rc = sqlite3_step(st);
+            if (rc != SQLITE_DONE) {
+                break;
+            }
+            changes += sqlite3_changes(self->connection->db);
+            sqlite3_reset(st);
+        }
+        Py_END_ALLOW_THREADS
+    } else {
+        for (row = 0; row < nrows; row++) {
+            for (i = 0; i < ncols; i++) {
+                if (cols[i].code) {
+                    bind_rc = _pysqlite_bind_typed(st, (int)i + 1, &cols[i], row);
+                } else {
+                    bind_rc = pysqlite_statement_bind_object(self->statement, (int)i + 1,
+                            PySequence_Fast_GET_ITEM(cols[i].seq, row));
+                }
+                if (bind_rc != SQLITE_OK) {
+                    break;
+                }
+            }
+            if (bind_rc != SQLITE_OK) {
+                break;
+            }
+            rc = pysqlite_step(st, self->connection);
+            if (PyErr_Occurred()) {
+                break;
+            }
+            if (rc != SQLITE_DONE) {
+                break;
+            }
+            changes += sqlite3_changes(self->connection->db);
+            sqlite3_reset(st);
+        }
+    }
+
+    if (PyErr_Occurred()) {
+        /* raised by an adapter */
+    } else if (bind_rc != SQLITE_OK) {
+        PyErr_Format(pysqlite_InterfaceError, "Error binding parameter %zd - probably unsupported type.", i);
+    } else if (rc == SQLITE_ROW) {
+        PyErr_SetString(pysqlite_ProgrammingError, "executecolumns() can only execute DML statements.");
+    } else if (rc != SQLITE_DONE) {
+        (void)pysqlite_statement_reset(self->statement);
+        _pysqlite_seterror(self->connection->db, NULL);
+    }
+
+    switch (statement_type) {
+        case STATEMENT_UPDATE:
+        case STATEMENT_DELETE:
+        case STATEMENT_INSERT:
+        case STATEMENT_REPLACE:
+            self->rowcount = changes;
+    }
+
+finally:
+    if (self->statement) {
+        (void)pysqlite_statement_reset(self->statement);
+    }
+    for (i = 0; i < initialized; i++) {
+        if (cols[i].code) {
+            PyBuffer_Release(&cols[i].view);
+        } else {
+            Py_XDECREF(cols[i].seq);
+        }
+    }
+    PyMem_Free(cols);
+    Py_DECREF(columns_seq);
+}
+
 PyObject* _pysqlite_query_execute(pysqlite_Cursor* self, int multiple, PyObject* args)
 {
     PyObject* operation;
@@ -442,7 +645,7 @@ PyObject* _pysqlite_query_execute(pysqlite_Cursor* self, int multiple, PyObject*
     Py_CLEAR(self->next_row);
 
     if (multiple) {
-        /* executemany() */
+        /* executemany() and executecolumns() */
         if (!PyArg_ParseTuple(args, "OO", &operation, &second_argument)) {
             goto error;
         }
@@ -452,7 +655,9 @@ PyObject* _pysqlite_query_execute(pysqlite_Cursor* self, int multiple, PyObject*
             goto error;
         }
 
-        if (PyIter_Check(second_argument)) {
+        if (multiple == 2) {
+            /* the columns are consumed by _pysqlite_execute_columns() */
+        } else if (PyIter_Check(second_argument)) {
             /* iterator */
             Py_INCREF(second_argument);
             parameters_iter = second_argument;
@@ -578,14 +783,19 @@ PyObject* _pysqlite_query_execute(pysqlite_Cursor* self, int multiple, PyObject*
                 break;
             case STATEMENT_SELECT:
                 if (multiple) {
-                    PyErr_SetString(pysqlite_ProgrammingError,
-                                "You cannot execute SELECT statements in executemany().");
+                    PyErr_Format(pysqlite_ProgrammingError,
+                                 "You cannot execute SELECT statements in %s().",
+                                 multiple == 2 ? "executecolumns" : "executemany");
                     goto error;
                 }
                 break;
         }
     }
 
+    if (multiple == 2) {
+        _pysqlite_execute_columns(self, second_argument, statement_type);
+        goto error;
+    }
 
     while (1) {
         parameters = PyIter_Next(parameters_iter);
@@ -641,7 +851,9 @@ PyObject* _pysqlite_query_execute(pysqlite_Cursor* self, int multiple, PyObject*
             }
         }
 
-        if (pysqlite_build_row_cast_map(self) != 0) {
+        /* executemany() never fetches rows, so don't bother looking up
+           converters for every parameter set */
+        if (!multiple && pysqlite_build_row_cast_map(self) != 0) {
             PyErr_SetString(pysqlite_OperationalError, "Error while building row_cast_map");
             goto error;
         }
@@ -751,6 +963,11 @@ PyObject* pysqlite_cursor_executemany(pysqlite_Cursor* self, PyObject* args)
     return _pysqlite_query_execute(self, 1, args);
 }
 
+PyObject* pysqlite_cursor_executecolumns(pysqlite_Cursor* self, PyObject* args)
+{
+    return _pysqlite_query_execute(self, 2, args);
+}
+
 PyObject* pysqlite_cursor_executescript(pysqlite_Cursor* self, PyObject* args)
 {
     PyObject* script_obj;
@@ -993,6 +1210,319 @@ PyObject* pysqlite_cursor_fetchall(pysqlite_Cursor* self, PyObject* args)
     }
 }
 
+/* Makes room for at least n + 1 rows in every typed column.  Doesn't need
+   the GIL. */
+static int _pysqlite_grow_columns(char** bufs, const char* codes, Py_ssize_t ncols,
+                                  Py_ssize_t n, Py_ssize_t* capacity)
+{
+    Py_ssize_t i, newcap;
+    char* p;
+
+    if (n < *capacity) {
+        return 0;
+    }
+    newcap = *capacity ? *capacity * 2 : 64;
+    if (newcap > PY_SSIZE_T_MAX / 8) {
+        return -1;
+    }
+    for (i = 0; i < ncols; i++) {
+        if (codes[i]) {
+            p = PyMem_RawRealloc(bufs[i], newcap * 8);
+            if (p == NULL) {
+                return -1;
+            }
+            bufs[i] = p;
+        }
+    }
+    *capacity = newcap;
+    return 0;
+}
+
+/* Stores the typed columns of the current row as the n-th item of their
+   buffers.  Returns the index of a column whose value doesn't fit its
+   typecode, or -1.  Doesn't need the GIL. */
+static Py_ssize_t _pysqlite_store_typed(sqlite3_stmt* st, char** bufs, const char* codes,
+                                        Py_ssize_t ncols, Py_ssize_t n)
+{
+    Py_ssize_t i;
+    int coltype;
+    sqlite_int64 lval;
+    double dval;
+
+    for (i = 0; i < ncols; i++) {
+        if (!codes[i]) {
+            continue;
+        }
+        coltype = sqlite3_column_type(st, (int)i);
+        if (codes[i] == 'q') {
+            if (coltype != SQLITE_INTEGER) {
+                return i;
+            }
+            lval = sqlite3_column_int64(st, (int)i);
+            memcpy(bufs[i] + n * 8, &lval, 8);
+        } else {
+            if (coltype != SQLITE_INTEGER && coltype != SQLITE_FLOAT) {
+                return i;
+            }
+            dval = sqlite3_column_double(st, (int)i);
+            memcpy(bufs[i] + n * 8, &dval, 8);
+        }
+    }
+    return -1;
+}
+
+static PyObject* _pysqlite_build_array(char code, const char* buf, Py_ssize_t n)
+{
+    PyObject* array_module;
+    PyObject* array;
+    PyObject* view;
+    PyObject* result;
+
+    array_module = PyImport_ImportModule("array");
+    if (!array_module) {
+        return NULL;
+    }
+    array = PyObject_CallMethod(array_module, "array", "C", code);
+    Py_DECREF(array_module);
+    if (!array || n == 0) {
+        return array;
+    }
+    view = PyMemoryView_FromMemory((char*)buf, n * 8, PyBUF_READ);
+    if (!view) {
+        Py_DECREF(array);
+        return NULL;
+    }
+    result = PyObject_CallMethod(array, "frombytes", "O", view);
+    Py_DECREF(view);
+    if (!result) {
+        Py_DECREF(array);
+        return NULL;
+    }
+    Py_DECREF(result);
+    return array;
+}
+
+PyObject* pysqlite_cursor_fetchcolumns(pysqlite_Cursor* self, PyObject* args, PyObject* kwargs)
+{
+    static char *kwlist[] = {"size", "typecodes", NULL};
+
+    Py_ssize_t maxrows = -1;
+    PyObject* typecodes = Py_None;
+    PyObject* typecodes_seq = NULL;
+    PyObject* result = NULL;
+    PyObject* value;
+    PyObject* item;
+    Py_ssize_t ncols = 0, i, n = 0, capacity = 0, bad = -1;
+    char* codes = NULL;
+    char** bufs = NULL;
+    sqlite3_stmt* st;
+    int all_typed = 1;
+    int rc;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "|nO:fetchcolumns", kwlist,
+                                     &maxrows, &typecodes)) {
+        return NULL;
+    }
+
+    if (!check_cursor(self)) {
+        return NULL;
+    }
+
+    if (self->reset) {
+        PyErr_SetString(pysqlite_InterfaceError, errmsg_fetch_across_rollback);
+        return NULL;
+    }
+
+    if (PyTuple_Check(self->description)) {
+        ncols = PyTuple_GET_SIZE(self->description);
+    }
+
+    codes = PyMem_Malloc(ncols + 1);
+    bufs = PyMem_Calloc(ncols + 1, sizeof(char*));
+    if (!codes || !bufs) {
+        PyErr_NoMemory();
+        goto error;
+    }
+    memset(codes, 0, ncols + 1);
+
+    if (typecodes != Py_None) {
+        typecodes_seq = PySequence_Fast(typecodes, "typecodes must be a sequence");
+        if (!typecodes_seq) {
+            goto error;
+        }
+        if (PySequence_Fast_GET_SIZE(typecodes_seq) != ncols) {
+            PyErr_Format(pysqlite_ProgrammingError,
+                         "typecodes must have one entry per result column (%zd), not %zd",
+                         ncols, PySequence_Fast_GET_SIZE(typecodes_seq));
+            goto error;
+        }
+        for (i = 0; i < ncols; i++) {
+            item = PySequence_Fast_GET_ITEM(typecodes_seq, i);
+            if (item == Py_None) {
+                continue;
+            }
+            if (PyUnicode_Check(item) && PyUnicode_GET_LENGTH(item) == 1 &&
+                (PyUnicode_READ_CHAR(item, 0) == 'q' || PyUnicode_READ_CHAR(item, 0) == 'd')) {
+                codes[i] = (char)PyUnicode_READ_CHAR(item, 0);
+            } else {
+                PyErr_Format(PyExc_ValueError,
+                             "typecodes entries must be 'q', 'd' or None, not %R", item);
+                goto error;
+            }
+        }
+    }
+
+    result = PyList_New(ncols);
+    if (!result) {
+        goto error;
+    }
+    for (i = 0; i < ncols; i++) {
+        if (!codes[i]) {
+            all_typed = 0;
+            value = PyList_New(0);
+            if (!value) {
+                goto error;
+            }
+            PyList_SET_ITEM(result, i, value);
+        }
+    }
+
+    if (!self->next_row) {
+        if (self->statement) {
+            (void)pysqlite_statement_reset(self->statement);
+            Py_CLEAR(self->statement);
+        }
+        goto build;
+    }
+    if (maxrows == 0) {
+        goto build;
+    }
+
+    self->locked = 1;
+    st = self->statement->st;
+
+    /* The statement is still positioned on the row held in next_row: read
+       the typed columns from SQLite and take the others from the tuple, so
+       that converters are only called once. */
+    if (_pysqlite_grow_columns(bufs, codes, ncols, 0, &capacity) < 0) {
+        PyErr_NoMemory();
+        goto error;
+    }
+    bad = _pysqlite_store_typed(st, bufs, codes, ncols, 0);
+    if (bad >= 0) {
+        goto bad_value;
+    }
+    for (i = 0; i < ncols; i++) {
+        if (!codes[i] &&
+            PyList_Append(PyList_GET_ITEM(result, i), PyTuple_GET_ITEM(self->next_row, i)) < 0) {
+            goto error;
+        }
+    }
+    Py_CLEAR(self->next_row);
+    n = 1;
+
+    if (all_typed) {
+        Py_BEGIN_ALLOW_THREADS
+        while (1) {
+            rc = sqlite3_step(st);
+            if (rc != SQLITE_ROW || n == maxrows) {
+                break;
+            }
+            if (_pysqlite_grow_columns(bufs, codes, ncols, n, &capacity) < 0) {
+                break;
+            }
+            bad = _pysqlite_store_typed(st, bufs, codes, ncols, n);
+            if (bad >= 0) {
+                break;
+            }
+            n++;
+        }
+        Py_END_ALLOW_THREADS
+    } else {
+        while (1) {
+            rc = pysqlite_step(st, self->connection);
+            if (PyErr_Occurred()) {
+                (void)pysqlite_statement_reset(self->statement);
+                goto error;
+            }
+            if (rc != SQLITE_ROW || n == maxrows) {
+                break;
+            }
+            if (_pysqlite_grow_columns(bufs, codes, ncols, n, &capacity) < 0) {
+                break;
+            }
+            bad = _pysqlite_store_typed(st, bufs, codes, ncols, n);
+            if (bad >= 0) {
+                break;
+            }
+            for (i = 0; i < ncols; i++) {
+                if (codes[i]) {
+                    continue;
+                }
+                value = _pysqlite_fetch_cell(self, (int)i);
+                if (!value) {
+                    (void)pysqlite_statement_reset(self->statement);
+                    goto error;
+                }
+                if (PyList_Append(PyList_GET_ITEM(result, i), value) < 0) {
+                    Py_DECREF(value);
+                    goto error;
+                }
+                Py_DECREF(value);
+            }
+            n++;
+        }
+    }
+
+    if (rc == SQLITE_ROW) {
+        /* Keep the row we stopped at for the next fetch.  If it couldn't
+           be stored, the rows before it are returned and the next call
+           raises the error, starting with that row. */
+        self->next_row = _pysqlite_fetch_one_row(self);
+        if (!self->next_row) {
+            (void)pysqlite_statement_reset(self->statement);
+            goto error;
+        }
+    } else if (rc == SQLITE_DONE) {
+        (void)pysqlite_statement_reset(self->statement);
+        Py_CLEAR(self->statement);
+    } else {
+        (void)pysqlite_statement_reset(self->statement);
+        _pysqlite_seterror(self->connection->db, NULL);
+        goto error;
+    }
+
+build:
+    for (i = 0; i < ncols; i++) {
+        if (codes[i]) {
+            value = _pysqlite_build_array(codes[i], bufs[i], n);
+            if (!value) {
+                goto error;
+            }
+            PyList_SET_ITEM(result, i, value);
+        }
+    }
+    goto finally;
+
+bad_value:
+    PyErr_Format(pysqlite_DataError,
+                 "value of column %zd can't be fetched with typecode '%c'",
+                 bad, codes[bad]);
+error:
+    Py_CLEAR(result);
+finally:
+    self->locked = 0;
+    if (bufs) {
+        for (i = 0; i < ncols; i++) {
+            PyMem_RawFree(bufs[i]);
+        }
+    }
+    PyMem_Free(bufs);
+    PyMem_Free(codes);
+    Py_XDECREF(typecodes_seq);
+    return result;
+}
+
 PyObject* pysqlite_noop(pysqlite_Connection* self, PyObject* args)
 {
     /* don't care, return None */
@@ -1022,6 +1552,8 @@ static PyMethodDef cursor_methods[] = {
         PyDoc_STR("Executes a SQL statement.")},
     {"executemany", (PyCFunction)pysqlite_cursor_executemany, METH_VARARGS,
         PyDoc_STR("Repeatedly executes a SQL statement.")},
+    {"executecolumns", (PyCFunction)pysqlite_cursor_executecolumns, METH_VARARGS,
+        PyDoc_STR("Executes a SQL statement once per row of a set of columns. Non-standard.")},
     {"executescript", (PyCFunction)pysqlite_cursor_executescript, METH_VARARGS,
         PyDoc_STR("Executes a multiple SQL statements at once. Non-standard.")},
     {"fetchone", (PyCFunction)pysqlite_cursor_fetchone, METH_NOARGS,
@@ -1030,6 +1562,8 @@ static PyMethodDef cursor_methods[] = {
         PyDoc_STR("Fetches several rows from the resultset.")},
     {"fetchall", (PyCFunction)pysqlite_cursor_fetchall, METH_NOARGS,
         PyDoc_STR("Fetches all rows from the resultset.")},
+    {"fetchcolumns", (PyCFunction)pysqlite_cursor_fetchcolumns, METH_VARARGS|METH_KEYWORDS,
+        PyDoc_STR("Fetches rows from the resultset as a list of columns. Non-standard.")},
     {"close", (PyCFunction)pysqlite_cursor_close, METH_NOARGS,
         PyDoc_STR("Closes the cursor.")},
     {"setinputsizes", (PyCFunction)pysqlite_noop, METH_VARARGS,
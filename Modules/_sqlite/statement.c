@@ -183,10 +183,32 @@ static int _need_adapt(PyObject* obj)
     }
 }
 
+/* adapts the parameter if needed and binds it; returns SQLITE_OK on success */
+int pysqlite_statement_bind_object(pysqlite_Statement* self, int pos, PyObject* parameter)
+{
+    PyObject* adapted;
+    int rc;
+
+    if (!_need_adapt(parameter)) {
+        adapted = parameter;
+        Py_INCREF(adapted);
+    } else {
+        adapted = pysqlite_microprotocols_adapt(parameter, (PyObject*)&pysqlite_PrepareProtocolType, NULL);
+        if (!adapted) {
+            PyErr_Clear();
+            adapted = parameter;
+            Py_INCREF(adapted);
+        }
+    }
+
+    rc = pysqlite_statement_bind_parameter(self, pos, adapted);
+    Py_DECREF(adapted);
+    return rc;
+}
+
 void pysqlite_statement_bind_parameters(pysqlite_Statement* self, PyObject* parameters)
 {
     PyObject* current_param;
-    PyObject* adapted;
     const char* binding_name;
     int i;
     int rc;
@@ -227,20 +249,8 @@ void pysqlite_statement_bind_parameters(pysqlite_Statement* self, PyObject* para
                 return;
             }
 
-            if (!_need_adapt(current_param)) {
-                adapted = current_param;
-            } else {
-                adapted = pysqlite_microprotocols_adapt(current_param, (PyObject*)&pysqlite_PrepareProtocolType, NULL);
-                if (adapted) {
-                    Py_DECREF(current_param);
-                } else {
-                    PyErr_Clear();
-                    adapted = current_param;
-                }
-            }
-
-            rc = pysqlite_statement_bind_parameter(self, i + 1, adapted);
-            Py_DECREF(adapted);
+            rc = pysqlite_statement_bind_object(self, i + 1, current_param);
+            Py_DECREF(current_param);
 
             if (rc != SQLITE_OK) {
                 if (!PyErr_Occurred()) {
@@ -272,20 +282,8 @@ void pysqlite_statement_bind_parameters(pysqlite_Statement* self, PyObject* para
                 return;
             }
 
-            if (!_need_adapt(current_param)) {
-                adapted = current_param;
-            } else {
-                adapted = pysqlite_microprotocols_adapt(current_param, (PyObject*)&pysqlite_PrepareProtocolType, NULL);
-                if (adapted) {
-                    Py_DECREF(current_param);
-                } else {
-                    PyErr_Clear();
-                    adapted = current_param;
-                }
-            }
-
-            rc = pysqlite_statement_bind_parameter(self, i, adapted);
-            Py_DECREF(adapted);
+            rc = pysqlite_statement_bind_object(self, i, current_param);
+            Py_DECREF(current_param);
 
             if (rc != SQLITE_OK) {
                 if (!PyErr_Occurred()) {
@@ -47,6 +47,7 @@ int pysqlite_statement_create(pysqlite_Statement* self, pysqlite_Connection* con
 void pysqlite_statement_dealloc(pysqlite_Statement* self);
 
 int pysqlite_statement_bind_parameter(pysqlite_Statement* self, int pos, PyObject* parameter);
+int pysqlite_statement_bind_object(pysqlite_Statement* self, int pos, PyObject* parameter);
 void pysqlite_statement_bind_parameters(pysqlite_Statement* self, PyObject* parameters);
 
 int pysqlite_statement_recompile(pysqlite_Statement* self, PyObject* parameters);
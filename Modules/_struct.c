@@ -1455,6 +1455,23 @@ s_dealloc(PyStructObject *s)
     Py_TYPE(s)->tp_free((PyObject *)s);
 }
 
+/* Unpack a single item of the given format code stored at res. */
+static PyObject *
+unpack_item(const formatcode *code, const char *res)
+{
+    const formatdef *e = code->fmtdef;
+
+    if (e->format == 's') {
+        return PyBytes_FromStringAndSize(res, code->size);
+    } else if (e->format == 'p') {
+        Py_ssize_t n = *(unsigned char*)res;
+        if (n >= code->size)
+            n = code->size - 1;
+        return PyBytes_FromStringAndSize(res + 1, n);
+    }
+    return e->unpack(res, e);
+}
+
 static PyObject *
 s_unpack_internal(PyStructObject *soself, const char *startfrom) {
     formatcode *code;
@@ -1464,21 +1481,10 @@ s_unpack_internal(PyStructObject *soself, const char *startfrom) {
         return NULL;
 
     for (code = soself->s_codes; code->fmtdef != NULL; code++) {
-        const formatdef *e = code->fmtdef;
         const char *res = startfrom + code->offset;
         Py_ssize_t j = code->repeat;
         while (j--) {
-            PyObject *v;
-            if (e->format == 's') {
-                v = PyBytes_FromStringAndSize(res, code->size);
-            } else if (e->format == 'p') {
-                Py_ssize_t n = *(unsigned char*)res;
-                if (n >= code->size)
-                    n = code->size - 1;
-                v = PyBytes_FromStringAndSize(res + 1, n);
-            } else {
-                v = e->unpack(res, e);
-            }
+            PyObject *v = unpack_item(code, res);
             if (v == NULL)
                 goto fail;
             PyTuple_SET_ITEM(result, i++, v);
@@ -1701,6 +1707,71 @@ s_iter_unpack(PyObject *_so, PyObject *input)
 }
 
 
+/* Pack the single item v of the given format code into res.  Return 0 on
+   success, -1 on error. */
+static int
+pack_item(const formatcode *code, char *res, PyObject *v)
+{
+    const formatdef *e = code->fmtdef;
+
+    if (e->format == 's') {
+        Py_ssize_t n;
+        int isstring;
+        void *p;
+        isstring = PyBytes_Check(v);
+        if (!isstring && !PyByteArray_Check(v)) {
+            PyErr_SetString(StructError,
+                            "argument for 's' must be a bytes object");
+            return -1;
+        }
+        if (isstring) {
+            n = PyBytes_GET_SIZE(v);
+            p = PyBytes_AS_STRING(v);
+        }
+        else {
+            n = PyByteArray_GET_SIZE(v);
+            p = PyByteArray_AS_STRING(v);
+        }
+        if (n > code->size)
+            n = code->size;
+        if (n > 0)
+            memcpy(res, p, n);
+    } else if (e->format == 'p') {
+        Py_ssize_t n;
+        int isstring;
+        void *p;
+        isstring = PyBytes_Check(v);
+        if (!isstring && !PyByteArray_Check(v)) {
+            PyErr_SetString(StructError,
+                            "argument for 'p' must be a bytes object");
+            return -1;
+        }
+        if (isstring) {
+            n = PyBytes_GET_SIZE(v);
+            p = PyBytes_AS_STRING(v);
+        }
+        else {
+            n = PyByteArray_GET_SIZE(v);
+            p = PyByteArray_AS_STRING(v);
+        }
+        if (n > (code->size - 1))
+            n = code->size - 1;
+        if (n > 0)
+            memcpy(res + 1, p, n);
+        if (n > 255)
+            n = 255;
+        *res = Py_SAFE_DOWNCAST(n, Py_ssize_t, unsigned char);
+    } else {
+        if (e->pack(res, v, e) < 0) {
+            if (PyLong_Check(v) && PyErr_ExceptionMatches(PyExc_OverflowError))
+                PyErr_SetString(StructError,
+                                "int too large to convert");
+            return -1;
+        }
+    }
+    return 0;
+}
+
 /*
  * Guts of the pack function.
  *
@@ -1722,66 +1793,12 @@ s_pack_internal(PyStructObject *soself, PyObject *args, int offset, char* buf)
     memset(buf, '\0', soself->s_size);
     i = offset;
     for (code = soself->s_codes; code->fmtdef != NULL; code++) {
-        const formatdef *e = code->fmtdef;
         char *res = buf + code->offset;
         Py_ssize_t j = code->repeat;
         while (j--) {
             PyObject *v = PyTuple_GET_ITEM(args, i++);
-            if (e->format == 's') {
-                Py_ssize_t n;
-                int isstring;
-                void *p;
-                isstring = PyBytes_Check(v);
-                if (!isstring && !PyByteArray_Check(v)) {
-                    PyErr_SetString(StructError,
-                                    "argument for 's' must be a bytes object");
-                    return -1;
-                }
-                if (isstring) {
-                    n = PyBytes_GET_SIZE(v);
-                    p = PyBytes_AS_STRING(v);
-                }
-                else {
-                    n = PyByteArray_GET_SIZE(v);
-                    p = PyByteArray_AS_STRING(v);
-                }
-                if (n > code->size)
-                    n = code->size;
-                if (n > 0)
-                    memcpy(res, p, n);
-            } else if (e->format == 'p') {
-                Py_ssize_t n;
-                int isstring;
-                void *p;
-                isstring = PyBytes_Check(v);
-                if (!isstring && !PyByteArray_Check(v)) {
-                    PyErr_SetString(StructError,
-                                    "argument for 'p' must be a bytes object");
-                    return -1;
-                }
-                if (isstring) {
-                    n = PyBytes_GET_SIZE(v);
-                    p = PyBytes_AS_STRING(v);
-                }
-                else {
-                    n = PyByteArray_GET_SIZE(v);
-                    p = PyByteArray_AS_STRING(v);
-                }
-                if (n > (code->size - 1))
-                    n = code->size - 1;
-                if (n > 0)
-                    memcpy(res + 1, p, n);
-                if (n > 255)
-                    n = 255;
-                *res = Py_SAFE_DOWNCAST(n, Py_ssize_t, unsigned char);
-            } else {
-                if (e->pack(res, v, e) < 0) {
-                    if (PyLong_Check(v) && PyErr_ExceptionMatches(PyExc_OverflowError))
-                        PyErr_SetString(StructError,
-                                        "int too large to convert");
-                    return -1;
-                }
-            }
+            if (pack_item(code, res, v) < 0)
+                return -1;
             res += code->size;
         }
     }
@@ -1901,6 +1918,509 @@ s_pack_into(PyObject *self, PyObject *args)
     Py_RETURN_NONE;
 }
 
+/*
+ * Columnar access to arrays of records.
+ *
+ * unpack_columns() and pack_columns_into() convert between a buffer holding
+ * consecutive records and one column per field of the format.  Integer and
+ * float fields are copied byte by byte between the records and the contiguous
+ * storage of array.array objects (or other buffers of the same C type), with
+ * the GIL released for large copies; the other fields go through the same
+ * per-item functions as unpack() and pack().
+ */
+
+/* Release the GIL when copying at least that many bytes */
+#define COLUMN_GIL_MINSIZE 2048
+
+#define IN_TABLE(e, table) \
+    ((e) >= (table) && (e) < (table) + Py_ARRAY_LENGTH(table))
+
+/* Set at module initialization if float and double use the IEEE 754 format,
+   in which case the standard size 'f' and 'd' codes can be copied. */
+static int ieee_float = 0;
+static int ieee_double = 0;
+
+static char
+int_typecode(Py_ssize_t size, int is_signed)
+{
+    if (size == sizeof(char))
+        return is_signed ? 'b' : 'B';
+    if (size == sizeof(short))
+        return is_signed ? 'h' : 'H';
+    if (size == sizeof(int))
+        return is_signed ? 'i' : 'I';
+    if (size == sizeof(long))
+        return is_signed ? 'l' : 'L';
+#ifdef HAVE_LONG_LONG
+    if (size == sizeof(PY_LONG_LONG))
+        return is_signed ? 'q' : 'Q';
+#endif
+    return 0;
+}
+
+/* Return the array typecode storing the values of the format code e, or 0
+   if they must be converted one by one. */
+static char
+column_typecode(const formatdef *e)
+{
+    int native = IN_TABLE(e, native_table);
+
+    switch (e->format) {
+    case 'b': case 'h': case 'i': case 'l': case 'q':
+    case 'B': case 'H': case 'I': case 'L': case 'Q':
+        if (native)
+            return e->format;
+        return int_typecode(e->size, Py_ISLOWER(e->format));
+    case 'n':
+        return int_typecode(e->size, 1);
+    case 'N':
+        return int_typecode(e->size, 0);
+    case 'f':
+        return (native || ieee_float) ? 'f' : 0;
+    case 'd':
+        return (native || ieee_double) ? 'd' : 0;
+    }
+    return 0;
+}
+
+/* Whether the values of the format code e are stored in the opposite byte
+   order of the host */
+static int
+column_swapped(const formatdef *e)
+{
+#if PY_LITTLE_ENDIAN
+    return IN_TABLE(e, bigendian_table);
+#else
+    return IN_TABLE(e, lilendian_table);
+#endif
+}
+
+/* Return 1 if the buffer format fmt describes the same kind of C values as
+   the array typecode tc (the item sizes are compared separately). */
+static int
+column_format_matches(const char *fmt, char tc)
+{
+    static const char *kinds[] = {"bhilqn", "BHILQN", "fd"};
+    int i;
+
+    if (fmt == NULL)
+        fmt = "B";
+    if (fmt[0] == '@')
+        fmt++;
+    if (fmt[0] == '\0' || fmt[1] != '\0')
+        return 0;
+    for (i = 0; i < 3; i++) {
+        if (strchr(kinds[i], fmt[0]) != NULL)
+            return strchr(kinds[i], tc) != NULL;
+    }
+    return 0;
+}
+
+#define COPY_ITEMS(SIZE)                                        \
+    for (i = 0; i < n; i++, dst += dst_stride, src += src_stride) \
+        memcpy(dst, src, SIZE);                                 \
+    break
+
+/* Copy n items of itemsize bytes from src to dst, advancing by the given
+   strides, and reverse the bytes of each item if swap is true. */
+static void
+copy_items(char *dst, Py_ssize_t dst_stride,
+           const char *src, Py_ssize_t src_stride,
+           Py_ssize_t n, Py_ssize_t itemsize, int swap)
+{
+    Py_ssize_t i, k;
+
+    if (swap) {
+        for (i = 0; i < n; i++, dst += dst_stride, src += src_stride) {
+            for (k = 0; k < itemsize; k++)
+                dst[k] = src[itemsize - 1 - k];
+        }
+        return;
+    }
+    /* constant sizes let the compiler inline memcpy() */
+    switch (itemsize) {
+    case 1: COPY_ITEMS(1);
+    case 2: COPY_ITEMS(2);
+    case 4: COPY_ITEMS(4);
+    case 8: COPY_ITEMS(8);
+    default: COPY_ITEMS(itemsize);
+    }
+}
+
+#undef COPY_ITEMS
+
+static void
+copy_column(char *dst, Py_ssize_t dst_stride,
+            const char *src, Py_ssize_t src_stride,
+            Py_ssize_t n, Py_ssize_t itemsize, int swap)
+{
+    if (n * itemsize >= COLUMN_GIL_MINSIZE) {
+        Py_BEGIN_ALLOW_THREADS
+        copy_items(dst, dst_stride, src, src_stride, n, itemsize, swap);
+        Py_END_ALLOW_THREADS
+    }
+    else
+        copy_items(dst, dst_stride, src, src_stride, n, itemsize, swap);
+}
+
+static PyObject *
+unpack_column(const formatcode *code, const char *src, Py_ssize_t stride,
+              Py_ssize_t n, PyObject **arraytype)
+{
+    const formatdef *e = code->fmtdef;
+    char tc = column_typecode(e);
+    PyObject *column, *data, *v;
+    Py_ssize_t i;
+
+    if (tc) {
+        if (*arraytype == NULL) {
+            PyObject *arraymodule = PyImport_ImportModule("array");
+            if (arraymodule == NULL)
+                return NULL;
+            *arraytype = PyObject_GetAttrString(arraymodule, "array");
+            Py_DECREF(arraymodule);
+            if (*arraytype == NULL)
+                return NULL;
+        }
+        data = PyBytes_FromStringAndSize(NULL, n * e->size);
+        if (data == NULL)
+            return NULL;
+        copy_column(PyBytes_AS_STRING(data), e->size, src, stride,
+                    n, e->size, column_swapped(e));
+        column = PyObject_CallFunction(*arraytype, "CO", tc, data);
+        Py_DECREF(data);
+        return column;
+    }
+
+    column = PyList_New(n);
+    if (column == NULL)
+        return NULL;
+    for (i = 0; i < n; i++, src += stride) {
+        v = unpack_item(code, src);
+        if (v == NULL) {
+            Py_DECREF(column);
+            return NULL;
+        }
+        PyList_SET_ITEM(column, i, v);
+    }
+    return column;
+}
+
+static PyObject *
+s_unpack_columns_internal(PyStructObject *soself, const char *startfrom,
+                          Py_ssize_t count)
+{
+    formatcode *code;
+    Py_ssize_t i = 0;
+    PyObject *arraytype = NULL;
+    PyObject *result = PyTuple_New(soself->s_len);
+    if (result == NULL)
+        return NULL;
+
+    for (code = soself->s_codes; code->fmtdef != NULL; code++) {
+        const char *res = startfrom + code->offset;
+        Py_ssize_t j = code->repeat;
+        while (j--) {
+            PyObject *column = unpack_column(code, res, soself->s_size,
+                                             count, &arraytype);
+            if (column == NULL)
+                goto fail;
+            PyTuple_SET_ITEM(result, i++, column);
+            res += code->size;
+        }
+    }
+
+    Py_XDECREF(arraytype);
+    return result;
+fail:
+    Py_XDECREF(arraytype);
+    Py_DECREF(result);
+    return NULL;
+}
+
+PyDoc_STRVAR(s_unpack_columns__doc__,
+"S.unpack_columns(buffer, offset=0, count=-1) -> (column1, column2, ...)\n\
+\n\
+Unpack count consecutive records of format S.format starting at offset\n\
+in buffer and return a tuple with one column per field.  Integer and float\n\
+fields are returned as array.array objects, other fields as lists.  By\n\
+default, all the records up to the end of the buffer are unpacked, which\n\
+requires len(buffer[offset:]) to be a multiple of S.size.");
+
+static PyObject *
+s_unpack_columns(PyObject *self, PyObject *args, PyObject *kwds)
+{
+    static char *kwlist[] = {"buffer", "offset", "count", 0};
+
+    PyObject *input;
+    Py_ssize_t offset = 0, count = -1, avail;
+    Py_buffer vbuf;
+    PyObject *result;
+    PyStructObject *soself = (PyStructObject *)self;
+
+    assert(PyStruct_Check(self));
+    assert(soself->s_codes != NULL);
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds,
+                                     "O|nn:unpack_columns", kwlist,
+                                     &input, &offset, &count))
+        return NULL;
+    if (PyObject_GetBuffer(input, &vbuf, PyBUF_SIMPLE) < 0)
+        return NULL;
+    if (offset < 0)
+        offset += vbuf.len;
+    if (offset < 0 || offset > vbuf.len) {
+        PyErr_SetString(StructError, "unpack_columns offset out of range");
+        goto error;
+    }
+    avail = vbuf.len - offset;
+    if (count < 0) {
+        if (soself->s_size == 0) {
+            PyErr_SetString(StructError,
+                            "cannot unpack columns with a struct of length 0 "
+                            "without a count");
+            goto error;
+        }
+        if (avail % soself->s_size != 0) {
+            PyErr_Format(StructError,
+                         "unpack_columns requires a buffer length "
+                         "multiple of %zd",
+                         soself->s_size);
+            goto error;
+        }
+        count = avail / soself->s_size;
+    }
+    else if (soself->s_size != 0 && count > avail / soself->s_size) {
+        PyErr_Format(StructError,
+                     "unpack_columns requires a buffer holding "
+                     "%zd records of %zd bytes",
+                     count, soself->s_size);
+        goto error;
+    }
+    result = s_unpack_columns_internal(soself, (char*)vbuf.buf + offset,
+                                       count);
+    PyBuffer_Release(&vbuf);
+    return result;
+
+error:
+    PyBuffer_Release(&vbuf);
+    return NULL;
+}
+
+/* Pack the column into the field of code of the n records at dst.  Return 0
+   on success, -1 on error. */
+static int
+pack_column(const formatcode *code, char *dst, Py_ssize_t stride,
+            Py_ssize_t n, PyObject *column)
+{
+    const formatdef *e = code->fmtdef;
+    char tc = column_typecode(e);
+    PyObject *seq;
+    Py_ssize_t i;
+
+    if (tc && PyObject_CheckBuffer(column)) {
+        Py_buffer view;
+        if (PyObject_GetBuffer(column, &view,
+                               PyBUF_FORMAT | PyBUF_C_CONTIGUOUS) < 0) {
+            /* not contiguous: convert the items one by one */
+            PyErr_Clear();
+        }
+        else if (view.ndim <= 1 && view.itemsize == e->size &&
+                 view.len == n * e->size &&
+                 column_format_matches(view.format, tc)) {
+            copy_column(dst, stride, view.buf, e->size,
+                        n, e->size, column_swapped(e));
+            PyBuffer_Release(&view);
+            return 0;
+        }
+        else
+            PyBuffer_Release(&view);
+    }
+
+    seq = PySequence_Fast(column, "columns must be sequences");
+    if (seq == NULL)
+        return -1;
+    if (PySequence_Fast_GET_SIZE(seq) != n) {
+        PyErr_SetString(StructError, "columns must have the same length");
+        Py_DECREF(seq);
+        return -1;
+    }
+    for (i = 0; i < n; i++, dst += stride) {
+        if (pack_item(code, dst, PySequence_Fast_GET_ITEM(seq, i)) < 0) {
+            Py_DECREF(seq);
+            return -1;
+        }
+    }
+    Py_DECREF(seq);
+    return 0;
+}
+
+/* Return 1 if obj exposes a buffer whose memory overlaps the len bytes at
+   start, and 0 otherwise. */
+static int
+column_overlaps(PyObject *obj, const char *start, Py_ssize_t len)
+{
+    Py_buffer view;
+    const char *lo, *hi;
+    int i, overlaps;
+
+    if (!PyObject_CheckBuffer(obj))
+        return 0;
+    if (PyObject_GetBuffer(obj, &view, PyBUF_FULL_RO) < 0) {
+        PyErr_Clear();
+        return 0;
+    }
+    lo = hi = view.buf;
+    if (view.suboffsets != NULL) {
+        /* the memory may be anywhere */
+        overlaps = 1;
+    }
+    else if (view.strides == NULL) {
+        hi += view.len;
+        overlaps = lo < start + len && start < hi;
+    }
+    else {
+        overlaps = 1;
+        for (i = 0; i < view.ndim; i++) {
+            Py_ssize_t extent;
+            if (view.shape[i] == 0) {
+                overlaps = 0;
+                break;
+            }
+            extent = (view.shape[i] - 1) * view.strides[i];
+            if (extent < 0)
+                lo += extent;
+            else
+                hi += extent;
+        }
+        hi += view.itemsize;
+        overlaps = overlaps && lo < start + len && start < hi;
+    }
+    PyBuffer_Release(&view);
+    return overlaps;
+}
+
+PyDoc_STRVAR(s_pack_columns_into__doc__,
+"S.pack_columns_into(buffer, offset, column1, column2, ...) -> int\n\
+\n\
+Pack the columns column1, column2, ... as consecutive records of format\n\
+S.format into the writable buffer starting at offset, and return the\n\
+number of records.  There must be one column per field, all of the same\n\
+length.  Array-like columns of the field's C type are copied directly.\n\
+See help(struct) for more on format strings.");
+
+static PyObject *
+s_pack_columns_into(PyObject *self, PyObject *args)
+{
+    PyStructObject *soself;
+    Py_buffer buffer;
+    Py_ssize_t offset, n = 0, i;
+    formatcode *code;
+    char *base, *dst, *tmp = NULL;
+
+    /* Validate arguments.  +2 is for the buffer and offset arguments. */
+    soself = (PyStructObject *)self;
+    assert(PyStruct_Check(self));
+    assert(soself->s_codes != NULL);
+    if (PyTuple_GET_SIZE(args) != (soself->s_len + 2))
+    {
+        if (PyTuple_GET_SIZE(args) == 0) {
+            PyErr_Format(StructError,
+                        "pack_columns_into expected buffer argument");
+        }
+        else if (PyTuple_GET_SIZE(args) == 1) {
+            PyErr_Format(StructError,
+                        "pack_columns_into expected offset argument");
+        }
+        else {
+            PyErr_Format(StructError,
+                        "pack_columns_into expected %zd columns (got %zd)",
+                        soself->s_len, (PyTuple_GET_SIZE(args) - 2));
+        }
+        return NULL;
+    }
+
+    /* All columns must have the same length */
+    for (i = 0; i < soself->s_len; i++) {
+        Py_ssize_t len = PyObject_Size(PyTuple_GET_ITEM(args, i + 2));
+        if (len < 0)
+            return NULL;
+        if (i > 0 && len != n) {
+            PyErr_SetString(StructError,
+                            "columns must have the same length");
+            return NULL;
+        }
+        n = len;
+    }
+
+    /* Extract a writable memory buffer from the first argument */
+    if (!PyArg_Parse(PyTuple_GET_ITEM(args, 0), "w*", &buffer))
+        return NULL;
+    assert(buffer.len >= 0);
+
+    /* Extract the offset from the first argument */
+    offset = PyNumber_AsSsize_t(PyTuple_GET_ITEM(args, 1), PyExc_IndexError);
+    if (offset == -1 && PyErr_Occurred())
+        goto error;
+
+    /* Support negative offsets. */
+    if (offset < 0)
+        offset += buffer.len;
+
+    /* Check boundaries */
+    if (offset < 0 || offset > buffer.len ||
+        (soself->s_size != 0 && n > (buffer.len - offset) / soself->s_size)) {
+        PyErr_Format(StructError,
+                     "pack_columns_into requires a buffer holding "
+                     "%zd records of %zd bytes",
+                     n, soself->s_size);
+        goto error;
+    }
+
+    /* Columns sharing memory with the records are read before the records
+       are written, by packing into a temporary buffer. */
+    base = dst = (char *)buffer.buf + offset;
+    for (i = 0; i < soself->s_len; i++) {
+        if (column_overlaps(PyTuple_GET_ITEM(args, i + 2),
+                            dst, n * soself->s_size)) {
+            tmp = PyMem_Malloc(n * soself->s_size);
+            if (tmp == NULL) {
+                PyErr_NoMemory();
+                goto error;
+            }
+            base = tmp;
+            break;
+        }
+    }
+
+    /* Clear the pad bytes, as pack_into() does */
+    memset(base, '\0', n * soself->s_size);
+
+    i = 2;
+    for (code = soself->s_codes; code->fmtdef != NULL; code++) {
+        char *res = base + code->offset;
+        Py_ssize_t j = code->repeat;
+        while (j--) {
+            if (pack_column(code, res, soself->s_size, n,
+                            PyTuple_GET_ITEM(args, i++)) < 0)
+                goto error;
+            res += code->size;
+        }
+    }
+
+    if (tmp != NULL) {
+        memcpy(dst, tmp, n * soself->s_size);
+        PyMem_Free(tmp);
+    }
+    PyBuffer_Release(&buffer);
+    return PyLong_FromSsize_t(n);
+
+error:
+    PyMem_Free(tmp);
+    PyBuffer_Release(&buffer);
+    return NULL;
+}
+
 static PyObject *
 s_get_format(PyStructObject *self, void *unused)
 {
@@ -1938,6 +2458,10 @@ static struct PyMethodDef s_methods[] = {
     {"unpack",          s_unpack,       METH_O, s_unpack__doc__},
     {"unpack_from",     (PyCFunction)s_unpack_from, METH_VARARGS|METH_KEYWORDS,
                     s_unpack_from__doc__},
+    {"pack_columns_into", s_pack_columns_into, METH_VARARGS,
+                    s_pack_columns_into__doc__},
+    {"unpack_columns",  (PyCFunction)s_unpack_columns, METH_VARARGS|METH_KEYWORDS,
+                    s_unpack_columns__doc__},
     {"__sizeof__",      (PyCFunction)s_sizeof, METH_NOARGS, s_sizeof__doc__},
     {NULL,       NULL}          /* sentinel */
 };
@@ -2206,13 +2730,84 @@ iter_unpack(PyObject *self, PyObject *args)
     return result;
 }
 
+PyDoc_STRVAR(unpack_columns_doc,
+"unpack_columns(fmt, buffer, offset=0, count=-1) -> (column1, column2, ...)\n\
+\n\
+Unpack count consecutive records of the format string fmt starting at\n\
+offset in buffer and return a tuple with one column per field.  Integer\n\
+and float fields are returned as array.array objects, other fields as\n\
+lists.  By default, all the records up to the end of the buffer are\n\
+unpacked.  See help(struct) for more on format strings.");
+
+static PyObject *
+unpack_columns(PyObject *self, PyObject *args, PyObject *kwds)
+{
+    PyObject *s_object, *fmt, *newargs, *result;
+    Py_ssize_t n = PyTuple_GET_SIZE(args);
+
+    if (n == 0) {
+        PyErr_SetString(PyExc_TypeError, "missing format argument");
+        return NULL;
+    }
+    fmt = PyTuple_GET_ITEM(args, 0);
+    newargs = PyTuple_GetSlice(args, 1, n);
+    if (newargs == NULL)
+        return NULL;
+
+    s_object = cache_struct(fmt);
+    if (s_object == NULL) {
+        Py_DECREF(newargs);
+        return NULL;
+    }
+    result = s_unpack_columns(s_object, newargs, kwds);
+    Py_DECREF(newargs);
+    Py_DECREF(s_object);
+    return result;
+}
+
+PyDoc_STRVAR(pack_columns_into_doc,
+"pack_columns_into(fmt, buffer, offset, column1, column2, ...) -> int\n\
+\n\
+Pack the columns column1, column2, ... as consecutive records of the\n\
+format string fmt into the writable buffer starting at offset, and return\n\
+the number of records.  See help(struct) for more on format strings.");
+
+static PyObject *
+pack_columns_into(PyObject *self, PyObject *args)
+{
+    PyObject *s_object, *fmt, *newargs, *result;
+    Py_ssize_t n = PyTuple_GET_SIZE(args);
+
+    if (n == 0) {
+        PyErr_SetString(PyExc_TypeError, "missing format argument");
+        return NULL;
+    }
+    fmt = PyTuple_GET_ITEM(args, 0);
+    newargs = PyTuple_GetSlice(args, 1, n);
+    if (newargs == NULL)
+        return NULL;
+
+    s_object = cache_struct(fmt);
+    if (s_object == NULL) {
+        Py_DECREF(newargs);
+        return NULL;
+    }
+    result = s_pack_columns_into(s_object, newargs);
+    Py_DECREF(newargs);
+    Py_DECREF(s_object);
+    return result;
+}
+
 static struct PyMethodDef module_functions[] = {
     {"_clearcache",     (PyCFunction)clearcache,        METH_NOARGS,    clearcache_doc},
     {"calcsize",        calcsize,       METH_O, calcsize_doc},
     {"iter_unpack",     iter_unpack,    METH_VARARGS,   iter_unpack_doc},
     {"pack",            pack,           METH_VARARGS,   pack_doc},
+    {"pack_columns_into", pack_columns_into, METH_VARARGS, pack_columns_into_doc},
     {"pack_into",       pack_into,      METH_VARARGS,   pack_into_doc},
     {"unpack",          unpack, METH_VARARGS,   unpack_doc},
+    {"unpack_columns",  (PyCFunction)unpack_columns,
+                    METH_VARARGS|METH_KEYWORDS,         unpack_columns_doc},
     {"unpack_from",     (PyCFunction)unpack_from,
                     METH_VARARGS|METH_KEYWORDS,         unpack_from_doc},
     {NULL,       NULL}          /* sentinel */
@@ -2316,6 +2911,21 @@ PyInit__struct(void)
         }
     }
 
+    /* Check whether the standard size float formats can be copied as is,
+       using the same test values as float.__getformat__() */
+    {
+        float x = 16711938.0;
+        double y = 9006104071832581.0;
+        unsigned char buf[8];
+
+        ieee_float = (sizeof(float) == 4 &&
+                      _PyFloat_Pack4(x, buf, PY_LITTLE_ENDIAN) == 0 &&
+                      memcmp(buf, &x, 4) == 0);
+        ieee_double = (sizeof(double) == 8 &&
+                       _PyFloat_Pack8(y, buf, PY_LITTLE_ENDIAN) == 0 &&
+                       memcmp(buf, &y, 8) == 0);
+    }
+
     /* Add some symbolic constants to the module */
     if (StructError == NULL) {
         StructError = PyErr_NewException("struct.error", NULL, NULL);
@@ -1297,19 +1297,42 @@ array_array_append(arrayobject *self, PyObject *v)
 /*[clinic input]
 array.array.byteswap
 
+    byteorder: str = NULL
+    /
+
 Byteswap all items of the array.
 
+If byteorder is given, the items are only swapped if it differs from the
+native byte order of the machine.  It must be 'little' or 'big'.  This
+converts the items between the native byte order and the given one, in
+either direction.
+
 If the items in the array are not 1, 2, 4, or 8 bytes in size, RuntimeError is
 raised.
 [clinic start generated code]*/
 
 static PyObject *
-array_array_byteswap_impl(arrayobject *self)
-/*[clinic end generated code: output=5f8236cbdf0d90b5 input=6a85591b950a0186]*/
+array_array_byteswap_impl(arrayobject *self, const char *byteorder)
+/*[clinic end generated code: output=21422677a6b5c2d8 input=96a4b98fb98c7198]*/
 {
     char *p;
     Py_ssize_t i;
 
+    if (byteorder != NULL) {
+        int big;
+        if (strcmp(byteorder, "big") == 0)
+            big = 1;
+        else if (strcmp(byteorder, "little") == 0)
+            big = 0;
+        else {
+            PyErr_SetString(PyExc_ValueError,
+                            "byteorder must be either 'little' or 'big'");
+            return NULL;
+        }
+        if (big == PY_BIG_ENDIAN)
+            Py_RETURN_NONE;
+    }
+
     switch (self->ob_descr->itemsize) {
     case 1:
         break;
@@ -1355,6 +1378,719 @@ array_array_byteswap_impl(arrayobject *self)
     return Py_None;
 }
 
+/*********************** Bulk numeric operations *************************/
+
+/* The following methods work on the items in their C representation,
+   without creating a Python object per item.  Integer items are handled as
+   bulk_int (signed typecodes) or bulk_uint (unsigned typecodes) and float
+   items as double; results are checked against the range of the typecode
+   and never wrap around. */
+
+#ifdef HAVE_LONG_LONG
+typedef PY_LONG_LONG bulk_int;
+typedef unsigned PY_LONG_LONG bulk_uint;
+#define BULK_INT_MIN PY_LLONG_MIN
+#define BULK_INT_MAX PY_LLONG_MAX
+#define BULK_UINT_MAX PY_ULLONG_MAX
+#define bulk_int_from_pylong PyLong_AsLongLong
+#define bulk_uint_from_pylong PyLong_AsUnsignedLongLong
+#define pylong_from_bulk_int PyLong_FromLongLong
+#define pylong_from_bulk_uint PyLong_FromUnsignedLongLong
+#else
+typedef long bulk_int;
+typedef unsigned long bulk_uint;
+#define BULK_INT_MIN LONG_MIN
+#define BULK_INT_MAX LONG_MAX
+#define BULK_UINT_MAX ULONG_MAX
+#define bulk_int_from_pylong PyLong_AsLong
+#define bulk_uint_from_pylong PyLong_AsUnsignedLong
+#define pylong_from_bulk_int PyLong_FromLong
+#define pylong_from_bulk_uint PyLong_FromUnsignedLong
+#endif
+
+enum bulk_kind {BULK_SIGNED, BULK_UNSIGNED, BULK_FLOAT};
+enum bulk_op {BULK_ADD, BULK_SUB, BULK_MUL, BULK_DIV};
+
+/* A value of the kind of an array, or of one of its items */
+typedef union {
+    bulk_int s;
+    bulk_uint u;
+    double d;
+} bulk_value;
+
+/* Return the kind of the items, or -1 with TypeError for 'u' arrays */
+static int
+bulk_kind(const struct arraydescr *descr)
+{
+    if (descr->is_integer_type)
+        return descr->is_signed ? BULK_SIGNED : BULK_UNSIGNED;
+    if (descr->typecode == 'f' || descr->typecode == 'd')
+        return BULK_FLOAT;
+    PyErr_Format(PyExc_TypeError,
+                 "numeric operation on array with typecode '%c'",
+                 descr->typecode);
+    return -1;
+}
+
+static bulk_value
+bulk_get(const char *items, char typecode, Py_ssize_t i)
+{
+    bulk_value v;
+
+    switch (typecode) {
+    case 'b': v.s = ((signed char *)items)[i]; break;
+    case 'h': v.s = ((short *)items)[i]; break;
+    case 'i': v.s = ((int *)items)[i]; break;
+    case 'l': v.s = ((long *)items)[i]; break;
+    case 'B': v.u = ((unsigned char *)items)[i]; break;
+    case 'H': v.u = ((unsigned short *)items)[i]; break;
+    case 'I': v.u = ((unsigned int *)items)[i]; break;
+    case 'L': v.u = ((unsigned long *)items)[i]; break;
+#ifdef HAVE_LONG_LONG
+    case 'q': v.s = ((PY_LONG_LONG *)items)[i]; break;
+    case 'Q': v.u = ((unsigned PY_LONG_LONG *)items)[i]; break;
+#endif
+    case 'f': v.d = ((float *)items)[i]; break;
+    default: v.d = ((double *)items)[i]; break;
+    }
+    return v;
+}
+
+/* Store v, of the given kind, as item i.  Return -1 if v is out of the
+   range of the typecode, without setting an exception. */
+static int
+bulk_set(char *items, char typecode, Py_ssize_t i, int kind, bulk_value v)
+{
+    bulk_int s = 0;
+    bulk_uint u = 0;
+    int negative = 0;
+
+    if (typecode == 'f' || typecode == 'd') {
+        double d;
+        if (kind == BULK_SIGNED)
+            d = (double)v.s;
+        else if (kind == BULK_UNSIGNED)
+            d = (double)v.u;
+        else
+            d = v.d;
+        if (typecode == 'f')
+            ((float *)items)[i] = (float)d;
+        else
+            ((double *)items)[i] = d;
+        return 0;
+    }
+    if (kind == BULK_FLOAT)
+        return -1;
+    if (kind == BULK_SIGNED && v.s < 0) {
+        negative = 1;
+        s = v.s;
+    }
+    else
+        u = kind == BULK_SIGNED ? (bulk_uint)v.s : v.u;
+
+    switch (typecode) {
+    case 'b':
+        if (negative ? s < SCHAR_MIN : u > SCHAR_MAX)
+            return -1;
+        ((signed char *)items)[i] = negative ? (signed char)s : (signed char)u;
+        break;
+    case 'h':
+        if (negative ? s < SHRT_MIN : u > SHRT_MAX)
+            return -1;
+        ((short *)items)[i] = negative ? (short)s : (short)u;
+        break;
+    case 'i':
+        if (negative ? s < INT_MIN : u > INT_MAX)
+            return -1;
+        ((int *)items)[i] = negative ? (int)s : (int)u;
+        break;
+    case 'l':
+        if (negative ? s < LONG_MIN : u > LONG_MAX)
+            return -1;
+        ((long *)items)[i] = negative ? (long)s : (long)u;
+        break;
+    case 'B':
+        if (negative || u > UCHAR_MAX)
+            return -1;
+        ((unsigned char *)items)[i] = (unsigned char)u;
+        break;
+    case 'H':
+        if (negative || u > USHRT_MAX)
+            return -1;
+        ((unsigned short *)items)[i] = (unsigned short)u;
+        break;
+    case 'I':
+        if (negative || u > UINT_MAX)
+            return -1;
+        ((unsigned int *)items)[i] = (unsigned int)u;
+        break;
+    case 'L':
+        if (negative || u > ULONG_MAX)
+            return -1;
+        ((unsigned long *)items)[i] = (unsigned long)u;
+        break;
+#ifdef HAVE_LONG_LONG
+    case 'q':
+        if (!negative && u > PY_LLONG_MAX)
+            return -1;
+        ((PY_LONG_LONG *)items)[i] = negative ? s : (PY_LONG_LONG)u;
+        break;
+    case 'Q':
+        if (negative)
+            return -1;
+        ((unsigned PY_LONG_LONG *)items)[i] = u;
+        break;
+#endif
+    default:
+        return -1;
+    }
+    return 0;
+}
+
+/* Set *r to a op b.  Return -1 on overflow or division by zero, without
+   setting an exception. */
+static int
+bulk_arith(int kind, int op, bulk_value a, bulk_value b, bulk_value *r)
+{
+    if (kind == BULK_FLOAT) {
+        switch (op) {
+        case BULK_ADD: r->d = a.d + b.d; break;
+        case BULK_SUB: r->d = a.d - b.d; break;
+        case BULK_MUL: r->d = a.d * b.d; break;
+        default:
+            if (b.d == 0.0)
+                return -1;
+            r->d = a.d / b.d;
+        }
+    }
+    else if (kind == BULK_SIGNED) {
+        switch (op) {
+        case BULK_ADD:
+            if ((b.s > 0 && a.s > BULK_INT_MAX - b.s) ||
+                (b.s < 0 && a.s < BULK_INT_MIN - b.s))
+                return -1;
+            r->s = a.s + b.s;
+            break;
+        case BULK_SUB:
+            if ((b.s < 0 && a.s > BULK_INT_MAX + b.s) ||
+                (b.s > 0 && a.s < BULK_INT_MIN + b.s))
+                return -1;
+            r->s = a.s - b.s;
+            break;
+        default:
+            if (a.s > 0 ? (b.s > 0 ? a.s > BULK_INT_MAX / b.s
+                                   : b.s < BULK_INT_MIN / a.s)
+                        : (b.s > 0 ? a.s < BULK_INT_MIN / b.s
+                                   : a.s != 0 && b.s < BULK_INT_MAX / a.s))
+                return -1;
+            r->s = a.s * b.s;
+        }
+    }
+    else {
+        switch (op) {
+        case BULK_ADD:
+            if (a.u > BULK_UINT_MAX - b.u)
+                return -1;
+            r->u = a.u + b.u;
+            break;
+        case BULK_SUB:
+            if (b.u > a.u)
+                return -1;
+            r->u = a.u - b.u;
+            break;
+        default:
+            if (b.u != 0 && a.u > BULK_UINT_MAX / b.u)
+                return -1;
+            r->u = a.u * b.u;
+        }
+    }
+    return 0;
+}
+
+/* Return -1, 0 or 1 if a is less than, equal to or greater than b, and 2 if
+   they are unordered (NaNs). */
+static int
+bulk_compare(int kind, bulk_value a, bulk_value b)
+{
+    if (kind == BULK_FLOAT) {
+        if (a.d < b.d)
+            return -1;
+        if (a.d > b.d)
+            return 1;
+        return a.d == b.d ? 0 : 2;
+    }
+    if (kind == BULK_SIGNED)
+        return a.s < b.s ? -1 : a.s > b.s;
+    return a.u < b.u ? -1 : a.u > b.u;
+}
+
+/* Convert the second operand of a bulk operation on self.  An array must
+   have the typecode and the length of self, *other_items is then set to its
+   items.  Anything else is converted to a value of the kind of self in
+   *scalar: an int for integer typecodes, a real number for float ones.
+
+   If overflow isn't NULL, an int out of the range of the kind doesn't raise
+   OverflowError, *overflow is set to its sign instead. */
+static int
+bulk_operand(arrayobject *self, int kind, PyObject *other,
+             const char **other_items, bulk_value *scalar, int *overflow)
+{
+    PyObject *index;
+
+    *other_items = NULL;
+    if (overflow != NULL)
+        *overflow = 0;
+    if (array_Check(other)) {
+        arrayobject *oa = (arrayobject *)other;
+        if (oa->ob_descr != self->ob_descr) {
+            PyErr_Format(PyExc_TypeError,
+                         "array typecodes differ ('%c' and '%c')",
+                         self->ob_descr->typecode, oa->ob_descr->typecode);
+            return -1;
+        }
+        if (Py_SIZE(oa) != Py_SIZE(self)) {
+            PyErr_SetString(PyExc_ValueError, "array lengths differ");
+            return -1;
+        }
+        *other_items = oa->ob_item;
+        return 0;
+    }
+    if (kind == BULK_FLOAT) {
+        scalar->d = PyFloat_AsDouble(other);
+        if (scalar->d == -1.0 && PyErr_Occurred())
+            return -1;
+        return 0;
+    }
+    index = PyNumber_Index(other);
+    if (index == NULL)
+        return -1;
+    if (kind == BULK_SIGNED)
+        scalar->s = bulk_int_from_pylong(index);
+    else
+        scalar->u = bulk_uint_from_pylong(index);
+    if (PyErr_Occurred()) {
+        if (overflow == NULL || !PyErr_ExceptionMatches(PyExc_OverflowError)) {
+            Py_DECREF(index);
+            return -1;
+        }
+        PyErr_Clear();
+        *overflow = _PyLong_Sign(index);
+    }
+    Py_DECREF(index);
+    return 0;
+}
+
+static PyObject *
+array_bulk_arith(arrayobject *self, PyObject *other, int op)
+{
+    const char typecode = self->ob_descr->typecode;
+    const Py_ssize_t n = Py_SIZE(self);
+    const char *other_items;
+    char *result;
+    bulk_value a, b, r;
+    Py_ssize_t i;
+    int kind;
+
+    kind = bulk_kind(self->ob_descr);
+    if (kind < 0)
+        return NULL;
+    if (op == BULK_DIV && kind != BULK_FLOAT) {
+        PyErr_Format(PyExc_TypeError,
+                     "divide() requires an array of floats, not of "
+                     "typecode '%c'", typecode);
+        return NULL;
+    }
+    if (bulk_operand(self, kind, other, &other_items, &b, NULL) < 0)
+        return NULL;
+    if (n == 0)
+        Py_RETURN_NONE;
+
+    /* Compute into a copy so that the array is left unchanged on errors */
+    result = PyMem_Malloc(n * self->ob_descr->itemsize);
+    if (result == NULL)
+        return PyErr_NoMemory();
+    for (i = 0; i < n; i++) {
+        a = bulk_get(self->ob_item, typecode, i);
+        if (other_items != NULL)
+            b = bulk_get(other_items, typecode, i);
+        if (bulk_arith(kind, op, a, b, &r) < 0 ||
+            bulk_set(result, typecode, i, kind, r) < 0) {
+            PyMem_Free(result);
+            if (op == BULK_DIV)
+                PyErr_SetString(PyExc_ZeroDivisionError,
+                                "float division by zero");
+            else
+                PyErr_Format(PyExc_OverflowError,
+                             "result out of range for typecode '%c'",
+                             typecode);
+            return NULL;
+        }
+    }
+    memcpy(self->ob_item, result, n * self->ob_descr->itemsize);
+    PyMem_Free(result);
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+array.array.add
+
+    other: object
+    /
+
+Add other to the items of the array, in place.
+
+other is a number or an array of the same typecode and length.  If a result
+doesn't fit the typecode, OverflowError is raised and the array is unchanged.
+[clinic start generated code]*/
+
+static PyObject *
+array_array_add(arrayobject *self, PyObject *other)
+/*[clinic end generated code: output=4db948a31a7faeff input=9f707624b0687d18]*/
+{
+    return array_bulk_arith(self, other, BULK_ADD);
+}
+
+/*[clinic input]
+array.array.subtract
+
+    other: object
+    /
+
+Subtract other from the items of the array, in place.
+
+See add() for the operand.
+[clinic start generated code]*/
+
+static PyObject *
+array_array_subtract(arrayobject *self, PyObject *other)
+/*[clinic end generated code: output=b1fecce4851c17a1 input=61028c72a712b816]*/
+{
+    return array_bulk_arith(self, other, BULK_SUB);
+}
+
+/*[clinic input]
+array.array.multiply
+
+    other: object
+    /
+
+Multiply the items of the array by other, in place.
+
+See add() for the operand.
+[clinic start generated code]*/
+
+static PyObject *
+array_array_multiply(arrayobject *self, PyObject *other)
+/*[clinic end generated code: output=8ee32fa54e062554 input=9f2a3da728608ead]*/
+{
+    return array_bulk_arith(self, other, BULK_MUL);
+}
+
+/*[clinic input]
+array.array.divide
+
+    other: object
+    /
+
+Divide the items of an array of floats by other, in place.
+
+See add() for the operand.
+[clinic start generated code]*/
+
+static PyObject *
+array_array_divide(arrayobject *self, PyObject *other)
+/*[clinic end generated code: output=2ca071dbc1187c1f input=ba3ff57ad63de320]*/
+{
+    return array_bulk_arith(self, other, BULK_DIV);
+}
+
+/*[clinic input]
+array.array.compare
+
+    op: str
+    other: object
+    /
+
+Compare the items of the array with other.
+
+op is one of '<', '<=', '==', '!=', '>' or '>='.  other is a number or an array
+of the same typecode and length; the items of an array of integers are
+compared exactly with a float.  Return an array of typecode 'B' holding 1
+where the comparison is true and 0 where it is false.
+[clinic start generated code]*/
+
+static PyObject *
+array_array_compare_impl(arrayobject *self, const char *op, PyObject *other)
+/*[clinic end generated code: output=54a00162e42d3f44 input=3087d9e01f7bb71a]*/
+{
+    static const char * const opnames[] = {"<", "<=", "==", "!=", ">", ">="};
+    const char typecode = self->ob_descr->typecode;
+    const Py_ssize_t n = Py_SIZE(self);
+    const struct arraydescr *descr;
+    const char *other_items;
+    unsigned char *result;
+    arrayobject *mask;
+    bulk_value a, b;
+    Py_ssize_t i;
+    int kind, overflow, cmpop, c, res;
+    int fraction = 0, unordered = 0;
+
+    for (cmpop = 0; cmpop < 6; cmpop++) {
+        if (strcmp(op, opnames[cmpop]) == 0)
+            break;
+    }
+    if (cmpop == 6) {
+        PyErr_Format(PyExc_ValueError,
+                     "unknown comparison operator '%.10s'", op);
+        return NULL;
+    }
+    kind = bulk_kind(self->ob_descr);
+    if (kind < 0)
+        return NULL;
+    if (kind != BULK_FLOAT && PyFloat_Check(other)) {
+        /* Compare the items with the floor of the float; those equal to it
+           are less than the float if it has a fractional part. */
+        double x = PyFloat_AS_DOUBLE(other), f;
+        PyObject *floor_int;
+
+        other_items = NULL;
+        overflow = 0;
+        if (Py_IS_NAN(x))
+            unordered = 1;
+        else if (Py_IS_INFINITY(x))
+            overflow = x > 0.0 ? 1 : -1;
+        else {
+            f = floor(x);
+            fraction = x != f;
+            floor_int = PyLong_FromDouble(f);
+            if (floor_int == NULL)
+                return NULL;
+            res = bulk_operand(self, kind, floor_int, &other_items, &b,
+                               &overflow);
+            Py_DECREF(floor_int);
+            if (res < 0)
+                return NULL;
+        }
+    }
+    else if (bulk_operand(self, kind, other, &other_items, &b,
+                          &overflow) < 0)
+        return NULL;
+
+    for (descr = descriptors; descr->typecode != 'B'; descr++)
+        ;
+    mask = (arrayobject *)newarrayobject(&Arraytype, n, descr);
+    if (mask == NULL)
+        return NULL;
+    result = (unsigned char *)mask->ob_item;
+    for (i = 0; i < n; i++) {
+        if (unordered)
+            c = 2;
+        else if (overflow) {
+            /* other is beyond the range of any item */
+            c = -overflow;
+        }
+        else {
+            a = bulk_get(self->ob_item, typecode, i);
+            if (other_items != NULL)
+                b = bulk_get(other_items, typecode, i);
+            c = bulk_compare(kind, a, b);
+            if (c == 0 && fraction)
+                c = -1;
+        }
+        switch (cmpop) {
+        case Py_LT: result[i] = c == -1; break;
+        case Py_LE: result[i] = c == -1 || c == 0; break;
+        case Py_EQ: result[i] = c == 0; break;
+        case Py_NE: result[i] = c != 0; break;
+        case Py_GT: result[i] = c == 1; break;
+        default: result[i] = c == 1 || c == 0; break;
+        }
+    }
+    return (PyObject *)mask;
+}
+
+/*[clinic input]
+array.array.sum
+
+Return the sum of the items.
+
+The sum of an array of integers is an int, computed exactly.  The sum of an
+array of floats is a float.
+[clinic start generated code]*/
+
+static PyObject *
+array_array_sum_impl(arrayobject *self)
+/*[clinic end generated code: output=1fea0a058435b932 input=8c736e5610943488]*/
+{
+    const char typecode = self->ob_descr->typecode;
+    const Py_ssize_t n = Py_SIZE(self);
+    PyObject *total, *part, *tmp;
+    bulk_value acc, x;
+    Py_ssize_t i;
+    int kind;
+
+    kind = bulk_kind(self->ob_descr);
+    if (kind < 0)
+        return NULL;
+    if (kind == BULK_FLOAT) {
+        double dtotal = 0.0;
+        for (i = 0; i < n; i++)
+            dtotal += bulk_get(self->ob_item, typecode, i).d;
+        return PyFloat_FromDouble(dtotal);
+    }
+
+    /* Sum into acc, and add it to total before it would overflow */
+    total = PyLong_FromLong(0);
+    if (total == NULL)
+        return NULL;
+    acc.s = 0;
+    acc.u = 0;
+    for (i = 0; i <= n; i++) {
+        if (i < n) {
+            x = bulk_get(self->ob_item, typecode, i);
+            if (bulk_arith(kind, BULK_ADD, acc, x, &acc) == 0)
+                continue;
+        }
+        part = kind == BULK_SIGNED ? pylong_from_bulk_int(acc.s)
+                                   : pylong_from_bulk_uint(acc.u);
+        if (part == NULL) {
+            Py_DECREF(total);
+            return NULL;
+        }
+        tmp = PyNumber_Add(total, part);
+        Py_DECREF(part);
+        Py_DECREF(total);
+        if (tmp == NULL)
+            return NULL;
+        total = tmp;
+        if (i < n)
+            acc = x;
+    }
+    return total;
+}
+
+static PyObject *
+array_bulk_minmax(arrayobject *self, int sign, const char *name)
+{
+    const char typecode = self->ob_descr->typecode;
+    const Py_ssize_t n = Py_SIZE(self);
+    bulk_value best, x;
+    Py_ssize_t i, besti = 0;
+    int kind;
+
+    kind = bulk_kind(self->ob_descr);
+    if (kind < 0)
+        return NULL;
+    if (n == 0) {
+        PyErr_Format(PyExc_ValueError, "%s() of an empty array", name);
+        return NULL;
+    }
+    /* Like the builtin min() and max(), only replace the current extreme
+       by an item that compares less, resp. greater */
+    best = bulk_get(self->ob_item, typecode, 0);
+    for (i = 1; i < n; i++) {
+        x = bulk_get(self->ob_item, typecode, i);
+        if (bulk_compare(kind, x, best) == sign) {
+            best = x;
+            besti = i;
+        }
+    }
+    return getarrayitem((PyObject *)self, besti);
+}
+
+/*[clinic input]
+array.array.min
+
+Return the smallest item.
+
+ValueError is raised if the array is empty.
+[clinic start generated code]*/
+
+static PyObject *
+array_array_min_impl(arrayobject *self)
+/*[clinic end generated code: output=f87ea946f2832bda input=072dd3da6400d03c]*/
+{
+    return array_bulk_minmax(self, -1, "min");
+}
+
+/*[clinic input]
+array.array.max
+
+Return the largest item.
+
+ValueError is raised if the array is empty.
+[clinic start generated code]*/
+
+static PyObject *
+array_array_max_impl(arrayobject *self)
+/*[clinic end generated code: output=a7d50dfabda245cf input=0cf7f277b619efe3]*/
+{
+    return array_bulk_minmax(self, 1, "max");
+}
+
+/*[clinic input]
+array.array.astype
+
+    typecode: int(accept={str})
+    /
+
+Return a new array with the items converted to the given typecode.
+
+This is equivalent to array(typecode, self): integers must fit the new
+typecode, and floats can only be converted to 'f' or 'd'.
+[clinic start generated code]*/
+
+static PyObject *
+array_array_astype_impl(arrayobject *self, int typecode)
+/*[clinic end generated code: output=6c187d3dbaa22faa input=67fb8304a8e37c65]*/
+{
+    const char from = self->ob_descr->typecode;
+    const Py_ssize_t n = Py_SIZE(self);
+    const struct arraydescr *descr;
+    arrayobject *result;
+    Py_ssize_t i;
+    int kind;
+
+    for (descr = descriptors; descr->typecode != '\0'; descr++) {
+        if ((int)descr->typecode == typecode)
+            break;
+    }
+    if (descr->typecode == '\0') {
+#ifdef HAVE_LONG_LONG
+        PyErr_SetString(PyExc_ValueError,
+            "bad typecode (must be b, B, u, h, H, i, I, l, L, q, Q, f or d)");
+#else
+        PyErr_SetString(PyExc_ValueError,
+            "bad typecode (must be b, B, u, h, H, i, I, l, L, f or d)");
+#endif
+        return NULL;
+    }
+    if (descr == self->ob_descr)
+        return array_slice(self, 0, n);
+    kind = bulk_kind(self->ob_descr);
+    if (kind < 0 || bulk_kind(descr) < 0)
+        return NULL;
+    if (kind == BULK_FLOAT && descr->is_integer_type) {
+        PyErr_SetString(PyExc_TypeError, "integer argument expected, got float");
+        return NULL;
+    }
+
+    result = (arrayobject *)newarrayobject(&Arraytype, n, descr);
+    if (result == NULL)
+        return NULL;
+    for (i = 0; i < n; i++) {
+        if (bulk_set(result->ob_item, descr->typecode, i, kind,
+                     bulk_get(self->ob_item, from, i)) < 0) {
+            Py_DECREF(result);
+            PyErr_Format(PyExc_OverflowError,
+                         "array item out of range for typecode '%c'",
+                         descr->typecode);
+            return NULL;
+        }
+    }
+    return (PyObject *)result;
+}
+
 /*[clinic input]
 array.array.reverse
 
@@ -2249,12 +2985,16 @@ static PyGetSetDef array_getsets [] = {
 };
 
 static PyMethodDef array_methods[] = {
+    ARRAY_ARRAY_ADD_METHODDEF
     ARRAY_ARRAY_APPEND_METHODDEF
+    ARRAY_ARRAY_ASTYPE_METHODDEF
     ARRAY_ARRAY_BUFFER_INFO_METHODDEF
     ARRAY_ARRAY_BYTESWAP_METHODDEF
+    ARRAY_ARRAY_COMPARE_METHODDEF
     ARRAY_ARRAY___COPY___METHODDEF
     ARRAY_ARRAY_COUNT_METHODDEF
     ARRAY_ARRAY___DEEPCOPY___METHODDEF
+    ARRAY_ARRAY_DIVIDE_METHODDEF
     ARRAY_ARRAY_EXTEND_METHODDEF
     ARRAY_ARRAY_FROMFILE_METHODDEF
     ARRAY_ARRAY_FROMLIST_METHODDEF
@@ -2263,10 +3003,15 @@ static PyMethodDef array_methods[] = {
     ARRAY_ARRAY_FROMUNICODE_METHODDEF
     ARRAY_ARRAY_INDEX_METHODDEF
     ARRAY_ARRAY_INSERT_METHODDEF
+    ARRAY_ARRAY_MAX_METHODDEF
+    ARRAY_ARRAY_MIN_METHODDEF
+    ARRAY_ARRAY_MULTIPLY_METHODDEF
     ARRAY_ARRAY_POP_METHODDEF
     ARRAY_ARRAY___REDUCE_EX___METHODDEF
     ARRAY_ARRAY_REMOVE_METHODDEF
     ARRAY_ARRAY_REVERSE_METHODDEF
+    ARRAY_ARRAY_SUBTRACT_METHODDEF
+    ARRAY_ARRAY_SUM_METHODDEF
     ARRAY_ARRAY_TOFILE_METHODDEF
     ARRAY_ARRAY_TOLIST_METHODDEF
     ARRAY_ARRAY_TOSTRING_METHODDEF
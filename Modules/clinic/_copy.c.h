@@ -0,0 +1,35 @@
+/*[clinic input]
+preserve
+[clinic start generated code]*/
+
+PyDoc_STRVAR(_copy_deepcopy__doc__,
+"deepcopy($module, /, x, memo=None)\n"
+"--\n"
+"\n"
+"Deep copy operation on arbitrary Python objects.\n"
+"\n"
+"See the copy module\'s __doc__ string for more info.");
+
+#define _COPY_DEEPCOPY_METHODDEF    \
+    {"deepcopy", (PyCFunction)_copy_deepcopy, METH_VARARGS|METH_KEYWORDS, _copy_deepcopy__doc__},
+
+static PyObject *
+_copy_deepcopy_impl(PyModuleDef *module, PyObject *x, PyObject *memo);
+
+static PyObject *
+_copy_deepcopy(PyModuleDef *module, PyObject *args, PyObject *kwargs)
+{
+    PyObject *return_value = NULL;
+    static char *_keywords[] = {"x", "memo", NULL};
+    PyObject *x;
+    PyObject *memo = Py_None;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O|O:deepcopy", _keywords,
+        &x, &memo))
+        goto exit;
+    return_value = _copy_deepcopy_impl(module, x, memo);
+
+exit:
+    return return_value;
+}
+/*[clinic end generated code: output=68b77d06029c225f input=a9049054013a1b77]*/
@@ -649,7 +649,8 @@ exit:
 }
 
 PyDoc_STRVAR(_elementtree_XMLParser__setevents__doc__,
-"_setevents($self, events_queue, events_to_report=None, /)\n"
+"_setevents($self, events_queue, events_to_report=None,\n"
+"           stream_path=None, /)\n"
 "--\n"
 "\n");
 
@@ -659,7 +660,8 @@ PyDoc_STRVAR(_elementtree_XMLParser__setevents__doc__,
 static PyObject *
 _elementtree_XMLParser__setevents_impl(XMLParserObject *self,
                                        PyObject *events_queue,
-                                       PyObject *events_to_report);
+                                       PyObject *events_to_report,
+                                       PyObject *stream_path);
 
 static PyObject *
 _elementtree_XMLParser__setevents(XMLParserObject *self, PyObject *args)
@@ -667,14 +669,15 @@ _elementtree_XMLParser__setevents(XMLParserObject *self, PyObject *args)
     PyObject *return_value = NULL;
     PyObject *events_queue;
     PyObject *events_to_report = Py_None;
+    PyObject *stream_path = Py_None;
 
     if (!PyArg_UnpackTuple(args, "_setevents",
-        1, 2,
-        &events_queue, &events_to_report))
+        1, 3,
+        &events_queue, &events_to_report, &stream_path))
         goto exit;
-    return_value = _elementtree_XMLParser__setevents_impl(self, events_queue, events_to_report);
+    return_value = _elementtree_XMLParser__setevents_impl(self, events_queue, events_to_report, stream_path);
 
 exit:
     return return_value;
 }
-/*[clinic end generated code: output=19d94e2d2726d3aa input=a9049054013a1b77]*/
+/*[clinic end generated code: output=794b557b1ea813e4 input=a9049054013a1b77]*/
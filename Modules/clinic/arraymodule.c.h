@@ -153,24 +153,206 @@ PyDoc_STRVAR(array_array_append__doc__,
     {"append", (PyCFunction)array_array_append, METH_O, array_array_append__doc__},
 
 PyDoc_STRVAR(array_array_byteswap__doc__,
-"byteswap($self, /)\n"
+"byteswap($self, byteorder=None, /)\n"
 "--\n"
 "\n"
 "Byteswap all items of the array.\n"
 "\n"
+"If byteorder is given, the items are only swapped if it differs from the\n"
+"native byte order of the machine.  It must be \'little\' or \'big\'.  This\n"
+"converts the items between the native byte order and the given one, in\n"
+"either direction.\n"
+"\n"
 "If the items in the array are not 1, 2, 4, or 8 bytes in size, RuntimeError is\n"
 "raised.");
 
 #define ARRAY_ARRAY_BYTESWAP_METHODDEF    \
-    {"byteswap", (PyCFunction)array_array_byteswap, METH_NOARGS, array_array_byteswap__doc__},
+    {"byteswap", (PyCFunction)array_array_byteswap, METH_VARARGS, array_array_byteswap__doc__},
+
+static PyObject *
+array_array_byteswap_impl(arrayobject *self, const char *byteorder);
+
+static PyObject *
+array_array_byteswap(arrayobject *self, PyObject *args)
+{
+    PyObject *return_value = NULL;
+    const char *byteorder = NULL;
+
+    if (!PyArg_ParseTuple(args, "|s:byteswap",
+        &byteorder))
+        goto exit;
+    return_value = array_array_byteswap_impl(self, byteorder);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(array_array_add__doc__,
+"add($self, other, /)\n"
+"--\n"
+"\n"
+"Add other to the items of the array, in place.\n"
+"\n"
+"other is a number or an array of the same typecode and length.  If a result\n"
+"doesn\'t fit the typecode, OverflowError is raised and the array is unchanged.");
+
+#define ARRAY_ARRAY_ADD_METHODDEF    \
+    {"add", (PyCFunction)array_array_add, METH_O, array_array_add__doc__},
+
+PyDoc_STRVAR(array_array_subtract__doc__,
+"subtract($self, other, /)\n"
+"--\n"
+"\n"
+"Subtract other from the items of the array, in place.\n"
+"\n"
+"See add() for the operand.");
+
+#define ARRAY_ARRAY_SUBTRACT_METHODDEF    \
+    {"subtract", (PyCFunction)array_array_subtract, METH_O, array_array_subtract__doc__},
+
+PyDoc_STRVAR(array_array_multiply__doc__,
+"multiply($self, other, /)\n"
+"--\n"
+"\n"
+"Multiply the items of the array by other, in place.\n"
+"\n"
+"See add() for the operand.");
+
+#define ARRAY_ARRAY_MULTIPLY_METHODDEF    \
+    {"multiply", (PyCFunction)array_array_multiply, METH_O, array_array_multiply__doc__},
+
+PyDoc_STRVAR(array_array_divide__doc__,
+"divide($self, other, /)\n"
+"--\n"
+"\n"
+"Divide the items of an array of floats by other, in place.\n"
+"\n"
+"See add() for the operand.");
+
+#define ARRAY_ARRAY_DIVIDE_METHODDEF    \
+    {"divide", (PyCFunction)array_array_divide, METH_O, array_array_divide__doc__},
+
+PyDoc_STRVAR(array_array_compare__doc__,
+"compare($self, op, other, /)\n"
+"--\n"
+"\n"
+"Compare the items of the array with other.\n"
+"\n"
+"op is one of \'<\', \'<=\', \'==\', \'!=\', \'>\' or \'>=\'.  other is a number or an array\n"
+"of the same typecode and length; the items of an array of integers are\n"
+"compared exactly with a float.  Return an array of typecode \'B\' holding 1\n"
+"where the comparison is true and 0 where it is false.");
+
+#define ARRAY_ARRAY_COMPARE_METHODDEF    \
+    {"compare", (PyCFunction)array_array_compare, METH_VARARGS, array_array_compare__doc__},
 
 static PyObject *
-array_array_byteswap_impl(arrayobject *self);
+array_array_compare_impl(arrayobject *self, const char *op, PyObject *other);
 
 static PyObject *
-array_array_byteswap(arrayobject *self, PyObject *Py_UNUSED(ignored))
+array_array_compare(arrayobject *self, PyObject *args)
 {
-    return array_array_byteswap_impl(self);
+    PyObject *return_value = NULL;
+    const char *op;
+    PyObject *other;
+
+    if (!PyArg_ParseTuple(args, "sO:compare",
+        &op, &other))
+        goto exit;
+    return_value = array_array_compare_impl(self, op, other);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(array_array_sum__doc__,
+"sum($self, /)\n"
+"--\n"
+"\n"
+"Return the sum of the items.\n"
+"\n"
+"The sum of an array of integers is an int, computed exactly.  The sum of an\n"
+"array of floats is a float.");
+
+#define ARRAY_ARRAY_SUM_METHODDEF    \
+    {"sum", (PyCFunction)array_array_sum, METH_NOARGS, array_array_sum__doc__},
+
+static PyObject *
+array_array_sum_impl(arrayobject *self);
+
+static PyObject *
+array_array_sum(arrayobject *self, PyObject *Py_UNUSED(ignored))
+{
+    return array_array_sum_impl(self);
+}
+
+PyDoc_STRVAR(array_array_min__doc__,
+"min($self, /)\n"
+"--\n"
+"\n"
+"Return the smallest item.\n"
+"\n"
+"ValueError is raised if the array is empty.");
+
+#define ARRAY_ARRAY_MIN_METHODDEF    \
+    {"min", (PyCFunction)array_array_min, METH_NOARGS, array_array_min__doc__},
+
+static PyObject *
+array_array_min_impl(arrayobject *self);
+
+static PyObject *
+array_array_min(arrayobject *self, PyObject *Py_UNUSED(ignored))
+{
+    return array_array_min_impl(self);
+}
+
+PyDoc_STRVAR(array_array_max__doc__,
+"max($self, /)\n"
+"--\n"
+"\n"
+"Return the largest item.\n"
+"\n"
+"ValueError is raised if the array is empty.");
+
+#define ARRAY_ARRAY_MAX_METHODDEF    \
+    {"max", (PyCFunction)array_array_max, METH_NOARGS, array_array_max__doc__},
+
+static PyObject *
+array_array_max_impl(arrayobject *self);
+
+static PyObject *
+array_array_max(arrayobject *self, PyObject *Py_UNUSED(ignored))
+{
+    return array_array_max_impl(self);
+}
+
+PyDoc_STRVAR(array_array_astype__doc__,
+"astype($self, typecode, /)\n"
+"--\n"
+"\n"
+"Return a new array with the items converted to the given typecode.\n"
+"\n"
+"This is equivalent to array(typecode, self): integers must fit the new\n"
+"typecode, and floats can only be converted to \'f\' or \'d\'.");
+
+#define ARRAY_ARRAY_ASTYPE_METHODDEF    \
+    {"astype", (PyCFunction)array_array_astype, METH_O, array_array_astype__doc__},
+
+static PyObject *
+array_array_astype_impl(arrayobject *self, int typecode);
+
+static PyObject *
+array_array_astype(arrayobject *self, PyObject *arg)
+{
+    PyObject *return_value = NULL;
+    int typecode;
+
+    if (!PyArg_Parse(arg, "C:astype", &typecode))
+        goto exit;
+    return_value = array_array_astype_impl(self, typecode);
+
+exit:
+    return return_value;
 }
 
 PyDoc_STRVAR(array_array_reverse__doc__,
@@ -496,4 +678,4 @@ PyDoc_STRVAR(array_arrayiterator___setstate____doc__,
 
 #define ARRAY_ARRAYITERATOR___SETSTATE___METHODDEF    \
     {"__setstate__", (PyCFunction)array_arrayiterator___setstate__, METH_O, array_arrayiterator___setstate____doc__},
-/*[clinic end generated code: output=d2e82c65ea841cfc input=a9049054013a1b77]*/
+/*[clinic end generated code: output=4d268a0e164c0b59 input=a9049054013a1b77]*/
@@ -65,6 +65,18 @@ PyDoc_STRVAR(MD5Type_update__doc__,
 #define MD5TYPE_UPDATE_METHODDEF    \
     {"update", (PyCFunction)MD5Type_update, METH_O, MD5Type_update__doc__},
 
+PyDoc_STRVAR(MD5Type_digest_many__doc__,
+"digest_many($self, iterable, /)\n"
+"--\n"
+"\n"
+"Return a list with the digest of each buffer in iterable.\n"
+"\n"
+"Each digest is that of a copy of this hash object updated with the\n"
+"buffer; the hash object itself is left unchanged.");
+
+#define MD5TYPE_DIGEST_MANY_METHODDEF    \
+    {"digest_many", (PyCFunction)MD5Type_digest_many, METH_O, MD5Type_digest_many__doc__},
+
 PyDoc_STRVAR(_md5_md5__doc__,
 "md5($module, /, string=b\'\')\n"
 "--\n"
@@ -92,4 +104,4 @@ _md5_md5(PyModuleDef *module, PyObject *args, PyObject *kwargs)
 exit:
     return return_value;
 }
-/*[clinic end generated code: output=0f803ded701aca54 input=a9049054013a1b77]*/
+/*[clinic end generated code: output=e0333fef0b4ada46 input=a9049054013a1b77]*/
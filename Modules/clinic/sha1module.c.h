@@ -65,6 +65,18 @@ PyDoc_STRVAR(SHA1Type_update__doc__,
 #define SHA1TYPE_UPDATE_METHODDEF    \
     {"update", (PyCFunction)SHA1Type_update, METH_O, SHA1Type_update__doc__},
 
+PyDoc_STRVAR(SHA1Type_digest_many__doc__,
+"digest_many($self, iterable, /)\n"
+"--\n"
+"\n"
+"Return a list with the digest of each buffer in iterable.\n"
+"\n"
+"Each digest is that of a copy of this hash object updated with the\n"
+"buffer; the hash object itself is left unchanged.");
+
+#define SHA1TYPE_DIGEST_MANY_METHODDEF    \
+    {"digest_many", (PyCFunction)SHA1Type_digest_many, METH_O, SHA1Type_digest_many__doc__},
+
 PyDoc_STRVAR(_sha1_sha1__doc__,
 "sha1($module, /, string=b\'\')\n"
 "--\n"
@@ -92,4 +104,4 @@ _sha1_sha1(PyModuleDef *module, PyObject *args, PyObject *kwargs)
 exit:
     return return_value;
 }
-/*[clinic end generated code: output=be19102f3120490a input=a9049054013a1b77]*/
+/*[clinic end generated code: output=1665174f2f5beccf input=a9049054013a1b77]*/
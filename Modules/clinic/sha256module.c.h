@@ -65,6 +65,18 @@ PyDoc_STRVAR(SHA256Type_update__doc__,
 #define SHA256TYPE_UPDATE_METHODDEF    \
     {"update", (PyCFunction)SHA256Type_update, METH_O, SHA256Type_update__doc__},
 
+PyDoc_STRVAR(SHA256Type_digest_many__doc__,
+"digest_many($self, iterable, /)\n"
+"--\n"
+"\n"
+"Return a list with the digest of each buffer in iterable.\n"
+"\n"
+"Each digest is that of a copy of this hash object updated with the\n"
+"buffer; the hash object itself is left unchanged.");
+
+#define SHA256TYPE_DIGEST_MANY_METHODDEF    \
+    {"digest_many", (PyCFunction)SHA256Type_digest_many, METH_O, SHA256Type_digest_many__doc__},
+
 PyDoc_STRVAR(_sha256_sha256__doc__,
 "sha256($module, /, string=b\'\')\n"
 "--\n"
@@ -120,4 +132,4 @@ _sha256_sha224(PyModuleDef *module, PyObject *args, PyObject *kwargs)
 exit:
     return return_value;
 }
-/*[clinic end generated code: output=354cedf3b632c7b2 input=a9049054013a1b77]*/
+/*[clinic end generated code: output=85db90ab486014ad input=a9049054013a1b77]*/
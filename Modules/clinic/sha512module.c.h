@@ -83,6 +83,22 @@ PyDoc_STRVAR(SHA512Type_update__doc__,
 
 #if defined(PY_LONG_LONG)
 
+PyDoc_STRVAR(SHA512Type_digest_many__doc__,
+"digest_many($self, iterable, /)\n"
+"--\n"
+"\n"
+"Return a list with the digest of each buffer in iterable.\n"
+"\n"
+"Each digest is that of a copy of this hash object updated with the\n"
+"buffer; the hash object itself is left unchanged.");
+
+#define SHA512TYPE_DIGEST_MANY_METHODDEF    \
+    {"digest_many", (PyCFunction)SHA512Type_digest_many, METH_O, SHA512Type_digest_many__doc__},
+
+#endif /* defined(PY_LONG_LONG) */
+
+#if defined(PY_LONG_LONG)
+
 PyDoc_STRVAR(_sha512_sha512__doc__,
 "sha512($module, /, string=b\'\')\n"
 "--\n"
@@ -161,6 +177,10 @@ exit:
     #define SHA512TYPE_UPDATE_METHODDEF
 #endif /* !defined(SHA512TYPE_UPDATE_METHODDEF) */
 
+#ifndef SHA512TYPE_DIGEST_MANY_METHODDEF
+    #define SHA512TYPE_DIGEST_MANY_METHODDEF
+#endif /* !defined(SHA512TYPE_DIGEST_MANY_METHODDEF) */
+
 #ifndef _SHA512_SHA512_METHODDEF
     #define _SHA512_SHA512_METHODDEF
 #endif /* !defined(_SHA512_SHA512_METHODDEF) */
@@ -168,4 +188,4 @@ exit:
 #ifndef _SHA512_SHA384_METHODDEF
     #define _SHA512_SHA384_METHODDEF
 #endif /* !defined(_SHA512_SHA384_METHODDEF) */
-/*[clinic end generated code: output=1c7d385731fee7c0 input=a9049054013a1b77]*/
+/*[clinic end generated code: output=4bb0073b5287a6a7 input=a9049054013a1b77]*/
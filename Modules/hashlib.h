@@ -59,3 +59,117 @@
  * to allow the user to optimize based on the platform they're using. */
 #define HASHLIB_GIL_MINSIZE 2048
 
+
+/*
+ * Helper code for the digest_many() method of hash objects.  The buffers
+ * taken from the iterable are hashed HASHLIB_BATCH_SIZE at a time by
+ * hash_batch(), with the GIL released if they hold enough data.  hash_batch()
+ * must only use the state passed to it, usually a copy of the hash object's
+ * state, and store the n digests of digest_size bytes consecutively.
+ */
+
+#define HASHLIB_BATCH_SIZE 256
+
+typedef void (*hashlib_batch_func)(void *state, const Py_buffer *views,
+                                   Py_ssize_t n, unsigned char *digests);
+
+/* Like GET_BUFFER_VIEW_OR_ERROUT() but returns -1 on errors */
+static int
+_hashlib_get_buffer(PyObject *obj, Py_buffer *view)
+{
+    if (PyUnicode_Check(obj)) {
+        PyErr_SetString(PyExc_TypeError,
+                        "Unicode-objects must be encoded before hashing");
+        return -1;
+    }
+    if (!PyObject_CheckBuffer(obj)) {
+        PyErr_SetString(PyExc_TypeError,
+                        "object supporting the buffer API required");
+        return -1;
+    }
+    if (PyObject_GetBuffer(obj, view, PyBUF_SIMPLE) == -1)
+        return -1;
+    if (view->ndim > 1) {
+        PyErr_SetString(PyExc_BufferError,
+                        "Buffer must be single dimension");
+        PyBuffer_Release(view);
+        return -1;
+    }
+    return 0;
+}
+
+static PyObject *
+_hashlib_digest_many(PyObject *iterable, hashlib_batch_func hash_batch,
+                     void *state, Py_ssize_t digest_size)
+{
+    PyObject *it, *item, *digest, *result = NULL;
+    Py_buffer *views = NULL;
+    unsigned char *digests = NULL;
+    Py_ssize_t i, n = 0, total;
+    int rc;
+
+    it = PyObject_GetIter(iterable);
+    if (it == NULL)
+        return NULL;
+    result = PyList_New(0);
+    if (result == NULL)
+        goto error;
+    views = PyMem_New(Py_buffer, HASHLIB_BATCH_SIZE);
+    digests = (unsigned char *)PyMem_Malloc(HASHLIB_BATCH_SIZE * digest_size);
+    if (views == NULL || digests == NULL) {
+        PyErr_NoMemory();
+        goto error;
+    }
+
+    for (;;) {
+        total = 0;
+        while (n < HASHLIB_BATCH_SIZE && (item = PyIter_Next(it)) != NULL) {
+            rc = _hashlib_get_buffer(item, &views[n]);
+            Py_DECREF(item);
+            if (rc < 0)
+                goto error;
+            if (total < HASHLIB_GIL_MINSIZE)
+                total += views[n].len;
+            n++;
+        }
+        if (PyErr_Occurred())
+            goto error;
+        if (n == 0)
+            break;
+
+        if (total >= HASHLIB_GIL_MINSIZE) {
+            Py_BEGIN_ALLOW_THREADS
+            hash_batch(state, views, n, digests);
+            Py_END_ALLOW_THREADS
+        }
+        else
+            hash_batch(state, views, n, digests);
+
+        for (i = 0; i < n; i++) {
+            digest = PyBytes_FromStringAndSize(
+                (const char *)digests + i * digest_size, digest_size);
+            if (digest == NULL)
+                goto error;
+            rc = PyList_Append(result, digest);
+            Py_DECREF(digest);
+            if (rc < 0)
+                goto error;
+        }
+        while (n > 0)
+            PyBuffer_Release(&views[--n]);
+    }
+
+    PyMem_Free(views);
+    PyMem_Free(digests);
+    Py_DECREF(it);
+    return result;
+
+error:
+    while (n > 0)
+        PyBuffer_Release(&views[--n]);
+    PyMem_Free(views);
+    PyMem_Free(digests);
+    Py_XDECREF(result);
+    Py_DECREF(it);
+    return NULL;
+}
@@ -420,11 +420,49 @@ MD5Type_update(MD5object *self, PyObject *obj)
     return Py_None;
 }
 
+static void
+md5_digest_batch(void *state, const Py_buffer *views, Py_ssize_t n,
+                 unsigned char *digests)
+{
+    struct md5_state temp;
+    Py_ssize_t i;
+
+    for (i = 0; i < n; i++) {
+        temp = *(struct md5_state *)state;
+        md5_process(&temp, views[i].buf, views[i].len);
+        md5_done(&temp, digests + i * MD5_DIGESTSIZE);
+    }
+}
+
+/*[clinic input]
+MD5Type.digest_many
+
+    iterable: object
+    /
+
+Return a list with the digest of each buffer in iterable.
+
+Each digest is that of a copy of this hash object updated with the
+buffer; the hash object itself is left unchanged.
+[clinic start generated code]*/
+
+static PyObject *
+MD5Type_digest_many(MD5object *self, PyObject *iterable)
+/*[clinic end generated code: output=72ad3101d57796a8 input=0e8a62143bb74148]*/
+{
+    /* the GIL may be released, so hash a copy of the state */
+    struct md5_state base = self->hash_state;
+
+    return _hashlib_digest_many(iterable, md5_digest_batch, &base,
+                                MD5_DIGESTSIZE);
+}
+
 static PyMethodDef MD5_methods[] = {
     MD5TYPE_COPY_METHODDEF
     MD5TYPE_DIGEST_METHODDEF
     MD5TYPE_HEXDIGEST_METHODDEF
     MD5TYPE_UPDATE_METHODDEF
+    MD5TYPE_DIGEST_MANY_METHODDEF
     {NULL,        NULL}         /* sentinel */
 };
 
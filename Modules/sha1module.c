@@ -397,11 +397,49 @@ SHA1Type_update(SHA1object *self, PyObject *obj)
     return Py_None;
 }
 
+static void
+sha1_digest_batch(void *state, const Py_buffer *views, Py_ssize_t n,
+                  unsigned char *digests)
+{
+    struct sha1_state temp;
+    Py_ssize_t i;
+
+    for (i = 0; i < n; i++) {
+        temp = *(struct sha1_state *)state;
+        sha1_process(&temp, views[i].buf, views[i].len);
+        sha1_done(&temp, digests + i * SHA1_DIGESTSIZE);
+    }
+}
+
+/*[clinic input]
+SHA1Type.digest_many
+
+    iterable: object
+    /
+
+Return a list with the digest of each buffer in iterable.
+
+Each digest is that of a copy of this hash object updated with the
+buffer; the hash object itself is left unchanged.
+[clinic start generated code]*/
+
+static PyObject *
+SHA1Type_digest_many(SHA1object *self, PyObject *iterable)
+/*[clinic end generated code: output=bcf513b8cd1e6f67 input=19a5b3626c77f795]*/
+{
+    /* the GIL may be released, so hash a copy of the state */
+    struct sha1_state base = self->hash_state;
+
+    return _hashlib_digest_many(iterable, sha1_digest_batch, &base,
+                                SHA1_DIGESTSIZE);
+}
+
 static PyMethodDef SHA1_methods[] = {
     SHA1TYPE_COPY_METHODDEF
     SHA1TYPE_DIGEST_METHODDEF
     SHA1TYPE_HEXDIGEST_METHODDEF
     SHA1TYPE_UPDATE_METHODDEF
+    SHA1TYPE_DIGEST_MANY_METHODDEF
     {NULL,        NULL}         /* sentinel */
 };
 
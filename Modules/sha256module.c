@@ -487,11 +487,53 @@ SHA256Type_update(SHAobject *self, PyObject *obj)
     return Py_None;
 }
 
+static void
+sha_digest_batch(void *state, const Py_buffer *views, Py_ssize_t n,
+                 unsigned char *digests)
+{
+    SHAobject *base = (SHAobject *)state;
+    SHAobject temp;
+    unsigned char digest[SHA_DIGESTSIZE];
+    Py_ssize_t i;
+
+    for (i = 0; i < n; i++) {
+        SHAcopy(base, &temp);
+        sha_update(&temp, views[i].buf, views[i].len);
+        sha_final(digest, &temp);
+        memcpy(digests + i * base->digestsize, digest, base->digestsize);
+    }
+}
+
+/*[clinic input]
+SHA256Type.digest_many
+
+    iterable: object
+    /
+
+Return a list with the digest of each buffer in iterable.
+
+Each digest is that of a copy of this hash object updated with the
+buffer; the hash object itself is left unchanged.
+[clinic start generated code]*/
+
+static PyObject *
+SHA256Type_digest_many(SHAobject *self, PyObject *iterable)
+/*[clinic end generated code: output=5506810aa61ea3af input=ae5c193028b993e5]*/
+{
+    /* the GIL may be released, so hash a copy of the state */
+    SHAobject base;
+
+    SHAcopy(self, &base);
+    return _hashlib_digest_many(iterable, sha_digest_batch, &base,
+                                self->digestsize);
+}
+
 static PyMethodDef SHA_methods[] = {
     SHA256TYPE_COPY_METHODDEF
     SHA256TYPE_DIGEST_METHODDEF
     SHA256TYPE_HEXDIGEST_METHODDEF
     SHA256TYPE_UPDATE_METHODDEF
+    SHA256TYPE_DIGEST_MANY_METHODDEF
     {NULL,        NULL}         /* sentinel */
 };
 
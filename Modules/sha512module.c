@@ -558,11 +558,53 @@ dump buffer
 [clinic start generated code]*/
 /*[clinic end generated code: output=da39a3ee5e6b4b0d input=524ce2e021e4eba6]*/
 
+static void
+sha512_digest_batch(void *state, const Py_buffer *views, Py_ssize_t n,
+                    unsigned char *digests)
+{
+    SHAobject *base = (SHAobject *)state;
+    SHAobject temp;
+    unsigned char digest[SHA_DIGESTSIZE];
+    Py_ssize_t i;
+
+    for (i = 0; i < n; i++) {
+        SHAcopy(base, &temp);
+        sha512_update(&temp, views[i].buf, views[i].len);
+        sha512_final(digest, &temp);
+        memcpy(digests + i * base->digestsize, digest, base->digestsize);
+    }
+}
+
+/*[clinic input]
+SHA512Type.digest_many
+
+    iterable: object
+    /
+
+Return a list with the digest of each buffer in iterable.
+
+Each digest is that of a copy of this hash object updated with the
+buffer; the hash object itself is left unchanged.
+[clinic start generated code]*/
+
+static PyObject *
+SHA512Type_digest_many(SHAobject *self, PyObject *iterable)
+/*[clinic end generated code: output=ec4676f068de5a07 input=0ff0b1023c51dd3f]*/
+{
+    /* the GIL may be released, so hash a copy of the state */
+    SHAobject base;
+
+    SHAcopy(self, &base);
+    return _hashlib_digest_many(iterable, sha512_digest_batch, &base,
+                                self->digestsize);
+}
+
 static PyMethodDef SHA_methods[] = {
     SHA512TYPE_COPY_METHODDEF
     SHA512TYPE_DIGEST_METHODDEF
     SHA512TYPE_HEXDIGEST_METHODDEF
     SHA512TYPE_UPDATE_METHODDEF
+    SHA512TYPE_DIGEST_MANY_METHODDEF
     {NULL,        NULL}         /* sentinel */
 };
 
@@ -3,6 +3,13 @@
 #include "osdefs.h"
 #include "marshal.h"
 #include <time.h>
+#ifdef HAVE_FCNTL_H
+#include <fcntl.h>
+#endif
+#ifdef HAVE_MMAP
+#include <sys/mman.h>
+#define ZIP_USE_MMAP
+#endif
 
 
 #define IS_SOURCE   0x0
@@ -47,6 +54,13 @@ struct _zipimporter {
 static PyObject *ZipImportError;
 /* read_directory() cache */
 static PyObject *zip_directory_cache = NULL;
+#ifdef ZIP_USE_MMAP
+/* get_mapping() cache: {archive: capsule of zip_mapping} */
+static PyObject *zip_mapping_cache = NULL;
+/* Set by -X zipimportmmap.  Reading a map past the end of an archive that
+   was truncated after it was mapped raises SIGBUS, so this is opt-in. */
+static int zip_use_mapping = 0;
+#endif
 
 /* forward decls */
 static PyObject *read_directory(PyObject *archive);
@@ -844,6 +858,147 @@ get_long(const unsigned char *buf) {
     return x;
 }
 
+/* Same for the short represented by the first 2 bytes.  This partially
+   reimplements marshal.c:r_short() */
+static short
+get_short(const unsigned char *buf) {
+    short x;
+    x =  buf[0];
+    x |= buf[1] << 8;
+    /* Sign-extension, in case short greater than 16 bits */
+    x |= -(x & 0x8000);
+    return x;
+}
+
+#ifdef ZIP_USE_MMAP
+/* A read-only memory map of an archive, shared by all the importers of the
+   archive.  The map is checked against stat() before each use and is
+   replaced when the archive changes. */
+typedef struct {
+    char *data;
+    Py_ssize_t size;
+    dev_t dev;
+    ino_t ino;
+    time_t mtime;
+} zip_mapping;
+
+static void
+zip_mapping_destructor(PyObject *capsule)
+{
+    zip_mapping *m = (zip_mapping *)PyCapsule_GetPointer(capsule, NULL);
+    munmap(m->data, (size_t)m->size);
+    PyMem_Free(m);
+}
+
+/* Return the memory map of archive as a new reference to a capsule, or
+   NULL without an exception set if the archive can't be mapped or mapping
+   is disabled, in which case the caller reads the file instead. */
+static PyObject *
+get_mapping(PyObject *archive)
+{
+    struct stat st;
+    PyObject *capsule, *bytes;
+    zip_mapping *m;
+    void *data;
+    int fd, err;
+
+    if (!zip_use_mapping)
+        return NULL;
+    if (_Py_stat(archive, &st) != 0) {
+        PyErr_Clear();
+        return NULL;
+    }
+    capsule = PyDict_GetItem(zip_mapping_cache, archive);
+    if (capsule != NULL) {
+        m = (zip_mapping *)PyCapsule_GetPointer(capsule, NULL);
+        if (m->size == st.st_size && m->dev == st.st_dev &&
+            m->ino == st.st_ino && m->mtime == st.st_mtime) {
+            Py_INCREF(capsule);
+            return capsule;
+        }
+        /* The archive has changed; readers still holding the old map keep
+           it alive until they are done. */
+        if (PyDict_DelItem(zip_mapping_cache, archive) < 0) {
+            PyErr_Clear();
+            return NULL;
+        }
+    }
+
+    bytes = PyUnicode_EncodeFSDefault(archive);
+    if (bytes == NULL) {
+        PyErr_Clear();
+        return NULL;
+    }
+    fd = _Py_open_noraise(PyBytes_AS_STRING(bytes), O_RDONLY);
+    Py_DECREF(bytes);
+    if (fd < 0)
+        return NULL;
+    /* Map the file that was opened, even if the path was replaced since */
+    err = fstat(fd, &st);
+    if (err != 0 || !S_ISREG(st.st_mode) || st.st_size <= 0 ||
+        (unsigned long long)st.st_size > PY_SSIZE_T_MAX) {
+        close(fd);
+        return NULL;
+    }
+    data = mmap(NULL, (size_t)st.st_size, PROT_READ, MAP_SHARED, fd, 0);
+    close(fd);
+    if (data == MAP_FAILED)
+        return NULL;
+
+    m = PyMem_Malloc(sizeof(zip_mapping));
+    if (m == NULL) {
+        munmap(data, (size_t)st.st_size);
+        return NULL;
+    }
+    m->data = (char *)data;
+    m->size = (Py_ssize_t)st.st_size;
+    m->dev = st.st_dev;
+    m->ino = st.st_ino;
+    m->mtime = st.st_mtime;
+    capsule = PyCapsule_New(m, NULL, zip_mapping_destructor);
+    if (capsule == NULL) {
+        munmap(data, (size_t)st.st_size);
+        PyMem_Free(m);
+        PyErr_Clear();
+        return NULL;
+    }
+    if (PyDict_SetItem(zip_mapping_cache, archive, capsule) < 0) {
+        Py_DECREF(capsule);
+        PyErr_Clear();
+        return NULL;
+    }
+    return capsule;
+}
+
+/* Return a pointer to the data of the archive member whose local file
+   header is at file_offset in the map, or NULL with an exception set. */
+static const char *
+find_mapped_data(PyObject *archive, zip_mapping *m, long data_size,
+                 long file_offset)
+{
+    const unsigned char *header;
+    Py_ssize_t start;
+
+    if (file_offset < 0 || file_offset > m->size - 30) {
+        PyErr_Format(ZipImportError, "can't read Zip file: %R", archive);
+        return NULL;
+    }
+    header = (const unsigned char *)m->data + file_offset;
+    if (get_long(header) != 0x04034B50) {
+        /* Bad: Local File Header */
+        PyErr_Format(ZipImportError, "bad local file header in %U", archive);
+        return NULL;
+    }
+    start = file_offset + 30 + (unsigned short)get_short(header + 26) +
+            (unsigned short)get_short(header + 28);
+    if (start > m->size - data_size) {
+        PyErr_SetString(PyExc_IOError, "zipimport: can't read data");
+        return NULL;
+    }
+    return m->data + start;
+}
+#endif
+
 /*
    read_directory(archive) -> files dict (new reference)
 
@@ -870,47 +1025,63 @@ static PyObject *
 read_directory(PyObject *archive)
 {
     PyObject *files = NULL;
-    FILE *fp;
+    FILE *fp = NULL;
     unsigned short flags;
     short compress, time, date, name_size;
     long crc, data_size, file_size, header_size;
-    Py_ssize_t file_offset, header_position, header_offset;
-    long l, count;
+    Py_ssize_t file_offset, header_position, header_offset, dir_size;
+    long count;
     Py_ssize_t i;
     char name[MAXPATHLEN + 5];
-    char dummy[8]; /* Buffer to read unused header values into */
     PyObject *nameobj = NULL;
     char *p, endof_central_dir[22];
     Py_ssize_t arc_offset;  /* Absolute offset to start of the zip-archive. */
     PyObject *path;
     const char *charset;
     int bootstrap;
+    const unsigned char *dir, *dir_end, *header;
+    char *dir_buffer = NULL;
+    PyObject *capsule = NULL;
 
-    fp = _Py_fopen_obj(archive, "rb");
-    if (fp == NULL) {
-        if (PyErr_ExceptionMatches(PyExc_OSError)) {
-            PyObject *exc, *val, *tb;
-            PyErr_Fetch(&exc, &val, &tb);
-            PyErr_Format(ZipImportError, "can't open Zip file: %R", archive);
-            _PyErr_ChainExceptions(exc, val, tb);
+#ifdef ZIP_USE_MMAP
+    capsule = get_mapping(archive);
+#endif
+    if (capsule != NULL) {
+#ifdef ZIP_USE_MMAP
+        zip_mapping *m = (zip_mapping *)PyCapsule_GetPointer(capsule, NULL);
+        if (m->size < 22) {
+            Py_DECREF(capsule);
+            PyErr_Format(ZipImportError, "not a Zip file: %R", archive);
+            return NULL;
         }
-        return NULL;
+        header_position = m->size - 22;
+        memcpy(endof_central_dir, m->data + header_position, 22);
+#endif
     }
+    else {
+        fp = _Py_fopen_obj(archive, "rb");
+        if (fp == NULL) {
+            if (PyErr_ExceptionMatches(PyExc_OSError)) {
+                PyObject *exc, *val, *tb;
+                PyErr_Fetch(&exc, &val, &tb);
+                PyErr_Format(ZipImportError, "can't open Zip file: %R",
+                             archive);
+                _PyErr_ChainExceptions(exc, val, tb);
+            }
+            return NULL;
+        }
 
-    if (fseek(fp, -22, SEEK_END) == -1) {
-        fclose(fp);
-        PyErr_Format(ZipImportError, "can't read Zip file: %R", archive);
-        return NULL;
-    }
-    header_position = ftell(fp);
-    if (fread(endof_central_dir, 1, 22, fp) != 22) {
-        fclose(fp);
-        PyErr_Format(ZipImportError, "can't read Zip file: %R", archive);
-        return NULL;
+        if (fseek(fp, -22, SEEK_END) == -1)
+            goto file_error;
+        header_position = ftell(fp);
+        if (fread(endof_central_dir, 1, 22, fp) != 22)
+            goto file_error;
     }
     if (get_long((unsigned char *)endof_central_dir) != 0x06054B50) {
         /* Bad: End of Central Dir signature */
-        fclose(fp);
+        if (fp != NULL)
+            fclose(fp);
+        Py_XDECREF(capsule);
         PyErr_Format(ZipImportError, "not a Zip file: %R", archive);
         return NULL;
     }
@@ -919,6 +1090,30 @@ read_directory(PyObject *archive)
     header_offset = get_long((unsigned char *)endof_central_dir + 16);
     arc_offset = header_position - header_offset - header_size;
     header_offset += arc_offset;
+    if (header_offset < 0 || header_offset > header_position)
+        goto file_error;
+
+    /* The Central Directory runs up to the End of Central Dir record; parse
+       it from the memory map, or read it in one go. */
+    dir_size = header_position - header_offset;
+    if (capsule != NULL) {
+#ifdef ZIP_USE_MMAP
+        zip_mapping *m = (zip_mapping *)PyCapsule_GetPointer(capsule, NULL);
+        dir = (const unsigned char *)m->data + header_offset;
+#endif
+    }
+    else {
+        dir_buffer = PyMem_Malloc(dir_size + 1);
+        if (dir_buffer == NULL) {
+            PyErr_NoMemory();
+            goto error;
+        }
+        if (fseek(fp, header_offset, 0) == -1 ||
+            fread(dir_buffer, 1, dir_size, fp) != (size_t)dir_size)
+            goto file_error;
+        dir = (const unsigned char *)dir_buffer;
+    }
+    dir_end = dir + dir_size;
 
     files = PyDict_New();
     if (files == NULL)
@@ -926,59 +1121,43 @@ read_directory(PyObject *archive)
 
     /* Start of Central Directory */
     count = 0;
-    if (fseek(fp, header_offset, 0) == -1)
-        goto file_error;
-    for (;;) {
+    for (header = dir; ; ) {
         PyObject *t;
         int err;
 
         /* Start of file header */
-        l = PyMarshal_ReadLongFromFile(fp);
-        if (l == -1 && PyErr_Occurred())
-            goto error;
-        if (l != 0x02014B50)
+        if (dir_end - header < 4 || get_long(header) != 0x02014B50)
             break;              /* Bad: Central Dir File Header */
-
-        /* On Windows, calling fseek to skip over the fields we don't use is
-        slower than reading the data into a dummy buffer because fseek flushes
-        stdio's internal buffers. See issue #8745. */
-        if (fread(dummy, 1, 4, fp) != 4) /* Skip unused fields, avoid fseek */
+        if (dir_end - header < 46)
             goto file_error;
 
-        flags = (unsigned short)PyMarshal_ReadShortFromFile(fp);
-        compress = PyMarshal_ReadShortFromFile(fp);
-        time = PyMarshal_ReadShortFromFile(fp);
-        date = PyMarshal_ReadShortFromFile(fp);
-        crc = PyMarshal_ReadLongFromFile(fp);
-        data_size = PyMarshal_ReadLongFromFile(fp);
-        file_size = PyMarshal_ReadLongFromFile(fp);
-        name_size = PyMarshal_ReadShortFromFile(fp);
-        header_size = name_size +
-           PyMarshal_ReadShortFromFile(fp) +
-           PyMarshal_ReadShortFromFile(fp);
-        if (PyErr_Occurred())
-            goto error;
-
-        if (fread(dummy, 1, 8, fp) != 8) /* Skip unused fields, avoid fseek */
+        flags = (unsigned short)get_short(header + 8);
+        compress = get_short(header + 10);
+        time = get_short(header + 12);
+        date = get_short(header + 14);
+        crc = get_long(header + 16);
+        data_size = get_long(header + 20);
+        file_size = get_long(header + 24);
+        name_size = get_short(header + 28);
+        header_size = (unsigned short)name_size +
+           (unsigned short)get_short(header + 30) +
+           (unsigned short)get_short(header + 32);
+        file_offset = get_long(header + 42) + arc_offset;
+        if (dir_end - header - 46 < header_size)
             goto file_error;
-        file_offset = PyMarshal_ReadLongFromFile(fp) + arc_offset;
-        if (PyErr_Occurred())
-            goto error;
 
-        if (name_size > MAXPATHLEN)
+        if ((unsigned short)name_size > MAXPATHLEN)
             name_size = MAXPATHLEN;
 
         p = name;
         for (i = 0; i < (Py_ssize_t)name_size; i++) {
-            *p = (char)getc(fp);
+            *p = (char)header[46 + i];
             if (*p == '/')
                 *p = SEP;
             p++;
         }
         *p = 0;         /* Add terminating null byte */
-        for (; i < header_size; i++) /* Skip the rest of the header */
-            if(getc(fp) == EOF) /* Avoid fseek */
-                goto file_error;
+        header += 46 + header_size;
 
         bootstrap = 0;
         if (flags & 0x0800)
@@ -1020,19 +1199,21 @@ read_directory(PyObject *archive)
             goto error;
         count++;
     }
-    fclose(fp);
+    if (fp != NULL)
+        fclose(fp);
+    Py_XDECREF(capsule);
+    PyMem_Free(dir_buffer);
     if (Py_VerboseFlag)
         PySys_FormatStderr("# zipimport: found %ld names in %R\n",
                            count, archive);
     return files;
 file_error:
-    fclose(fp);
-    Py_XDECREF(files);
-    Py_XDECREF(nameobj);
     PyErr_Format(ZipImportError, "can't read Zip file: %R", archive);
-    return NULL;
 error:
-    fclose(fp);
+    if (fp != NULL)
+        fclose(fp);
+    Py_XDECREF(capsule);
+    PyMem_Free(dir_buffer);
     Py_XDECREF(files);
     Py_XDECREF(nameobj);
     return NULL;
@@ -1071,12 +1252,60 @@ get_decompress_func(void)
     return decompress;
 }
 
+/* Decompress raw deflated data, which must be followed by one spare byte
+   in the bytes object.  Return a new reference. */
+static PyObject *
+decompress_data(PyObject *raw_data)
+{
+    PyObject *data, *decompress;
+    char *buf = PyBytes_AS_STRING(raw_data);
+    Py_ssize_t data_size = PyBytes_GET_SIZE(raw_data) - 1;
+
+    buf[data_size] = 'Z';  /* saw this in zipfile.py */
+    decompress = get_decompress_func();
+    if (decompress == NULL) {
+        PyErr_SetString(ZipImportError,
+                        "can't decompress data; "
+                        "zlib not available");
+        return NULL;
+    }
+    data = PyObject_CallFunction(decompress, "Oi", raw_data, -15);
+    Py_DECREF(decompress);
+    return data;
+}
+
+#ifdef ZIP_USE_MMAP
+/* get_data() reading from the memory map of the archive */
+static PyObject *
+get_mapped_data(PyObject *archive, PyObject *capsule, long compress,
+                long data_size, long file_offset)
+{
+    zip_mapping *m = (zip_mapping *)PyCapsule_GetPointer(capsule, NULL);
+    PyObject *raw_data, *data;
+    const char *buf;
+
+    buf = find_mapped_data(archive, m, data_size, file_offset);
+    if (buf == NULL)
+        return NULL;
+    if (compress == 0)  /* data is not compressed */
+        return PyBytes_FromStringAndSize(buf, data_size);
+
+    raw_data = PyBytes_FromStringAndSize(NULL, data_size + 1);
+    if (raw_data == NULL)
+        return NULL;
+    memcpy(PyBytes_AS_STRING(raw_data), buf, data_size);
+    data = decompress_data(raw_data);
+    Py_DECREF(raw_data);
+    return data;
+}
+#endif
+
 /* Given a path to a Zip file and a toc_entry, return the (uncompressed)
    data as a new reference. */
 static PyObject *
 get_data(PyObject *archive, PyObject *toc_entry)
 {
-    PyObject *raw_data, *data = NULL, *decompress;
+    PyObject *raw_data, *data = NULL;
     char *buf;
     FILE *fp;
     int err;
@@ -1095,6 +1324,22 @@ get_data(PyObject *archive, PyObject *toc_entry)
         PyErr_Format(ZipImportError, "negative data size");
         return NULL;
     }
+    if (data_size > LONG_MAX - 1) {
+        PyErr_NoMemory();
+        return NULL;
+    }
+
+#ifdef ZIP_USE_MMAP
+    {
+        PyObject *capsule = get_mapping(archive);
+        if (capsule != NULL) {
+            data = get_mapped_data(archive, capsule, compress, data_size,
+                                   file_offset);
+            Py_DECREF(capsule);
+            return data;
+        }
+    }
+#endif
 
     fp = _Py_fopen_obj(archive, "rb");
     if (!fp)
@@ -1131,14 +1376,7 @@ get_data(PyObject *archive, PyObject *toc_entry)
     }
     file_offset += l;           /* Start of file data */
 
-    if (data_size > LONG_MAX - 1) {
-        fclose(fp);
-        PyErr_NoMemory();
-        return NULL;
-    }
     bytes_size = compress == 0 ? data_size : data_size + 1;
-    if (bytes_size == 0)
-        bytes_size++;
     raw_data = PyBytes_FromStringAndSize((char *)NULL, bytes_size);
 
     if (raw_data == NULL) {
@@ -1164,29 +1402,11 @@ get_data(PyObject *archive, PyObject *toc_entry)
         return NULL;
     }
 
-    if (compress != 0) {
-        buf[data_size] = 'Z';  /* saw this in zipfile.py */
-        data_size++;
-    }
-    buf[data_size] = '\0';
-
-    if (compress == 0) {  /* data is not compressed */
-        data = PyBytes_FromStringAndSize(buf, data_size);
-        Py_DECREF(raw_data);
-        return data;
-    }
+    if (compress == 0)  /* data is not compressed */
+        return raw_data;
 
     /* Decompress with zlib */
-    decompress = get_decompress_func();
-    if (decompress == NULL) {
-        PyErr_SetString(ZipImportError,
-                        "can't decompress data; "
-                        "zlib not available");
-        goto error;
-    }
-    data = PyObject_CallFunction(decompress, "Oi", raw_data, -15);
-    Py_DECREF(decompress);
-error:
+    data = decompress_data(raw_data);
     Py_DECREF(raw_data);
     return data;
 }
@@ -1210,11 +1430,10 @@ eq_mtime(time_t t1, time_t t2)
    to .py if available and we don't want to mask other errors).
    Returns a new reference. */
 static PyObject *
-unmarshal_code(PyObject *pathname, PyObject *data, time_t mtime)
+unmarshal_code(PyObject *pathname, const char *buf, Py_ssize_t size,
+               time_t mtime)
 {
     PyObject *code;
-    char *buf = PyBytes_AsString(data);
-    Py_ssize_t size = PyBytes_Size(data);
 
     if (size <= 9) {
         PyErr_SetString(ZipImportError,
@@ -1376,19 +1595,63 @@ get_mtime_of_source(ZipImporter *self, PyObject *path)
 
 /* Return the code object for the module named by 'fullname' from the
    Zip archive as a new reference. */
+#ifdef ZIP_USE_MMAP
+/* Unmarshal the code of stored (uncompressed) bytecode straight from the
+   memory map of the archive.  Return NULL without an exception set if the
+   entry is compressed or the archive can't be mapped. */
+static PyObject *
+get_mapped_code(PyObject *archive, PyObject *toc_entry, PyObject *modpath,
+                time_t mtime)
+{
+    PyObject *datapath, *capsule, *code;
+    long compress, data_size, file_size, file_offset;
+    long time, date, crc;
+    const char *buf;
+
+    if (!PyArg_ParseTuple(toc_entry, "Olllllll", &datapath, &compress,
+                          &data_size, &file_size, &file_offset, &time,
+                          &date, &crc)) {
+        return NULL;
+    }
+    if (compress != 0 || data_size < 0)
+        return NULL;
+    capsule = get_mapping(archive);
+    if (capsule == NULL)
+        return NULL;
+    buf = find_mapped_data(archive,
+                           (zip_mapping *)PyCapsule_GetPointer(capsule, NULL),
+                           data_size, file_offset);
+    if (buf == NULL)
+        code = NULL;
+    else
+        code = unmarshal_code(modpath, buf, data_size, mtime);
+    Py_DECREF(capsule);
+    return code;
+}
+#endif
+
 static PyObject *
 get_code_from_data(ZipImporter *self, int ispackage, int isbytecode,
                    time_t mtime, PyObject *toc_entry)
 {
     PyObject *data, *modpath, *code;
 
+    modpath = PyTuple_GetItem(toc_entry, 0);
+#ifdef ZIP_USE_MMAP
+    if (isbytecode) {
+        code = get_mapped_code(self->archive, toc_entry, modpath, mtime);
+        if (code != NULL || PyErr_Occurred())
+            return code;
+    }
+#endif
+
     data = get_data(self->archive, toc_entry);
     if (data == NULL)
         return NULL;
 
-    modpath = PyTuple_GetItem(toc_entry, 0);
     if (isbytecode)
-        code = unmarshal_code(modpath, data, mtime);
+        code = unmarshal_code(modpath, PyBytes_AS_STRING(data),
+                              PyBytes_GET_SIZE(data), mtime);
     else
         code = compile_source(modpath, data);
     Py_DECREF(data);
@@ -1497,6 +1760,9 @@ PyMODINIT_FUNC
 PyInit_zipimport(void)
 {
     PyObject *mod;
+#ifdef ZIP_USE_MMAP
+    PyObject *xoptions;
+#endif
 
     if (PyType_Ready(&ZipImporter_Type) < 0)
         return NULL;
@@ -1527,9 +1793,24 @@ PyInit_zipimport(void)
     zip_directory_cache = PyDict_New();
     if (zip_directory_cache == NULL)
         return NULL;
+#ifdef ZIP_USE_MMAP
+    zip_mapping_cache = PyDict_New();
+    if (zip_mapping_cache == NULL)
+        return NULL;
+    xoptions = PySys_GetXOptions();
+    if (xoptions != NULL &&
+        PyDict_GetItemString(xoptions, "zipimportmmap") != NULL)
+        zip_use_mapping = 1;
+#endif
     Py_INCREF(zip_directory_cache);
     if (PyModule_AddObject(mod, "_zip_directory_cache",
                            zip_directory_cache) < 0)
         return NULL;
+#ifdef ZIP_USE_MMAP
+    Py_INCREF(zip_mapping_cache);
+    if (PyModule_AddObject(mod, "_zip_mapping_cache",
+                           zip_mapping_cache) < 0)
+        return NULL;
+#endif
     return mod;
 }
@@ -84,10 +84,12 @@ PyCode_New(int argcount, int kwonlyargcount,
     intern_strings(varnames);
     intern_strings(freevars);
     intern_strings(cellvars);
-    /* Intern selected string constants */
+    /* Intern selected string constants.  Those loaded by marshal are
+       usually interned already, which saves scanning them. */
     for (i = PyTuple_GET_SIZE(consts); --i >= 0; ) {
-        PyObject *v = PyTuple_GetItem(consts, i);
-        if (!all_name_chars(v))
+        PyObject *v = PyTuple_GET_ITEM(consts, i);
+        if (!PyUnicode_CheckExact(v) || PyUnicode_CHECK_INTERNED(v) ||
+            !all_name_chars(v))
             continue;
         PyUnicode_InternInPlace(&PyTuple_GET_ITEM(consts, i));
     }
@@ -30,6 +30,7 @@ extern PyObject* PyInit_msvcrt(void);
 extern PyObject* PyInit__locale(void);
 #endif
 extern PyObject* PyInit__codecs(void);
+extern PyObject* PyInit__abc(void);
 extern PyObject* PyInit__weakref(void);
 extern PyObject* PyInit_xxsubtype(void);
 extern PyObject* PyInit_zipimport(void);
@@ -38,6 +39,8 @@ extern PyObject* PyInit_itertools(void);
 extern PyObject* PyInit__collections(void);
 extern PyObject* PyInit__heapq(void);
 extern PyObject* PyInit__bisect(void);
+extern PyObject* PyInit__enum(void);
+extern PyObject* PyInit__copy(void);
 extern PyObject* PyInit__symtable(void);
 extern PyObject* PyInit_mmap(void);
 extern PyObject* PyInit__csv(void);
@@ -109,10 +112,13 @@ struct _inittab _PyImport_Inittab[] = {
     {"_winapi", PyInit__winapi},
 
     {"_codecs", PyInit__codecs},
+    {"_abc", PyInit__abc},
     {"_weakref", PyInit__weakref},
     {"_random", PyInit__random},
     {"_bisect", PyInit__bisect},
     {"_heapq", PyInit__heapq},
+    {"_enum", PyInit__enum},
+    {"_copy", PyInit__copy},
     {"_lsprof", PyInit__lsprof},
     {"itertools", PyInit_itertools},
     {"_collections", PyInit__collections},
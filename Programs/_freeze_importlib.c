@@ -1,5 +1,8 @@
 /* This is built as a stand-alone executable by the Makefile, and helps turn
    Lib/importlib/_bootstrap.py into a frozen module in Python/importlib.h
+
+   If a module name is passed as third argument, the module is frozen under
+   that name instead, as done for the modules in Python/frozen_startup.h.
 */
 
 #include <Python.h>
@@ -32,7 +35,8 @@ const char header[] = "/* Auto-generated by Programs/_freeze_importlib.c */";
 int
 main(int argc, char *argv[])
 {
-    char *inpath, *outpath, *code_name;
+    char *inpath, *outpath, *modname = NULL;
+    char code_name[256], symbol[256], *p;
     FILE *infile = NULL, *outfile = NULL;
     struct _Py_stat_struct status;
     size_t text_size, data_size, n;
@@ -43,12 +47,19 @@ main(int argc, char *argv[])
 
     PyImport_FrozenModules = _PyImport_FrozenModules;
 
-    if (argc != 3) {
+    if (argc != 3 && argc != 4) {
         fprintf(stderr, "need to specify input and output paths\n");
         return 2;
     }
     inpath = argv[1];
     outpath = argv[2];
+    if (argc == 4) {
+        modname = argv[3];
+        if (strlen(modname) > 200) {
+            fprintf(stderr, "module name too long: '%s'\n", modname);
+            return 2;
+        }
+    }
     infile = fopen(inpath, "rb");
     if (infile == NULL) {
         fprintf(stderr, "cannot open '%s' for reading\n", inpath);
@@ -82,13 +93,25 @@ main(int argc, char *argv[])
     /* Don't install importlib, since it could execute outdated bytecode. */
     _Py_InitializeEx_Private(1, 0);
 
-    if (strstr(inpath, "_external") != NULL) {
-        is_bootstrap = 0;
+    if (modname != NULL) {
+        /* The C symbol is the module name with dots replaced. */
+        sprintf(code_name, "<frozen %s>", modname);
+        sprintf(symbol, "_Py_M__%s", modname);
+        for (p = symbol; *p; p++) {
+            if (*p == '.')
+                *p = '_';
+        }
+    }
+    else {
+        if (strstr(inpath, "_external") != NULL) {
+            is_bootstrap = 0;
+        }
+        strcpy(code_name, is_bootstrap ?
+               "<frozen importlib._bootstrap>" :
+               "<frozen importlib._bootstrap_external>");
+        strcpy(symbol, is_bootstrap ?
+               "_Py_M__importlib" : "_Py_M__importlib_external");
     }
-
-    code_name = is_bootstrap ?
-        "<frozen importlib._bootstrap>" :
-        "<frozen importlib._bootstrap_external>";
     code = Py_CompileStringExFlags(text, code_name, Py_file_input, NULL, 0);
     if (code == NULL)
         goto error;
@@ -112,11 +135,7 @@ main(int argc, char *argv[])
         goto error;
     }
     fprintf(outfile, "%s\n", header);
-    if (is_bootstrap)
-        fprintf(outfile, "const unsigned char _Py_M__importlib[] = {\n");
-    else
-        fprintf(outfile,
-                "const unsigned char _Py_M__importlib_external[] = {\n");
+    fprintf(outfile, "const unsigned char %s[] = {\n", symbol);
     for (n = 0; n < data_size; n += 16) {
         size_t i, end = Py_MIN(n + 16, data_size);
         fprintf(outfile, "    ");
@@ -4,6 +4,9 @@
 #include "Python.h"
 #include "importlib.h"
 #include "importlib_external.h"
+#ifdef Py_FROZEN_STARTUP
+#include "frozen_startup.h"
+#endif
 
 /* In order to test the support for frozen modules, by default we
    define a single frozen module, __hello__.  Loading it will print
@@ -34,6 +37,10 @@ static const struct _frozen _PyImport_FrozenModules[] = {
     {"_frozen_importlib", _Py_M__importlib, (int)sizeof(_Py_M__importlib)},
     {"_frozen_importlib_external", _Py_M__importlib_external,
         (int)sizeof(_Py_M__importlib_external)},
+#ifdef Py_FROZEN_STARTUP
+    /* stdlib modules imported at startup */
+    FROZEN_STARTUP_MODULES,
+#endif
     /* Test module */
     {"__hello__", M___hello__, SIZE},
     /* Test package (negative size indicates package-ness) */
@@ -0,0 +1,35 @@
+/* Standard library modules imported during interpreter startup, frozen
+   into the interpreter when configured with --with-frozen-startup.
+
+   The headers are generated by Programs/_freeze_importlib; the list of
+   modules must be kept in sync with FROZEN_STARTUP_HEADERS in
+   Makefile.pre.in.  Packages are not frozen, since a frozen package cannot
+   import submodules from the file system (e.g. encodings). */
+
+#include "Python/frozen_startup/_bootlocale.h"
+#include "Python/frozen_startup/_collections_abc.h"
+#include "Python/frozen_startup/_sitebuiltins.h"
+#include "Python/frozen_startup/abc.h"
+#include "Python/frozen_startup/codecs.h"
+#include "Python/frozen_startup/genericpath.h"
+#include "Python/frozen_startup/io.h"
+#include "Python/frozen_startup/os.h"
+#include "Python/frozen_startup/posixpath.h"
+#include "Python/frozen_startup/site.h"
+#include "Python/frozen_startup/stat.h"
+
+#define FROZEN_STARTUP_MODULE(name) \
+    {#name, _Py_M__##name, (int)sizeof(_Py_M__##name)}
+
+#define FROZEN_STARTUP_MODULES \
+    FROZEN_STARTUP_MODULE(_bootlocale), \
+    FROZEN_STARTUP_MODULE(_collections_abc), \
+    FROZEN_STARTUP_MODULE(_sitebuiltins), \
+    FROZEN_STARTUP_MODULE(abc), \
+    FROZEN_STARTUP_MODULE(codecs), \
+    FROZEN_STARTUP_MODULE(genericpath), \
+    FROZEN_STARTUP_MODULE(io), \
+    FROZEN_STARTUP_MODULE(os), \
+    FROZEN_STARTUP_MODULE(posixpath), \
+    FROZEN_STARTUP_MODULE(site), \
+    FROZEN_STARTUP_MODULE(stat)
@@ -1662,6 +1662,58 @@ to the file. The object will not be properly read back by load()\n\
 \n\
 The version argument indicates the data format that dump should use.");
 
+/* Read one value in place from an object exporting its whole content as a
+   buffer, such as mmap.mmap, starting at f.tell() and seeking past it. */
+static PyObject *
+marshal_load_buffer(PyObject *f)
+{
+    PyObject *res, *result;
+    Py_buffer buf;
+    Py_ssize_t pos;
+    RFILE rf;
+    _Py_IDENTIFIER(tell);
+    _Py_IDENTIFIER(seek);
+
+    res = _PyObject_CallMethodId(f, &PyId_tell, NULL);
+    if (res == NULL)
+        return NULL;
+    pos = PyNumber_AsSsize_t(res, PyExc_OverflowError);
+    Py_DECREF(res);
+    if (pos == -1 && PyErr_Occurred())
+        return NULL;
+    if (PyObject_GetBuffer(f, &buf, PyBUF_SIMPLE) < 0)
+        return NULL;
+    if (pos < 0 || pos > buf.len) {
+        PyBuffer_Release(&buf);
+        PyErr_SetString(PyExc_EOFError, "EOF read where object expected");
+        return NULL;
+    }
+    rf.depth = 0;
+    rf.fp = NULL;
+    rf.readable = NULL;
+    rf.current_filename = NULL;
+    rf.ptr = (char *)buf.buf + pos;
+    rf.end = (char *)buf.buf + buf.len;
+    rf.buf = NULL;
+    if ((rf.refs = PyList_New(0)) == NULL) {
+        PyBuffer_Release(&buf);
+        return NULL;
+    }
+    result = read_object(&rf);
+    Py_DECREF(rf.refs);
+    pos = rf.ptr - (char *)buf.buf;
+    PyBuffer_Release(&buf);
+    if (result == NULL)
+        return NULL;
+    res = _PyObject_CallMethodId(f, &PyId_seek, "n", pos);
+    if (res == NULL) {
+        Py_DECREF(result);
+        return NULL;
+    }
+    Py_DECREF(res);
+    return result;
+}
+
 static PyObject *
 marshal_load(PyObject *self, PyObject *f)
 {
@@ -1669,6 +1721,10 @@ marshal_load(PyObject *self, PyObject *f)
     _Py_IDENTIFIER(read);
     RFILE rf;
 
+    /* Memory-mapped files are read in place without copying the data. */
+    if (PyObject_CheckBuffer(f))
+        return marshal_load_buffer(f);
+
     /*
      * Make a call to the read method, but read zero bytes.
      * This is to ensure that the object passed in at least
@@ -1711,7 +1767,8 @@ Read one value from the open file and return it. If no valid value is\n\
 read (e.g. because the data has a different Python version's\n\
 incompatible marshal format), raise EOFError, ValueError or TypeError.\n\
 The file must be an open file object opened in binary mode ('rb' or\n\
-'r+b').\n\
+'r+b'), or a file-like object supporting the buffer protocol, such as\n\
+mmap.mmap, which is then read in place.\n\
 \n\
 Note: If an object containing an unsupported type was marshalled with\n\
 dump(), load() will substitute None for the unmarshallable type.");
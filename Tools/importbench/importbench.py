@@ -5,7 +5,6 @@ thus has no external changes made to import-related attributes in sys.
 
 """
 from test.test_importlib import util
-from test.test_importlib.source import util as source_util
 import decimal
 import imp
 import importlib
@@ -13,9 +12,13 @@ import importlib.machinery
 import json
 import os
 import py_compile
+import shutil
+import subprocess
 import sys
 import tabnanny
+import tempfile
 import timeit
+import zipfile
 
 
 def bench(name, cleanup=lambda: None, *, seconds=1, repeat=3):
@@ -65,7 +68,7 @@ def source_wo_bytecode(seconds, repeat):
     try:
         name = '__importlib_test_benchmark__'
         # Clears out sys.modules and puts an entry at the front of sys.path.
-        with source_util.create_modules(name) as mapping:
+        with util.create_modules(name) as mapping:
             assert not os.path.exists(imp.cache_from_source(mapping[name]))
             sys.meta_path.append(importlib.machinery.PathFinder)
             loader = (importlib.machinery.SourceFileLoader,
@@ -102,7 +105,7 @@ def source_writing_bytecode(seconds, repeat):
     """Source writing bytecode: small"""
     assert not sys.dont_write_bytecode
     name = '__importlib_test_benchmark__'
-    with source_util.create_modules(name) as mapping:
+    with util.create_modules(name) as mapping:
         sys.meta_path.append(importlib.machinery.PathFinder)
         loader = (importlib.machinery.SourceFileLoader,
                   importlib.machinery.SOURCE_SUFFIXES, True)
@@ -136,7 +139,7 @@ decimal_writing_bytecode = _writing_bytecode(decimal)
 def source_using_bytecode(seconds, repeat):
     """Source w/ bytecode: small"""
     name = '__importlib_test_benchmark__'
-    with source_util.create_modules(name) as mapping:
+    with util.create_modules(name) as mapping:
         sys.meta_path.append(importlib.machinery.PathFinder)
         loader = (importlib.machinery.SourceFileLoader,
                 importlib.machinery.SOURCE_SUFFIXES, True)
@@ -163,6 +166,32 @@ tabnanny_using_bytecode = _using_bytecode(tabnanny)
 decimal_using_bytecode = _using_bytecode(decimal)
 
 
+def _zip_using_bytecode(module):
+    name = module.__name__
+    def zip_using_bytecode_benchmark(seconds, repeat):
+        """Zip w/ bytecode: {}"""
+        with tempfile.TemporaryDirectory() as directory:
+            archive = os.path.join(directory, 'modules.zip')
+            bytecode_path = os.path.join(directory, name + '.pyc')
+            py_compile.compile(module.__file__, cfile=bytecode_path)
+            with zipfile.ZipFile(archive, 'w') as zf:
+                zf.write(bytecode_path, name + '.pyc')
+            sys.path.insert(0, archive)
+            try:
+                yield from bench(name, lambda: sys.modules.pop(name),
+                                 repeat=repeat, seconds=seconds)
+            finally:
+                sys.path.remove(archive)
+                sys.path_importer_cache.pop(archive, None)
+
+    zip_using_bytecode_benchmark.__doc__ = (
+                            zip_using_bytecode_benchmark.__doc__.format(name))
+    return zip_using_bytecode_benchmark
+
+tabnanny_zip_using_bytecode = _zip_using_bytecode(tabnanny)
+decimal_zip_using_bytecode = _zip_using_bytecode(decimal)
+
+
 def main(import_, options):
     if options.source_file:
         with options.source_file:
@@ -177,6 +206,7 @@ def main(import_, options):
                   tabnanny_wo_bytecode, tabnanny_using_bytecode,
                   decimal_writing_bytecode,
                   decimal_wo_bytecode, decimal_using_bytecode,
+                  tabnanny_zip_using_bytecode, decimal_zip_using_bytecode,
                 )
     if options.benchmark:
         for b in benchmarks:
@@ -222,6 +252,74 @@ def main(import_, options):
             json.dump(new_results, options.dest_file, indent=2)
 
 
+# Report how the modules imported at startup were loaded.
+STARTUP_REPORT = """if True:
+    import _imp, sys
+    frozen = [name for name in sys.modules if _imp.is_frozen(name)]
+    print(len(sys.modules), len(frozen))
+    """
+
+# System calls made by the import system to find and load modules.
+IMPORT_SYSCALLS = ('stat', 'lstat', 'fstat', 'newfstatat', 'open', 'openat',
+                   'read', 'getdents', 'getdents64', 'lseek')
+
+
+def startup_syscalls(executable):
+    """Return a dict of the number of import-related system calls made by
+    starting executable, or None if strace is not available."""
+    strace = shutil.which('strace')
+    if strace is None:
+        return None
+    with tempfile.NamedTemporaryFile('r') as output:
+        subprocess.check_call([strace, '-f', '-c', '-o', output.name,
+                               executable, '-c', 'pass'])
+        counts = {}
+        for line in output:
+            fields = line.split()
+            # % time, seconds, usecs/call, calls, [errors,] syscall
+            if len(fields) >= 5 and fields[-1] in IMPORT_SYSCALLS:
+                counts[fields[-1]] = int(fields[3])
+    return counts
+
+
+def startup_main(executables, options):
+    """Compare the startup time and system calls of several interpreters,
+    e.g. builds configured with and without --with-frozen-startup."""
+    runs = 20
+    repeat = 3
+    print('Measuring startup time of {} runs, best out of {}\n'.format(
+          runs, repeat))
+    for executable in executables:
+        print(executable)
+        output = subprocess.check_output([executable, '-c', STARTUP_REPORT],
+                                         universal_newlines=True)
+        modules, frozen = map(int, output.split())
+        print('  modules at startup: {} ({} frozen)'.format(modules, frozen))
+        timer = timeit.Timer(lambda: subprocess.check_call([executable, '-c',
+                                                            'pass']))
+        best = min(timer.repeat(repeat, runs)) / runs
+        print('  startup time: {:.1f} ms'.format(best * 1e3))
+        counts = startup_syscalls(executable)
+        if counts is None:
+            print('  system calls: strace not found')
+        else:
+            print('  system calls: {} ({})'.format(
+                  sum(counts.values()),
+                  ', '.join('{} {}'.format(name, count)
+                            for name, count in sorted(counts.items()))))
+        if options.lazy:
+            imports = 'import ' + ', '.join(options.lazy)
+            lazy = ('import importlib.util, sys; '
+                    'sys.meta_path.insert(0, importlib.util.LazyFinder({!r})); '
+                    .format(options.lazy))
+            for label, code in (('eager', imports), ('lazy', lazy + imports)):
+                timer = timeit.Timer(lambda: subprocess.check_call(
+                    [executable, '-c', code]))
+                best = min(timer.repeat(repeat, runs)) / runs
+                print('  startup time with {} imports: {:.1f} ms'.format(
+                      label, best * 1e3))
+
+
 if __name__ == '__main__':
     import argparse
 
@@ -237,7 +335,18 @@ if __name__ == '__main__':
                         help='file to write benchmark data to')
     parser.add_argument('--benchmark', dest='benchmark',
                         help='specific benchmark to run')
+    parser.add_argument('--startup', dest='startup', nargs='+',
+                        metavar='EXECUTABLE',
+                        help='compare the startup time and system calls of '
+                             'the given interpreters instead')
+    parser.add_argument('--lazy', dest='lazy', nargs='+', metavar='MODULE',
+                        help='with --startup, also compare importing the '
+                             'given modules eagerly and with '
+                             'importlib.util.LazyFinder')
     options = parser.parse_args()
+    if options.startup:
+        startup_main(options.startup, options)
+        sys.exit()
     import_ = __import__
     if not options.builtin:
         import_ = importlib.__import__
@@ -0,0 +1,103 @@
+from pybench import Test
+
+from collections.abc import Mapping, Sequence, Hashable, Iterable
+
+class ABCInstanceChecks(Test):
+
+    version = 2.0
+    operations = 4 * 5
+    rounds = 80000
+
+    def test(self):
+
+        d = {}
+        l = []
+        s = ''
+        n = 1
+
+        for i in range(self.rounds):
+
+            isinstance(d, Mapping)
+            isinstance(l, Mapping)
+            isinstance(s, Mapping)
+            isinstance(n, Mapping)
+
+            isinstance(d, Sequence)
+            isinstance(l, Sequence)
+            isinstance(s, Sequence)
+            isinstance(n, Sequence)
+
+            isinstance(d, Hashable)
+            isinstance(l, Hashable)
+            isinstance(s, Hashable)
+            isinstance(n, Hashable)
+
+            isinstance(d, Iterable)
+            isinstance(l, Iterable)
+            isinstance(s, Iterable)
+            isinstance(n, Iterable)
+
+            isinstance(d, Mapping)
+            isinstance(l, Sequence)
+            isinstance(s, Hashable)
+            isinstance(n, Iterable)
+
+    def calibrate(self):
+
+        d = {}
+        l = []
+        s = ''
+        n = 1
+
+        for i in range(self.rounds):
+            pass
+
+class ABCSubclassChecks(Test):
+
+    version = 2.0
+    operations = 4 * 5
+    rounds = 80000
+
+    def test(self):
+
+        d = dict
+        l = list
+        s = str
+        n = int
+
+        for i in range(self.rounds):
+
+            issubclass(d, Mapping)
+            issubclass(l, Mapping)
+            issubclass(s, Mapping)
+            issubclass(n, Mapping)
+
+            issubclass(d, Sequence)
+            issubclass(l, Sequence)
+            issubclass(s, Sequence)
+            issubclass(n, Sequence)
+
+            issubclass(d, Hashable)
+            issubclass(l, Hashable)
+            issubclass(s, Hashable)
+            issubclass(n, Hashable)
+
+            issubclass(d, Iterable)
+            issubclass(l, Iterable)
+            issubclass(s, Iterable)
+            issubclass(n, Iterable)
+
+            issubclass(d, Mapping)
+            issubclass(l, Sequence)
+            issubclass(s, Hashable)
+            issubclass(n, Iterable)
+
+    def calibrate(self):
+
+        d = dict
+        l = list
+        s = str
+        n = int
+
+        for i in range(self.rounds):
+            pass
@@ -0,0 +1,30 @@
+from pybench import Test
+
+from array import array
+
+class ArrayNumericOps(Test):
+
+    version = 2.0
+    operations = 5
+    rounds = 2000
+
+    def test(self):
+
+        a = array('d', range(1000))
+        b = array('d', range(1000, 0, -1))
+
+        for i in range(self.rounds):
+
+            a.add(b)
+            a.multiply(0.5)
+            a.compare('<', 500.0)
+            a.sum()
+            a.max()
+
+    def calibrate(self):
+
+        a = array('d', range(1000))
+        b = array('d', range(1000, 0, -1))
+
+        for i in range(self.rounds):
+            pass
@@ -0,0 +1,41 @@
+from pybench import Test
+
+from copy import deepcopy
+
+class DeepCopyContainers(Test):
+
+    version = 2.0
+    operations = 4
+    rounds = 5000
+
+    def test(self):
+
+        config = {
+            'name': 'server',
+            'ports': [80, 443, 8080],
+            'limits': {'cpu': 2.5, 'memory': 1024, 'burst': None},
+            'hosts': [{'host': 'a', 'weight': 1}, {'host': 'b', 'weight': 2}],
+            'tags': ('web', 'prod'),
+        }
+        rows = [[i, 'x' * 10, float(i), (i, i + 1)] for i in range(20)]
+
+        for i in range(self.rounds):
+
+            deepcopy(config)
+            deepcopy(rows)
+            deepcopy(config)
+            deepcopy(rows)
+
+    def calibrate(self):
+
+        config = {
+            'name': 'server',
+            'ports': [80, 443, 8080],
+            'limits': {'cpu': 2.5, 'memory': 1024, 'burst': None},
+            'hosts': [{'host': 'a', 'weight': 1}, {'host': 'b', 'weight': 2}],
+            'tags': ('web', 'prod'),
+        }
+        rows = [[i, 'x' * 10, float(i), (i, i + 1)] for i in range(20)]
+
+        for i in range(self.rounds):
+            pass
@@ -0,0 +1,85 @@
+from pybench import Test
+
+from enum import Enum, IntEnum
+
+class Color(Enum):
+    red = 1
+    green = 2
+    blue = 3
+
+class Status(IntEnum):
+    ok = 200
+    created = 201
+    not_found = 404
+
+class EnumValueLookup(Test):
+
+    version = 2.0
+    operations = 4 * 3
+    rounds = 40000
+
+    def test(self):
+
+        for i in range(self.rounds):
+
+            Color(1)
+            Color(2)
+            Color(3)
+
+            Status(200)
+            Status(201)
+            Status(404)
+
+            Color(Color.red)
+            Color(Color.green)
+            Color(Color.blue)
+
+            Status(Status.ok)
+            Status(Status.created)
+            Status(Status.not_found)
+
+    def calibrate(self):
+
+        for i in range(self.rounds):
+            pass
+
+class EnumMemberAttributes(Test):
+
+    version = 2.0
+    operations = 4 * 4
+    rounds = 80000
+
+    def test(self):
+
+        r = Color.red
+        s = Status.not_found
+
+        for i in range(self.rounds):
+
+            r.name
+            r.value
+            s.name
+            s.value
+
+            r.name
+            r.value
+            s.name
+            s.value
+
+            r.name
+            r.value
+            s.name
+            s.value
+
+            r.name
+            r.value
+            s.name
+            s.value
+
+    def calibrate(self):
+
+        r = Color.red
+        s = Status.not_found
+
+        for i in range(self.rounds):
+            pass
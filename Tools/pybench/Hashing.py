@@ -0,0 +1,49 @@
+from pybench import Test
+
+import hashlib
+
+class HashDigestMany(Test):
+
+    version = 2.0
+    operations = 1
+    rounds = 1000
+
+    def test(self):
+
+        h = hashlib.sha256()
+        keys = [str(i).encode() for i in range(100)]
+
+        for i in range(self.rounds):
+
+            h.digest_many(keys)
+
+    def calibrate(self):
+
+        h = hashlib.sha256()
+        keys = [str(i).encode() for i in range(100)]
+
+        for i in range(self.rounds):
+            pass
+
+class HashDigestLoop(Test):
+
+    version = 2.0
+    operations = 1
+    rounds = 1000
+
+    def test(self):
+
+        sha256 = hashlib.sha256
+        keys = [str(i).encode() for i in range(100)]
+
+        for i in range(self.rounds):
+
+            [sha256(key).digest() for key in keys]
+
+    def calibrate(self):
+
+        sha256 = hashlib.sha256
+        keys = [str(i).encode() for i in range(100)]
+
+        for i in range(self.rounds):
+            pass
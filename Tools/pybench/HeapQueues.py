@@ -0,0 +1,67 @@
+from pybench import Test
+
+import heapq
+import random
+from operator import itemgetter
+
+class HeapMerge(Test):
+
+    version = 2.0
+    operations = 2
+    rounds = 100
+
+    def test(self):
+
+        merge = heapq.merge
+        shards = [sorted(random.random() for i in range(250))
+                  for j in range(8)]
+        pairs = [sorted(((x, i) for i, x in enumerate(shard)),
+                        key=itemgetter(0)) for shard in shards]
+
+        for i in range(self.rounds):
+
+            for x in merge(*shards):
+                pass
+            for x in merge(*pairs, key=itemgetter(0), reverse=False):
+                pass
+
+    def calibrate(self):
+
+        merge = heapq.merge
+        shards = [sorted(random.random() for i in range(250))
+                  for j in range(8)]
+        pairs = [sorted(((x, i) for i, x in enumerate(shard)),
+                        key=itemgetter(0)) for shard in shards]
+
+        for i in range(self.rounds):
+            pass
+
+class HeapTopK(Test):
+
+    version = 2.0
+    operations = 4
+    rounds = 100
+
+    def test(self):
+
+        nsmallest = heapq.nsmallest
+        nlargest = heapq.nlargest
+        data = [random.random() for i in range(2000)]
+        key = abs
+
+        for i in range(self.rounds):
+
+            nsmallest(10, data)
+            nlargest(10, data)
+            nsmallest(10, data, key=key)
+            nlargest(10, data, key=key)
+
+    def calibrate(self):
+
+        nsmallest = heapq.nsmallest
+        nlargest = heapq.nlargest
+        data = [random.random() for i in range(2000)]
+        key = abs
+
+        for i in range(self.rounds):
+            pass
@@ -0,0 +1,70 @@
+from pybench import Test
+
+from collections import namedtuple
+
+class NamedTupleCreation(Test):
+
+    version = 2.0
+    operations = 5
+    rounds = 400
+
+    def test(self):
+
+        for i in range(self.rounds):
+
+            namedtuple('Point', 'x y')
+            namedtuple('Point3D', 'x y z')
+            namedtuple('Record', 'id name email phone address')
+            namedtuple('Color', 'red green blue alpha')
+            namedtuple('Row', 'a b c d e f g h i j')
+
+    def calibrate(self):
+
+        for i in range(self.rounds):
+            pass
+
+class NamedTupleAttributes(Test):
+
+    version = 2.0
+    operations = 4 * 5
+    rounds = 100000
+
+    def test(self):
+
+        Point = namedtuple('Point', 'x y z w')
+        p = Point(1, 2, 3, 4)
+
+        for i in range(self.rounds):
+
+            p.x
+            p.y
+            p.z
+            p.w
+
+            p.x
+            p.y
+            p.z
+            p.w
+
+            p.x
+            p.y
+            p.z
+            p.w
+
+            p.x
+            p.y
+            p.z
+            p.w
+
+            p.x
+            p.y
+            p.z
+            p.w
+
+    def calibrate(self):
+
+        Point = namedtuple('Point', 'x y z w')
+        p = Point(1, 2, 3, 4)
+
+        for i in range(self.rounds):
+            pass
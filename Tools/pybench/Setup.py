@@ -22,6 +22,16 @@ from Calls import *
 from Constructs import *
 from Lookups import *
 from Instances import *
+from ABCs import *
+from NamedTuples import *
+from Enums import *
+from Copies import *
+from Statistics import *
+from SingleDispatch import *
+from Arrays import *
+from Structs import *
+from Hashing import *
+from HeapQueues import *
 try:
     from NewInstances import *
 except ImportError:
@@ -0,0 +1,44 @@
+from pybench import Test
+
+from functools import singledispatch
+
+class SingleDispatchCalls(Test):
+
+    version = 2.0
+    operations = 5
+    rounds = 100000
+
+    def test(self):
+
+        @singledispatch
+        def f(x):
+            return x
+        @f.register(int)
+        def _(x):
+            return x
+        @f.register(list)
+        def _(x):
+            return x
+
+        for i in range(self.rounds):
+
+            f(1)
+            f('a')
+            f([])
+            f(2.0)
+            f(3)
+
+    def calibrate(self):
+
+        @singledispatch
+        def f(x):
+            return x
+        @f.register(int)
+        def _(x):
+            return x
+        @f.register(list)
+        def _(x):
+            return x
+
+        for i in range(self.rounds):
+            pass
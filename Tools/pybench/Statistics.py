@@ -0,0 +1,26 @@
+from pybench import Test
+
+from statistics import mean, median, variance
+
+class StatisticsFloats(Test):
+
+    version = 2.0
+    operations = 3
+    rounds = 50
+
+    def test(self):
+
+        data = [((i * 7919) % 1009) / 7.0 for i in range(2000)]
+
+        for i in range(self.rounds):
+
+            mean(data)
+            median(data)
+            variance(data)
+
+    def calibrate(self):
+
+        data = [((i * 7919) % 1009) / 7.0 for i in range(2000)]
+
+        for i in range(self.rounds):
+            pass
@@ -0,0 +1,61 @@
+from pybench import Test
+
+import struct
+from array import array
+
+class StructColumns(Test):
+
+    version = 2.0
+    operations = 2
+    rounds = 1000
+
+    def test(self):
+
+        s = struct.Struct('<idh')
+        columns = (array('i', range(1000)),
+                   array('d', range(1000)),
+                   array('h', range(1000)))
+        buffer = bytearray(s.size * 1000)
+
+        for i in range(self.rounds):
+
+            s.pack_columns_into(buffer, 0, *columns)
+            s.unpack_columns(buffer)
+
+    def calibrate(self):
+
+        s = struct.Struct('<idh')
+        columns = (array('i', range(1000)),
+                   array('d', range(1000)),
+                   array('h', range(1000)))
+        buffer = bytearray(s.size * 1000)
+
+        for i in range(self.rounds):
+            pass
+
+class StructRecords(Test):
+
+    version = 2.0
+    operations = 2
+    rounds = 100
+
+    def test(self):
+
+        s = struct.Struct('<idh')
+        records = [(i, float(i), i) for i in range(1000)]
+        buffer = bytearray(s.size * 1000)
+
+        for i in range(self.rounds):
+
+            for j, record in enumerate(records):
+                s.pack_into(buffer, j * s.size, *record)
+            list(zip(*s.iter_unpack(buffer)))
+
+    def calibrate(self):
+
+        s = struct.Struct('<idh')
+        records = [(i, float(i), i) for i in range(1000)]
+        buffer = bytearray(s.size * 1000)
+
+        for i in range(self.rounds):
+            pass
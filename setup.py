@@ -607,6 +607,10 @@ class PyBuildExt(build_ext):
         exts.append( Extension("_bisect", ["_bisectmodule.c"]) )
         # heapq
         exts.append( Extension("_heapq", ["_heapqmodule.c"]) )
+        # enum accelerator
+        exts.append( Extension("_enum", ["_enum.c"]) )
+        # copy.deepcopy accelerator
+        exts.append( Extension("_copy", ["_copy.c"]) )
         # C-optimized pickle replacement
         exts.append( Extension("_pickle", ["_pickle.c"]) )
         # atexit